@@ -62,7 +62,12 @@ from .snapshots import (
     InMemorySnapshotRepository,
     SnapshotDatabaseOperationFactory,
     SnapshotEntry,
+    SnapshotEntryCache,
+    SnapshotIndex,
+    SnapshotPage,
+    SnapshotPageCursor,
     SnapshotRepository,
+    SnapshotSchemaCache,
     SnapshotService,
 )
 from .transactions import (
@@ -8,9 +8,12 @@ from datetime import (
 )
 from typing import (
     AsyncIterator,
+    ClassVar,
+    Iterable,
     Optional,
     Type,
     TypeVar,
+    Union,
 )
 from uuid import (
     UUID,
@@ -39,6 +42,7 @@ from ..queries import (
     _Ordering,
 )
 from ..snapshots import (
+    SnapshotIndex,
     SnapshotRepository,
 )
 
@@ -69,7 +73,11 @@ T = TypeVar("T", bound="RootEntity")
 
 
 class RootEntity(Entity):
-    """Base Root Entity class."""
+    """Base Root Entity class.
+
+    The fields by which the instances are frequently filtered or sorted can be declared on the ``_snapshot_indexes``
+    class attribute, so that the snapshot repositories maintain secondary indexes over them.
+    """
 
     version: int
     created_at: datetime
@@ -78,6 +86,12 @@ class RootEntity(Entity):
     _event_repository: EventRepository
     _snapshot_repository: SnapshotRepository
 
+    _snapshot_indexes: ClassVar[tuple[Union[str, SnapshotIndex], ...]] = tuple()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        SnapshotIndex.register(cls.classname, cls._snapshot_indexes)
+
     @Inject()
     def __init__(
         self,
@@ -116,6 +130,25 @@ class RootEntity(Entity):
         # noinspection PyTypeChecker
         return await _snapshot_repository.get(cls.classname, uuid, _snapshot_repository=_snapshot_repository, **kwargs)
 
+    @classmethod
+    @Inject()
+    async def get_many(
+        cls: Type[T], uuids: Iterable[UUID], *, _snapshot_repository: SnapshotRepository, **kwargs
+    ) -> list[T]:
+        """Get many instances from the database based on their identifiers.
+
+        :param uuids: The identifiers of the instances.
+        :param _snapshot_repository: Snapshot to be set to the root entity.
+        :return: A list of ``RootEntity`` instances, in the same order as the given identifiers.
+        """
+        if _snapshot_repository is None:
+            raise NotProvidedException(f"A {SnapshotRepository!r} instance is required.")
+
+        # noinspection PyTypeChecker
+        return await _snapshot_repository.get_many(
+            cls.classname, uuids, _snapshot_repository=_snapshot_repository, **kwargs
+        )
+
     @classmethod
     @Inject()
     def get_all(
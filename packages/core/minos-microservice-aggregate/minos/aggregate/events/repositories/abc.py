@@ -9,13 +9,20 @@ from abc import (
 from asyncio import (
     gather,
 )
+from collections import (
+    defaultdict,
+)
 from contextlib import (
+    AsyncExitStack,
+    asynccontextmanager,
     suppress,
 )
 from typing import (
     TYPE_CHECKING,
+    AsyncContextManager,
     AsyncIterator,
     Awaitable,
+    Iterable,
     Optional,
     Union,
 )
@@ -75,7 +82,13 @@ if TYPE_CHECKING:
 
 @Injectable("event_repository")
 class EventRepository(ABC, SetupMixin):
-    """Base event repository class in ``minos``."""
+    """Base event repository class in ``minos``.
+
+    The writes are serialized per ``RootEntity`` identifier, so the entries of independent instances can be validated
+    concurrently, also from different processes. The version collisions of each instance are detected by the storage.
+    The storage operations themselves are serialized by a short global lock, so that the entries become visible in
+    ``id`` order and the offset can be used as a watermark by the readers.
+    """
 
     @Inject()
     def __init__(
@@ -104,6 +117,7 @@ class EventRepository(ABC, SetupMixin):
         self._broker_publisher = broker_publisher
         self._transaction_repository = transaction_repository
         self._lock_pool = lock_pool
+        self._local_offset = 0
 
     def transaction(self, **kwargs) -> TransactionEntry:
         """Build a transaction instance related to the repository.
@@ -155,17 +169,17 @@ class EventRepository(ABC, SetupMixin):
         try:
             transaction = TRANSACTION_CONTEXT_VAR.get()
 
-            if isinstance(entry, Event):
-                entry = EventEntry.from_event(entry, transaction=transaction)
+            entry = self._build_entry(entry, transaction)
 
-            if not isinstance(entry.action, Action):
-                raise EventRepositoryException("The 'EventEntry.action' attribute must be an 'Action' instance.")
-
-            async with self.write_lock():
+            async with self.write_lock(entry.uuid):
                 if not await self.validate(entry, **kwargs):
                     raise EventRepositoryConflictException(f"{entry!r} could not be committed!", await self.offset)
 
-                entry = await self._submit(entry, **kwargs)
+                async with self.insert_lock():
+                    entry = await self._submit(entry, **kwargs)
+
+            if entry.id is not None:
+                self._local_offset = max(self._local_offset, entry.id)
 
             if entry.transaction_uuid == NULL_UUID:
                 await self._send_events(entry.event)
@@ -175,6 +189,53 @@ class EventRepository(ABC, SetupMixin):
 
         return entry
 
+    async def submit_many(self, entries: Iterable[Union[Event, EventEntry]], **kwargs) -> list[EventEntry]:
+        """Store new entries into the repository at once.
+
+        The entries are validated in a single pass and stored with a single operation per transaction. Then, the
+        events of the non-transactional entries are published together.
+
+        :param entries: The entries to be stored.
+        :param kwargs: Additional named arguments.
+        :return: The repository entries containing the stored information, in the same order as the given ones.
+        """
+
+        token = IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.set(True)
+        try:
+            transaction = TRANSACTION_CONTEXT_VAR.get()
+
+            entries = [self._build_entry(entry, transaction) for entry in entries]
+            if not len(entries):
+                return entries
+
+            async with self.write_lock(*(entry.uuid for entry in entries)):
+                if not await self.validate_many(entries, **kwargs):
+                    raise EventRepositoryConflictException(f"{entries!r} could not be committed!", await self.offset)
+
+                async with self.insert_lock():
+                    entries = await self._submit_many(entries, **kwargs)
+
+            ids = [entry.id for entry in entries if entry.id is not None]
+            if len(ids):
+                self._local_offset = max(self._local_offset, *ids)
+
+            await gather(*(self._send_events(entry.event) for entry in entries if entry.transaction_uuid == NULL_UUID))
+
+        finally:
+            IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.reset(token)
+
+        return entries
+
+    @staticmethod
+    def _build_entry(entry: Union[Event, EventEntry], transaction: Optional[TransactionEntry]) -> EventEntry:
+        if isinstance(entry, Event):
+            entry = EventEntry.from_event(entry, transaction=transaction)
+
+        if not isinstance(entry.action, Action):
+            raise EventRepositoryException("The 'EventEntry.action' attribute must be an 'Action' instance.")
+
+        return entry
+
     # noinspection PyUnusedLocal
     async def validate(self, entry: EventEntry, transaction_uuid_ne: Optional[UUID] = None, **kwargs) -> bool:
         """Check if it is able to submit the given entry.
@@ -202,10 +263,49 @@ class EventRepository(ABC, SetupMixin):
 
         return True
 
+    async def validate_many(
+        self, entries: Iterable[EventEntry], transaction_uuid_ne: Optional[UUID] = None, **kwargs
+    ) -> bool:
+        """Check if it is able to submit all the given entries.
+
+        The check performs a single transaction query and a single event query per destination transaction, restricted
+        to the identifiers of its entries, instead of validating each entry separately.
+
+        :param entries: The entries to be validated.
+        :param transaction_uuid_ne: Optional transaction identifier to skip it from the validation.
+        :param kwargs: Additional named arguments.
+        :return: ``True`` if all the entries can be submitted or ``False`` otherwise.
+        """
+        uuids = defaultdict(set)
+        for entry in entries:
+            uuids[entry.transaction_uuid].add(entry.uuid)
+
+        for destination_uuid, group in uuids.items():
+            iterable = self._transaction_repository.select(
+                destination_uuid=destination_uuid,
+                uuid_ne=transaction_uuid_ne,
+                status_in=(TransactionStatus.RESERVING, TransactionStatus.RESERVED, TransactionStatus.COMMITTING),
+            )
+
+            transaction_uuids = {e.uuid async for e in iterable}
+
+            if len(transaction_uuids):
+                with suppress(StopAsyncIteration):
+                    iterable = self.select(uuid_in=tuple(group), transaction_uuid_in=tuple(transaction_uuids), **kwargs)
+
+                    await iterable.__anext__()  # Will raise a `StopAsyncIteration` exception if not any item.
+
+                    return False
+
+        return True
+
     @abstractmethod
     async def _submit(self, entry: EventEntry, **kwargs) -> EventEntry:
         raise NotImplementedError
 
+    async def _submit_many(self, entries: list[EventEntry], **kwargs) -> list[EventEntry]:
+        return [await self._submit(entry, **kwargs) for entry in entries]
+
     async def _send_events(self, event: Event):
         suffix_mapper = {
             Action.CREATE: "Created",
@@ -213,9 +313,10 @@ class EventRepository(ABC, SetupMixin):
             Action.DELETE: "Deleted",
         }
         topic = f"{event.simplified_name}{suffix_mapper[event.action]}"
+        headers = {"priority": str(event.version)}
         message = BrokerMessageV1(
             topic=topic,
-            payload=BrokerMessageV1Payload(content=event),
+            payload=BrokerMessageV1Payload(content=event, headers=headers),
             strategy=BrokerMessageV1Strategy.MULTICAST,
         )
         futures = [self._broker_publisher.send(message)]
@@ -229,7 +330,7 @@ class EventRepository(ABC, SetupMixin):
 
                 message = BrokerMessageV1(
                     topic=composed_topic,
-                    payload=BrokerMessageV1Payload(content=decomposed_event),
+                    payload=BrokerMessageV1Payload(content=decomposed_event, headers=headers),
                     strategy=BrokerMessageV1Strategy.MULTICAST,
                 )
                 futures.append(self._broker_publisher.send(message))
@@ -240,6 +341,7 @@ class EventRepository(ABC, SetupMixin):
     async def select(
         self,
         uuid: Optional[UUID] = None,
+        uuid_in: Optional[tuple[UUID, ...]] = None,
         name: Optional[Union[str, type[RootEntity]]] = None,
         version: Optional[int] = None,
         version_lt: Optional[int] = None,
@@ -259,6 +361,7 @@ class EventRepository(ABC, SetupMixin):
         """Perform a selection query of entries stored in to the repository.
 
         :param uuid: The identifier must be equal to the given value.
+        :param uuid_in: The identifier must be equal to one of the given values.
         :param name: The classname must be equal to the given value.
         :param version: The version must be equal to the given value.
         :param version_lt: The version must be lower than the given value.
@@ -279,6 +382,7 @@ class EventRepository(ABC, SetupMixin):
             name = classname(name)
         generator = self._select(
             uuid=uuid,
+            uuid_in=uuid_in,
             name=name,
             version=version,
             version_lt=version_lt,
@@ -316,9 +420,47 @@ class EventRepository(ABC, SetupMixin):
     async def _offset(self) -> int:
         raise NotImplementedError
 
-    def write_lock(self) -> Lock:
-        """Get a write lock.
+    @property
+    def local_offset(self) -> int:
+        """Get the highest entry identifier submitted by the current process.
+
+        The value is computed without any query, so it does not consider the entries submitted by other processes.
+
+        :return: An integer value.
+        """
+        return self._local_offset
+
+    def write_lock(self, *uuids: UUID) -> AsyncContextManager[None]:
+        """Get a write lock over the entries of the given ``RootEntity`` identifiers.
+
+        The locks are acquired in a deterministic order, so that concurrent holders of overlapping sets of identifiers
+        cannot deadlock. The ``NULL_UUID`` is skipped, as it only represents instances that have not been created yet.
+
+        :param uuids: The identifiers of the ``RootEntity`` instances.
+        :return: An asynchronous context manager.
+        """
+        keys = sorted({self._get_write_lock_key(uuid) for uuid in uuids if uuid != NULL_UUID})
+        return self._acquire_write_locks(keys)
+
+    def insert_lock(self) -> Lock:
+        """Get the lock that serializes the storage operations.
+
+        It is only held around the storage operations, so that the identifiers are committed in the same order in which
+        they are generated. Otherwise, an entry with a lower identifier could become visible after a higher one has
+        been read, so it would be skipped by the readers that use the offset as a cursor.
 
         :return: An asynchronous context manager.
         """
-        return self._lock_pool.acquire("aggregate_event_write_lock")
+        return self._lock_pool.acquire("aggregate_event_insert_lock")
+
+    @asynccontextmanager
+    async def _acquire_write_locks(self, keys: list[int]) -> AsyncIterator[None]:
+        async with AsyncExitStack() as stack:
+            for key in keys:
+                await stack.enter_async_context(self._lock_pool.acquire(key))
+            yield
+
+    @staticmethod
+    def _get_write_lock_key(uuid: UUID) -> int:
+        # The lowest bits are already used by the storage to lock the submission of each instance.
+        return uuid.int >> 65
@@ -9,6 +9,7 @@ from datetime import (
     datetime,
 )
 from typing import (
+    Any,
     Optional,
 )
 from uuid import (
@@ -64,11 +65,27 @@ class EventDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``DatabaseOperation`` instance.
         """
 
+    @abstractmethod
+    def build_submit_many(
+        self, transaction_uuids: Iterable[UUID], entries: Iterable[dict[str, Any]]
+    ) -> DatabaseOperation:
+        """Build the database operation to submit multiple rows into the event table at once.
+
+        The operation must return the ``(id, uuid, version, created_at)`` values of the submitted rows, in the same
+        order as the given entries.
+
+        :param transaction_uuids: The sequence of nested transaction in on top of the current events' transaction.
+        :param entries: The entries to be submitted, as mappings containing the ``build_submit`` arguments. All of them
+            must belong to the same transaction.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
     # noinspection PyShadowingBuiltins
     @abstractmethod
     def build_query(
         self,
         uuid: Optional[UUID] = None,
+        uuid_in: Optional[tuple[UUID, ...]] = None,
         name: Optional[str] = None,
         version: Optional[int] = None,
         version_lt: Optional[int] = None,
@@ -88,6 +105,7 @@ class EventDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         """Build the database operation to select rows.
 
         :param uuid: The identifier must be equal to the given value.
+        :param uuid_in: The identifier must be equal to one of the given values.
         :param name: The classname must be equal to the given value.
         :param version: The version must be equal to the given value.
         :param version_lt: The version must be lower than the given value.
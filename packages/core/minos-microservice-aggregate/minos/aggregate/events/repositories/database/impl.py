@@ -2,10 +2,16 @@ from __future__ import (
     annotations,
 )
 
+from collections import (
+    defaultdict,
+)
 from typing import (
     AsyncIterator,
     Optional,
 )
+from uuid import (
+    UUID,
+)
 
 from minos.common import (
     NULL_UUID,
@@ -63,16 +69,39 @@ class DatabaseEventRepository(DatabaseMixin[EventDatabaseOperationFactory], Even
         if entry.uuid != NULL_UUID:
             lock = entry.uuid.int & (1 << 32) - 1
 
-        if entry.transaction_uuid != NULL_UUID:
-            transaction = await self._transaction_repository.get(uuid=entry.transaction_uuid)
-            transaction_uuids = await transaction.uuids
-        else:
-            transaction_uuids = (NULL_UUID,)
+        transaction_uuids = await self._get_transaction_uuids(entry.transaction_uuid)
 
         return self.database_operation_factory.build_submit(
             transaction_uuids=transaction_uuids, **entry.as_raw(), lock=lock
         )
 
+    async def _submit_many(self, entries: list[EventEntry], **kwargs) -> list[EventEntry]:
+        groups = defaultdict(list)
+        for entry in entries:
+            groups[entry.transaction_uuid].append(entry)
+
+        for transaction_uuid, group in groups.items():
+            transaction_uuids = await self._get_transaction_uuids(transaction_uuid)
+            operation = self.database_operation_factory.build_submit_many(
+                transaction_uuids, [entry.as_raw() for entry in group]
+            )
+
+            try:
+                rows = [row async for row in self.execute_on_database_and_fetch_all(operation)]
+            except IntegrityException:
+                raise EventRepositoryConflictException(
+                    f"{group!r} could not be submitted due to a key (uuid, version, transaction) collision",
+                    await self.offset,
+                )
+
+            for entry, row in zip(group, rows):
+                entry.id, entry.uuid, entry.version, entry.created_at = row
+
+        return entries
+
+    async def _get_transaction_uuids(self, transaction_uuid: UUID) -> tuple[UUID, ...]:
+        return await self._transaction_repository.get_ancestry(transaction_uuid)
+
     async def _select(self, streaming_mode: Optional[bool] = None, **kwargs) -> AsyncIterator[EventEntry]:
         operation = self.database_operation_factory.build_query(**kwargs)
         async for row in self.execute_on_database_and_fetch_all(operation, streaming_mode=streaming_mode):
@@ -2,14 +2,22 @@ from __future__ import (
     annotations,
 )
 
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
 from collections import (
     defaultdict,
 )
+from heapq import (
+    merge,
+)
 from itertools import (
     count,
 )
 from typing import (
     AsyncIterator,
+    Iterable,
     Optional,
 )
 from uuid import (
@@ -34,7 +42,11 @@ from .abc import (
 
 
 class InMemoryEventRepository(EventRepository):
-    """Memory-based implementation of the event repository class in ``minos``."""
+    """Memory-based implementation of the event repository class in ``minos``.
+
+    The entries are indexed by ``uuid``, ``name`` and ``transaction_uuid``, and also by ``id`` ranges, so that the
+    queries only have to filter the entries of the most selective index instead of the whole history.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -42,6 +54,11 @@ class InMemoryEventRepository(EventRepository):
         self._id_generator = count()
         self._next_versions = defaultdict(int)
 
+        self._ids: list[int] = list()
+        self._uuid_index: defaultdict[UUID, list[int]] = defaultdict(list)
+        self._name_index: defaultdict[str, list[int]] = defaultdict(list)
+        self._transaction_uuid_index: defaultdict[UUID, list[int]] = defaultdict(list)
+
     async def _submit(self, entry: EventEntry, **kwargs) -> EventEntry:
         if entry.uuid == NULL_UUID:
             entry.uuid = uuid4()
@@ -59,9 +76,17 @@ class InMemoryEventRepository(EventRepository):
             entry.created_at = current_datetime()
 
         entry.id = self._generate_next_id()
-        self._storage.append(entry)
+        self._store(entry)
         return entry
 
+    def _store(self, entry: EventEntry) -> None:
+        position = len(self._storage)
+        self._storage.append(entry)
+        self._ids.append(entry.id)
+        self._uuid_index[entry.uuid].append(position)
+        self._name_index[entry.name].append(position)
+        self._transaction_uuid_index[entry.transaction_uuid].append(position)
+
     def _generate_next_id(self) -> int:
         return next(self._id_generator) + 1
 
@@ -73,6 +98,7 @@ class InMemoryEventRepository(EventRepository):
     async def _select(
         self,
         uuid: Optional[int] = None,
+        uuid_in: Optional[tuple[UUID, ...]] = None,
         name: Optional[str] = None,
         version: Optional[int] = None,
         version_lt: Optional[int] = None,
@@ -95,6 +121,8 @@ class InMemoryEventRepository(EventRepository):
         def _fn_filter(entry: EventEntry) -> bool:
             if uuid is not None and uuid != entry.uuid:
                 return False
+            if uuid_in is not None and entry.uuid not in uuid_in:
+                return False
             if name is not None and name != entry.name:
                 return False
             if version is not None and version != entry.version:
@@ -125,11 +153,69 @@ class InMemoryEventRepository(EventRepository):
                 return False
             return True
 
-        iterable = iter(self._storage)
+        iterable = self._get_candidates(
+            uuid=uuid,
+            uuid_in=uuid_in,
+            name=name,
+            transaction_uuid=transaction_uuid,
+            transaction_uuid_in=transaction_uuid_in,
+            id=id,
+            id_lt=id_lt,
+            id_gt=id_gt,
+            id_le=id_le,
+            id_ge=id_ge,
+        )
         iterable = filter(_fn_filter, iterable)
         for item in iterable:
             yield item
 
+    # noinspection PyShadowingBuiltins
+    def _get_candidates(
+        self,
+        uuid: Optional[UUID],
+        uuid_in: Optional[tuple[UUID, ...]],
+        name: Optional[str],
+        transaction_uuid: Optional[UUID],
+        transaction_uuid_in: Optional[tuple[UUID, ...]],
+        id: Optional[int],
+        id_lt: Optional[int],
+        id_gt: Optional[int],
+        id_le: Optional[int],
+        id_ge: Optional[int],
+    ) -> Iterable[EventEntry]:
+        start, end = 0, len(self._storage)
+        if id is not None:
+            start, end = max(start, bisect_left(self._ids, id)), min(end, bisect_right(self._ids, id))
+        if id_lt is not None:
+            end = min(end, bisect_left(self._ids, id_lt))
+        if id_gt is not None:
+            start = max(start, bisect_right(self._ids, id_gt))
+        if id_le is not None:
+            end = min(end, bisect_right(self._ids, id_le))
+        if id_ge is not None:
+            start = max(start, bisect_left(self._ids, id_ge))
+
+        indexed = list()
+        if uuid is not None:
+            indexed.append(self._uuid_index.get(uuid, list()))
+        if uuid_in is not None:
+            parts = (self._uuid_index.get(value, list()) for value in set(uuid_in))
+            indexed.append(list(merge(*parts)))
+        if name is not None:
+            indexed.append(self._name_index.get(name, list()))
+        if transaction_uuid is not None:
+            indexed.append(self._transaction_uuid_index.get(transaction_uuid, list()))
+        if transaction_uuid_in is not None:
+            parts = (self._transaction_uuid_index.get(value, list()) for value in set(transaction_uuid_in))
+            indexed.append(list(merge(*parts)))
+
+        if not len(indexed):
+            return self._storage[start:end]
+
+        positions = min(indexed, key=len)
+        lower, upper = bisect_left(positions, start), bisect_left(positions, end)
+        return [self._storage[position] for position in positions[lower:upper]]
+
     @property
     async def _offset(self) -> int:
         return len(self._storage)
@@ -1,6 +1,17 @@
+from .caches import (
+    SnapshotEntryCache,
+    SnapshotSchemaCache,
+)
 from .entries import (
     SnapshotEntry,
 )
+from .indexes import (
+    SnapshotIndex,
+)
+from .pages import (
+    SnapshotPage,
+    SnapshotPageCursor,
+)
 from .repositories import (
     DatabaseSnapshotRepository,
     InMemorySnapshotRepository,
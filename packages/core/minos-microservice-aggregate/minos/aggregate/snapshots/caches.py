@@ -0,0 +1,280 @@
+from __future__ import (
+    annotations,
+)
+
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
+from collections.abc import (
+    Iterable,
+)
+from hashlib import (
+    sha256,
+)
+from typing import (
+    Any,
+    Optional,
+)
+from uuid import (
+    UUID,
+)
+
+from minos.common import (
+    MinosJsonBinaryProtocol,
+)
+
+from .entries import (
+    SnapshotEntry,
+)
+
+SnapshotEntryCacheKey = tuple[str, UUID, UUID]
+
+
+class SnapshotEntryCache:
+    """Snapshot Entry Cache class.
+
+    It is a size-bounded Least-Recently-Used (LRU) mapping from ``(name, uuid, transaction_uuid)`` keys to the
+    ``SnapshotEntry`` instances retrieved from the snapshot, in which the ``transaction_uuid`` is the identifier of the
+    transaction within the query was performed. The entries are invalidated by identifier and version, so that an
+    entry is never replaced by an older one. Every invalidation increases the ``generation`` counter, which allows to
+    discard the entries that were retrieved before a concurrent invalidation.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if max_size < 1:
+            raise ValueError(f"The max_size must be a positive integer. Obtained: {max_size}")
+
+        self.max_size = max_size
+
+        self._entries: OrderedDict[SnapshotEntryCacheKey, SnapshotEntry] = OrderedDict()
+        self._keys: defaultdict[UUID, set[SnapshotEntryCacheKey]] = defaultdict(set)
+
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: SnapshotEntryCacheKey) -> bool:
+        return key in self._entries
+
+    @property
+    def generation(self) -> int:
+        """Get the number of invalidations performed so far.
+
+        :return: An ``int`` value.
+        """
+        return self._generation
+
+    @property
+    def hits(self) -> int:
+        """Get the number of lookups that have found an entry.
+
+        :return: An ``int`` value.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of lookups that have not found an entry.
+
+        :return: An ``int`` value.
+        """
+        return self._misses
+
+    def get(self, key: SnapshotEntryCacheKey) -> Optional[SnapshotEntry]:
+        """Get the entry stored for the given key, marking it as the most recently used.
+
+        :param key: A ``(name, uuid, transaction_uuid)`` tuple.
+        :return: A ``SnapshotEntry`` instance or ``None`` if there is not any entry for the given key.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: SnapshotEntryCacheKey, entry: SnapshotEntry, generation: Optional[int] = None) -> None:
+        """Store an entry for the given key, evicting the least recently used one if the cache is full.
+
+        The entry is ignored if there is already a newer one stored for the same key or if any invalidation has been
+        performed since the given generation.
+
+        :param key: A ``(name, uuid, transaction_uuid)`` tuple.
+        :param entry: The ``SnapshotEntry`` to be stored.
+        :param generation: The generation at which the entry was retrieved.
+        :return: This method does not return anything.
+        """
+        if generation is not None and generation != self._generation:
+            return
+
+        previous = self._entries.get(key)
+        if previous is not None and previous.version > entry.version:
+            return
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._keys[key[1]].add(key)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, uuid: UUID, version: Optional[int] = None) -> None:
+        """Remove the entries of the given identifier.
+
+        :param uuid: The identifier of the ``RootEntity``.
+        :param version: If set, only the entries with a version lower than or equal to it are removed.
+        :return: This method does not return anything.
+        """
+        self._generation += 1
+        for key in tuple(self._keys.get(uuid, ())):
+            if version is None or self._entries[key].version <= version:
+                self._remove(key)
+
+    def invalidate_transactions(self, transaction_uuids: Iterable[UUID]) -> None:
+        """Remove the entries retrieved within the given transactions.
+
+        :param transaction_uuids: The identifiers of the transactions.
+        :return: This method does not return anything.
+        """
+        self._generation += 1
+        transaction_uuids = set(transaction_uuids)
+        for key in [key for key in self._entries if key[2] in transaction_uuids]:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all the entries.
+
+        :return: This method does not return anything.
+        """
+        self._generation += 1
+        self._entries.clear()
+        self._keys.clear()
+
+    def _remove(self, key: SnapshotEntryCacheKey) -> None:
+        del self._entries[key]
+
+        keys = self._keys[key[1]]
+        keys.discard(key)
+        if not len(keys):
+            del self._keys[key[1]]
+
+
+class SnapshotSchemaCache:
+    """Snapshot Schema Cache class.
+
+    It is a size-bounded Least-Recently-Used (LRU) mapping from content hashes to decoded schemas, so that each schema
+    is stored only once and it is decoded at most once per process. It also tracks the hashes that are already known
+    to be stored, so that they are not stored again.
+    """
+
+    def __init__(self, max_size: int = 256):
+        if max_size < 1:
+            raise ValueError(f"The max_size must be a positive integer. Obtained: {max_size}")
+
+        self.max_size = max_size
+
+        self._schemas: OrderedDict[bytes, Any] = OrderedDict()
+        self._stored: set[bytes] = set()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __contains__(self, schema_hash: bytes) -> bool:
+        return schema_hash in self._schemas
+
+    @staticmethod
+    def hash(encoded_schema: bytes) -> bytes:
+        """Compute the content hash of an encoded schema.
+
+        :param encoded_schema: The encoded schema.
+        :return: A ``bytes`` value.
+        """
+        return sha256(encoded_schema).digest()
+
+    @staticmethod
+    def normalize(schema: Any) -> Any:
+        """Normalize a schema, so that equivalent schemas have the same representation.
+
+        The avro schema encoder appends a random suffix to every namespace, which is stripped by the decoder, so the
+        suffixes are replaced by their order of appearance, keeping the distinct ones distinct.
+
+        :param schema: The schema to be normalized.
+        :return: The normalized schema.
+        """
+        suffixes = dict()
+
+        def _fn(value: Any) -> Any:
+            if isinstance(value, list):
+                return [_fn(v) for v in value]
+
+            if not isinstance(value, dict):
+                return value
+
+            if isinstance(namespace := value.get("namespace"), str) and "." in namespace:
+                namespace, suffix = namespace.rsplit(".", 1)
+                value = value | {"namespace": f"{namespace}.{suffixes.setdefault(suffix, len(suffixes))}"}
+            return {k: _fn(v) for k, v in value.items()}
+
+        return _fn(schema)
+
+    def get(self, schema_hash: bytes) -> Optional[Any]:
+        """Get the decoded schema for the given hash, marking it as the most recently used.
+
+        :param schema_hash: The content hash of the schema.
+        :return: The decoded schema or ``None`` if it is not cached.
+        """
+        schema = self._schemas.get(schema_hash)
+        if schema is not None:
+            self._schemas.move_to_end(schema_hash)
+        return schema
+
+    def put(self, schema_hash: bytes, schema: Any, stored: bool = False) -> Any:
+        """Store a schema, reusing the already cached one if available.
+
+        The least recently used schema is evicted if the cache is full.
+
+        :param schema_hash: The content hash of the schema.
+        :param schema: The decoded schema or its encoded representation.
+        :param stored: If ``True`` the schema is marked as stored.
+        :return: The cached decoded schema.
+        """
+        if schema_hash not in self._schemas:
+            if isinstance(schema, memoryview):
+                schema = schema.tobytes()
+            if isinstance(schema, bytes):
+                schema = MinosJsonBinaryProtocol.decode(schema)
+            self._schemas[schema_hash] = schema
+        self._schemas.move_to_end(schema_hash)
+
+        if stored:
+            self._stored.add(schema_hash)
+
+        schema = self._schemas[schema_hash]
+
+        while len(self._schemas) > self.max_size:
+            evicted, _ = self._schemas.popitem(last=False)
+            self._stored.discard(evicted)
+
+        return schema
+
+    def is_stored(self, schema_hash: bytes) -> bool:
+        """Check if the schema for the given hash is known to be stored.
+
+        :param schema_hash: The content hash of the schema.
+        :return: ``True`` if it is stored or ``False`` otherwise.
+        """
+        return schema_hash in self._stored
+
+    def mark_stored(self, schema_hashes: Iterable[bytes]) -> None:
+        """Mark the schemas for the given hashes as stored.
+
+        :param schema_hashes: The content hashes of the schemas.
+        :return: This method does not return anything.
+        """
+        self._stored.update(schema_hash for schema_hash in schema_hashes if schema_hash in self._schemas)
@@ -39,7 +39,8 @@ if TYPE_CHECKING:
 class SnapshotEntry:
     """Minos Snapshot Entry class.
 
-    Is the python object representation of a row in the ``snapshot`` storage system.
+    Is the python object representation of a row in the ``snapshot`` storage system. The schema can be provided
+    directly or referenced by its ``schema_hash``, in which case it must be resolved by the repository.
     """
 
     # noinspection PyShadowingBuiltins
@@ -53,7 +54,10 @@ class SnapshotEntry:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         transaction_uuid: UUID = NULL_UUID,
+        schema_hash: Optional[Union[bytes, memoryview]] = None,
     ):
+        if isinstance(schema_hash, memoryview):
+            schema_hash = schema_hash.tobytes()
         if isinstance(schema, memoryview):
             schema = schema.tobytes()
         if isinstance(schema, bytes):
@@ -67,6 +71,7 @@ class SnapshotEntry:
         self.version = version
 
         self.schema = schema
+        self.schema_hash = schema_hash
         self.data = data
 
         self.created_at = created_at
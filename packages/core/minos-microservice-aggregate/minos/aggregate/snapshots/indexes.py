@@ -0,0 +1,72 @@
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    Any,
+    ClassVar,
+    Union,
+)
+
+
+class SnapshotIndex:
+    """Snapshot Index class.
+
+    It declares a field of a ``RootEntity`` by which its snapshot is frequently filtered or sorted, so that the
+    snapshot repositories can maintain a secondary index over it. The indexes are declared through the
+    ``_snapshot_indexes`` class attribute of the ``RootEntity`` classes, either as ``SnapshotIndex`` instances or as
+    plain field names, which are registered by class name.
+    """
+
+    _registry: ClassVar[dict[str, tuple[SnapshotIndex, ...]]] = dict()
+
+    def __init__(self, field: str):
+        if not isinstance(field, str) or not len(field):
+            raise ValueError(f"The field must be a non-empty string. Obtained: {field!r}")
+        self.field = field
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, type(self)) and tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __iter__(self) -> Iterable[Any]:
+        yield from (self.field,)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.field!r})"
+
+    @classmethod
+    def register(cls, name: str, indexes: Iterable[Union[str, SnapshotIndex]]) -> None:
+        """Register the indexes of a ``RootEntity``.
+
+        :param name: Class name of the ``RootEntity``.
+        :param indexes: The indexes, as ``SnapshotIndex`` instances or field names.
+        :return: This method does not return anything.
+        """
+        indexes = tuple(dict.fromkeys(index if isinstance(index, cls) else cls(index) for index in indexes))
+        if not len(indexes):
+            cls._registry.pop(name, None)
+            return
+        cls._registry[name] = indexes
+
+    @classmethod
+    def get_registered(cls, name: str) -> tuple[SnapshotIndex, ...]:
+        """Get the indexes registered for a ``RootEntity``.
+
+        :param name: Class name of the ``RootEntity``.
+        :return: A tuple of ``SnapshotIndex`` instances.
+        """
+        return cls._registry.get(name, tuple())
+
+    @classmethod
+    def get_all_registered(cls) -> dict[str, tuple[SnapshotIndex, ...]]:
+        """Get the indexes registered for all the ``RootEntity`` classes.
+
+        :return: A mapping from class names to tuples of ``SnapshotIndex`` instances.
+        """
+        return dict(cls._registry)
@@ -0,0 +1,56 @@
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+)
+from uuid import (
+    UUID,
+)
+
+if TYPE_CHECKING:
+    from ..entities import (
+        RootEntity,
+    )
+
+SnapshotPageCursor = tuple[Any, UUID]
+
+
+class SnapshotPage:
+    """Snapshot Page class.
+
+    It contains a page of ``RootEntity`` instances retrieved from the snapshot with keyset pagination, together with
+    the cursor from which the next page must be retrieved. The cursor is the ``(value, uuid)`` pair of the last
+    instance of the page, in which the ``value`` is the one of the ordering field, or ``None`` if there are not any
+    more pages.
+    """
+
+    def __init__(self, items: Iterable[RootEntity], cursor: Optional[SnapshotPageCursor] = None):
+        self.items = list(items)
+        self.cursor = cursor
+
+    @property
+    def has_next(self) -> bool:
+        """Check if there is a next page.
+
+        :return: ``True`` if there is a next page or ``False`` otherwise.
+        """
+        return self.cursor is not None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, type(self)) and tuple(self) == tuple(other)
+
+    def __iter__(self) -> Iterable[Any]:
+        yield from (self.items, self.cursor)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self))})"
@@ -6,10 +6,14 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from operator import (
+    attrgetter,
+)
 from typing import (
     TYPE_CHECKING,
     AsyncIterator,
     Awaitable,
+    Iterable,
     Optional,
     Union,
 )
@@ -28,8 +32,13 @@ from ...exceptions import (
 )
 from ...queries import (
     _TRUE_CONDITION,
+    _AndCondition,
     _Condition,
     _EqualCondition,
+    _GreaterCondition,
+    _InCondition,
+    _LowerCondition,
+    _OrCondition,
     _Ordering,
 )
 from ...transactions import (
@@ -39,6 +48,10 @@ from ...transactions import (
 from ..entries import (
     SnapshotEntry,
 )
+from ..pages import (
+    SnapshotPage,
+    SnapshotPageCursor,
+)
 
 if TYPE_CHECKING:
     from ...entities import (
@@ -91,6 +104,50 @@ class SnapshotRepository(ABC, SetupMixin):
         except StopAsyncIteration:
             raise NotFoundException(f"The instance could not be found: {uuid!s}")
 
+    async def get_many(
+        self,
+        name: Union[str, type[RootEntity]],
+        uuids: Iterable[UUID],
+        transaction: Optional[TransactionEntry] = None,
+        **kwargs,
+    ) -> list[RootEntity]:
+        """Get a sequence of ``RootEntity`` instances from their identifiers.
+
+        :param name: Class name of the ``RootEntity``.
+        :param uuids: Identifiers of the ``RootEntity`` instances.
+        :param transaction: The transaction within the operation is performed. If not any value is provided, then the
+            transaction is extracted from the context var. If not any transaction is being scoped then the query is
+            performed to the global snapshot.
+        :param kwargs: Additional named arguments.
+        :return: A list of ``RootEntity`` instances, in the same order as the given identifiers.
+        """
+        snapshot_entries = await self.get_many_entries(name, uuids, transaction=transaction, **kwargs)
+        instances = [snapshot_entry.build(**kwargs) for snapshot_entry in snapshot_entries]
+        return instances
+
+    async def get_many_entries(self, name: str, uuids: Iterable[UUID], **kwargs) -> list[SnapshotEntry]:
+        """Get a sequence of ``SnapshotEntry`` instances from their identifiers.
+
+        The entries are retrieved with a single synchronization and a single query.
+
+        :param name: Class name of the ``RootEntity``.
+        :param uuids: Identifiers of the ``RootEntity`` instances.
+        :param kwargs: Additional named arguments.
+        :return: A list of ``SnapshotEntry`` instances, in the same order as the given identifiers.
+        """
+        uuids = tuple(uuids)
+        if not len(uuids):
+            return list()
+
+        iterable = self.find_entries(name, _InCondition("uuid", set(uuids)), **kwargs | {"exclude_deleted": False})
+        snapshot_entries = {snapshot_entry.uuid: snapshot_entry async for snapshot_entry in iterable}
+
+        missing = [uuid for uuid in uuids if uuid not in snapshot_entries]
+        if len(missing):
+            raise NotFoundException(f"The instances could not be found: {', '.join(map(str, missing))}")
+
+        return [snapshot_entries[uuid] for uuid in uuids]
+
     def get_all(
         self,
         name: str,
@@ -163,6 +220,109 @@ class SnapshotRepository(ABC, SetupMixin):
         async for snapshot_entry in iterable:
             yield snapshot_entry.build(**kwargs)
 
+    async def find_page(
+        self,
+        name: Union[str, type[RootEntity]],
+        condition: _Condition,
+        ordering: Optional[_Ordering] = None,
+        page_size: int = 100,
+        after: Optional[SnapshotPageCursor] = None,
+        transaction: Optional[TransactionEntry] = None,
+        **kwargs,
+    ) -> SnapshotPage:
+        """Find a page of ``RootEntity`` instances based on a ``Condition``, using keyset pagination.
+
+        The instances are sorted by the ordering field and then by ``uuid``, and the page starts right after the given
+        cursor, so that the cost of retrieving a page does not depend on its position. The page is fully loaded on
+        memory, so that the database connection is released as soon as it has been retrieved. The ordering field must
+        not contain null values.
+
+        :param name: Class name of the ``RootEntity``.
+        :param condition: The condition that must be satisfied by the ``RootEntity`` instances.
+        :param ordering: Optional argument to sort the instances by a field. The default behaviour is to sort them by
+            ``uuid``.
+        :param page_size: The maximum number of instances of the page.
+        :param after: The cursor of the previous page. If ``None``, the first page is retrieved.
+        :param transaction: The transaction within the operation is performed. If not any value is provided, then the
+            transaction is extracted from the context var. If not any transaction is being scoped then the query is
+            performed to the global snapshot.
+        :param kwargs: Additional named arguments.
+        :return: A ``SnapshotPage`` instance.
+        """
+        if page_size < 1:
+            raise ValueError(f"The page_size must be a positive integer. Obtained: {page_size}")
+
+        if ordering is None:
+            ordering = _Ordering("uuid", reverse=False)
+
+        if after is not None:
+            condition = _AndCondition(condition, self._build_keyset_condition(ordering, after))
+
+        iterable = self.find(
+            name,
+            condition,
+            ordering=ordering,
+            limit=page_size + 1,
+            streaming_mode=False,
+            transaction=transaction,
+            **kwargs,
+        )
+        instances = [instance async for instance in iterable]
+
+        cursor = None
+        if len(instances) > page_size:
+            instances = instances[:page_size]
+            cursor = (attrgetter(ordering.by)(instances[-1]), instances[-1].uuid)
+
+        return SnapshotPage(instances, cursor)
+
+    async def find_paginated(
+        self,
+        name: Union[str, type[RootEntity]],
+        condition: _Condition,
+        ordering: Optional[_Ordering] = None,
+        page_size: int = 100,
+        **kwargs,
+    ) -> AsyncIterator[RootEntity]:
+        """Find a collection of ``RootEntity`` instances based on a ``Condition``, retrieving them page by page.
+
+        Each page is retrieved with ``find_page``, so that at most ``page_size`` instances are loaded on memory at
+        once and the database connection is not kept open between pages. The snapshot is synchronized only before the
+        first page.
+
+        :param name: Class name of the ``RootEntity``.
+        :param condition: The condition that must be satisfied by the ``RootEntity`` instances.
+        :param ordering: Optional argument to sort the instances by a field. The default behaviour is to sort them by
+            ``uuid``.
+        :param page_size: The maximum number of instances retrieved at once.
+        :param kwargs: Additional named arguments.
+        :return: An asynchronous iterator that containing the ``RootEntity`` instances.
+        """
+        cursor = None
+        while True:
+            page = await self.find_page(name, condition, ordering, page_size, after=cursor, **kwargs)
+            for instance in page.items:
+                yield instance
+
+            if not page.has_next:
+                return
+
+            cursor = page.cursor
+            kwargs["synchronize"] = False
+
+    @staticmethod
+    def _build_keyset_condition(ordering: _Ordering, cursor: SnapshotPageCursor) -> _Condition:
+        value, uuid = cursor
+        after = _LowerCondition if ordering.reverse else _GreaterCondition
+
+        if ordering.by == "uuid":
+            return after("uuid", uuid)
+
+        return _OrCondition(
+            after(ordering.by, value),
+            _AndCondition(_EqualCondition(ordering.by, value), after("uuid", uuid)),
+        )
+
     async def find_entries(
         self,
         name: str,
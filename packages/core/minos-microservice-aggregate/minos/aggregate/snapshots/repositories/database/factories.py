@@ -17,6 +17,7 @@ from uuid import (
 )
 
 from minos.common import (
+    ComposedDatabaseOperation,
     DatabaseOperation,
     DatabaseOperationFactory,
 )
@@ -25,6 +26,9 @@ from ....queries import (
     _Condition,
     _Ordering,
 )
+from ...indexes import (
+    SnapshotIndex,
+)
 
 
 class SnapshotDatabaseOperationFactory(DatabaseOperationFactory, ABC):
@@ -37,6 +41,17 @@ class SnapshotDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``DatabaseOperation`` instance.
         """
 
+    def build_create_indexes(self, name: str, indexes: Iterable[SnapshotIndex]) -> DatabaseOperation:
+        """Build the database operation to create the secondary indexes of a ``RootEntity``.
+
+        By default, it does not create any index, so the queries are performed without them.
+
+        :param name: Class name of the ``RootEntity``.
+        :param indexes: The indexes to be created.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return ComposedDatabaseOperation([])
+
     @abstractmethod
     def build_delete(self, transaction_uuids: Iterable[UUID]) -> DatabaseOperation:
         """Build the database operation to delete rows by transaction identifiers.
@@ -56,6 +71,7 @@ class SnapshotDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         created_at: datetime,
         updated_at: datetime,
         transaction_uuid: UUID,
+        schema_hash: Optional[bytes] = None,
     ) -> DatabaseOperation:
         """Build the insert database operation.
 
@@ -67,9 +83,37 @@ class SnapshotDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :param created_at: The creation datetime.
         :param updated_at: The last update datetime.
         :param transaction_uuid: The transaction identifier.
+        :param schema_hash: The content hash of the schema, stored with ``build_submit_schemas``.
         :return: A ``DatabaseOperation`` instance.
         """
 
+    def build_submit_many(self, entries: Iterable[dict[str, Any]]) -> DatabaseOperation:
+        """Build the database operation to insert multiple rows at once.
+
+        By default, it composes one insert operation per entry, so implementations are encouraged to override it with a
+        single multi-row statement.
+
+        :param entries: The entries to be inserted, as mappings containing the ``build_submit`` arguments.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return ComposedDatabaseOperation([self.build_submit(**entry) for entry in entries])
+
+    @abstractmethod
+    def build_submit_schemas(self, schemas: dict[bytes, bytes]) -> DatabaseOperation:
+        """Build the database operation to store schemas, ignoring the already stored ones.
+
+        :param schemas: A mapping from content hashes to encoded schemas.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    @abstractmethod
+    def build_query_schemas(self, schema_hashes: Iterable[bytes]) -> DatabaseOperation:
+        """Build the database operation to get schemas by content hash.
+
+        :param schema_hashes: The content hashes of the schemas.
+        :return: A ``DatabaseOperation`` instance that returns ``(hash, schema)`` rows.
+        """
+
     @abstractmethod
     def build_query(
         self,
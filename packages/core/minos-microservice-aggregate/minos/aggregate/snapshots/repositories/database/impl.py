@@ -2,12 +2,20 @@ from __future__ import (
     annotations,
 )
 
+from collections import (
+    defaultdict,
+)
 from collections.abc import (
     AsyncIterator,
+    Iterable,
+)
+from time import (
+    monotonic,
 )
 from typing import (
     TYPE_CHECKING,
     Optional,
+    Union,
 )
 from uuid import (
     UUID,
@@ -15,10 +23,15 @@ from uuid import (
 
 from minos.common import (
     NULL_UUID,
+    ComposedDatabaseOperation,
+    Config,
     DatabaseMixin,
+    DatabaseOperation,
     Inject,
+    MinosConfigException,
     NotProvidedException,
     ProgrammingException,
+    classname,
     import_module,
 )
 
@@ -28,22 +41,31 @@ from ....events import (
     EventRepository,
 )
 from ....exceptions import (
-    NotFoundException,
     SnapshotRepositoryConflictException,
-    TransactionNotFoundException,
+    SnapshotRepositoryException,
 )
 from ....queries import (
     _Condition,
+    _InCondition,
     _Ordering,
 )
 from ....transactions import (
+    TRANSACTION_CONTEXT_VAR,
     TransactionEntry,
     TransactionRepository,
     TransactionStatus,
 )
+from ...caches import (
+    SnapshotEntryCache,
+    SnapshotEntryCacheKey,
+    SnapshotSchemaCache,
+)
 from ...entries import (
     SnapshotEntry,
 )
+from ...indexes import (
+    SnapshotIndex,
+)
 from ..abc import (
     SnapshotRepository,
 )
@@ -62,8 +84,39 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
 
     The snapshot provides a direct accessor to the ``RootEntity`` instances stored as events by the event repository
     class.
+
+    The synchronization processes the events in pages of ``synchronize_page_size`` entries. The diffs of each page are
+    folded in memory and the resulting snapshots are stored with a single transactional operation, together with the
+    cleaning of the finished transactions and the new offset, so that the offset never gets ahead of the snapshots.
+
+    The synchronization is skipped when the snapshot is known to be up to date. The entries submitted by the current
+    process are always detected, but the ones submitted by other processes are detected by checking the event
+    repository offset, which is performed at most once every ``synchronize_max_staleness`` seconds (by default, on
+    every synchronization if the cache is disabled and once per second otherwise).
+
+    The secondary indexes declared by the ``RootEntity`` classes are created on setup, so the classes must be imported
+    before the repository is set up. The queries never create indexes, as it would lock the table on the hot path.
+
+    The schemas are stored once in a content-addressed table and referenced by hash from the snapshot rows. The
+    decoded schemas are cached by the repository, so each one is retrieved and decoded at most once.
+
+    If ``cache_size`` is greater than zero, the entries retrieved by identifier are stored on a ``SnapshotEntryCache``
+    of that size, so that the following retrievals of the same instances avoid the snapshot query. The instances are
+    still built from the cached entries on every retrieval, which includes the decoding of their data. The cached
+    entries are invalidated as soon as newer versions are stored by the synchronization, including the ones stored by
+    other repositories sharing the same database, which are detected from the events between the locally synchronized
+    offset and the stored one. As the offset check is what detects them, a hit only avoids every database round trip
+    if ``synchronize_max_staleness`` is positive, so the changes made by other processes can be seen up to that number
+    of seconds later.
+
+    The ``synchronize_page_size``, ``synchronize_max_staleness`` and ``cache_size`` values can also be set on the
+    ``snapshot`` section of the ``aggregate`` config.
     """
 
+    _CACHED_SYNCHRONIZE_MAX_STALENESS = 1.0
+
+    _SCHEMA_RESOLUTION_BATCH_SIZE = 100
+
     @Inject()
     def __init__(
         self,
@@ -71,6 +124,9 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
         event_repository: EventRepository,
         transaction_repository: TransactionRepository,
         database_key: Optional[tuple[str]] = None,
+        synchronize_page_size: Optional[int] = None,
+        synchronize_max_staleness: Optional[float] = None,
+        cache_size: Optional[int] = None,
         **kwargs,
     ):
         if database_key is None:
@@ -83,16 +139,161 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
         if transaction_repository is None:
             raise NotProvidedException("A transaction repository instance is required.")
 
+        if synchronize_page_size is None:
+            synchronize_page_size = 1000
+        if cache_size is None:
+            cache_size = 0
+        if synchronize_max_staleness is None:
+            synchronize_max_staleness = self._CACHED_SYNCHRONIZE_MAX_STALENESS if cache_size > 0 else 0.0
+
         self._event_repository = event_repository
         self._transaction_repository = transaction_repository
+        self._synchronize_page_size = synchronize_page_size
+        self._synchronize_max_staleness = synchronize_max_staleness
+
+        self._synchronized_offset: Optional[int] = None
+        self._synchronized_at: Optional[float] = None
+
+        self._cache = SnapshotEntryCache(cache_size) if cache_size > 0 else None
+        self._schemas = SnapshotSchemaCache()
+
+    @classmethod
+    def _from_config(cls, config: Config, **kwargs) -> DatabaseSnapshotRepository:
+        try:
+            snapshot_config = config.get_aggregate().get("snapshot", dict())
+        except MinosConfigException:
+            snapshot_config = dict()
+
+        for key in ("synchronize_page_size", "synchronize_max_staleness", "cache_size"):
+            if kwargs.get(key) is None and snapshot_config.get(key) is not None:
+                kwargs[key] = snapshot_config[key]
+
+        return super()._from_config(config, **kwargs)
 
     async def _setup(self) -> None:
         operation = self.database_operation_factory.build_create()
         await self.execute_on_database(operation)
 
+        for name, indexes in SnapshotIndex.get_all_registered().items():
+            operation = self.database_operation_factory.build_create_indexes(name, indexes)
+            await self.execute_on_database(operation)
+
     async def _destroy(self) -> None:
         await super()._destroy()
 
+    @property
+    def synchronize_max_staleness(self) -> float:
+        """Get the maximum number of seconds between two checks of the event repository offset.
+
+        :return: A ``float`` value.
+        """
+        return self._synchronize_max_staleness
+
+    @property
+    def cache(self) -> Optional[SnapshotEntryCache]:
+        """Get the entry cache.
+
+        :return: A ``SnapshotEntryCache`` instance or ``None`` if the cache is disabled.
+        """
+        return self._cache
+
+    async def get_entry(
+        self,
+        name: Union[str, type[RootEntity]],
+        uuid: UUID,
+        transaction: Optional[TransactionEntry] = None,
+        synchronize: bool = True,
+        **kwargs,
+    ) -> SnapshotEntry:
+        """Get a ``SnapshotEntry`` from its identifier.
+
+        :param name: Class name of the ``RootEntity``.
+        :param uuid: Identifier of the ``RootEntity``.
+        :param transaction: The transaction within the operation is performed.
+        :param synchronize: If ``True`` a synchronization is performed before retrieving the entry.
+        :param kwargs: Additional named arguments.
+        :return: The ``SnapshotEntry`` instance.
+        """
+        if self._cache is None:
+            return await super().get_entry(name, uuid, transaction=transaction, synchronize=synchronize, **kwargs)
+
+        name, transaction = self._resolve_name_and_transaction(name, transaction)
+        if synchronize:
+            await self.synchronize(**kwargs)
+
+        key = self._get_cache_key(name, uuid, transaction)
+        if (entry := self._cache.get(key)) is not None:
+            return entry
+
+        generation = self._cache.generation
+        entry = await super().get_entry(name, uuid, transaction=transaction, synchronize=False, **kwargs)
+        self._cache.put(key, entry, generation)
+        return entry
+
+    async def get_many_entries(
+        self,
+        name: Union[str, type[RootEntity]],
+        uuids: Iterable[UUID],
+        transaction: Optional[TransactionEntry] = None,
+        synchronize: bool = True,
+        **kwargs,
+    ) -> list[SnapshotEntry]:
+        """Get a sequence of ``SnapshotEntry`` instances from their identifiers.
+
+        :param name: Class name of the ``RootEntity``.
+        :param uuids: Identifiers of the ``RootEntity`` instances.
+        :param transaction: The transaction within the operation is performed.
+        :param synchronize: If ``True`` a synchronization is performed before retrieving the entries.
+        :param kwargs: Additional named arguments.
+        :return: A list of ``SnapshotEntry`` instances, in the same order as the given identifiers.
+        """
+        if self._cache is None:
+            return await super().get_many_entries(
+                name, uuids, transaction=transaction, synchronize=synchronize, **kwargs
+            )
+
+        uuids = tuple(uuids)
+        if not len(uuids):
+            return list()
+
+        name, transaction = self._resolve_name_and_transaction(name, transaction)
+        if synchronize:
+            await self.synchronize(**kwargs)
+
+        snapshot_entries = dict()
+        for uuid in uuids:
+            if (entry := self._cache.get(self._get_cache_key(name, uuid, transaction))) is not None:
+                snapshot_entries[uuid] = entry
+
+        missing = [uuid for uuid in dict.fromkeys(uuids) if uuid not in snapshot_entries]
+        if len(missing):
+            generation = self._cache.generation
+            entries = await super().get_many_entries(
+                name, missing, transaction=transaction, synchronize=False, **kwargs
+            )
+            for entry in entries:
+                self._cache.put(self._get_cache_key(name, entry.uuid, transaction), entry, generation)
+                snapshot_entries[entry.uuid] = entry
+
+        return [snapshot_entries[uuid] for uuid in uuids]
+
+    @staticmethod
+    def _resolve_name_and_transaction(
+        name: Union[str, type[RootEntity]], transaction: Optional[TransactionEntry]
+    ) -> tuple[str, Optional[TransactionEntry]]:
+        if isinstance(name, type):
+            name = classname(name)
+
+        if transaction is None:
+            transaction = TRANSACTION_CONTEXT_VAR.get()
+
+        return name, transaction
+
+    @staticmethod
+    def _get_cache_key(name: str, uuid: UUID, transaction: Optional[TransactionEntry]) -> SnapshotEntryCacheKey:
+        transaction_uuid = NULL_UUID if transaction is None else transaction.uuid
+        return name, uuid, transaction_uuid
+
     # noinspection PyUnusedLocal
     async def _find_entries(
         self,
@@ -114,8 +315,39 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
             name, condition, ordering, limit, transaction_uuids, exclude_deleted
         )
 
+        snapshot_entries = list()
         async for row in self.execute_on_database_and_fetch_all(operation, streaming_mode=streaming_mode):
-            yield SnapshotEntry(*row)
+            snapshot_entries.append(SnapshotEntry(*row))
+            if len(snapshot_entries) >= self._SCHEMA_RESOLUTION_BATCH_SIZE:
+                await self._resolve_schemas(snapshot_entries)
+                for snapshot_entry in snapshot_entries:
+                    yield snapshot_entry
+                snapshot_entries.clear()
+
+        await self._resolve_schemas(snapshot_entries)
+        for snapshot_entry in snapshot_entries:
+            yield snapshot_entry
+
+    async def _resolve_schemas(self, snapshot_entries: list[SnapshotEntry]) -> None:
+        pending = [entry for entry in snapshot_entries if entry.schema is None and entry.schema_hash is not None]
+        if not len(pending):
+            return
+
+        schemas = {entry.schema_hash: self._schemas.get(entry.schema_hash) for entry in pending}
+        missing = tuple(schema_hash for schema_hash, schema in schemas.items() if schema is None)
+        if len(missing):
+            operation = self.database_operation_factory.build_query_schemas(missing)
+            async for schema_hash, encoded_schema in self.execute_on_database_and_fetch_all(operation):
+                if isinstance(schema_hash, memoryview):
+                    schema_hash = schema_hash.tobytes()
+                schemas[schema_hash] = self._schemas.put(schema_hash, encoded_schema, stored=True)
+
+        for entry in pending:
+            if (schema := schemas.get(entry.schema_hash)) is None:
+                raise SnapshotRepositoryException(
+                    f"The schema identified by {entry.schema_hash.hex()!r} does not exist."
+                )
+            entry.schema = schema
 
     async def is_synced(self, name: str, **kwargs) -> bool:
         """Check if the snapshot has the latest version of a ``RootEntity`` instance.
@@ -132,21 +364,59 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
             return True
 
     async def _synchronize(self, **kwargs) -> None:
-        initial_offset = await self._load_offset()
+        if await self._is_synchronized():
+            return
 
-        offset = initial_offset
+        synchronized_at = monotonic()
+        offset = await self._load_offset()
+        await self._invalidate_external_entries(offset)
+
+        event_entries = list()
         async for event_entry in self._event_repository.select(id_gt=offset, **kwargs):
-            try:
-                await self._dispatch_one(event_entry, **kwargs)
-            except SnapshotRepositoryConflictException:
-                pass
-            offset = max(event_entry.id, offset)
+            event_entries.append(event_entry)
+            if len(event_entries) >= self._synchronize_page_size:
+                offset = await self._synchronize_page(event_entries, offset, **kwargs)
+                event_entries = list()
 
-        if initial_offset < offset:
-            await self._clean_transactions(initial_offset)
+        if len(event_entries):
+            offset = await self._synchronize_page(event_entries, offset, **kwargs)
 
         await self._store_offset(offset)
 
+        self._synchronized_offset = offset
+        self._synchronized_at = synchronized_at
+
+    async def _is_synchronized(self) -> bool:
+        if self._synchronized_offset is None:
+            return False
+
+        if self._synchronized_offset < self._event_repository.local_offset:
+            return False
+
+        if monotonic() - self._synchronized_at < self._synchronize_max_staleness:
+            return True
+
+        checked_at = monotonic()
+        if self._synchronized_offset < await self._event_repository.offset:
+            return False
+
+        self._synchronized_at = checked_at
+        return True
+
+    async def _invalidate_external_entries(self, offset: int) -> None:
+        if self._cache is None:
+            return
+
+        if self._synchronized_offset is None:
+            self._cache.clear()
+            return
+
+        if offset <= self._synchronized_offset:
+            return
+
+        async for event_entry in self._event_repository.select(id_gt=self._synchronized_offset, id_le=offset):
+            self._cache.invalidate(event_entry.uuid, event_entry.version)
+
     async def _load_offset(self) -> int:
         operation = self.database_operation_factory.build_query_offset()
         # noinspection PyBroadException
@@ -160,68 +430,172 @@ class DatabaseSnapshotRepository(SnapshotRepository, DatabaseMixin[SnapshotDatab
         operation = self.database_operation_factory.build_submit_offset(offset)
         await self.execute_on_database(operation)
 
-    async def _dispatch_one(self, event_entry: EventEntry, **kwargs) -> SnapshotEntry:
-        if event_entry.action.is_delete:
-            return await self._submit_delete(event_entry)
+    async def _synchronize_page(self, event_entries: list[EventEntry], offset: int, **kwargs) -> int:
+        snapshot_entries = await self._dispatch_page(event_entries, **kwargs)
 
-        return await self._submit_update_or_create(event_entry, **kwargs)
+        new_offset = max(offset, max(event_entry.id for event_entry in event_entries))
+        transaction_uuids = set()
+        if offset < new_offset:
+            transaction_uuids = await self._get_finished_transactions(offset, event_offset_le=new_offset)
 
-    async def _submit_delete(self, event_entry: EventEntry) -> SnapshotEntry:
-        snapshot_entry = SnapshotEntry.from_event_entry(event_entry)
-        snapshot_entry = await self._submit_entry(snapshot_entry)
-        return snapshot_entry
+        await self._submit_page(snapshot_entries, transaction_uuids, new_offset)
+        return new_offset
 
-    async def _submit_update_or_create(self, event_entry: EventEntry, **kwargs) -> SnapshotEntry:
-        instance = await self._build_instance(event_entry, **kwargs)
+    async def _dispatch_page(self, event_entries: list[EventEntry], **kwargs) -> list[SnapshotEntry]:
+        transactions = await self._get_transactions(event_entries)
+        previous_entries = await self._get_previous_entries(event_entries, transactions, **kwargs)
 
-        snapshot_entry = SnapshotEntry.from_root_entity(instance, transaction_uuid=event_entry.transaction_uuid)
-        snapshot_entry = await self._submit_entry(snapshot_entry)
-        return snapshot_entry
+        snapshots: dict[tuple[UUID, UUID], Union[RootEntity, SnapshotEntry]] = dict()
+        for event_entry in event_entries:
+            key = (event_entry.uuid, event_entry.transaction_uuid)
+            transaction, transaction_uuids = transactions[event_entry.transaction_uuid]
 
-    async def _build_instance(self, event_entry: EventEntry, **kwargs) -> RootEntity:
-        diff = event_entry.event
+            if event_entry.action.is_delete:
+                snapshots[key] = SnapshotEntry.from_event_entry(event_entry)
+                continue
 
-        try:
-            transaction = await self._transaction_repository.get(uuid=event_entry.transaction_uuid)
-        except TransactionNotFoundException:
-            transaction = None
+            previous = self._get_previous(event_entry, transaction_uuids, snapshots, previous_entries)
+            try:
+                snapshots[key] = self._update_instance(event_entry.event, previous, transaction=transaction, **kwargs)
+            except SnapshotRepositoryConflictException:
+                pass
 
-        instance = await self._update_instance_if_exists(diff, transaction=transaction, **kwargs)
-        return instance
+        return [
+            snapshot
+            if isinstance(snapshot, SnapshotEntry)
+            else SnapshotEntry.from_root_entity(snapshot, transaction_uuid=transaction_uuid)
+            for (_, transaction_uuid), snapshot in snapshots.items()
+        ]
 
-    async def _update_instance_if_exists(self, event: Event, **kwargs) -> RootEntity:
-        # noinspection PyBroadException
-        try:
-            # noinspection PyTypeChecker
-            previous = await self._select_one_instance(event.name, event.uuid, **kwargs)
-        except NotFoundException:
+    async def _get_transactions(
+        self, event_entries: list[EventEntry]
+    ) -> dict[UUID, tuple[Optional[TransactionEntry], tuple[UUID, ...]]]:
+        transaction_uuids = {event_entry.transaction_uuid for event_entry in event_entries} - {NULL_UUID}
+
+        transactions = {NULL_UUID: (None, (NULL_UUID,))}
+        for transaction_uuid in transaction_uuids:
+            transactions[transaction_uuid] = (None, (NULL_UUID,))
+
+        if len(transaction_uuids):
+            async for transaction in self._transaction_repository.select(uuid_in=tuple(transaction_uuids)):
+                transactions[transaction.uuid] = (transaction, await transaction.uuids)
+
+        return transactions
+
+    async def _get_previous_entries(
+        self,
+        event_entries: list[EventEntry],
+        transactions: dict[UUID, tuple[Optional[TransactionEntry], tuple[UUID, ...]]],
+        **kwargs,
+    ) -> dict[tuple[UUID, UUID], SnapshotEntry]:
+        uuids = defaultdict(set)
+        for event_entry in event_entries:
+            if not event_entry.action.is_delete:
+                uuids[(event_entry.name, event_entry.transaction_uuid)].add(event_entry.uuid)
+
+        previous_entries = dict()
+        for (name, transaction_uuid), group in uuids.items():
+            transaction, _ = transactions[transaction_uuid]
+            iterable = self._find_entries(
+                name,
+                _InCondition("uuid", group),
+                ordering=None,
+                limit=None,
+                streaming_mode=False,
+                transaction=transaction,
+                exclude_deleted=False,
+                **kwargs,
+            )
+            async for snapshot_entry in iterable:
+                previous_entries[(snapshot_entry.uuid, transaction_uuid)] = snapshot_entry
+
+        return previous_entries
+
+    @staticmethod
+    def _get_previous(
+        event_entry: EventEntry,
+        transaction_uuids: tuple[UUID, ...],
+        snapshots: dict[tuple[UUID, UUID], Union[RootEntity, SnapshotEntry]],
+        previous_entries: dict[tuple[UUID, UUID], SnapshotEntry],
+    ) -> Optional[Union[RootEntity, SnapshotEntry]]:
+        stored = previous_entries.get((event_entry.uuid, event_entry.transaction_uuid))
+
+        for transaction_uuid in reversed(transaction_uuids):
+            if (previous := snapshots.get((event_entry.uuid, transaction_uuid))) is not None:
+                if transaction_uuid != event_entry.transaction_uuid and not isinstance(previous, SnapshotEntry):
+                    # The instance belongs to an outer transaction, so it must not be modified in place.
+                    previous = SnapshotEntry.from_root_entity(previous, transaction_uuid=transaction_uuid)
+                return previous
+
+            if stored is not None and stored.transaction_uuid == transaction_uuid:
+                return stored
+
+        return None
+
+    @staticmethod
+    def _update_instance(event: Event, previous: Optional[Union[RootEntity, SnapshotEntry]], **kwargs) -> RootEntity:
+        if previous is None:
             # noinspection PyTypeChecker
             cls = import_module(event.name)
             return cls.from_diff(event, **kwargs)
 
+        if isinstance(previous, SnapshotEntry):
+            previous = previous.build(**kwargs)
+
         if previous.version >= event.version:
             raise SnapshotRepositoryConflictException(previous, event)
 
         previous.apply_diff(event)
         return previous
 
-    async def _select_one_instance(self, name: str, uuid: UUID, **kwargs) -> RootEntity:
-        snapshot_entry = await self.get_entry(name, uuid, **kwargs)
-        return snapshot_entry.build(**kwargs)
-
-    async def _submit_entry(self, snapshot_entry: SnapshotEntry) -> SnapshotEntry:
-        operation = self.database_operation_factory.build_submit(**snapshot_entry.as_raw())
-        response = await self.execute_on_database_and_fetch_one(operation)
-
-        snapshot_entry.created_at, snapshot_entry.updated_at = response
-
-        return snapshot_entry
-
-    async def _clean_transactions(self, offset: int, **kwargs) -> None:
+    async def _submit_page(
+        self, snapshot_entries: list[SnapshotEntry], transaction_uuids: set[UUID], offset: Optional[int] = None
+    ) -> None:
+        operations = list()
+        schemas = dict()
+        if len(snapshot_entries):
+            operations.extend(self._build_submit_entries(snapshot_entries, schemas))
+        if len(transaction_uuids):
+            operations.append(self.database_operation_factory.build_delete(transaction_uuids))
+        if offset is not None:
+            operations.append(self.database_operation_factory.build_submit_offset(offset))
+
+        if not len(operations):
+            return
+
+        await self.execute_on_database(ComposedDatabaseOperation(operations, transactional=True))
+
+        self._schemas.mark_stored(schemas)
+        if self._cache is not None:
+            for snapshot_entry in snapshot_entries:
+                self._cache.invalidate(snapshot_entry.uuid, snapshot_entry.version)
+            if len(transaction_uuids):
+                self._cache.invalidate_transactions(transaction_uuids)
+
+    def _build_submit_entries(
+        self, snapshot_entries: list[SnapshotEntry], schemas: dict[bytes, bytes]
+    ) -> list[DatabaseOperation]:
+        raw_entries = list()
+        for snapshot_entry in snapshot_entries:
+            if snapshot_entry.schema is not None:
+                snapshot_entry.schema = self._schemas.normalize(snapshot_entry.schema)
+            raw = snapshot_entry.as_raw()
+            if (encoded_schema := raw["schema"]) is not None:
+                schema_hash = self._schemas.hash(encoded_schema)
+                self._schemas.put(schema_hash, snapshot_entry.schema)
+                if not self._schemas.is_stored(schema_hash):
+                    schemas[schema_hash] = encoded_schema
+                raw |= {"schema": None, "schema_hash": schema_hash}
+            raw_entries.append(raw)
+
+        operations = list()
+        if len(schemas):
+            operations.append(self.database_operation_factory.build_submit_schemas(schemas))
+        operations.append(self.database_operation_factory.build_submit_many(raw_entries))
+        return operations
+
+    async def _get_finished_transactions(self, offset: int, **kwargs) -> set[UUID]:
         iterable = self._transaction_repository.select(
             event_offset_gt=offset, status_in=(TransactionStatus.COMMITTED, TransactionStatus.REJECTED), **kwargs
         )
-        transaction_uuids = {transaction.uuid async for transaction in iterable}
-        if len(transaction_uuids):
-            operation = self.database_operation_factory.build_delete(transaction_uuids)
-            await self.execute_on_database(operation)
+        return {transaction.uuid async for transaction in iterable}
@@ -2,6 +2,13 @@ from __future__ import (
     annotations,
 )
 
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from collections import (
+    defaultdict,
+)
 from contextlib import (
     suppress,
 )
@@ -12,6 +19,8 @@ from operator import (
     attrgetter,
 )
 from typing import (
+    TYPE_CHECKING,
+    Any,
     AsyncIterator,
     Optional,
 )
@@ -33,8 +42,17 @@ from ...exceptions import (
     AlreadyDeletedException,
 )
 from ...queries import (
+    _AndCondition,
     _Condition,
+    _EqualCondition,
+    _GreaterCondition,
+    _GreaterEqualCondition,
+    _InCondition,
+    _LowerCondition,
+    _LowerEqualCondition,
+    _OrCondition,
     _Ordering,
+    _SimpleCondition,
 )
 from ...transactions import (
     TransactionEntry,
@@ -44,16 +62,32 @@ from ...transactions import (
 from ..entries import (
     SnapshotEntry,
 )
+from ..indexes import (
+    SnapshotIndex,
+)
 from .abc import (
     SnapshotRepository,
 )
 
+if TYPE_CHECKING:
+    from ...entities import (
+        RootEntity,
+    )
+
 
 class InMemorySnapshotRepository(SnapshotRepository):
     """InMemory Snapshot class.
 
     The snapshot provides a direct accessor to the ``RootEntity`` instances stored as events by the event repository
     class.
+
+    The ``RootEntity`` instances out of any transaction are materialized into a snapshot map, which is incrementally
+    updated with the new events before each access, so that the events are not replayed on every query. The queries
+    performed within a transaction still replay the events of the involved transactions.
+
+    The fields declared as ``SnapshotIndex`` by the ``RootEntity`` classes are indexed with hash and sorted indexes,
+    which are incrementally updated with the new events before each query out of a transaction. These indexes are used
+    to reduce the instances that have to be built to evaluate the conditions.
     """
 
     @Inject()
@@ -75,16 +109,35 @@ class InMemorySnapshotRepository(SnapshotRepository):
         self._event_repository = event_repository
         self._transaction_repository = transaction_repository
 
+        self._indexes: dict[str, _InMemorySnapshotIndex] = dict()
+
+        self._offset = 0
+        self._snapshots: defaultdict[str, dict[UUID, SnapshotEntry]] = defaultdict(dict)
+        self._instances: dict[tuple[str, UUID], RootEntity] = dict()
+        self._unmaterialized: defaultdict[str, set[UUID]] = defaultdict(set)
+
     async def _find_entries(
         self,
         name: str,
         condition: _Condition,
         ordering: Optional[_Ordering],
         limit: Optional[int],
+        streaming_mode: bool,
         exclude_deleted: bool,
         **kwargs,
     ) -> AsyncIterator[SnapshotEntry]:
-        uuids = {v.uuid async for v in self._event_repository.select(name=name)}
+        if kwargs.get("transaction") is None:
+            await self._update_snapshots()
+            uuids = set(self._snapshots[name]) | self._unmaterialized[name]
+        else:
+            uuids = {v.uuid async for v in self._event_repository.select(name=name)}
+
+        if (candidates := self._get_uuid_candidates(condition)) is not None:
+            uuids &= candidates
+
+        if kwargs.get("transaction") is None and (index := await self._update_index(name)) is not None:
+            if (candidates := index.get_candidates(condition)) is not None:
+                uuids &= candidates
 
         entries = list()
         for uuid in uuids:
@@ -119,6 +172,11 @@ class InMemorySnapshotRepository(SnapshotRepository):
                     elif aa < bb:
                         return -1
 
+                if a.uuid > b.uuid:
+                    return 1
+                elif a.uuid < b.uuid:
+                    return -1
+
                 return 0
 
             entries.sort(key=cmp_to_key(_cmp), reverse=ordering.reverse)
@@ -129,25 +187,100 @@ class InMemorySnapshotRepository(SnapshotRepository):
         for entry in entries:
             yield entry
 
+    @staticmethod
+    def _get_uuid_candidates(condition: _Condition) -> Optional[set[UUID]]:
+        if isinstance(condition, _EqualCondition) and condition.field == "uuid":
+            return {condition.parameter}
+        if isinstance(condition, _InCondition) and condition.field == "uuid":
+            return set(condition.parameter)
+        return None
+
+    async def _update_index(self, name: str) -> Optional[_InMemorySnapshotIndex]:
+        indexes = SnapshotIndex.get_registered(name)
+        if not len(indexes):
+            self._indexes.pop(name, None)
+            return None
+
+        index = self._indexes.get(name)
+        if index is None or index.indexes != indexes:
+            index = self._indexes[name] = _InMemorySnapshotIndex(indexes)
+
+        uuids = set()
+        async for event_entry in self._event_repository.select(name=name, id_gt=index.offset):
+            index.offset = max(index.offset, event_entry.id)
+            if event_entry.transaction_uuid == NULL_UUID:
+                uuids.add(event_entry.uuid)
+
+        for uuid in uuids:
+            try:
+                instance = (await self._get(name, uuid)).build()
+            except AlreadyDeletedException:
+                instance = None
+            index.update(uuid, instance)
+
+        return index
+
     # noinspection PyMethodOverriding
     async def _get(
         self, name: str, uuid: UUID, transaction: Optional[TransactionEntry] = None, **kwargs
     ) -> SnapshotEntry:
         transaction_uuids = await self._get_transaction_uuids(transaction)
+        # The materialized snapshots are built without additional arguments, so they cannot be used if any is given.
+        if transaction_uuids == (NULL_UUID,) and not kwargs:
+            await self._update_snapshots()
+            if (snapshot := self._snapshots[name].get(uuid)) is not None:
+                return snapshot
+
         entries = await self._get_event_entries(name, uuid, transaction_uuids)
         return self._build_instance(entries, **kwargs)
 
+    async def _update_snapshots(self) -> None:
+        async for event_entry in self._event_repository.select(id_gt=self._offset):
+            self._offset = max(self._offset, event_entry.id)
+            if event_entry.transaction_uuid == NULL_UUID:
+                self._materialize(event_entry)
+
+    def _materialize(self, event_entry: EventEntry) -> None:
+        name, uuid = event_entry.name, event_entry.uuid
+        if uuid in self._unmaterialized[name]:
+            return
+
+        key = (name, uuid)
+        try:
+            instance = self._instances.get(key)
+            if instance is None:
+                instance = self._instances[key] = event_entry.type_.from_diff(event_entry.event)
+            elif event_entry.version < instance.version:
+                raise ValueError(f"The events of {uuid!r} are not sorted by version.")
+            else:
+                instance.apply_diff(event_entry.event)
+
+            if event_entry.action.is_delete:
+                snapshot = SnapshotEntry.from_event_entry(event_entry)
+            else:
+                snapshot = SnapshotEntry.from_root_entity(instance)
+        except Exception:
+            # The instances that cannot be materialized incrementally are rebuilt from their events on each access.
+            self._instances.pop(key, None)
+            self._snapshots[name].pop(uuid, None)
+            self._unmaterialized[name].add(uuid)
+            return
+
+        self._snapshots[name][uuid] = snapshot
+
     async def _get_transaction_uuids(self, transaction: Optional[TransactionEntry]) -> tuple[UUID, ...]:
         if transaction is None:
             transaction_uuids = (NULL_UUID,)
         else:
             transaction_uuids = await transaction.uuids
 
-        while len(transaction_uuids) > 1:
-            transaction = await self._transaction_repository.get(uuid=transaction_uuids[-1])
-            if transaction.status != TransactionStatus.REJECTED:
-                break
-            transaction_uuids = tuple(transaction_uuids[:-1])
+        if len(transaction_uuids) > 1:
+            iterable = self._transaction_repository.select(
+                uuid_in=transaction_uuids[1:], status=TransactionStatus.REJECTED
+            )
+            rejected = {transaction.uuid async for transaction in iterable}
+            while len(transaction_uuids) > 1 and transaction_uuids[-1] in rejected:
+                transaction_uuids = transaction_uuids[:-1]
 
         return transaction_uuids
 
@@ -183,4 +316,123 @@ class InMemorySnapshotRepository(SnapshotRepository):
         return snapshot
 
     async def _synchronize(self, **kwargs) -> None:
-        pass
+        await self._update_snapshots()
+
+
+class _InMemorySnapshotIndex:
+    def __init__(self, indexes: tuple[SnapshotIndex, ...]):
+        self.indexes = indexes
+        self.offset = 0
+
+        self._values: dict[UUID, dict[str, Any]] = dict()
+        self._hashed: dict[str, defaultdict[Any, set[UUID]]] = {index.field: defaultdict(set) for index in indexes}
+        self._sorted: dict[str, Optional[tuple[list[Any], list[UUID]]]] = {
+            index.field: (list(), list()) for index in indexes
+        }
+        self._unindexed: set[UUID] = set()
+
+    def update(self, uuid: UUID, instance: Optional[RootEntity]) -> None:
+        """Update the indexed values of an instance.
+
+        :param uuid: The identifier of the instance.
+        :param instance: The ``RootEntity`` instance or ``None`` if it has been deleted.
+        :return: This method does not return anything.
+        """
+        self._remove(uuid)
+
+        if instance is None:
+            self._unindexed.add(uuid)
+            return
+
+        try:
+            values = {index.field: attrgetter(index.field)(instance) for index in self.indexes}
+            for value in values.values():
+                hash(value)
+        except (AttributeError, TypeError):
+            self._unindexed.add(uuid)
+            return
+
+        self._values[uuid] = values
+        for field, value in values.items():
+            self._hashed[field][value].add(uuid)
+            if (sorted_ := self._sorted[field]) is not None:
+                try:
+                    position = bisect_right(sorted_[0], value)
+                except TypeError:
+                    self._sorted[field] = None
+                    continue
+                sorted_[0].insert(position, value)
+                sorted_[1].insert(position, uuid)
+
+    def _remove(self, uuid: UUID) -> None:
+        self._unindexed.discard(uuid)
+        values = self._values.pop(uuid, None)
+        if values is None:
+            return
+
+        for field, value in values.items():
+            hashed = self._hashed[field]
+            hashed[value].discard(uuid)
+            if not len(hashed[value]):
+                del hashed[value]
+
+            if (sorted_ := self._sorted[field]) is not None:
+                start, end = bisect_left(sorted_[0], value), bisect_right(sorted_[0], value)
+                position = sorted_[1].index(uuid, start, end)
+                del sorted_[0][position]
+                del sorted_[1][position]
+
+    def get_candidates(self, condition: _Condition) -> Optional[set[UUID]]:
+        """Get the identifiers of the instances that may satisfy the given condition.
+
+        :param condition: The condition to be satisfied.
+        :return: A set of identifiers or ``None`` if the condition cannot be resolved with the indexes.
+        """
+        if isinstance(condition, _AndCondition):
+            candidates = [self.get_candidates(part) for part in condition]
+            candidates = [part for part in candidates if part is not None]
+            if not len(candidates):
+                return None
+            return set.intersection(*candidates)
+
+        if isinstance(condition, _OrCondition):
+            candidates = [self.get_candidates(part) for part in condition]
+            if any(part is None for part in candidates):
+                return None
+            return set.union(set(), *candidates)
+
+        if not isinstance(condition, _SimpleCondition) or condition.field not in self._hashed:
+            return None
+
+        try:
+            candidates = self._get_simple_candidates(condition)
+        except TypeError:
+            return None
+
+        if candidates is None:
+            return None
+        return candidates | self._unindexed
+
+    def _get_simple_candidates(self, condition: _SimpleCondition) -> Optional[set[UUID]]:
+        hashed = self._hashed[condition.field]
+        if isinstance(condition, _EqualCondition):
+            return set(hashed.get(condition.parameter, set()))
+        if isinstance(condition, _InCondition):
+            return set().union(*(hashed.get(parameter, set()) for parameter in condition.parameter))
+
+        if (sorted_ := self._sorted[condition.field]) is None:
+            return None
+        values, uuids = sorted_
+        if isinstance(condition, _LowerCondition):
+            position = bisect_left(values, condition.parameter)
+            return set(uuids[:position])
+        if isinstance(condition, _LowerEqualCondition):
+            position = bisect_right(values, condition.parameter)
+            return set(uuids[:position])
+        if isinstance(condition, _GreaterCondition):
+            position = bisect_right(values, condition.parameter)
+            return set(uuids[position:])
+        if isinstance(condition, _GreaterEqualCondition):
+            position = bisect_left(values, condition.parameter)
+            return set(uuids[position:])
+        return None
@@ -3,9 +3,6 @@ from __future__ import (
 )
 
 import logging
-from asyncio import (
-    gather,
-)
 from typing import (
     TYPE_CHECKING,
 )
@@ -84,7 +81,7 @@ class SnapshotService:
             raise ResponseException(f"There was a problem while parsing the given request: {exc!r}")
 
         try:
-            instances = await gather(*(self.type_.get(uuid) for uuid in content["uuids"]))
+            instances = await self.type_.get_many(content["uuids"])
         except Exception as exc:
             raise ResponseException(f"There was a problem while getting the instances: {exc!r}")
 
@@ -1,7 +1,11 @@
+from collections.abc import (
+    Iterable,
+)
 from datetime import (
     datetime,
 )
 from typing import (
+    Any,
     Optional,
 )
 from uuid import (
@@ -47,9 +51,16 @@ class MockedEventDatabaseOperationFactory(EventDatabaseOperationFactory):
         """For testing purposes."""
         return MockedDatabaseOperation("submit")
 
+    def build_submit_many(
+        self, transaction_uuids: Iterable[UUID], entries: Iterable[dict[str, Any]]
+    ) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("submit_many")
+
     def build_query(
         self,
         uuid: Optional[UUID] = None,
+        uuid_in: Optional[tuple[UUID, ...]] = None,
         name: Optional[str] = None,
         version: Optional[int] = None,
         version_lt: Optional[int] = None,
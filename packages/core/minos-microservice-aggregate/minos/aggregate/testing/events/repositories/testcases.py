@@ -237,6 +237,27 @@ class EventRepositoryTestCase(MinosTestCase, ABC):
         with self.assertRaises(EventRepositoryException):
             await self.event_repository.submit(EventEntry(self.uuid, "example.Car", 1, "foo".encode()))
 
+    async def test_submit_many(self):
+        observed = await self.event_repository.submit_many(
+            [
+                EventEntry(self.uuid_1, "example.Car", action=Action.CREATE),
+                EventEntry(self.uuid_2, "example.Car", action=Action.CREATE),
+                EventEntry(self.uuid_1, "example.Car", action=Action.UPDATE),
+            ]
+        )
+        expected = [
+            EventEntry(self.uuid_1, "example.Car", 1, bytes(), 1, Action.CREATE),
+            EventEntry(self.uuid_2, "example.Car", 1, bytes(), 2, Action.CREATE),
+            EventEntry(self.uuid_1, "example.Car", 2, bytes(), 3, Action.UPDATE),
+        ]
+        self.assert_equal_repository_entries(expected, observed)
+
+        observed = [v async for v in self.event_repository.select()]
+        self.assert_equal_repository_entries(expected, observed)
+
+    async def test_submit_many_empty(self):
+        self.assertEqual([], await self.event_repository.submit_many([]))
+
     async def test_select_empty(self):
         self.assertEqual([], [v async for v in self.event_repository.select()])
 
@@ -287,6 +308,19 @@ class EventRepositoryTestCase(MinosTestCase, ABC):
         observed = [v async for v in self.event_repository.select(uuid=self.uuid_2)]
         self.assert_equal_repository_entries(expected, observed)
 
+    async def test_select_uuid_in(self):
+        await self.populate()
+        expected = [
+            self.entries[2],
+            self.entries[5],
+            self.entries[6],
+            self.entries[7],
+            self.entries[8],
+            self.entries[9],
+        ]
+        observed = [v async for v in self.event_repository.select(uuid_in=(self.uuid_2, self.uuid_4))]
+        self.assert_equal_repository_entries(expected, observed)
+
     async def test_select_name(self):
         await self.populate()
         expected = [self.entries[6]]
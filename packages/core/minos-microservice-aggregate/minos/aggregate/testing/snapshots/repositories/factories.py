@@ -50,10 +50,23 @@ class MockedSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
         created_at: datetime,
         updated_at: datetime,
         transaction_uuid: UUID,
+        schema_hash: Optional[bytes] = None,
     ) -> DatabaseOperation:
         """For testing purposes."""
         return MockedDatabaseOperation("insert")
 
+    def build_submit_many(self, entries: Iterable[dict[str, Any]]) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("insert_many")
+
+    def build_submit_schemas(self, schemas: dict[bytes, bytes]) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("insert_schemas")
+
+    def build_query_schemas(self, schema_hashes: Iterable[bytes]) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("query_schemas")
+
     def build_query(
         self,
         name: str,
@@ -350,14 +350,7 @@ class SnapshotRepositoryTestCase(MinosTestCase, ABC):
         mock.reset_mock()
 
         await self.snapshot_repository.synchronize()
-        self.assertEqual(1, mock.call_count)
-        self.assertEqual(call(id_gt=12, synchronize=False), mock.call_args)
-        mock.reset_mock()
-
-        await self.snapshot_repository.synchronize()
-        self.assertEqual(1, mock.call_count)
-        self.assertEqual(call(id_gt=12, synchronize=False), mock.call_args)
-        mock.reset_mock()
+        self.assertEqual(0, mock.call_count)
 
     async def test_find_by_uuid(self):
         await self.populate_and_synchronize()
@@ -571,6 +564,43 @@ class SnapshotRepositoryTestCase(MinosTestCase, ABC):
         with self.assertRaises(AlreadyDeletedException):
             await self.snapshot_repository.get(self.Car, self.uuid_2, transaction=TransactionEntry(self.transaction_2))
 
+    async def test_get_many(self):
+        await self.populate_and_synchronize()
+        observed = await self.snapshot_repository.get_many(self.Car, [self.uuid_3, self.uuid_2])
+
+        expected = [
+            self.Car(
+                3,
+                "blue",
+                uuid=self.uuid_3,
+                version=1,
+                created_at=observed[0].created_at,
+                updated_at=observed[0].updated_at,
+            ),
+            self.Car(
+                3,
+                "blue",
+                uuid=self.uuid_2,
+                version=2,
+                created_at=observed[1].created_at,
+                updated_at=observed[1].updated_at,
+            ),
+        ]
+        self.assertEqual(expected, observed)
+
+    async def test_get_many_empty(self):
+        await self.populate_and_synchronize()
+        observed = await self.snapshot_repository.get_many(self.Car, [])
+
+        self.assertEqual([], observed)
+
+    async def test_get_many_raises(self):
+        await self.populate_and_synchronize()
+        with self.assertRaises(AlreadyDeletedException):
+            await self.snapshot_repository.get_many(self.Car, [self.uuid_2, self.uuid_1])
+        with self.assertRaises(NotFoundException):
+            await self.snapshot_repository.get_many(self.Car, [self.uuid_2, uuid4()])
+
     async def test_find(self):
         await self.populate_and_synchronize()
         condition = Condition.EQUAL("color", "blue")
@@ -597,6 +627,27 @@ class SnapshotRepositoryTestCase(MinosTestCase, ABC):
         ]
         self.assertEqual(expected, observed)
 
+    async def test_find_page(self):
+        await self.populate_and_synchronize()
+        uuids = sorted([self.uuid_2, self.uuid_3])
+
+        first = await self.snapshot_repository.find_page(self.Car, Condition.TRUE, page_size=1)
+        self.assertEqual([uuids[0]], [v.uuid for v in first.items])
+        self.assertEqual((uuids[0], uuids[0]), first.cursor)
+
+        second = await self.snapshot_repository.find_page(self.Car, Condition.TRUE, page_size=1, after=first.cursor)
+        self.assertEqual([uuids[1]], [v.uuid for v in second.items])
+        self.assertIsNone(second.cursor)
+
+    async def test_find_paginated(self):
+        await self.populate_and_synchronize()
+        uuids = sorted([self.uuid_2, self.uuid_3], reverse=True)
+
+        iterable = self.snapshot_repository.find_paginated(self.Car, Condition.TRUE, Ordering.DESC("color"), 1)
+        observed = [v async for v in iterable]
+
+        self.assertEqual(uuids, [v.uuid for v in observed])
+
     async def test_find_all(self):
         await self.populate_and_synchronize()
         iterable = self.snapshot_repository.find(self.Car, Condition.TRUE, Ordering.ASC("updated_at"))
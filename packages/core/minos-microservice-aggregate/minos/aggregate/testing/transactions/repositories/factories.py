@@ -58,5 +58,9 @@ class MockedTransactionDatabaseOperationFactory(TransactionDatabaseOperationFact
         """For testing purposes."""
         return MockedDatabaseOperation("select")
 
+    def build_query_ancestry(self, uuid: UUID) -> DatabaseOperation:
+        """For testing purposes."""
+        return MockedDatabaseOperation("select_ancestry")
+
 
 MockedDatabaseClient.set_factory(TransactionDatabaseOperationFactory, MockedTransactionDatabaseOperationFactory)
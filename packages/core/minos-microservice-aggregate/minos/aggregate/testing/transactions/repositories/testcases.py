@@ -8,10 +8,14 @@ from uuid import (
 
 from minos.aggregate import (
     TransactionEntry,
+    TransactionNotFoundException,
     TransactionRepository,
     TransactionRepositoryConflictException,
     TransactionStatus,
 )
+from minos.common import (
+    NULL_UUID,
+)
 from minos.common.testing import (
     MinosTestCase,
 )
@@ -145,6 +149,25 @@ class TransactionRepositoryTestCase(MinosTestCase, ABC):
         with self.assertRaises(TransactionRepositoryConflictException):
             await self.transaction_repository.submit(TransactionEntry(self.uuid, TransactionStatus.REJECTED, 34))
 
+    async def test_get_ancestry(self):
+        await self.populate()
+        await self.transaction_repository.submit(
+            TransactionEntry(self.uuid, TransactionStatus.PENDING, 34, self.uuid_5)
+        )
+
+        observed = await self.transaction_repository.get_ancestry(self.uuid)
+        self.assertEqual((NULL_UUID, self.uuid_1, self.uuid_5, self.uuid), observed)
+
+    async def test_get_ancestry_root(self):
+        await self.populate()
+
+        observed = await self.transaction_repository.get_ancestry(self.uuid_2)
+        self.assertEqual((NULL_UUID, self.uuid_2), observed)
+
+    async def test_get_ancestry_raises(self):
+        with self.assertRaises(TransactionNotFoundException):
+            await self.transaction_repository.get_ancestry(uuid4())
+
     async def test_select_empty(self):
         expected = []
         observed = [v async for v in self.transaction_repository.select()]
@@ -64,6 +64,7 @@ class TransactionEntry:
         "_event_repository",
         "_transaction_repository",
         "_token",
+        "_uuids",
     )
 
     def __init__(
@@ -117,6 +118,7 @@ class TransactionEntry:
         self._transaction_repository = transaction_repository
 
         self._token = None
+        self._uuids = None
 
     async def __aenter__(self):
         if self.status != TransactionStatus.PENDING:
@@ -172,8 +174,10 @@ class TransactionEntry:
         if self.status != TransactionStatus.PENDING:
             raise ValueError(f"Current status is not {TransactionStatus.PENDING!r}. Obtained: {self.status!r}")
 
+        uuids = {entry.uuid async for entry in self._event_repository.select(transaction_uuid=self.uuid)}
+
         async with self._transaction_repository.write_lock():
-            async with self._event_repository.write_lock():
+            async with self._event_repository.write_lock(*uuids):
                 await self.save(status=TransactionStatus.RESERVING)
 
                 committable = await self.validate()
@@ -270,17 +274,25 @@ class TransactionEntry:
     async def uuids(self) -> tuple[UUID, ...]:
         """Get the sequence of transaction identifiers, from the outer one (``NULL_UUID``) to the one related with self.
 
+        The sequence is resolved once and then memoized, as the destination of a transaction cannot change once it has
+        been set.
+
         :return: A tuple of ``UUID`` values.
         """
-        uuids = []
-        current = self
+        if self._uuids is None or self._uuids[-2:] != (self.destination_uuid, self.uuid):
+            self._uuids = (*(await self._get_destination_uuids()), self.uuid)
 
-        while current is not None:
-            uuids.append(current.uuid)
-            current = await current.destination
+        return self._uuids
 
-        # noinspection PyRedundantParentheses
-        return (NULL_UUID, *uuids[::-1])
+    async def _get_destination_uuids(self) -> tuple[UUID, ...]:
+        if self.destination_uuid == NULL_UUID:
+            return (NULL_UUID,)
+
+        destination = getattr(self._token, "old_value", Token.MISSING)
+        if destination == Token.MISSING:
+            return await self._transaction_repository.get_ancestry(self.destination_uuid)
+
+        return await destination.uuids
 
     @property
     async def destination(self) -> Optional[TransactionEntry]:
@@ -6,6 +6,9 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections import (
+    OrderedDict,
+)
 from datetime import (
     datetime,
 )
@@ -18,6 +21,7 @@ from uuid import (
 )
 
 from minos.common import (
+    NULL_UUID,
     Inject,
     Injectable,
     Lock,
@@ -42,7 +46,12 @@ class TransactionRepository(ABC, SetupMixin):
 
     @Inject()
     def __init__(
-        self, lock_pool: Optional[LockPool] = None, pool_factory: Optional[PoolFactory] = None, *args, **kwargs
+        self,
+        lock_pool: Optional[LockPool] = None,
+        pool_factory: Optional[PoolFactory] = None,
+        *args,
+        ancestry_cache_size: int = 1024,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
 
@@ -54,6 +63,9 @@ class TransactionRepository(ABC, SetupMixin):
 
         self._lock_pool = lock_pool
 
+        self._ancestry_cache_size = ancestry_cache_size
+        self._ancestries: OrderedDict[UUID, tuple[UUID, ...]] = OrderedDict()
+
     async def submit(self, transaction: TransactionEntry) -> TransactionEntry:
         """Submit a new or updated transaction to store it on the repository.
 
@@ -79,6 +91,41 @@ class TransactionRepository(ABC, SetupMixin):
         except StopAsyncIteration:
             raise TransactionNotFoundException(f"Transaction identified by {uuid!r} does not exist.")
 
+    async def get_ancestry(self, uuid: UUID) -> tuple[UUID, ...]:
+        """Get the sequence of transaction identifiers, from the outer one (``NULL_UUID``) to the given one.
+
+        The sequences are memoized, as the destination of a transaction cannot change once it has been stored.
+
+        :param uuid: Identifier of the transaction.
+        :return: A tuple of ``UUID`` values.
+        """
+        if uuid == NULL_UUID:
+            return (NULL_UUID,)
+
+        ancestry = self._ancestries.get(uuid)
+        if ancestry is None:
+            ancestry = await self._get_ancestry(uuid)
+            self._ancestries[uuid] = ancestry
+            while len(self._ancestries) > self._ancestry_cache_size:
+                self._ancestries.popitem(last=False)
+        else:
+            self._ancestries.move_to_end(uuid)
+
+        return ancestry
+
+    async def _get_ancestry(self, uuid: UUID) -> tuple[UUID, ...]:
+        uuids = [uuid]
+        while True:
+            destination_uuid = (await self.get(uuid=uuids[-1])).destination_uuid
+            if destination_uuid == NULL_UUID:
+                break
+            if (ancestry := self._ancestries.get(destination_uuid)) is not None:
+                return (*ancestry, *uuids[::-1])
+            uuids.append(destination_uuid)
+
+        # noinspection PyRedundantParentheses
+        return (NULL_UUID, *uuids[::-1])
+
     async def select(
         self,
         uuid: Optional[UUID] = None,
@@ -94,3 +94,12 @@ class TransactionDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :param kwargs: Additional named arguments.
         :return: A ``DatabaseOperation`` instance.
         """
+
+    @abstractmethod
+    def build_query_ancestry(self, uuid: UUID) -> DatabaseOperation:
+        """Build the database operation to select the ancestry of a transaction in a single query.
+
+        :param uuid: The identifier of the transaction.
+        :return: A ``DatabaseOperation`` instance that returns ``(uuid, destination_uuid)`` rows, from the outer
+            transaction to the given one.
+        """
@@ -6,13 +6,18 @@ from typing import (
     AsyncIterator,
     Optional,
 )
+from uuid import (
+    UUID,
+)
 
 from minos.common import (
+    NULL_UUID,
     DatabaseMixin,
     ProgrammingException,
 )
 
 from ....exceptions import (
+    TransactionNotFoundException,
     TransactionRepositoryConflictException,
 )
 from ...entries import (
@@ -52,6 +57,16 @@ class DatabaseTransactionRepository(DatabaseMixin[TransactionDatabaseOperationFa
         transaction.updated_at = updated_at
         return transaction
 
+    async def _get_ancestry(self, uuid: UUID) -> tuple[UUID, ...]:
+        operation = self.database_operation_factory.build_query_ancestry(uuid)
+        rows = [row async for row in self.execute_on_database_and_fetch_all(operation)]
+
+        if not len(rows) or rows[0][1] != NULL_UUID:
+            raise TransactionNotFoundException(f"The ancestry of the transaction {uuid!r} could not be resolved.")
+
+        # noinspection PyRedundantParentheses
+        return (NULL_UUID, *(row[0] for row in rows))
+
     async def _select(self, streaming_mode: Optional[bool] = None, **kwargs) -> AsyncIterator[TransactionEntry]:
         operation = self.database_operation_factory.build_query(**kwargs)
         async for row in self.execute_on_database_and_fetch_all(operation, streaming_mode=streaming_mode):
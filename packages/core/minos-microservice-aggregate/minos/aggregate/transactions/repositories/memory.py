@@ -1,8 +1,12 @@
+from collections import (
+    defaultdict,
+)
 from datetime import (
     datetime,
 )
 from typing import (
     AsyncIterator,
+    Iterable,
     Optional,
 )
 from uuid import (
@@ -26,11 +30,18 @@ from .abc import (
 
 
 class InMemoryTransactionRepository(TransactionRepository):
-    """In Memory Transaction Repository class."""
+    """In Memory Transaction Repository class.
+
+    The transactions are indexed by ``destination_uuid`` and ``status``, so that the queries only have to filter the
+    transactions of the most selective index instead of all of them.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._storage = dict()
+        self._positions: dict[UUID, int] = dict()
+        self._destination_uuid_index: defaultdict[UUID, set[UUID]] = defaultdict(set)
+        self._status_index: defaultdict[s, set[UUID]] = defaultdict(set)
 
     async def _submit(self, transaction: TransactionEntry) -> TransactionEntry:
         transaction.updated_at = current_datetime()
@@ -49,6 +60,15 @@ class InMemoryTransactionRepository(TransactionRepository):
                     f"{transaction!r} status is invalid respect to the previous one."
                 )
 
+        if (previous := self._storage.get(transaction.uuid)) is not None:
+            self._destination_uuid_index[previous.destination_uuid].discard(transaction.uuid)
+            self._status_index[previous.status].discard(transaction.uuid)
+        else:
+            self._positions[transaction.uuid] = len(self._positions)
+
+        self._destination_uuid_index[transaction.destination_uuid].add(transaction.uuid)
+        self._status_index[transaction.status].add(transaction.uuid)
+
         self._storage[transaction.uuid] = TransactionEntry(
             uuid=transaction.uuid,
             destination_uuid=transaction.destination_uuid,
@@ -118,7 +138,44 @@ class InMemoryTransactionRepository(TransactionRepository):
                 return False
             return True
 
-        iterable = iter(self._storage.values())
+        iterable = self._get_candidates(
+            uuid=uuid, uuid_in=uuid_in, destination_uuid=destination_uuid, status=status, status_in=status_in
+        )
         iterable = filter(_fn_filter, iterable)
         for item in iterable:
             yield item
+
+    def _get_candidates(
+        self,
+        uuid: Optional[UUID],
+        uuid_in: Optional[tuple[UUID, ...]],
+        destination_uuid: Optional[UUID],
+        status: Optional[s],
+        status_in: Optional[tuple[str, ...]],
+    ) -> Iterable[TransactionEntry]:
+        indexed = list()
+        if uuid is not None:
+            indexed.append({uuid})
+        if uuid_in is not None:
+            indexed.append(set(uuid_in))
+        if destination_uuid is not None:
+            indexed.append(self._destination_uuid_index.get(destination_uuid, set()))
+        if status is not None:
+            indexed.append(self._get_status_uuids(status))
+        if status_in is not None:
+            indexed.append(set().union(*(self._get_status_uuids(value) for value in status_in)))
+
+        if not len(indexed):
+            return list(self._storage.values())
+
+        uuids = [uuid for uuid in min(indexed, key=len) if uuid in self._storage]
+        uuids.sort(key=self._positions.__getitem__)
+        return [self._storage[uuid] for uuid in uuids]
+
+    def _get_status_uuids(self, status: str) -> set[UUID]:
+        if not isinstance(status, s):
+            try:
+                status = s.value_of(status)
+            except ValueError:
+                return set()
+        return self._status_index.get(status, set())
@@ -86,6 +86,17 @@ class TestRootEntity(AggregateTestCase):
 
         self.assertEqual(original, recovered)
 
+    async def test_get_many(self):
+        originals = list(
+            await gather(
+                Car.create(doors=3, color="blue"),
+                Car.create(doors=5, color="red"),
+            )
+        )
+        recovered = await Car.get_many([originals[1].uuid, originals[0].uuid])
+
+        self.assertEqual([originals[1], originals[0]], recovered)
+
     async def test_get_raises(self):
         with self.assertRaises(NotFoundException):
             await Car.get(NULL_UUID)
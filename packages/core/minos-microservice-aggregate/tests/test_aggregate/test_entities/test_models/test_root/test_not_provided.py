@@ -27,6 +27,11 @@ class TestRootEntityNotProvided(AggregateTestCase):
             # noinspection PyTypeChecker
             await Car.get(uuid4(), _snapshot_repository=None)
 
+    async def test_get_many_raises(self):
+        with self.assertRaises(NotProvidedException):
+            # noinspection PyTypeChecker
+            await Car.get_many([uuid4()], _snapshot_repository=None)
+
     async def test_get_all_raises(self):
         with self.assertRaises(NotProvidedException):
             # noinspection PyTypeChecker
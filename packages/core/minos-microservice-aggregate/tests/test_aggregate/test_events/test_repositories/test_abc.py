@@ -2,9 +2,20 @@ import unittest
 from abc import (
     ABC,
 )
+from asyncio import (
+    Lock,
+    gather,
+    sleep,
+)
+from collections import (
+    defaultdict,
+)
 from collections.abc import (
     AsyncIterator,
 )
+from itertools import (
+    count,
+)
 from unittest.mock import (
     AsyncMock,
     MagicMock,
@@ -178,6 +189,7 @@ class TestEventRepository(AggregateTestCase):
         self.assertEqual(Action.UPDATE, observed.action)
         self.assertEqual(created_at, observed.created_at)
         self.assertEqual(NULL_UUID, observed.transaction_uuid)
+        self.assertEqual(12, self.event_repository.local_offset)
 
     async def test_submit_in_transaction(self):
         created_at = current_datetime()
@@ -270,6 +282,7 @@ class TestEventRepository(AggregateTestCase):
             ),
             observed[0].content,
         )
+        self.assertEqual(56, observed[0].priority)
         self.assertEqual("CarUpdated.colors.create", observed[1].topic)
         self.assertIsInstance(observed[1], BrokerMessageV1)
         self.assertEqual(
@@ -283,6 +296,7 @@ class TestEventRepository(AggregateTestCase):
             ),
             observed[1].content,
         )
+        self.assertEqual(56, observed[1].priority)
 
     async def test_submit_not_send_events(self):
         created_at = current_datetime()
@@ -337,6 +351,7 @@ class TestEventRepository(AggregateTestCase):
     async def test_submit_context_var(self):
         mocked_event = AsyncMock()
         mocked_event.action = Action.CREATE
+        mocked_event.id = 1
 
         async def _fn(entry):
             self.assertEqual(True, IS_REPOSITORY_SERIALIZATION_CONTEXT_VAR.get())
@@ -453,14 +468,161 @@ class TestEventRepository(AggregateTestCase):
             select_transaction_mock.call_args_list,
         )
 
-    def test_write_lock(self):
-        expected = FakeLock()
-        mock = MagicMock(return_value=expected)
+    async def test_submit_many(self):
+        uuid_1, uuid_2 = uuid4(), uuid4()
+
+        async def _fn(entries: list[EventEntry]) -> list[EventEntry]:
+            for id_, entry in enumerate(entries, start=1):
+                entry.id = id_
+            return entries
+
+        submit_mock = AsyncMock(side_effect=_fn)
+        send_events_mock = AsyncMock()
+        validate_mock = AsyncMock(return_value=True)
+        self.event_repository._submit_many = submit_mock
+        self.event_repository._send_events = send_events_mock
+        self.event_repository.validate_many = validate_mock
+
+        entries = [
+            EventEntry(uuid_1, "example.Car", 1, action=Action.CREATE),
+            EventEntry(uuid_2, "example.Car", 1, action=Action.CREATE, transaction_uuid=uuid4()),
+        ]
+        with patch.object(EventEntry, "event", new_callable=PropertyMock, return_value="foo"):
+            observed = await self.event_repository.submit_many(entries)
+
+        self.assertEqual(entries, observed)
+        self.assertEqual([call(entries)], validate_mock.call_args_list)
+        self.assertEqual([call(entries)], submit_mock.call_args_list)
+        self.assertEqual([call("foo")], send_events_mock.call_args_list)
+        self.assertEqual(2, self.event_repository.local_offset)
+
+    async def test_submit_many_raises_missing_action(self):
+        entry = EventEntry(uuid4(), "example.Car", 0, bytes())
+        with self.assertRaises(EventRepositoryException):
+            await self.event_repository.submit_many([entry])
+
+    async def test_submit_many_raises_conflict(self):
+        self.event_repository.validate_many = AsyncMock(return_value=False)
+
+        entry = EventEntry(uuid4(), "example.Car", 0, bytes(), action=Action.CREATE)
+        with self.assertRaises(EventRepositoryConflictException):
+            await self.event_repository.submit_many([entry])
+
+    async def test_validate_many_true(self):
+        uuid_1, uuid_2 = uuid4(), uuid4()
+        transaction_uuid = uuid4()
+
+        transactions = [TransactionEntry(transaction_uuid, TransactionStatus.RESERVING)]
+
+        select_event_mock = MagicMock(return_value=FakeAsyncIterator([]))
+        self.event_repository.select = select_event_mock
+
+        select_transaction_mock = MagicMock(return_value=FakeAsyncIterator(transactions))
+        self.transaction_repository.select = select_transaction_mock
+
+        entries = [EventEntry(uuid_1, "example.Car"), EventEntry(uuid_2, "example.Car")]
+
+        self.assertTrue(await self.event_repository.validate_many(entries))
+
+        self.assertEqual(1, select_event_mock.call_count)
+        self.assertEqual({uuid_1, uuid_2}, set(select_event_mock.call_args.kwargs["uuid_in"]))
+        self.assertEqual((transaction_uuid,), select_event_mock.call_args.kwargs["transaction_uuid_in"])
+        self.assertEqual(
+            [
+                call(
+                    destination_uuid=NULL_UUID,
+                    uuid_ne=None,
+                    status_in=(TransactionStatus.RESERVING, TransactionStatus.RESERVED, TransactionStatus.COMMITTING),
+                )
+            ],
+            select_transaction_mock.call_args_list,
+        )
+
+    async def test_validate_many_false(self):
+        uuid_1, uuid_2 = uuid4(), uuid4()
+        transaction_uuid = uuid4()
+
+        events = [EventEntry(uuid_2, "example.Car", 2, transaction_uuid=transaction_uuid)]
+        transactions = [TransactionEntry(transaction_uuid, TransactionStatus.RESERVED)]
+
+        self.event_repository.select = MagicMock(return_value=FakeAsyncIterator(events))
+        self.transaction_repository.select = MagicMock(return_value=FakeAsyncIterator(transactions))
+
+        entries = [EventEntry(uuid_1, "example.Car"), EventEntry(uuid_2, "example.Car")]
+
+        self.assertFalse(await self.event_repository.validate_many(entries))
+
+    async def test_write_lock(self):
+        uuid_1, uuid_2 = uuid4(), uuid4()
+        mock = MagicMock(side_effect=lambda key: FakeLock(key))
 
         self.pool_factory.get_pool("lock").acquire = mock
 
-        self.assertEqual(expected, self.event_repository.write_lock())
-        self.assertEqual([call("aggregate_event_write_lock")], mock.call_args_list)
+        async with self.event_repository.write_lock(uuid_1, NULL_UUID, uuid_2, uuid_1):
+            pass
+
+        expected = [call(key) for key in sorted({uuid_1.int >> 65, uuid_2.int >> 65})]
+        self.assertEqual(expected, mock.call_args_list)
+
+    async def test_write_lock_empty(self):
+        mock = MagicMock(side_effect=lambda key: FakeLock(key))
+
+        self.pool_factory.get_pool("lock").acquire = mock
+
+        async with self.event_repository.write_lock(NULL_UUID):
+            pass
+
+        self.assertEqual([], mock.call_args_list)
+
+    async def test_submit_locks_by_uuid(self):
+        uuid = uuid4()
+        mock = MagicMock(side_effect=lambda key: FakeLock(key))
+
+        self.pool_factory.get_pool("lock").acquire = mock
+        self.event_repository._submit = AsyncMock(side_effect=lambda entry, **kwargs: entry)
+        self.event_repository.validate = AsyncMock(return_value=True)
+
+        await self.event_repository.submit(
+            EventEntry(uuid, "example.Car", 1, action=Action.UPDATE, transaction_uuid=uuid4())
+        )
+
+        self.assertEqual([call(uuid.int >> 65), call("aggregate_event_insert_lock")], mock.call_args_list)
+
+    async def test_submit_concurrent_commits_in_id_order(self):
+        locks = defaultdict(Lock)
+
+        class _Lock(FakeLock):
+            async def acquire(self) -> None:
+                await locks[self.key].acquire()
+
+            async def release(self):
+                locks[self.key].release()
+
+        self.pool_factory.get_pool("lock").acquire = MagicMock(side_effect=lambda key: _Lock(key))
+        self.event_repository.validate = AsyncMock(return_value=True)
+
+        ids = count(1)
+        committed = list()
+
+        async def _submit(entry, **kwargs):
+            entry.id = next(ids)
+            # The first allocated identifier takes longer to be committed.
+            await sleep(0.02 if entry.id == 1 else 0)
+            committed.append(entry.id)
+            return entry
+
+        self.event_repository._submit = _submit
+
+        await gather(
+            self.event_repository.submit(
+                EventEntry(uuid4(), "example.Car", 1, action=Action.UPDATE, transaction_uuid=uuid4())
+            ),
+            self.event_repository.submit(
+                EventEntry(uuid4(), "example.Car", 1, action=Action.UPDATE, transaction_uuid=uuid4())
+            ),
+        )
+
+        self.assertEqual([1, 2], committed)
 
     async def test_select(self):
         mock = MagicMock(return_value=FakeAsyncIterator(range(5)))
@@ -476,6 +638,7 @@ class TestEventRepository(AggregateTestCase):
         self.assertEqual(1, mock.call_count)
         args = call(
             uuid=uuid,
+            uuid_in=None,
             name=classname(Car),
             version=None,
             version_lt=None,
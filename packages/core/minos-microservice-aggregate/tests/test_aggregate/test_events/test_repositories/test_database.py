@@ -13,7 +13,9 @@ from uuid import (
 from minos.aggregate import (
     Action,
     DatabaseEventRepository,
+    EventEntry,
     EventRepository,
+    EventRepositoryConflictException,
 )
 from minos.aggregate.testing import (
     EventRepositoryTestCase,
@@ -73,6 +75,30 @@ class TestDatabaseEventRepositorySubmit(AggregateTestCase, EventRepositoryTestCa
             with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator(fetch_all)):
                 await super().test_submit_with_created_at()
 
+    async def test_submit_many(self):
+        rows = [
+            (1, self.uuid_1, 1, current_datetime()),
+            (2, self.uuid_2, 1, current_datetime()),
+            (3, self.uuid_1, 2, current_datetime()),
+        ]
+        fetch_all = [
+            (self.uuid_1, "example.Car", 1, bytes(), 1, Action.CREATE, current_datetime()),
+            (self.uuid_2, "example.Car", 1, bytes(), 2, Action.CREATE, current_datetime()),
+            (self.uuid_1, "example.Car", 2, bytes(), 3, Action.UPDATE, current_datetime()),
+        ]
+        with patch.object(
+            DatabaseClient, "fetch_all", side_effect=[FakeAsyncIterator(rows), FakeAsyncIterator(fetch_all)]
+        ):
+            await super().test_submit_many()
+
+    async def test_submit_many_raises_duplicate(self):
+        with patch.object(DatabaseClient, "fetch_all", side_effect=IntegrityException("")):
+            with patch.object(DatabaseClient, "fetch_one", return_value=(1,)):
+                with self.assertRaises(EventRepositoryConflictException):
+                    await self.event_repository.submit_many(
+                        [EventEntry(self.uuid, "example.Car", 1, action=Action.CREATE)]
+                    )
+
     async def test_submit_raises_duplicate(self):
         fetch_one = [
             (1, uuid4(), 1, current_datetime()),
@@ -223,6 +249,23 @@ class TestDatabaseEventRepositorySubmit(AggregateTestCase, EventRepositoryTestCa
         ):
             await super().test_select_uuid()
 
+    async def test_select_uuid_in(self):
+        with patch.object(
+            DatabaseClient,
+            "fetch_all",
+            return_value=FakeAsyncIterator(
+                [
+                    tuple(self.entries[2].as_raw().values()),
+                    tuple(self.entries[5].as_raw().values()),
+                    tuple(self.entries[6].as_raw().values()),
+                    tuple(self.entries[7].as_raw().values()),
+                    tuple(self.entries[8].as_raw().values()),
+                    tuple(self.entries[9].as_raw().values()),
+                ]
+            ),
+        ):
+            await super().test_select_uuid_in()
+
     async def test_select_name(self):
         with patch.object(
             DatabaseClient,
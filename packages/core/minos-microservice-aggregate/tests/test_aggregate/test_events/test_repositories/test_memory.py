@@ -19,6 +19,41 @@ class TestInMemoryEventRepositorySubmit(AggregateTestCase, EventRepositoryTestCa
         """For testing purposes."""
         return InMemoryEventRepository()
 
+    async def test_select_combined_indexes(self):
+        await self.populate()
+
+        iterable = self.event_repository.select(
+            name="example.Car", id_gt=3, id_le=9, transaction_uuid_in=(self.first_transaction, self.second_transaction)
+        )
+        observed = [v async for v in iterable]
+
+        self.assertEqual([8, 9], [v.id for v in observed])
+
+    async def test_select_unknown_index_value(self):
+        await self.populate()
+
+        observed = [v async for v in self.event_repository.select(uuid=self.uuid, id_ge=1)]
+
+        self.assertEqual([], observed)
+
+    async def test_select_uses_index(self):
+        await self.populate()
+
+        observed = self.event_repository._get_candidates(
+            uuid=self.uuid_2,
+            uuid_in=None,
+            name="example.Car",
+            transaction_uuid=None,
+            transaction_uuid_in=None,
+            id=None,
+            id_lt=None,
+            id_gt=4,
+            id_le=None,
+            id_ge=None,
+        )
+
+        self.assertEqual([6, 8, 9, 10], [v.id for v in observed])
+
 
 if __name__ == "__main__":
     unittest.main()
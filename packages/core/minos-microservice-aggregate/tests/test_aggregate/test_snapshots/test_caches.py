@@ -0,0 +1,221 @@
+import unittest
+from uuid import (
+    uuid4,
+)
+
+from minos.aggregate import (
+    SnapshotEntry,
+    SnapshotEntryCache,
+    SnapshotSchemaCache,
+)
+from minos.common import (
+    NULL_UUID,
+    MinosJsonBinaryProtocol,
+)
+
+
+class TestSnapshotEntryCache(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.uuid_1 = uuid4()
+        self.uuid_2 = uuid4()
+        self.transaction_uuid = uuid4()
+
+        self.cache = SnapshotEntryCache(max_size=2)
+
+    def test_constructor(self):
+        cache = SnapshotEntryCache()
+
+        self.assertEqual(1024, cache.max_size)
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, cache.misses)
+        self.assertEqual(0, cache.generation)
+
+    def test_constructor_raises(self):
+        with self.assertRaises(ValueError):
+            SnapshotEntryCache(max_size=0)
+
+    def test_get_put(self):
+        key = ("Car", self.uuid_1, NULL_UUID)
+        entry = SnapshotEntry(self.uuid_1, "Car", 1)
+
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, entry)
+        self.assertEqual(entry, self.cache.get(key))
+
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_put_older_version(self):
+        key = ("Car", self.uuid_1, NULL_UUID)
+        entry = SnapshotEntry(self.uuid_1, "Car", 2)
+
+        self.cache.put(key, entry)
+        self.cache.put(key, SnapshotEntry(self.uuid_1, "Car", 1))
+
+        self.assertEqual(entry, self.cache.get(key))
+
+    def test_put_outdated_generation(self):
+        key = ("Car", self.uuid_1, NULL_UUID)
+        generation = self.cache.generation
+
+        self.cache.invalidate(self.uuid_2)
+        self.cache.put(key, SnapshotEntry(self.uuid_1, "Car", 1), generation)
+
+        self.assertNotIn(key, self.cache)
+
+    def test_put_evicts_least_recently_used(self):
+        key_1 = ("Car", self.uuid_1, NULL_UUID)
+        key_2 = ("Car", self.uuid_2, NULL_UUID)
+        key_3 = ("Car", self.uuid_1, self.transaction_uuid)
+
+        self.cache.put(key_1, SnapshotEntry(self.uuid_1, "Car", 1))
+        self.cache.put(key_2, SnapshotEntry(self.uuid_2, "Car", 1))
+        self.cache.get(key_1)
+        self.cache.put(key_3, SnapshotEntry(self.uuid_1, "Car", 2))
+
+        self.assertEqual(2, len(self.cache))
+        self.assertIn(key_1, self.cache)
+        self.assertNotIn(key_2, self.cache)
+        self.assertIn(key_3, self.cache)
+
+    def test_invalidate(self):
+        key_1 = ("Car", self.uuid_1, NULL_UUID)
+        key_2 = ("Car", self.uuid_1, self.transaction_uuid)
+        self.cache.put(key_1, SnapshotEntry(self.uuid_1, "Car", 1))
+        self.cache.put(key_2, SnapshotEntry(self.uuid_1, "Car", 2))
+
+        self.cache.invalidate(self.uuid_1)
+
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(1, self.cache.generation)
+
+    def test_invalidate_with_version(self):
+        key_1 = ("Car", self.uuid_1, NULL_UUID)
+        key_2 = ("Car", self.uuid_1, self.transaction_uuid)
+        self.cache.put(key_1, SnapshotEntry(self.uuid_1, "Car", 1))
+        self.cache.put(key_2, SnapshotEntry(self.uuid_1, "Car", 3))
+
+        self.cache.invalidate(self.uuid_1, 2)
+
+        self.assertNotIn(key_1, self.cache)
+        self.assertIn(key_2, self.cache)
+
+    def test_invalidate_transactions(self):
+        key_1 = ("Car", self.uuid_1, NULL_UUID)
+        key_2 = ("Car", self.uuid_1, self.transaction_uuid)
+        self.cache.put(key_1, SnapshotEntry(self.uuid_1, "Car", 1))
+        self.cache.put(key_2, SnapshotEntry(self.uuid_1, "Car", 2))
+
+        self.cache.invalidate_transactions([self.transaction_uuid])
+
+        self.assertIn(key_1, self.cache)
+        self.assertNotIn(key_2, self.cache)
+
+    def test_clear(self):
+        self.cache.put(("Car", self.uuid_1, NULL_UUID), SnapshotEntry(self.uuid_1, "Car", 1))
+
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(1, self.cache.generation)
+
+
+class TestSnapshotSchemaCache(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = {"type": "record", "name": "example.Car", "fields": [{"name": "color", "type": "string"}]}
+        self.encoded = MinosJsonBinaryProtocol.encode(self.schema)
+        self.hash = SnapshotSchemaCache.hash(self.encoded)
+
+        self.cache = SnapshotSchemaCache()
+
+    def test_hash(self):
+        self.assertEqual(32, len(self.hash))
+        self.assertEqual(self.hash, SnapshotSchemaCache.hash(MinosJsonBinaryProtocol.encode(self.schema)))
+        self.assertNotEqual(self.hash, SnapshotSchemaCache.hash(b"{}"))
+
+    def test_get_put(self):
+        self.assertIsNone(self.cache.get(self.hash))
+
+        observed = self.cache.put(self.hash, self.schema)
+
+        self.assertEqual(self.schema, observed)
+        self.assertEqual(self.schema, self.cache.get(self.hash))
+        self.assertIn(self.hash, self.cache)
+        self.assertEqual(1, len(self.cache))
+
+    def test_put_encoded(self):
+        self.assertEqual(self.schema, self.cache.put(self.hash, memoryview(self.encoded)))
+        self.assertEqual(self.schema, self.cache.get(self.hash))
+
+    def test_put_reuses_cached(self):
+        first = self.cache.put(self.hash, self.schema)
+        second = self.cache.put(self.hash, self.encoded)
+
+        self.assertIs(first, second)
+
+    def test_stored(self):
+        self.assertFalse(self.cache.is_stored(self.hash))
+
+        self.cache.put(self.hash, self.schema)
+        self.assertFalse(self.cache.is_stored(self.hash))
+
+        self.cache.mark_stored([self.hash])
+        self.assertTrue(self.cache.is_stored(self.hash))
+
+    def test_put_stored(self):
+        self.cache.put(self.hash, self.schema, stored=True)
+        self.assertTrue(self.cache.is_stored(self.hash))
+
+    def test_max_size(self):
+        cache = SnapshotSchemaCache(max_size=2)
+        hashes = [bytes([i]) * 32 for i in range(3)]
+
+        cache.put(hashes[0], self.schema, stored=True)
+        cache.put(hashes[1], self.schema, stored=True)
+        cache.get(hashes[0])
+        cache.put(hashes[2], self.schema, stored=True)
+
+        self.assertEqual(2, len(cache))
+        self.assertIn(hashes[0], cache)
+        self.assertNotIn(hashes[1], cache)
+        self.assertFalse(cache.is_stored(hashes[1]))
+
+    def test_max_size_raises(self):
+        with self.assertRaises(ValueError):
+            SnapshotSchemaCache(max_size=0)
+
+    def test_normalize(self):
+        schema = {
+            "type": "record",
+            "name": "Car",
+            "namespace": "example.5d3f",
+            "fields": [
+                {
+                    "name": "owner",
+                    "type": {"type": "record", "name": "Owner", "namespace": "example.8a1c", "fields": []},
+                },
+                {
+                    "name": "other",
+                    "type": {"type": "record", "name": "Owner", "namespace": "example.8a1c", "fields": []},
+                },
+            ],
+        }
+        expected = {
+            "type": "record",
+            "name": "Car",
+            "namespace": "example.0",
+            "fields": [
+                {"name": "owner", "type": {"type": "record", "name": "Owner", "namespace": "example.1", "fields": []}},
+                {"name": "other", "type": {"type": "record", "name": "Owner", "namespace": "example.1", "fields": []}},
+            ],
+        }
+
+        self.assertEqual(expected, SnapshotSchemaCache.normalize(schema))
+        self.assertEqual(expected, SnapshotSchemaCache.normalize(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
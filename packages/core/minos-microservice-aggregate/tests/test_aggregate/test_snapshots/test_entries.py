@@ -47,6 +47,7 @@ class TestSnapshotEntry(AggregateTestCase):
         self.assertEqual(self.data, entry.data)
         self.assertEqual(None, entry.created_at)
         self.assertEqual(None, entry.updated_at)
+        self.assertEqual(None, entry.schema_hash)
 
     def test_constructor_with_bytes_schema(self):
         raw = MinosJsonBinaryProtocol.encode(self.schema)
@@ -59,6 +60,11 @@ class TestSnapshotEntry(AggregateTestCase):
         entry = SnapshotEntry(self.uuid, "example.Car", 0, raw, self.data)
         self.assertEqual(self.schema, entry.schema)
 
+    def test_constructor_with_schema_hash(self):
+        entry = SnapshotEntry(self.uuid, "example.Car", 0, None, self.data, schema_hash=memoryview(b"hash"))
+        self.assertEqual(None, entry.schema)
+        self.assertEqual(b"hash", entry.schema_hash)
+
     def test_constructor_extended(self):
         entry = SnapshotEntry(
             self.uuid,
@@ -0,0 +1,73 @@
+import unittest
+
+from minos.aggregate import (
+    RootEntity,
+    SnapshotIndex,
+)
+
+
+class TestSnapshotIndex(unittest.TestCase):
+    def tearDown(self) -> None:
+        SnapshotIndex.register("path.to.Car", tuple())
+        super().tearDown()
+
+    def test_constructor(self):
+        index = SnapshotIndex("owner.name")
+        self.assertEqual("owner.name", index.field)
+
+    def test_constructor_raises(self):
+        with self.assertRaises(ValueError):
+            SnapshotIndex("")
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            SnapshotIndex(56)
+
+    def test_eq(self):
+        self.assertEqual(SnapshotIndex("color"), SnapshotIndex("color"))
+        self.assertNotEqual(SnapshotIndex("color"), SnapshotIndex("doors"))
+        self.assertEqual(hash(SnapshotIndex("color")), hash(SnapshotIndex("color")))
+
+    def test_repr(self):
+        self.assertEqual("SnapshotIndex('color')", repr(SnapshotIndex("color")))
+
+    def test_register(self):
+        SnapshotIndex.register("path.to.Car", ["color", SnapshotIndex("doors"), SnapshotIndex("color")])
+
+        self.assertEqual((SnapshotIndex("color"), SnapshotIndex("doors")), SnapshotIndex.get_registered("path.to.Car"))
+        self.assertIn("path.to.Car", SnapshotIndex.get_all_registered())
+
+    def test_register_empty(self):
+        SnapshotIndex.register("path.to.Car", ["color"])
+        SnapshotIndex.register("path.to.Car", [])
+
+        self.assertEqual(tuple(), SnapshotIndex.get_registered("path.to.Car"))
+        self.assertNotIn("path.to.Car", SnapshotIndex.get_all_registered())
+
+    def test_root_entity(self):
+        class _Car(RootEntity):
+            """For testing purposes."""
+
+            color: str
+            _snapshot_indexes = ("color",)
+
+        class _SubCar(_Car):
+            """For testing purposes."""
+
+        try:
+            self.assertEqual((SnapshotIndex("color"),), SnapshotIndex.get_registered(_Car.classname))
+            self.assertEqual((SnapshotIndex("color"),), SnapshotIndex.get_registered(_SubCar.classname))
+        finally:
+            SnapshotIndex.register(_Car.classname, tuple())
+            SnapshotIndex.register(_SubCar.classname, tuple())
+
+    def test_root_entity_without_indexes(self):
+        class _Car(RootEntity):
+            """For testing purposes."""
+
+            color: str
+
+        self.assertEqual(tuple(), SnapshotIndex.get_registered(_Car.classname))
+
+
+if __name__ == "__main__":
+    unittest.main()
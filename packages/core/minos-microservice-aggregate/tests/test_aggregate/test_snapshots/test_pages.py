@@ -0,0 +1,46 @@
+import unittest
+from uuid import (
+    uuid4,
+)
+
+from minos.aggregate import (
+    SnapshotPage,
+)
+from tests.utils import (
+    AggregateTestCase,
+    Car,
+)
+
+
+class TestSnapshotPage(AggregateTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.items = [Car(3, "red"), Car(5, "blue")]
+        self.cursor = ("blue", uuid4())
+
+    def test_constructor(self):
+        page = SnapshotPage(iter(self.items), self.cursor)
+
+        self.assertEqual(self.items, page.items)
+        self.assertEqual(self.cursor, page.cursor)
+        self.assertEqual(2, len(page))
+
+    def test_has_next(self):
+        self.assertTrue(SnapshotPage(self.items, self.cursor).has_next)
+        self.assertFalse(SnapshotPage(self.items).has_next)
+
+    def test_eq(self):
+        self.assertEqual(SnapshotPage(self.items, self.cursor), SnapshotPage(self.items, self.cursor))
+        self.assertNotEqual(SnapshotPage(self.items, self.cursor), SnapshotPage(self.items))
+        self.assertNotEqual(SnapshotPage(self.items), SnapshotPage(self.items[:1]))
+
+    def test_iter(self):
+        self.assertEqual((self.items, self.cursor), tuple(SnapshotPage(self.items, self.cursor)))
+
+    def test_repr(self):
+        page = SnapshotPage(self.items, self.cursor)
+        self.assertEqual(f"SnapshotPage({self.items!r}, {self.cursor!r})", repr(page))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,13 +17,16 @@ from uuid import (
 from minos.aggregate import (
     TRANSACTION_CONTEXT_VAR,
     Condition,
+    NotFoundException,
     Ordering,
     SnapshotEntry,
+    SnapshotPage,
     SnapshotRepository,
     TransactionEntry,
 )
 from minos.aggregate.queries import (
     _EqualCondition,
+    _InCondition,
 )
 from minos.common import (
     SetupMixin,
@@ -87,6 +90,38 @@ class TestSnapshotRepository(AggregateTestCase):
         )
         self.assertEqual(args, self.find_mock.call_args)
 
+    async def test_get_many(self):
+        transaction = TransactionEntry()
+        uuid = self.entries[0].uuid
+        observed = await self.snapshot_repository.get_many(self.classname, [uuid, uuid], transaction)
+        self.assertEqual([self.entries[0].build(), self.entries[0].build()], observed)
+
+        self.assertEqual(1, self.synchronize_mock.call_count)
+        self.assertEqual(call(synchronize=False), self.synchronize_mock.call_args)
+
+        self.assertEqual(1, self.find_mock.call_count)
+        args = call(
+            name=self.classname,
+            condition=_InCondition("uuid", {uuid}),
+            ordering=None,
+            limit=None,
+            streaming_mode=False,
+            transaction=transaction,
+            exclude_deleted=False,
+        )
+        self.assertEqual(args, self.find_mock.call_args)
+
+    async def test_get_many_empty(self):
+        observed = await self.snapshot_repository.get_many(self.classname, [])
+        self.assertEqual([], observed)
+
+        self.assertEqual(0, self.synchronize_mock.call_count)
+        self.assertEqual(0, self.find_mock.call_count)
+
+    async def test_get_many_raises(self):
+        with self.assertRaises(NotFoundException):
+            await self.snapshot_repository.get_many(self.classname, [self.entries[0].uuid, uuid4()])
+
     async def test_get_transaction_null(self):
         await self.snapshot_repository.get(self.classname, uuid4())
 
@@ -160,6 +195,78 @@ class TestSnapshotRepository(AggregateTestCase):
         self.assertEqual(1, self.find_mock.call_count)
         self.assertEqual(transaction, self.find_mock.call_args.kwargs["transaction"])
 
+    async def test_find_page(self):
+        instances = sorted((Car(3, "red") for _ in range(3)), key=lambda instance: instance.uuid)
+        self.find_mock.return_value = FakeAsyncIterator([SnapshotEntry.from_root_entity(i) for i in instances])
+
+        observed = await self.snapshot_repository.find_page(self.classname, Condition.TRUE, page_size=2)
+        self.assertEqual(SnapshotPage(instances[:2], (instances[1].uuid, instances[1].uuid)), observed)
+        self.assertTrue(observed.has_next)
+
+        args = call(
+            name=self.classname,
+            condition=Condition.TRUE,
+            ordering=Ordering.ASC("uuid"),
+            limit=3,
+            streaming_mode=False,
+            transaction=None,
+            exclude_deleted=True,
+        )
+        self.assertEqual([args], self.find_mock.call_args_list)
+
+    async def test_find_page_last(self):
+        instances = [Car(3, "red"), Car(3, "blue")]
+        self.find_mock.return_value = FakeAsyncIterator([SnapshotEntry.from_root_entity(i) for i in instances])
+
+        observed = await self.snapshot_repository.find_page(self.classname, Condition.TRUE, page_size=2)
+        self.assertEqual(SnapshotPage(instances, None), observed)
+        self.assertFalse(observed.has_next)
+
+    async def test_find_page_after(self):
+        uuid = uuid4()
+        await self.snapshot_repository.find_page(
+            self.classname, Condition.EQUAL("doors", 3), Ordering.DESC("color"), 2, after=("red", uuid)
+        )
+
+        expected = Condition.AND(
+            Condition.EQUAL("doors", 3),
+            Condition.OR(
+                Condition.LOWER("color", "red"),
+                Condition.AND(Condition.EQUAL("color", "red"), Condition.LOWER("uuid", uuid)),
+            ),
+        )
+        self.assertEqual(expected, self.find_mock.call_args.kwargs["condition"])
+        self.assertEqual(Ordering.DESC("color"), self.find_mock.call_args.kwargs["ordering"])
+
+    async def test_find_page_after_uuid(self):
+        uuid = uuid4()
+        await self.snapshot_repository.find_page(self.classname, Condition.TRUE, page_size=2, after=(uuid, uuid))
+
+        expected = Condition.AND(Condition.TRUE, Condition.GREATER("uuid", uuid))
+        self.assertEqual(expected, self.find_mock.call_args.kwargs["condition"])
+
+    async def test_find_page_raises(self):
+        with self.assertRaises(ValueError):
+            await self.snapshot_repository.find_page(self.classname, Condition.TRUE, page_size=0)
+
+    async def test_find_paginated(self):
+        instances = sorted((Car(3, "red") for _ in range(3)), key=lambda instance: instance.uuid)
+        self.find_mock.side_effect = [
+            FakeAsyncIterator([SnapshotEntry.from_root_entity(i) for i in instances[:3]]),
+            FakeAsyncIterator([SnapshotEntry.from_root_entity(i) for i in instances[2:]]),
+        ]
+
+        iterable = self.snapshot_repository.find_paginated(self.classname, Condition.TRUE, page_size=2)
+        observed = [a async for a in iterable]
+        self.assertEqual(instances, observed)
+
+        self.assertEqual(1, self.synchronize_mock.call_count)
+        self.assertEqual(2, self.find_mock.call_count)
+        self.assertEqual(
+            Condition.AND(Condition.TRUE, Condition.GREATER("uuid", instances[1].uuid)),
+            self.find_mock.call_args.kwargs["condition"],
+        )
+
     async def test_synchronize(self):
         await self.snapshot_repository.synchronize()
 
@@ -1,22 +1,35 @@
 import unittest
 from itertools import (
-    chain,
     cycle,
 )
 from unittest.mock import (
     MagicMock,
+    PropertyMock,
+    call,
     patch,
 )
 
 from minos.aggregate import (
+    Condition,
     DatabaseSnapshotRepository,
+    EventEntry,
+    FieldDiff,
+    FieldDiffContainer,
+    InMemoryEventRepository,
     SnapshotEntry,
+    SnapshotIndex,
     SnapshotRepository,
+    SnapshotRepositoryException,
+    SnapshotSchemaCache,
+    TransactionEntry,
 )
 from minos.aggregate.testing import (
     SnapshotRepositoryTestCase,
 )
 from minos.common import (
+    NULL_UUID,
+    ComposedDatabaseOperation,
+    Config,
     DatabaseClient,
     NotProvidedException,
     ProgrammingException,
@@ -41,6 +54,32 @@ class TestDatabaseSnapshotRepository(AggregateTestCase, SnapshotRepositoryTestCa
             # noinspection PyTypeChecker
             DatabaseSnapshotRepository(transaction_repository=None)
 
+    def test_synchronize_max_staleness_default(self):
+        self.assertEqual(0.0, DatabaseSnapshotRepository.from_config(self.config).synchronize_max_staleness)
+        self.assertEqual(
+            1.0, DatabaseSnapshotRepository.from_config(self.config, cache_size=10).synchronize_max_staleness
+        )
+        self.assertEqual(
+            0.0,
+            DatabaseSnapshotRepository.from_config(
+                self.config, cache_size=10, synchronize_max_staleness=0.0
+            ).synchronize_max_staleness,
+        )
+
+    def test_from_config_snapshot_options(self):
+        aggregate_config = self.config.get_aggregate() | {
+            "snapshot": {"synchronize_page_size": 4, "synchronize_max_staleness": 5.0, "cache_size": 10}
+        }
+
+        with patch.object(Config, "get_aggregate", return_value=aggregate_config):
+            snapshot_repository = DatabaseSnapshotRepository.from_config(self.config)
+            overridden = DatabaseSnapshotRepository.from_config(self.config, cache_size=20)
+
+        self.assertEqual(4, snapshot_repository._synchronize_page_size)
+        self.assertEqual(5.0, snapshot_repository.synchronize_max_staleness)
+        self.assertEqual(10, snapshot_repository.cache.max_size)
+        self.assertEqual(20, overridden.cache.max_size)
+
     async def test_is_synced(self):
         self.event_repository.select = MagicMock(side_effect=[FakeAsyncIterator([1]), FakeAsyncIterator([])])
 
@@ -52,51 +91,204 @@ class TestDatabaseSnapshotRepository(AggregateTestCase, SnapshotRepositoryTestCa
         return DatabaseSnapshotRepository.from_config(self.config)
 
     async def synchronize(self):
-        with patch.object(
-            DatabaseClient,
-            "fetch_one",
-            side_effect=[
-                ProgrammingException(""),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-            ],
-        ):
-            with patch.object(
-                DatabaseClient,
-                "fetch_all",
-                side_effect=chain(
-                    [
-                        FakeAsyncIterator([]),
-                        FakeAsyncIterator(
-                            [
-                                tuple(
-                                    SnapshotEntry.from_root_entity(
-                                        SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_1, version=1)
-                                    )
-                                    .as_raw()
-                                    .values()
-                                )
-                            ]
-                        ),
-                    ],
-                    cycle(
-                        [
-                            FakeAsyncIterator([]),
-                        ]
-                    ),
-                ),
-            ):
+        with patch.object(DatabaseClient, "fetch_one", side_effect=[ProgrammingException("")]):
+            with patch.object(DatabaseClient, "fetch_all", side_effect=cycle([FakeAsyncIterator([])])):
                 await super().synchronize()
 
+    async def test_setup_creates_indexes(self):
+        name = SnapshotRepositoryTestCase.Car.classname
+        SnapshotIndex.register(name, ["doors"])
+        try:
+            snapshot_repository = DatabaseSnapshotRepository.from_config(self.config)
+            factory = snapshot_repository.database_operation_factory
+
+            with patch.object(factory, "build_create_indexes", wraps=factory.build_create_indexes) as mock:
+                async with snapshot_repository:
+                    with patch.object(DatabaseClient, "fetch_all", side_effect=cycle([FakeAsyncIterator([])])):
+                        await self._find_without_synchronization(snapshot_repository, name)
+        finally:
+            SnapshotIndex.register(name, tuple())
+
+        self.assertEqual([call(name, (SnapshotIndex("doors"),))], mock.call_args_list)
+
+    async def test_find_does_not_create_indexes(self):
+        name = SnapshotRepositoryTestCase.Car.classname
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config)
+        factory = snapshot_repository.database_operation_factory
+
+        async with snapshot_repository:
+            SnapshotIndex.register(name, ["doors"])
+            try:
+                with patch.object(factory, "build_create_indexes", wraps=factory.build_create_indexes) as mock:
+                    with patch.object(DatabaseClient, "fetch_all", side_effect=cycle([FakeAsyncIterator([])])):
+                        await self._find_without_synchronization(snapshot_repository, name)
+            finally:
+                SnapshotIndex.register(name, tuple())
+
+        self.assertEqual([], mock.call_args_list)
+
+    @staticmethod
+    async def _find_without_synchronization(snapshot_repository: SnapshotRepository, name: str) -> None:
+        iterable = snapshot_repository.find_entries(name, Condition.EQUAL("doors", 3), synchronize=False)
+        [v async for v in iterable]
+
+    async def test_synchronize_by_pages(self):
+        await self.populate()
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, synchronize_page_size=4)
+        factory = snapshot_repository.database_operation_factory
+
+        with patch.object(DatabaseClient, "fetch_one", side_effect=[(0,)]):
+            with patch.object(DatabaseClient, "fetch_all", side_effect=cycle([FakeAsyncIterator([])])):
+                with patch.object(factory, "build_submit_many", wraps=factory.build_submit_many) as submit_mock:
+                    with patch.object(factory, "build_submit_offset", wraps=factory.build_submit_offset) as offset_mock:
+                        async with snapshot_repository:
+                            await snapshot_repository.synchronize()
+
+        self.assertEqual(3, submit_mock.call_count)
+        self.assertEqual(2, len(submit_mock.call_args_list[0].args[0]))
+        self.assertEqual([call(4), call(8), call(11), call(11)], offset_mock.call_args_list)
+
+    async def test_synchronize_page_is_transactional(self):
+        await self.populate()
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, synchronize_page_size=4)
+
+        with patch.object(DatabaseClient, "fetch_one", side_effect=[(0,)]):
+            with patch.object(DatabaseClient, "fetch_all", side_effect=cycle([FakeAsyncIterator([])])):
+                async with snapshot_repository:
+                    with patch.object(
+                        DatabaseClient, "execute", autospec=True, side_effect=DatabaseClient.execute
+                    ) as execute_mock:
+                        await snapshot_repository.synchronize()
+
+        composed = [c.args[1] for c in execute_mock.call_args_list if isinstance(c.args[1], ComposedDatabaseOperation)]
+        self.assertEqual(3, len(composed))
+        self.assertTrue(all(operation.transactional for operation in composed))
+
+    async def test_synchronize_stores_schemas_once(self):
+        await self.populate()
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, synchronize_page_size=4)
+        factory = snapshot_repository.database_operation_factory
+
+        with patch.object(DatabaseClient, "fetch_one", side_effect=[(0,)]):
+            with patch.object(DatabaseClient, "fetch_all", side_effect=cycle([FakeAsyncIterator([])])):
+                with patch.object(factory, "build_submit_many", wraps=factory.build_submit_many) as submit_mock:
+                    with patch.object(
+                        factory, "build_submit_schemas", wraps=factory.build_submit_schemas
+                    ) as schemas_mock:
+                        async with snapshot_repository:
+                            await snapshot_repository.synchronize()
+
+        schemas = dict()
+        for call_args in schemas_mock.call_args_list:
+            self.assertTrue(schemas.keys().isdisjoint(call_args.args[0].keys()))
+            schemas |= call_args.args[0]
+
+        self.assertGreater(len(schemas), 0)
+        for schema_hash, encoded_schema in schemas.items():
+            self.assertEqual(SnapshotSchemaCache.hash(encoded_schema), schema_hash)
+
+        for entries in (c.args[0] for c in submit_mock.call_args_list):
+            for entry in entries:
+                self.assertIsNone(entry["schema"])
+                if entry["data"] is not None:
+                    self.assertIn(entry["schema_hash"], schemas)
+
+    async def test_submit_entries_shares_schema_between_instances(self):
+        first = SnapshotEntry.from_root_entity(SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_1, version=1))
+        second = SnapshotEntry.from_root_entity(SnapshotRepositoryTestCase.Car(5, "red", uuid=self.uuid_2, version=1))
+        self.assertNotEqual(first.encoded_schema, second.encoded_schema)
+
+        factory = self.snapshot_repository.database_operation_factory
+        with patch.object(factory, "build_submit_many", wraps=factory.build_submit_many) as submit_mock:
+            with patch.object(factory, "build_submit_schemas", wraps=factory.build_submit_schemas) as schemas_mock:
+                await self.snapshot_repository._submit_page([first], set())
+                await self.snapshot_repository._submit_page([second], set())
+
+        self.assertEqual(1, schemas_mock.call_count)
+        self.assertEqual(1, len(schemas_mock.call_args.args[0]))
+
+        schema_hashes = {entry["schema_hash"] for c in submit_mock.call_args_list for entry in c.args[0]}
+        self.assertEqual(set(schemas_mock.call_args.args[0]), schema_hashes)
+
+    async def test_find_resolves_schema_hash(self):
+        car = SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_1, version=1)
+        raw = SnapshotEntry.from_root_entity(car).as_raw()
+        schema_hash = SnapshotSchemaCache.hash(raw["schema"])
+
+        row = (*(raw | {"schema": None}).values(), memoryview(schema_hash))
+        fetch_all_side_effect = [
+            FakeAsyncIterator([row]),
+            FakeAsyncIterator([(memoryview(schema_hash), memoryview(raw["schema"]))]),
+            FakeAsyncIterator([row]),
+        ]
+
+        factory = self.snapshot_repository.database_operation_factory
+        with patch.object(DatabaseClient, "fetch_all", side_effect=fetch_all_side_effect):
+            with patch.object(factory, "build_query_schemas", wraps=factory.build_query_schemas) as mock:
+                iterable = self.snapshot_repository.find_entries(car.classname, Condition.TRUE, synchronize=False)
+                first = [v async for v in iterable]
+                iterable = self.snapshot_repository.find_entries(car.classname, Condition.TRUE, synchronize=False)
+                second = [v async for v in iterable]
+
+        self.assertEqual([call((schema_hash,))], mock.call_args_list)
+        self.assertEqual(car, first[0].build())
+        self.assertEqual(car, second[0].build())
+
+    async def test_find_raises_unknown_schema_hash(self):
+        row = (self.uuid_1, "path.to.Car", 1, None, {"doors": 3}, None, None, NULL_UUID, b"unknown")
+
+        with patch.object(DatabaseClient, "fetch_all", side_effect=[FakeAsyncIterator([row]), FakeAsyncIterator([])]):
+            with self.assertRaises(SnapshotRepositoryException):
+                iterable = self.snapshot_repository.find_entries("path.to.Car", Condition.TRUE, synchronize=False)
+                [v async for v in iterable]
+
+    async def test_synchronize_skipped(self):
+        await self.populate_and_synchronize()
+
+        select_mock = MagicMock(side_effect=self.event_repository.select)
+        self.event_repository.select = select_mock
+
+        await self.snapshot_repository.synchronize()
+        self.assertEqual(0, select_mock.call_count)
+
+    async def test_synchronize_not_skipped_by_external_entries(self):
+        await self.populate_and_synchronize()
+
+        async def _fn():
+            return 12
+
+        select_mock = MagicMock(return_value=FakeAsyncIterator([]))
+        self.event_repository.select = select_mock
+
+        with patch.object(InMemoryEventRepository, "offset", new_callable=PropertyMock, side_effect=_fn):
+            with patch.object(DatabaseClient, "fetch_one", return_value=(11,)):
+                await self.snapshot_repository.synchronize()
+
+        self.assertEqual([call(id_gt=11, synchronize=False)], select_mock.call_args_list)
+
+    async def test_synchronize_max_staleness(self):
+        await self.populate()
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, synchronize_max_staleness=60)
+        async with snapshot_repository:
+            with patch.object(DatabaseClient, "fetch_one", side_effect=[(0,)]):
+                with patch.object(DatabaseClient, "fetch_all", side_effect=cycle([FakeAsyncIterator([])])):
+                    await snapshot_repository.synchronize()
+
+            async def _fn():
+                return 12
+
+            select_mock = MagicMock(return_value=FakeAsyncIterator([]))
+            self.event_repository.select = select_mock
+
+            with patch.object(InMemoryEventRepository, "offset", new_callable=PropertyMock, side_effect=_fn):
+                await snapshot_repository.synchronize()
+
+        self.assertEqual(0, select_mock.call_count)
+
     async def test_dispatch(self):
         entries = [
             SnapshotEntry(
@@ -258,32 +450,11 @@ class TestDatabaseSnapshotRepository(AggregateTestCase, SnapshotRepositoryTestCa
                 updated_at=current_datetime(),
             )
         ]
-        with patch.object(
-            DatabaseClient,
-            "fetch_one",
-            side_effect=[
-                ProgrammingException(""),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (9999,),
-            ],
-        ):
+        with patch.object(DatabaseClient, "fetch_one", side_effect=[ProgrammingException(""), (9999,)]):
             with patch.object(
                 DatabaseClient,
                 "fetch_all",
                 side_effect=[
-                    FakeAsyncIterator([]),
-                    FakeAsyncIterator(
-                        [
-                            tuple(
-                                SnapshotEntry.from_root_entity(
-                                    SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_1, version=5)
-                                )
-                                .as_raw()
-                                .values()
-                            )
-                        ]
-                    ),
                     FakeAsyncIterator([]),
                     FakeAsyncIterator([tuple(entry.as_raw().values()) for entry in entries]),
                 ],
@@ -291,28 +462,7 @@ class TestDatabaseSnapshotRepository(AggregateTestCase, SnapshotRepositoryTestCa
                 await super().test_dispatch_ignore_previous_version()
 
     async def test_dispatch_with_offset(self):
-        with patch.object(
-            DatabaseClient,
-            "fetch_one",
-            side_effect=[
-                (0,),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (current_datetime(), current_datetime()),
-                (11,),
-                (current_datetime(), current_datetime()),
-                (12,),
-                (12,),
-            ],
-        ):
+        with patch.object(DatabaseClient, "fetch_one", side_effect=[(0,), (11,)]):
             await super().test_dispatch_with_offset()
 
     async def test_find_by_uuid(self):
@@ -471,6 +621,173 @@ class TestDatabaseSnapshotRepository(AggregateTestCase, SnapshotRepositoryTestCa
             ):
                 await super().test_get_with_transaction_raises()
 
+    async def test_get_many(self):
+        entities = [
+            SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_2, version=2),
+            SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_3, version=1),
+        ]
+        with patch.object(DatabaseClient, "fetch_one", return_value=(9999,)):
+            with patch.object(
+                DatabaseClient,
+                "fetch_all",
+                return_value=FakeAsyncIterator(
+                    [tuple(SnapshotEntry.from_root_entity(entity).as_raw().values()) for entity in entities]
+                ),
+            ):
+                await super().test_get_many()
+
+    async def test_get_many_empty(self):
+        with patch.object(DatabaseClient, "fetch_one", return_value=(9999,)):
+            with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator([])):
+                await super().test_get_many_empty()
+
+    async def test_get_cached(self):
+        await self.populate()
+
+        entity = SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_2, version=2)
+        row = tuple(SnapshotEntry.from_root_entity(entity).as_raw().values())
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, cache_size=10)
+        async with snapshot_repository:
+            with patch.object(DatabaseClient, "fetch_one", return_value=(9999,)):
+                with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator([row])) as fetch_mock:
+                    first = await snapshot_repository.get(SnapshotRepositoryTestCase.Car, self.uuid_2)
+                    second = await snapshot_repository.get(SnapshotRepositoryTestCase.Car, self.uuid_2)
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(1, fetch_mock.call_count)
+        self.assertEqual(1, snapshot_repository.cache.hits)
+        self.assertEqual(1, snapshot_repository.cache.misses)
+
+    async def test_get_cached_without_offset_check(self):
+        await self.populate()
+
+        entity = SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_2, version=2)
+        row = tuple(SnapshotEntry.from_root_entity(entity).as_raw().values())
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, cache_size=10)
+        async with snapshot_repository:
+            with patch.object(DatabaseClient, "fetch_one", return_value=(9999,)):
+                with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator([row])):
+                    await snapshot_repository.get(SnapshotRepositoryTestCase.Car, self.uuid_2)
+
+            with patch.object(type(self.event_repository), "offset", new_callable=PropertyMock) as offset_mock:
+                with patch.object(DatabaseClient, "execute") as execute_mock:
+                    await snapshot_repository.get(SnapshotRepositoryTestCase.Car, self.uuid_2)
+
+        self.assertEqual(0, offset_mock.call_count)
+        self.assertEqual(0, execute_mock.call_count)
+        self.assertEqual(1, snapshot_repository.cache.hits)
+
+    async def test_get_many_cached(self):
+        await self.populate()
+
+        entities = [
+            SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_2, version=2),
+            SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_3, version=1),
+        ]
+        rows = [tuple(SnapshotEntry.from_root_entity(entity).as_raw().values()) for entity in entities]
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, cache_size=10)
+        async with snapshot_repository:
+            with patch.object(DatabaseClient, "fetch_one", return_value=(9999,)):
+                with patch.object(
+                    DatabaseClient, "fetch_all", side_effect=[FakeAsyncIterator(rows[:1]), FakeAsyncIterator(rows[1:])]
+                ) as fetch_mock:
+                    await snapshot_repository.get(SnapshotRepositoryTestCase.Car, self.uuid_2)
+                    observed = await snapshot_repository.get_many(
+                        SnapshotRepositoryTestCase.Car, [self.uuid_3, self.uuid_2]
+                    )
+
+        self.assertEqual([entities[1].uuid, entities[0].uuid], [entity.uuid for entity in observed])
+        self.assertEqual(2, fetch_mock.call_count)
+        self.assertEqual(1, snapshot_repository.cache.hits)
+        self.assertEqual(2, len(snapshot_repository.cache))
+
+    async def test_cache_invalidated_by_synchronize(self):
+        name = classname(SnapshotRepositoryTestCase.Car)
+        key = (name, self.uuid_2, NULL_UUID)
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, cache_size=10)
+        snapshot_repository.cache.put(key, SnapshotEntry(self.uuid_2, name, 2))
+
+        await snapshot_repository._submit_page([SnapshotEntry(self.uuid_2, name, 3)], set())
+
+        self.assertNotIn(key, snapshot_repository.cache)
+
+    async def test_cache_invalidated_by_other_repository(self):
+        await self.populate()
+        name = classname(SnapshotRepositoryTestCase.Car)
+        diff = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "blue")])
+
+        rows = [
+            tuple(SnapshotEntry.from_root_entity(entity).as_raw().values())
+            for entity in (
+                SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_2, version=2),
+                SnapshotRepositoryTestCase.Car(5, "blue", uuid=self.uuid_2, version=3),
+            )
+        ]
+
+        # The offset stored in the database shared by both repositories.
+        offsets = [await self.event_repository.offset]
+
+        first = DatabaseSnapshotRepository.from_config(self.config, cache_size=10)
+        second = DatabaseSnapshotRepository.from_config(self.config, cache_size=10)
+        async with first, second:
+            with patch.object(DatabaseClient, "fetch_one", side_effect=lambda *args, **kwargs: (offsets[-1],)):
+                with patch.object(DatabaseClient, "fetch_all", side_effect=[FakeAsyncIterator(rows[:1])]):
+                    observed = await second.get(SnapshotRepositoryTestCase.Car, self.uuid_2)
+                self.assertEqual(2, observed.version)
+
+                await self.event_repository.update(EventEntry(self.uuid_2, name, 3, diff.avro_bytes))
+                with patch.object(DatabaseClient, "fetch_all", side_effect=cycle([FakeAsyncIterator([])])):
+                    await first.synchronize()
+                offsets.append(await self.event_repository.offset)
+
+                with patch.object(DatabaseClient, "fetch_all", side_effect=[FakeAsyncIterator(rows[1:])]) as mock:
+                    observed = await second.get(SnapshotRepositoryTestCase.Car, self.uuid_2)
+
+        self.assertEqual(3, observed.version)
+        self.assertEqual(1, mock.call_count)
+
+    async def test_cache_invalidated_by_transaction_clean(self):
+        name = classname(SnapshotRepositoryTestCase.Car)
+        key = (name, self.uuid_2, self.transaction_1)
+
+        snapshot_repository = DatabaseSnapshotRepository.from_config(self.config, cache_size=10)
+        snapshot_repository.cache.put(key, SnapshotEntry(self.uuid_2, name, 2))
+
+        self.transaction_repository.select = MagicMock(
+            return_value=FakeAsyncIterator([TransactionEntry(self.transaction_1)])
+        )
+        transaction_uuids = await snapshot_repository._get_finished_transactions(0)
+        await snapshot_repository._submit_page(list(), transaction_uuids)
+
+        self.assertNotIn(key, snapshot_repository.cache)
+
+    async def test_get_many_raises(self):
+        entities = [SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_2, version=2)]
+        with patch.object(DatabaseClient, "fetch_one", return_value=(9999,)):
+            with patch.object(
+                DatabaseClient,
+                "fetch_all",
+                side_effect=[
+                    FakeAsyncIterator(
+                        [
+                            tuple(SnapshotEntry.from_root_entity(entities[0]).as_raw().values()),
+                            tuple(
+                                SnapshotEntry(self.uuid_1, classname(SnapshotRepositoryTestCase.Car), 1)
+                                .as_raw()
+                                .values()
+                            ),
+                        ]
+                    ),
+                    FakeAsyncIterator([tuple(SnapshotEntry.from_root_entity(entities[0]).as_raw().values())]),
+                ],
+            ):
+                await super().test_get_many_raises()
+
     async def test_find(self):
         entities = [
             SnapshotRepositoryTestCase.Car(3, "blue", uuid=self.uuid_2, version=2),
@@ -501,6 +818,36 @@ class TestDatabaseSnapshotRepository(AggregateTestCase, SnapshotRepositoryTestCa
             ):
                 await super().test_find_all()
 
+    async def test_find_page(self):
+        entities = [
+            SnapshotRepositoryTestCase.Car(3, "blue", uuid=uuid, version=1)
+            for uuid in sorted([self.uuid_2, self.uuid_3])
+        ]
+        rows = [tuple(SnapshotEntry.from_root_entity(entity).as_raw().values()) for entity in entities]
+
+        with patch.object(DatabaseClient, "fetch_one", return_value=(9999,)):
+            with patch.object(
+                DatabaseClient, "fetch_all", side_effect=[FakeAsyncIterator(rows), FakeAsyncIterator(rows[1:])]
+            ):
+                await super().test_find_page()
+
+    async def test_find_paginated(self):
+        entities = [
+            SnapshotRepositoryTestCase.Car(3, "blue", uuid=uuid, version=1)
+            for uuid in sorted([self.uuid_2, self.uuid_3], reverse=True)
+        ]
+        rows = [tuple(SnapshotEntry.from_root_entity(entity).as_raw().values()) for entity in entities]
+
+        factory = self.snapshot_repository.database_operation_factory
+        with patch.object(DatabaseClient, "fetch_one", return_value=(9999,)):
+            with patch.object(
+                DatabaseClient, "fetch_all", side_effect=[FakeAsyncIterator(rows), FakeAsyncIterator(rows[1:])]
+            ):
+                with patch.object(factory, "build_query", wraps=factory.build_query) as mock:
+                    await super().test_find_paginated()
+
+        self.assertEqual([2, 2], [c.args[3] for c in mock.call_args_list[-2:]])
+
 
 if __name__ == "__main__":
     unittest.main()
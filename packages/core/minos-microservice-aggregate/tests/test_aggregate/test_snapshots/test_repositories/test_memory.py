@@ -1,13 +1,29 @@
 import unittest
+from unittest.mock import (
+    patch,
+)
+from uuid import (
+    UUID,
+)
 
 from minos.aggregate import (
+    Condition,
+    EventEntry,
+    FieldDiff,
+    FieldDiffContainer,
     InMemorySnapshotRepository,
+    SnapshotIndex,
     SnapshotRepository,
+    TransactionEntry,
+)
+from minos.aggregate.queries import (
+    _Condition,
 )
 from minos.aggregate.testing import (
     SnapshotRepositoryTestCase,
 )
 from minos.common import (
+    NULL_UUID,
     NotProvidedException,
 )
 from tests.utils import (
@@ -33,6 +49,156 @@ class TestInMemorySnapshotRepository(AggregateTestCase, SnapshotRepositoryTestCa
     async def test_dispatch_with_offset(self):
         pass
 
+    async def test_find_with_index(self):
+        name = self.Car.classname
+        SnapshotIndex.register(name, ["doors", "color"])
+        try:
+            await self._populate_indexed(name)
+
+            self.assertEqual({self.uuid_1}, await self._find_uuids(Condition.EQUAL("doors", 9)))
+            self.assertEqual({self.uuid_3}, await self._find_uuids(Condition.IN("doors", [3, 7])))
+            self.assertEqual({self.uuid_1, self.uuid_3}, await self._find_uuids(Condition.GREATER("doors", 6)))
+            self.assertEqual({self.uuid_3}, await self._find_uuids(Condition.LOWER_EQUAL("doors", 7)))
+            self.assertEqual(
+                {self.uuid_3},
+                await self._find_uuids(Condition.AND(Condition.GREATER_EQUAL("doors", 7), Condition.LOWER("doors", 9))),
+            )
+            self.assertEqual(
+                {self.uuid_1, self.uuid_3},
+                await self._find_uuids(Condition.OR(Condition.EQUAL("color", "red"), Condition.EQUAL("doors", 7))),
+            )
+            self.assertEqual(set(), await self._find_uuids(Condition.EQUAL("doors", 5)))
+
+            await self.event_repository.update(
+                EventEntry(self.uuid_3, name, 2, FieldDiffContainer([FieldDiff("doors", int, 5)]).avro_bytes)
+            )
+            self.assertEqual({self.uuid_3}, await self._find_uuids(Condition.EQUAL("doors", 5)))
+            self.assertEqual(set(), await self._find_uuids(Condition.EQUAL("doors", 7)))
+        finally:
+            SnapshotIndex.register(name, tuple())
+
+    async def test_find_with_index_reduces_builds(self):
+        name = self.Car.classname
+        SnapshotIndex.register(name, ["doors"])
+        try:
+            await self._populate_indexed(name)
+            await self._find_uuids(Condition.TRUE)
+
+            with patch.object(InMemorySnapshotRepository, "_get", wraps=self.snapshot_repository._get) as mock:
+                self.assertEqual({self.uuid_1}, await self._find_uuids(Condition.EQUAL("doors", 9)))
+        finally:
+            SnapshotIndex.register(name, tuple())
+
+        # The deleted instances are not indexed, so they are always evaluated.
+        self.assertEqual({self.uuid_1, self.uuid_2}, {c.args[1] for c in mock.call_args_list})
+
+    async def test_find_with_index_unsupported_condition(self):
+        name = self.Car.classname
+        SnapshotIndex.register(name, ["doors"])
+        try:
+            await self._populate_indexed(name)
+
+            self.assertEqual({self.uuid_1, self.uuid_3}, await self._find_uuids(Condition.NOT_EQUAL("doors", 3)))
+            self.assertEqual({self.uuid_3}, await self._find_uuids(Condition.LIKE("color", "bl%")))
+        finally:
+            SnapshotIndex.register(name, tuple())
+
+    async def test_get_materialized(self):
+        await self.populate()
+
+        with patch.object(
+            InMemorySnapshotRepository, "_get_event_entries", wraps=self.snapshot_repository._get_event_entries
+        ) as mock:
+            first = await self.snapshot_repository.get(self.Car, self.uuid_2)
+            second = await self.snapshot_repository.get(self.Car, self.uuid_2)
+
+        self.assertEqual(0, mock.call_count)
+        self.assertEqual(first, second)
+        self.assertEqual(2, first.version)
+
+    async def test_get_materialized_updated(self):
+        await self.populate()
+        await self.snapshot_repository.get(self.Car, self.uuid_2)
+
+        diff = FieldDiffContainer([FieldDiff("color", str, "red")])
+        await self.event_repository.update(EventEntry(self.uuid_2, self.Car.classname, 3, diff.avro_bytes))
+
+        observed = await self.snapshot_repository.get(self.Car, self.uuid_2)
+        self.assertEqual("red", observed.color)
+        self.assertEqual(3, observed.version)
+
+    async def test_get_materialized_with_kwargs_replays(self):
+        await self.populate()
+        await self.snapshot_repository.get(self.Car, self.uuid_2)
+
+        with patch.object(
+            InMemorySnapshotRepository, "_get_event_entries", wraps=self.snapshot_repository._get_event_entries
+        ) as mock:
+            observed = await self.snapshot_repository.get(self.Car, self.uuid_2, foo="bar")
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(2, observed.version)
+
+    async def test_find_materialized_with_streaming_mode(self):
+        await self.populate()
+
+        with patch.object(
+            InMemorySnapshotRepository, "_get_event_entries", wraps=self.snapshot_repository._get_event_entries
+        ) as mock:
+            observed = [v async for v in self.snapshot_repository.find(self.Car, Condition.TRUE, streaming_mode=True)]
+
+        self.assertEqual(0, mock.call_count)
+        self.assertEqual(2, len(observed))
+
+    async def test_get_materialized_equals_replay(self):
+        await self.populate_and_synchronize()
+
+        for uuid in (self.uuid_1, self.uuid_2, self.uuid_3):
+            materialized = await self.snapshot_repository._get(self.Car.classname, uuid)
+            entries = await self.snapshot_repository._get_event_entries(self.Car.classname, uuid, (NULL_UUID,))
+            replayed = self.snapshot_repository._build_instance(entries)
+            self.assertEqual(replayed.version, materialized.version)
+            self.assertEqual(replayed.data, materialized.data)
+
+    async def test_get_with_transaction_replays(self):
+        await self.populate_and_synchronize()
+
+        with patch.object(
+            InMemorySnapshotRepository, "_get_event_entries", wraps=self.snapshot_repository._get_event_entries
+        ) as mock:
+            observed = await self.snapshot_repository.get(
+                self.Car, self.uuid_2, transaction=TransactionEntry(self.transaction_1)
+            )
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(4, observed.version)
+
+    async def test_get_unsorted_versions_replays(self):
+        name = self.Car.classname
+        diff = FieldDiffContainer([FieldDiff("doors", int, 3), FieldDiff("color", str, "blue")])
+        await self.event_repository.create(EventEntry(self.uuid_1, name, 1, diff.avro_bytes))
+        await self.event_repository.update(EventEntry(self.uuid_1, name, 5, diff.avro_bytes))
+        await self.event_repository.update(EventEntry(self.uuid_1, name, 3, diff.avro_bytes))
+
+        observed = await self.snapshot_repository.get(self.Car, self.uuid_1)
+
+        self.assertEqual(5, observed.version)
+        self.assertIn(self.uuid_1, self.snapshot_repository._unmaterialized[name])
+
+    async def _populate_indexed(self, name: str) -> None:
+        def _diff(doors: int, color: str) -> bytes:
+            return FieldDiffContainer([FieldDiff("doors", int, doors), FieldDiff("color", str, color)]).avro_bytes
+
+        await self.event_repository.create(EventEntry(self.uuid_1, name, 1, _diff(3, "red")))
+        await self.event_repository.create(EventEntry(self.uuid_2, name, 1, _diff(5, "red")))
+        await self.event_repository.create(EventEntry(self.uuid_3, name, 1, _diff(7, "blue")))
+        await self.event_repository.update(EventEntry(self.uuid_1, name, 2, _diff(9, "red")))
+        await self.event_repository.delete(EventEntry(self.uuid_2, name, 2))
+
+    async def _find_uuids(self, condition: _Condition) -> set[UUID]:
+        iterable = self.snapshot_repository.find_entries(self.Car.classname, condition)
+        return {entry.uuid async for entry in iterable}
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import (
     AsyncMock,
+    call,
     patch,
 )
 from uuid import (
@@ -51,14 +52,15 @@ class TestSnapshotService(AggregateTestCase, DatabaseMinosTestCase):
         uuids = [uuid4(), uuid4()]
 
         expected = [Agg(u) for u in uuids]
-        with patch.object(RootEntity, "get", side_effect=expected):
+        with patch.object(RootEntity, "get_many", return_value=expected) as mock:
             response = await self.service.__get_many__(InMemoryRequest({"uuids": uuids}))
         self.assertEqual(expected, await response.content())
+        self.assertEqual([call(uuids)], mock.call_args_list)
 
     async def test_get_many_raises(self):
         with self.assertRaises(ResponseException):
             await self.service.__get_many__(InMemoryRequest())
-        with patch.object(RootEntity, "get", side_effect=ValueError):
+        with patch.object(RootEntity, "get_many", side_effect=ValueError):
             with self.assertRaises(ResponseException):
                 await self.service.__get_many__(InMemoryRequest({"uuids": [uuid4()]}))
 
@@ -149,6 +149,33 @@ class TestTransactionEntry(AggregateTestCase):
             save_mock.call_args_list,
         )
 
+    async def test_reserve_locks_by_uuid(self) -> None:
+        uuid_1, uuid_2 = uuid4(), uuid4()
+        transaction = TransactionEntry(status=TransactionStatus.PENDING)
+
+        self.event_repository.select = MagicMock(
+            return_value=FakeAsyncIterator(
+                [
+                    EventEntry(uuid_1, "example.Car", 1, transaction_uuid=transaction.uuid),
+                    EventEntry(uuid_2, "example.Car", 1, transaction_uuid=transaction.uuid),
+                    EventEntry(uuid_1, "example.Car", 2, transaction_uuid=transaction.uuid),
+                ]
+            )
+        )
+
+        with patch(
+            "minos.aggregate.EventRepository.offset", new_callable=PropertyMock, side_effect=AsyncMock(return_value=55)
+        ), patch("minos.aggregate.TransactionEntry.save"), patch(
+            "minos.aggregate.TransactionEntry.validate", return_value=True
+        ), patch.object(
+            self.event_repository, "write_lock", wraps=self.event_repository.write_lock
+        ) as lock_mock:
+            await transaction.reserve()
+
+        self.assertEqual([call(transaction_uuid=transaction.uuid)], self.event_repository.select.call_args_list)
+        self.assertEqual(1, lock_mock.call_count)
+        self.assertEqual({uuid_1, uuid_2}, set(lock_mock.call_args.args))
+
     async def test_reserve_raises(self) -> None:
         with self.assertRaises(ValueError):
             await TransactionEntry(status=TransactionStatus.RESERVED).reserve()
@@ -495,6 +522,47 @@ class TestTransactionEntry(AggregateTestCase):
 
         self.assertEqual((NULL_UUID, first.uuid, second.uuid), await second.uuids)
 
+    async def test_uuids_memoized(self):
+        first = TransactionEntry()
+        await first.save()
+
+        second = TransactionEntry(destination_uuid=first.uuid)
+        await second.save()
+
+        with patch.object(
+            self.transaction_repository, "get_ancestry", wraps=self.transaction_repository.get_ancestry
+        ) as mock:
+            self.assertEqual((NULL_UUID, first.uuid, second.uuid), await second.uuids)
+            self.assertEqual((NULL_UUID, first.uuid, second.uuid), await second.uuids)
+
+        self.assertEqual([call(first.uuid)], mock.call_args_list)
+
+    async def test_uuids_root(self):
+        transaction = TransactionEntry()
+
+        with patch.object(self.transaction_repository, "get_ancestry") as mock:
+            self.assertEqual((NULL_UUID, transaction.uuid), await transaction.uuids)
+
+        self.assertEqual(0, mock.call_count)
+
+    async def test_uuids_context(self):
+        with patch.object(self.transaction_repository, "get_ancestry") as mock:
+            async with TransactionEntry(autocommit=False) as first:
+                async with TransactionEntry(autocommit=False) as second:
+                    self.assertEqual((NULL_UUID, first.uuid, second.uuid), await second.uuids)
+
+        self.assertEqual(0, mock.call_count)
+
+    async def test_uuids_destination_changed(self):
+        first = TransactionEntry()
+        await first.save()
+
+        second = TransactionEntry()
+        self.assertEqual((NULL_UUID, second.uuid), await second.uuids)
+
+        second.destination_uuid = first.uuid
+        self.assertEqual((NULL_UUID, first.uuid, second.uuid), await second.uuids)
+
     async def test_destination(self):
         first = TransactionEntry()
         await first.save()
@@ -21,6 +21,7 @@ from minos.aggregate import (
     TransactionStatus,
 )
 from minos.common import (
+    NULL_UUID,
     NotProvidedException,
     SetupMixin,
 )
@@ -91,6 +92,45 @@ class TestTransactionRepository(AggregateTestCase):
         with self.assertRaises(TransactionNotFoundException):
             await self.transaction_repository.get(uuid4())
 
+    async def test_get_ancestry(self):
+        uuid_1, uuid_2, uuid_3 = uuid4(), uuid4(), uuid4()
+        transactions = {
+            uuid_1: TransactionEntry(uuid_1, destination_uuid=NULL_UUID),
+            uuid_2: TransactionEntry(uuid_2, destination_uuid=uuid_1),
+            uuid_3: TransactionEntry(uuid_3, destination_uuid=uuid_2),
+        }
+        mock = AsyncMock(side_effect=lambda uuid: transactions[uuid])
+        self.transaction_repository.get = mock
+
+        self.assertEqual((NULL_UUID, uuid_1, uuid_2), await self.transaction_repository.get_ancestry(uuid_2))
+        self.assertEqual(2, mock.call_count)
+
+        mock.reset_mock()
+        self.assertEqual((NULL_UUID, uuid_1, uuid_2), await self.transaction_repository.get_ancestry(uuid_2))
+        self.assertEqual(0, mock.call_count)
+
+        self.assertEqual((NULL_UUID, uuid_1, uuid_2, uuid_3), await self.transaction_repository.get_ancestry(uuid_3))
+        self.assertEqual([call(uuid=uuid_3)], mock.call_args_list)
+
+    async def test_get_ancestry_null(self):
+        mock = AsyncMock()
+        self.transaction_repository.get = mock
+
+        self.assertEqual((NULL_UUID,), await self.transaction_repository.get_ancestry(NULL_UUID))
+        self.assertEqual(0, mock.call_count)
+
+    async def test_get_ancestry_evicts(self):
+        transaction_repository = _TransactionRepository(ancestry_cache_size=1)
+        uuid_1, uuid_2 = uuid4(), uuid4()
+        mock = AsyncMock(side_effect=lambda uuid: TransactionEntry(uuid, destination_uuid=NULL_UUID))
+        transaction_repository.get = mock
+
+        await transaction_repository.get_ancestry(uuid_1)
+        await transaction_repository.get_ancestry(uuid_2)
+        await transaction_repository.get_ancestry(uuid_1)
+
+        self.assertEqual([call(uuid=uuid_1), call(uuid=uuid_2), call(uuid=uuid_1)], mock.call_args_list)
+
     async def test_select(self):
         uuid = uuid4()
 
@@ -5,6 +5,7 @@ from unittest.mock import (
 
 from minos.aggregate import (
     DatabaseTransactionRepository,
+    TransactionNotFoundException,
     TransactionRepository,
     TransactionStatus,
 )
@@ -12,6 +13,7 @@ from minos.aggregate.testing import (
     TransactionRepositoryTestCase,
 )
 from minos.common import (
+    NULL_UUID,
     DatabaseClient,
     ProgrammingException,
     current_datetime,
@@ -185,6 +187,36 @@ class TestDatabaseTransactionRepository(AggregateTestCase, TransactionRepository
         ):
             await super().test_select_uuid_in()
 
+    async def test_get_ancestry(self):
+        rows = [(self.uuid_1, NULL_UUID), (self.uuid_5, self.uuid_1), (self.uuid, self.uuid_5)]
+        with patch.object(DatabaseClient, "fetch_one", return_value=[current_datetime()]):
+            with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator(rows)):
+                await super().test_get_ancestry()
+
+    async def test_get_ancestry_root(self):
+        with patch.object(DatabaseClient, "fetch_one", return_value=[current_datetime()]):
+            with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator([(self.uuid_2, NULL_UUID)])):
+                await super().test_get_ancestry_root()
+
+    async def test_get_ancestry_raises(self):
+        with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator([])):
+            await super().test_get_ancestry_raises()
+
+    async def test_get_ancestry_broken_raises(self):
+        rows = [(self.uuid_5, self.uuid_1), (self.uuid, self.uuid_5)]
+        with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator(rows)):
+            with self.assertRaises(TransactionNotFoundException):
+                await self.transaction_repository.get_ancestry(self.uuid)
+
+    async def test_get_ancestry_single_query(self):
+        rows = [(self.uuid_1, NULL_UUID), (self.uuid_5, self.uuid_1)]
+        with patch.object(DatabaseClient, "fetch_all", return_value=FakeAsyncIterator(rows)) as mock:
+            await self.transaction_repository.get_ancestry(self.uuid_5)
+            observed = await self.transaction_repository.get_ancestry(self.uuid_5)
+
+        self.assertEqual((NULL_UUID, self.uuid_1, self.uuid_5), observed)
+        self.assertEqual(1, mock.call_count)
+
     async def test_select_destination_uuid(self):
         with patch.object(
             DatabaseClient,
@@ -2,7 +2,9 @@ import unittest
 
 from minos.aggregate import (
     InMemoryTransactionRepository,
+    TransactionEntry,
     TransactionRepository,
+    TransactionStatus,
 )
 from minos.aggregate.testing import (
     TransactionRepositoryTestCase,
@@ -18,6 +20,33 @@ class TestInMemoryTransactionRepository(AggregateTestCase, TransactionRepository
     def build_transaction_repository(self) -> TransactionRepository:
         return InMemoryTransactionRepository()
 
+    async def test_select_status_updated(self):
+        await self.populate()
+        await self.transaction_repository.submit(TransactionEntry(self.uuid_2, TransactionStatus.RESERVING, 15))
+
+        pending = [v.uuid async for v in self.transaction_repository.select(status=TransactionStatus.PENDING)]
+        reserving = [v.uuid async for v in self.transaction_repository.select(status=TransactionStatus.RESERVING)]
+
+        self.assertEqual([self.uuid_1, self.uuid_5], pending)
+        self.assertEqual([self.uuid_2], reserving)
+
+    async def test_select_status_in_raw(self):
+        await self.populate()
+
+        iterable = self.transaction_repository.select(status_in=("rejected", "committed", "unknown"))
+        observed = [v.uuid async for v in iterable]
+
+        self.assertEqual([self.uuid_3, self.uuid_4], observed)
+
+    async def test_select_keeps_insertion_order(self):
+        await self.populate()
+        await self.transaction_repository.submit(TransactionEntry(self.uuid_1, TransactionStatus.RESERVING, 12))
+
+        iterable = self.transaction_repository.select(uuid_in=(self.uuid_5, self.uuid_2, self.uuid_1))
+        observed = [v.uuid async for v in iterable]
+
+        self.assertEqual([self.uuid_1, self.uuid_2, self.uuid_5], observed)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,8 +14,10 @@ from .config import (
     MinosConfig,
 )
 from .database import (
+    AvroSchemaDatabaseOperationFactory,
     ComposedDatabaseOperation,
     ConnectionException,
+    DatabaseAvroSchemaStore,
     DatabaseClient,
     DatabaseClientBuilder,
     DatabaseClientException,
@@ -23,11 +25,14 @@ from .database import (
     DatabaseLock,
     DatabaseLockPool,
     DatabaseMixin,
+    DatabaseNotification,
+    DatabaseNotificationListener,
     DatabaseOperation,
     DatabaseOperationFactory,
     IntegrityException,
     LockDatabaseOperationFactory,
     ManagementDatabaseOperationFactory,
+    NotificationDatabaseOperationFactory,
     ProgrammingException,
 )
 from .datetime import (
@@ -41,6 +46,7 @@ from .exceptions import (
     DataDecoderTypeException,
     EmptyMinosModelSequenceException,
     MinosAttributeValidationException,
+    MinosAvroSchemaNotFoundException,
     MinosBrokerException,
     MinosConfigException,
     MinosException,
@@ -87,6 +93,7 @@ from .model import (
     AvroSchemaDecoder,
     AvroSchemaEncoder,
     BucketModel,
+    CompiledAvroSchema,
     DataDecoder,
     DataEncoder,
     DataTransferObject,
@@ -120,6 +127,7 @@ from .ports import (
     Port,
 )
 from .protocol import (
+    AvroSchemaRegistry,
     MinosAvroDatabaseProtocol,
     MinosAvroMessageProtocol,
     MinosAvroProtocol,
@@ -129,6 +137,10 @@ from .protocol import (
 from .retries import (
     CircuitBreakerMixin,
 )
+from .schemas import (
+    AvroSchemaStore,
+    InMemoryAvroSchemaStore,
+)
 from .setup import (
     MinosSetup,
     SetupMixin,
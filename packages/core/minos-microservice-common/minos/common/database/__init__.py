@@ -16,6 +16,11 @@ from .managements import (
 from .mixins import (
     DatabaseMixin,
 )
+from .notifications import (
+    DatabaseNotification,
+    DatabaseNotificationListener,
+    NotificationDatabaseOperationFactory,
+)
 from .operations import (
     ComposedDatabaseOperation,
     DatabaseOperation,
@@ -25,3 +30,7 @@ from .pools import (
     DatabaseClientPool,
     DatabaseLockPool,
 )
+from .schemas import (
+    AvroSchemaDatabaseOperationFactory,
+    DatabaseAvroSchemaStore,
+)
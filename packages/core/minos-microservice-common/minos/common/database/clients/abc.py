@@ -13,6 +13,7 @@ from asyncio import (
 from collections.abc import (
     AsyncIterator,
     Hashable,
+    Iterable,
 )
 from typing import (
     TYPE_CHECKING,
@@ -40,6 +41,9 @@ if TYPE_CHECKING:
     from ..locks import (
         DatabaseLock,
     )
+    from ..notifications import (
+        DatabaseNotification,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -104,13 +108,65 @@ class DatabaseClient(ABC, BuildableMixin):
             await wait_for(self._execute(operation), operation.timeout)
 
     async def _execute_composed(self, operation: ComposedDatabaseOperation) -> None:
+        operations = tuple(self._flatten_composed(operation))
+        leaves = tuple(op for op in operations if not isinstance(op, ComposedDatabaseOperation))
+        locks = {op.lock for op in operations if op.lock is not None}
+
+        if len(locks) <= 1 and all(op.timeout is None for op in operations[1:]) and self._can_pipeline(leaves):
+            for lock in locks:
+                await self._create_lock(lock)
+            if len(leaves):
+                await self._execute_pipelined(leaves, transactional=operation.transactional)
+            return
+
         for op in operation.operations:
             await self.execute(op)
 
+    @staticmethod
+    def _flatten_composed(operation: ComposedDatabaseOperation) -> Iterable[DatabaseOperation]:
+        yield operation
+        for op in operation.operations:
+            if isinstance(op, ComposedDatabaseOperation):
+                yield from DatabaseClient._flatten_composed(op)
+            else:
+                yield op
+
+    # noinspection PyUnusedLocal
+    def _can_pipeline(self, operations: tuple[DatabaseOperation, ...]) -> bool:
+        """Check if the given operations can be sent to the database within a single round-trip.
+
+        The clients that return ``True`` for any operations must also implement ``_execute_pipelined``.
+
+        :param operations: The leaf operations of a ``ComposedDatabaseOperation``.
+        :return: ``True`` if they can be pipelined or ``False`` otherwise.
+        """
+        return False
+
+    async def _execute_pipelined(self, operations: tuple[DatabaseOperation, ...], transactional: bool) -> None:
+        """Execute the given operations within a single round-trip.
+
+        It is only called if ``_can_pipeline`` returned ``True`` for the same operations.
+
+        :param operations: The leaf operations of a ``ComposedDatabaseOperation``.
+        :param transactional: If ``True``, the operations must be applied atomically.
+        :return: This method does not return anything.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def _execute(self, operation: DatabaseOperation) -> None:
         raise NotImplementedError
 
+    async def receive_notification(self) -> DatabaseNotification:
+        """Wait until a notification is received from any of the listened channels.
+
+        :return: A ``DatabaseNotification`` instance.
+        """
+        return await self._receive_notification()
+
+    async def _receive_notification(self) -> DatabaseNotification:
+        raise NotImplementedError
+
     async def _create_lock(self, lock: Hashable, *args, **kwargs):
         if self._lock is not None and self._lock.key == lock:
             return
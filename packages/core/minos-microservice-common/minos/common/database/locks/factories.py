@@ -20,6 +20,16 @@ class LockDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``DatabaseOperation`` instance.
         """
 
+    @abstractmethod
+    def build_try_acquire(self, hashed_key: int) -> DatabaseOperation:
+        """Build the database operation to acquire the lock without waiting.
+
+        The operation must return a single row containing ``True`` if the lock has been acquired or ``False`` otherwise.
+
+        :param hashed_key: The hashed key that identifies the lock.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
     @abstractmethod
     def build_release(self, hashed_key: int) -> DatabaseOperation:
         """Build the database operation to release the lock.
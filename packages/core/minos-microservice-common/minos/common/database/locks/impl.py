@@ -46,6 +46,16 @@ class DatabaseLock(Lock):
         operation = self.operation_factory.build_acquire(self.hashed_key)
         await self.client.execute(operation)
 
+    async def try_acquire(self) -> bool:
+        """Try to acquire the lock without waiting.
+
+        :return: ``True`` if the lock has been acquired or ``False`` otherwise.
+        """
+        operation = self.operation_factory.build_try_acquire(self.hashed_key)
+        await self.client.execute(operation)
+        row = await self.client.fetch_one()
+        return bool(row[0])
+
     async def release(self) -> None:
         """Release the lock.
 
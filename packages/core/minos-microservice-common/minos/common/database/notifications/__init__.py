@@ -0,0 +1,7 @@
+from .factories import (
+    NotificationDatabaseOperationFactory,
+)
+from .impl import (
+    DatabaseNotification,
+    DatabaseNotificationListener,
+)
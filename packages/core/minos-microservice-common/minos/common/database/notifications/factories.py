@@ -0,0 +1,41 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    Optional,
+)
+
+from ..operations import (
+    DatabaseOperation,
+    DatabaseOperationFactory,
+)
+
+
+class NotificationDatabaseOperationFactory(DatabaseOperationFactory, ABC):
+    """Notification Database Operation Factory class."""
+
+    @abstractmethod
+    def build_listen(self, channel: str) -> DatabaseOperation:
+        """Build the database operation to start listening a channel.
+
+        :param channel: The name of the channel.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    @abstractmethod
+    def build_unlisten(self, channel: str) -> DatabaseOperation:
+        """Build the database operation to stop listening a channel.
+
+        :param channel: The name of the channel.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    @abstractmethod
+    def build_notify(self, channel: str, payload: Optional[str] = None) -> DatabaseOperation:
+        """Build the database operation to send a notification to a channel.
+
+        :param channel: The name of the channel.
+        :param payload: The payload of the notification.
+        :return: A ``DatabaseOperation`` instance.
+        """
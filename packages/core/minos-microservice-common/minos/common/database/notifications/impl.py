@@ -0,0 +1,114 @@
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    AsyncIterator,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+)
+
+from ...setup import (
+    SetupMixin,
+)
+from ..clients import (
+    DatabaseClient,
+)
+from .factories import (
+    NotificationDatabaseOperationFactory,
+)
+
+if TYPE_CHECKING:
+    from ..pools import (
+        DatabaseClientPool,
+    )
+
+
+class DatabaseNotification:
+    """Database Notification class."""
+
+    def __init__(self, channel: str, payload: Optional[str] = None):
+        self.channel = channel
+        self.payload = payload
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, type(self)) and (self.channel, self.payload) == (other.channel, other.payload)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(channel={self.channel!r}, payload={self.payload!r})"
+
+
+class DatabaseNotificationListener(SetupMixin):
+    """Database Notification Listener class.
+
+    The listener keeps a client acquired from the pool while it is set up, so it must be destroyed once it is not
+    needed.
+    """
+
+    _client: Optional[DatabaseClient]
+
+    def __init__(
+        self,
+        database_pool: DatabaseClientPool,
+        channel: str,
+        *args,
+        operation_factory: Optional[NotificationDatabaseOperationFactory] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        if operation_factory is None:
+            operation_factory = database_pool.client_cls.get_factory(NotificationDatabaseOperationFactory)
+
+        self.database_pool = database_pool
+        self.channel = channel
+        self.operation_factory = operation_factory
+
+        self._acquired = None
+        self._client = None
+
+    async def _setup(self) -> None:
+        await super()._setup()
+        self._acquired = self.database_pool.acquire()
+        self._client = await self._acquired.__aenter__()
+
+        try:
+            operation = self.operation_factory.build_listen(self.channel)
+            await self._client.execute(operation)
+        except BaseException as exc:
+            # The listener is not set up, so the client would never be released by the destruction.
+            await self._acquired.__aexit__(type(exc), exc, exc.__traceback__)
+            self._client = None
+            self._acquired = None
+            raise
+
+    async def _destroy(self) -> None:
+        try:
+            operation = self.operation_factory.build_unlisten(self.channel)
+            await self._client.execute(operation)
+        finally:
+            await self._acquired.__aexit__(None, None, None)
+            self._client = None
+            self._acquired = None
+
+        await super()._destroy()
+
+    def __aiter__(self) -> AsyncIterator[DatabaseNotification]:
+        return self
+
+    async def __anext__(self) -> DatabaseNotification:
+        if self.already_destroyed:
+            raise StopAsyncIteration
+        return await self.receive()
+
+    async def receive(self) -> DatabaseNotification:
+        """Receive the next notification sent to the channel.
+
+        :return: A ``DatabaseNotification`` instance.
+        """
+        while True:
+            notification = await self._client.receive_notification()
+            if notification.channel == self.channel:
+                return notification
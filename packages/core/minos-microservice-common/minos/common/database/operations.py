@@ -23,11 +23,17 @@ class DatabaseOperation(ABC):
 
 
 class ComposedDatabaseOperation(DatabaseOperation):
-    """Composed Database Operation class."""
+    """Composed Database Operation class.
 
-    def __init__(self, operations: Iterable[DatabaseOperation], *args, **kwargs):
+    If the client supports it, the operations are sent to the database within a single round-trip. In that case, the
+    ``transactional`` flag requests them to be applied atomically. Otherwise, they are executed sequentially, so the
+    atomicity is not guaranteed.
+    """
+
+    def __init__(self, operations: Iterable[DatabaseOperation], *args, transactional: bool = False, **kwargs):
         super().__init__(*args, **kwargs)
         self.operations = tuple(operations)
+        self.transactional = transactional
 
 
 class DatabaseOperationFactory(ABC):
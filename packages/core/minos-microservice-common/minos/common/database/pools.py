@@ -1,11 +1,26 @@
 import logging
 from asyncio import (
+    CancelledError,
+    Lock,
+    create_task,
+    shield,
     sleep,
+    wait_for,
+)
+from collections import (
+    defaultdict,
 )
 from collections.abc import (
     Hashable,
 )
+from contextlib import (
+    suppress,
+)
+from time import (
+    monotonic,
+)
 from typing import (
+    AsyncContextManager,
     Optional,
 )
 
@@ -100,23 +115,227 @@ class DatabaseClientPool(Pool[DatabaseClient]):
 
 
 class DatabaseLockPool(LockPool, DatabaseClientPool):
-    """Database Lock Pool class."""
+    """Database Lock Pool class.
+
+    The locks are multiplexed over ``connections`` shared clients, instead of checking out a whole client for each
+    held lock. Each key is always handled by the same client and its local waiters are queued in-process, so only one
+    of them requests the database lock at a time. The database lock is first requested with a non-blocking attempt on
+    the shared client. If the key is held by another process, the lock is waited with a blocking request on a client
+    checked out from this pool, so that it is granted as soon as it is released without blocking the rest of keys
+    sharing the same client. That wait is bounded by ``acquire_timeout`` seconds, if set.
+
+    As the database locks belong to the connection, a client whose connection is lost, or on which a lock could not be
+    released, is closed and replaced by a new one. The locks that were held through it are considered lost, so that
+    their release raises a ``ConnectionException``. The connection of each lock is also checked before it is provided,
+    so that a lock is never provided if it has been lost while it was being acquired.
+    """
+
+    def __init__(self, *args, connections: int = 2, acquire_timeout: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if connections < 1:
+            raise ValueError(f"The number of connections must be positive. Obtained: {connections}")
+
+        self.connections = connections
+        self.acquire_timeout = acquire_timeout
+
+        self._clients: dict[int, DatabaseClient] = dict()
+        self._client_locks: dict[int, Lock] = dict()
+        self._key_locks: dict[Hashable, tuple[Lock, int]] = dict()
+        self._held = 0
+        self._held_locks: defaultdict[int, set[DatabaseLock]] = defaultdict(set)
+        self._lost_locks: set[DatabaseLock] = set()
+        self._waited_locks: dict[DatabaseLock, AsyncContextManager[DatabaseClient]] = dict()
+
+    async def _destroy(self) -> None:
+        for client in self._clients.values():
+            await self._destroy_instance(client)
+        self._clients.clear()
+        self._held_locks.clear()
+
+        await super()._destroy()
+
+    @property
+    def held(self) -> int:
+        """Get the number of locks that are currently held.
 
-    def acquire(self, key: Hashable, *args, **kwargs) -> DatabaseLock:
+        :return: An ``int`` value.
+        """
+        return self._held
+
+    @property
+    def waiting(self) -> int:
+        """Get the number of acquisitions that are waiting for a lock.
+
+        :return: An ``int`` value.
+        """
+        return sum(count for _, count in self._key_locks.values()) - self._held
+
+    def acquire(self, key: Hashable, *args, **kwargs) -> AsyncContextManager[DatabaseLock]:
         """Acquire a new lock.
 
         :param key: The key to be used for locking.
-        :return: A ``DatabaseLock`` instance.
+        :return: An asynchronous context manager that provides a ``DatabaseLock`` instance.
         """
-        acquired = super(DatabaseClientPool, self).acquire()
 
         async def _fn_enter():
-            client = await acquired.__aenter__()
-            return await DatabaseLock(client, key, *args, **kwargs).__aenter__()
-
-        async def _fn_exit(lock: DatabaseLock):
-            await lock.__aexit__(None, None, None)
-            await acquired.__aexit__(None, None, None)
+            return await self._acquire_lock(key, *args, **kwargs)
 
         # noinspection PyTypeChecker
-        return ContextManager(_fn_enter, _fn_exit)
+        return ContextManager(_fn_enter, self._release_lock)
+
+    async def _acquire_lock(self, key: Hashable, *args, **kwargs) -> DatabaseLock:
+        started_at = monotonic()
+
+        local_lock = self._enter_key(key)
+        try:
+            await local_lock.acquire()
+            try:
+                lock = await self._acquire_database_lock(key, *args, **kwargs)
+                await self._check_database_lock(lock)
+            except BaseException:
+                local_lock.release()
+                raise
+        except BaseException:
+            self._exit_key(key)
+            raise
+
+        self._held += 1
+        self._update_wait_time(monotonic() - started_at)
+        return lock
+
+    async def _acquire_database_lock(self, key: Hashable, *args, **kwargs) -> DatabaseLock:
+        index, client = await self._get_client(key)
+        lock = DatabaseLock(client, key, *args, **kwargs)
+        async with self._client_locks[index]:
+            if await self._try_acquire_database_lock(index, lock):
+                self._held_locks[index].add(lock)
+                return lock
+
+        logger.debug(f"The {key!r} lock is held by another process. Waiting for it...")
+        return await self._wait_database_lock(key, *args, **kwargs)
+
+    async def _wait_database_lock(self, key: Hashable, *args, **kwargs) -> DatabaseLock:
+        context = DatabaseClientPool.acquire(self)
+        client = await context.__aenter__()
+        lock = DatabaseLock(client, key, *args, **kwargs)
+        try:
+            await wait_for(lock.acquire(), self.acquire_timeout)
+        except BaseException:
+            # The lock could have been granted before the interruption, so the connection is closed to release it.
+            await self._release_waited_client(lock, context)
+            raise
+
+        self._waited_locks[lock] = context
+        return lock
+
+    async def _try_acquire_database_lock(self, index: int, lock: DatabaseLock) -> bool:
+        task = create_task(lock.try_acquire())
+        try:
+            return await shield(task)
+        except CancelledError:
+            # The database could have granted the lock before the cancellation, so it must be released anyway.
+            try:
+                if await task:
+                    await lock.release()
+            except Exception:
+                await self._recycle_client(index)
+            raise
+        except Exception:
+            await self._recycle_client(index)
+            raise
+
+    async def _check_database_lock(self, lock: DatabaseLock) -> None:
+        if lock not in self._lost_locks and await lock.client.is_valid():
+            return
+
+        if lock in self._waited_locks:
+            await self._release_waited_client(lock, self._waited_locks.pop(lock))
+        else:
+            index = self._get_index(lock.key)
+            async with self._client_locks[index]:
+                if lock in self._held_locks[index]:
+                    await self._recycle_client(index)
+            self._lost_locks.discard(lock)
+
+        raise ConnectionException(f"The {lock.key!r} lock was lost because its connection was closed.")
+
+    async def _release_lock(self, lock: DatabaseLock) -> None:
+        index = self._get_index(lock.key)
+        lost = lock in self._lost_locks
+        try:
+            if lock in self._waited_locks:
+                context = self._waited_locks.pop(lock)
+                try:
+                    await lock.release()
+                except BaseException:
+                    await self._release_waited_client(lock, context)
+                    raise
+                await context.__aexit__(None, None, None)
+            elif not lost:
+                async with self._client_locks[index]:
+                    self._held_locks[index].discard(lock)
+                    try:
+                        await lock.release()
+                    except BaseException:
+                        # The lock would be held by the connection forever, so it is closed to release it.
+                        await self._recycle_client(index)
+                        raise
+        finally:
+            self._lost_locks.discard(lock)
+            self._held -= 1
+            local_lock, _ = self._key_locks[lock.key]
+            local_lock.release()
+            self._exit_key(lock.key)
+
+        if lost:
+            raise ConnectionException(f"The {lock.key!r} lock was lost because its connection was closed.")
+
+    async def _release_waited_client(self, lock: DatabaseLock, context: AsyncContextManager[DatabaseClient]) -> None:
+        # noinspection PyBroadException
+        with suppress(Exception):
+            await self._destroy_instance(lock.client)
+        await context.__aexit__(None, None, None)
+
+    async def _recycle_client(self, index: int) -> None:
+        client = self._clients.pop(index, None)
+
+        lost_locks = self._held_locks.pop(index, set())
+        self._lost_locks.update(lost_locks)
+        logger.warning(f"Recycling the {index!r} lock client. Lost {len(lost_locks)} held locks...")
+
+        # noinspection PyBroadException
+        with suppress(Exception):
+            await self._destroy_instance(client)
+
+    def _enter_key(self, key: Hashable) -> Lock:
+        local_lock, count = self._key_locks.get(key, (None, 0))
+        if local_lock is None:
+            local_lock = Lock()
+        self._key_locks[key] = (local_lock, count + 1)
+        return local_lock
+
+    def _exit_key(self, key: Hashable) -> None:
+        local_lock, count = self._key_locks[key]
+        if count > 1:
+            self._key_locks[key] = (local_lock, count - 1)
+        else:
+            del self._key_locks[key]
+
+    async def _get_client(self, key: Hashable) -> tuple[int, DatabaseClient]:
+        index = self._get_index(key)
+        if index not in self._client_locks:
+            self._client_locks[index] = Lock()
+
+        async with self._client_locks[index]:
+            client = self._clients.get(index)
+            if client is not None and not await client.is_valid():
+                await self._recycle_client(index)
+
+            while self._clients.get(index) is None:
+                self._clients[index] = await self._create_instance()
+
+        return index, self._clients[index]
+
+    def _get_index(self, key: Hashable) -> int:
+        hashed_key = key if isinstance(key, int) else hash(key)
+        return hashed_key % self.connections
@@ -0,0 +1,6 @@
+from .factories import (
+    AvroSchemaDatabaseOperationFactory,
+)
+from .impl import (
+    DatabaseAvroSchemaStore,
+)
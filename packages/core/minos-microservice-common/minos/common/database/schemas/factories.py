@@ -0,0 +1,37 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+from ..operations import (
+    DatabaseOperation,
+    DatabaseOperationFactory,
+)
+
+
+class AvroSchemaDatabaseOperationFactory(DatabaseOperationFactory, ABC):
+    """Avro Schema Database Operation Factory class."""
+
+    @abstractmethod
+    def build_create(self) -> DatabaseOperation:
+        """Build the database operation to create the schema table.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    @abstractmethod
+    def build_submit(self, fingerprint: bytes, schema: bytes) -> DatabaseOperation:
+        """Build the database operation to store a schema, doing nothing if it is already stored.
+
+        :param fingerprint: The fingerprint of the schema.
+        :param schema: The encoded schema.
+        :return: A ``DatabaseOperation`` instance.
+        """
+
+    @abstractmethod
+    def build_query(self, fingerprint: bytes) -> DatabaseOperation:
+        """Build the database operation to get the encoded schema identified by a fingerprint.
+
+        :param fingerprint: The fingerprint of the schema.
+        :return: A ``DatabaseOperation`` instance.
+        """
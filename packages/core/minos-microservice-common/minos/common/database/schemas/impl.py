@@ -0,0 +1,38 @@
+from typing import (
+    Any,
+    Optional,
+)
+
+from ...protocol import (
+    MinosJsonBinaryProtocol,
+)
+from ...schemas import (
+    AvroSchemaStore,
+)
+from ..mixins import (
+    DatabaseMixin,
+)
+from .factories import (
+    AvroSchemaDatabaseOperationFactory,
+)
+
+
+class DatabaseAvroSchemaStore(AvroSchemaStore, DatabaseMixin[AvroSchemaDatabaseOperationFactory]):
+    """Database Avro Schema Store class."""
+
+    async def _setup(self) -> None:
+        await super()._setup()
+        operation = self.database_operation_factory.build_create()
+        await self.execute_on_database(operation)
+
+    async def _publish(self, fingerprint: bytes, schema: list[Any]) -> None:
+        operation = self.database_operation_factory.build_submit(fingerprint, MinosJsonBinaryProtocol.encode(schema))
+        await self.execute_on_database(operation)
+
+    async def _load(self, fingerprint: bytes) -> Optional[list[Any]]:
+        operation = self.database_operation_factory.build_query(fingerprint)
+        async for (schema,) in self.execute_on_database_and_fetch_all(operation):
+            if isinstance(schema, memoryview):
+                schema = schema.tobytes()
+            return MinosJsonBinaryProtocol.decode(schema)
+        return None
@@ -36,6 +36,14 @@ class MinosProtocolException(MinosException):
     pass
 
 
+class MinosAvroSchemaNotFoundException(MinosProtocolException):
+    """Exception to be raised when the schema of a single-object encoded value is not registered."""
+
+    def __init__(self, fingerprint: bytes):
+        self.fingerprint = fingerprint
+        super().__init__(f"There is not any schema registered with the {fingerprint.hex()!r} fingerprint.")
+
+
 class MinosMessageException(MinosException):
     pass
 
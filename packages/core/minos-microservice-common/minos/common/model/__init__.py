@@ -19,6 +19,7 @@ from .serializers import (
     AvroDataEncoder,
     AvroSchemaDecoder,
     AvroSchemaEncoder,
+    CompiledAvroSchema,
     DataDecoder,
     DataEncoder,
     SchemaDecoder,
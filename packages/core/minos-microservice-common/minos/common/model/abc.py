@@ -42,10 +42,9 @@ from .fields import (
     Field,
 )
 from .serializers import (
-    AvroDataDecoder,
     AvroDataEncoder,
-    AvroSchemaDecoder,
     AvroSchemaEncoder,
+    CompiledAvroSchema,
     DataDecoder,
     DataEncoder,
     SchemaDecoder,
@@ -138,13 +137,8 @@ class Model(Mapping):
         :param data: The avro data of the model.
         :return: A new ``DynamicModel`` instance.
         """
-        schema_decoder = AvroSchemaDecoder()
-        type_ = schema_decoder.build(schema)
-
-        data_decoder = AvroDataDecoder()
-        instance = data_decoder.build(data, type_)
-
-        return instance
+        compiled = CompiledAvroSchema.from_schema(schema)
+        return compiled.decode(data)
 
     @classmethod
     def to_avro_str(cls: Type[T], models: list[T]) -> str:
@@ -171,9 +165,8 @@ class Model(Mapping):
                 f"Every model must have type {model_type} to be valid. Found types: {[type(model) for model in models]}"
             )
 
-        avro_schema = models[0].avro_schema
-        # noinspection PyTypeChecker
-        return MinosAvroProtocol.encode([model.avro_data for model in models], avro_schema, batch_mode=True)
+        compiled = CompiledAvroSchema.from_type(models[0].model_type)
+        return compiled.encode([model.avro_data for model in models], batch_mode=True)
 
     # noinspection PyMethodParameters
     @property_or_classproperty
@@ -286,8 +279,19 @@ class Model(Mapping):
 
         :return: A bytes object.
         """
-        # noinspection PyTypeChecker
-        return MinosAvroProtocol.encode(self.avro_data, self.avro_schema)
+        compiled = CompiledAvroSchema.from_type(self.model_type)
+        return compiled.encode(self.avro_data)
+
+    @property
+    def avro_single_object_bytes(self) -> bytes:
+        """Generate the compact bytes representation of the current instance, following the single-object encoding.
+
+        The schema is not embedded, so the bytes can only be decoded by processes that know it.
+
+        :return: A bytes object.
+        """
+        compiled = CompiledAvroSchema.from_type(self.model_type)
+        return compiled.encode(self.avro_data, single_object=True)
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -9,4 +9,5 @@ from .avro import (
     AvroDataEncoder,
     AvroSchemaDecoder,
     AvroSchemaEncoder,
+    CompiledAvroSchema,
 )
@@ -1,3 +1,6 @@
+from .compiled import (
+    CompiledAvroSchema,
+)
 from .data import (
     AvroDataDecoder,
     AvroDataEncoder,
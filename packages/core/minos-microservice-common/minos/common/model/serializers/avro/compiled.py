@@ -0,0 +1,114 @@
+from __future__ import (
+    annotations,
+)
+
+import json
+from functools import (
+    lru_cache,
+)
+from typing import (
+    Any,
+    Optional,
+)
+
+from cached_property import (
+    cached_property,
+)
+
+from ....protocol import (
+    MinosAvroProtocol,
+)
+from .data import (
+    AvroDataDecoder,
+)
+from .schema import (
+    AvroSchemaDecoder,
+    AvroSchemaEncoder,
+)
+
+
+class CompiledAvroSchema:
+    """Compiled Avro Schema class.
+
+    It keeps together a type, its avro schema and the corresponding parsed schema, so that they are computed once per
+    type instead of once per encoded or decoded value. The instances are cached with a bounded LRU policy.
+    """
+
+    def __init__(self, schema: Any, type_: Optional[type] = None):
+        self._schema = schema
+        self._type = type_
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def from_type(cls, type_: type) -> CompiledAvroSchema:
+        """Get the compiled schema for the given type.
+
+        :param type_: The type to be compiled. Usually it is a ``ModelType`` instance.
+        :return: A ``CompiledAvroSchema`` instance.
+        """
+        encoder = AvroSchemaEncoder()
+        return cls([encoder.build(type_)], type_)
+
+    @classmethod
+    def from_schema(cls, schema: Any) -> CompiledAvroSchema:
+        """Get the compiled schema for the given avro schema.
+
+        :param schema: The avro schema to be compiled.
+        :return: A ``CompiledAvroSchema`` instance.
+        """
+        return cls._from_raw_schema(json.dumps(schema))
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _from_raw_schema(cls, raw: str) -> CompiledAvroSchema:
+        return cls(json.loads(raw))
+
+    @property
+    def schema(self) -> Any:
+        """Get the avro schema.
+
+        :return: The avro schema.
+        """
+        return self._schema
+
+    @cached_property
+    def parsed_schema(self) -> dict[str, Any]:
+        """Get the parsed schema, ready to be used by ``fastavro``.
+
+        :return: A ``dict`` instance.
+        """
+        return MinosAvroProtocol.parse_schema(self._schema)
+
+    @property
+    def type_(self) -> type:
+        """Get the type described by the schema.
+
+        :return: A type.
+        """
+        if self._type is None:
+            decoder = AvroSchemaDecoder()
+            self._type = decoder.build(self._schema)
+        return self._type
+
+    def encode(self, data: Any, **kwargs) -> bytes:
+        """Encode the given avro data into bytes.
+
+        :param data: The avro data to be encoded.
+        :param kwargs: Additional named arguments passed to ``MinosAvroProtocol.encode``.
+        :return: A ``bytes`` instance.
+        """
+        schema = self.parsed_schema
+        if kwargs.get("single_object", False) or not isinstance(schema, dict):
+            # The single-object encoding relies on its own registry and the parsed unions cannot be told apart from
+            # a not parsed sequence of schemas.
+            schema = self._schema
+        return MinosAvroProtocol.encode(data, schema, **kwargs)
+
+    def decode(self, data: Any) -> Any:
+        """Decode the given avro data into an instance of the compiled type.
+
+        :param data: The avro data to be decoded.
+        :return: The decoded instance.
+        """
+        decoder = AvroDataDecoder()
+        return decoder.build(data, self.type_)
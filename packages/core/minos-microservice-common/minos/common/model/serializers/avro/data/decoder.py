@@ -17,12 +17,16 @@ from datetime import (
     timedelta,
     timezone,
 )
+from functools import (
+    lru_cache,
+)
 from itertools import (
     zip_longest,
 )
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Optional,
     Type,
     TypeVar,
@@ -114,45 +118,62 @@ class AvroDataDecoder(DataDecoder):
         if data is MissingSentinel:
             raise DataDecoderRequiredValueException("Value is missing.")
 
+        builder = self._get_single_builder(type_)
+        return builder(self, type_, data, **kwargs)
+
+    @classmethod
+    def _get_single_builder(cls, type_: type) -> Callable[..., Any]:
+        try:
+            return cls._get_single_builder_cached(type_)
+        except TypeError:
+            return cls._resolve_single_builder(type_)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _get_single_builder_cached(cls, type_: type) -> Callable[..., Any]:
+        return cls._resolve_single_builder(type_)
+
+    @classmethod
+    def _resolve_single_builder(cls, type_: type) -> Callable[..., Any]:
+        # The resolution only depends on the type, so it is computed once per type instead of once per value.
         if is_model_subclass(type_):
-            # noinspection PyTypeChecker
-            return self._build_model(type_, data, **kwargs)
+            return lambda self, type_, data, **kwargs: self._build_model(type_, data, **kwargs)
 
         if is_type_subclass(type_):
             if issubclass(type_, bool):
-                return self._build_bool(data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_bool(data, **kwargs)
 
             if issubclass(type_, int):
-                return self._build_int(type_, data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_int(type_, data, **kwargs)
 
             if issubclass(type_, float):
-                return self._build_float(data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_float(data, **kwargs)
 
             if issubclass(type_, str):
-                return self._build_string(type_, data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_string(type_, data, **kwargs)
 
             if issubclass(type_, bytes):
-                return self._build_bytes(data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_bytes(data, **kwargs)
 
             if issubclass(type_, datetime):
-                return self._build_datetime(data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_datetime(data, **kwargs)
 
             if issubclass(type_, timedelta):
-                return self._build_timedelta(data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_timedelta(data, **kwargs)
 
             if issubclass(type_, date):
-                return self._build_date(data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_date(data, **kwargs)
 
             if issubclass(type_, time):
-                return self._build_time(data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_time(data, **kwargs)
 
             if issubclass(type_, UUID):
-                return self._build_uuid(data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_uuid(data, **kwargs)
 
             if isinstance(type_, ModelType):
-                return self._build_model_type(type_, data, **kwargs)
+                return lambda self, type_, data, **kwargs: self._build_model_type(type_, data, **kwargs)
 
-        return self._build_collection(type_, data, **kwargs)
+        return lambda self, type_, data, **kwargs: self._build_collection(type_, data, **kwargs)
 
     @staticmethod
     def _build_none(type_: type, data: Any, **kwargs) -> Any:
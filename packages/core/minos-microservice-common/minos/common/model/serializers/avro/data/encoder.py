@@ -13,9 +13,13 @@ from datetime import (
 from decimal import (
     Decimal,
 )
+from functools import (
+    lru_cache,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
 )
 from uuid import (
     UUID,
@@ -26,6 +30,7 @@ from .....exceptions import (
 )
 from ....types import (
     MissingSentinel,
+    NoneType,
 )
 from ...abc import (
     DataEncoder,
@@ -59,54 +64,65 @@ class AvroDataEncoder(DataEncoder):
         return self._build(value, **kwargs)
 
     def _build(self, value: Any, **kwargs) -> Any:
-        if value is None:
-            return None
+        builder = self._get_builder(type(value))
+        return builder(self, value, **kwargs)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _get_builder(cls, type_: type) -> Callable[..., Any]:
+        # The resolution only depends on the type of the value, so it is computed once per type instead of once per
+        # value.
+        if issubclass(type_, NoneType):
+            return lambda self, value, **kwargs: None
 
         from ....abc import (
             Model,
         )
 
-        if isinstance(value, Model):
-            return self._build_model(value, **kwargs)
+        if issubclass(type_, Model):
+            return lambda self, value, **kwargs: self._build_model(value, **kwargs)
 
         from ....abc import (
             Field,
         )
 
-        if isinstance(value, Field):
-            return self._build_field(value, **kwargs)
+        if issubclass(type_, Field):
+            return lambda self, value, **kwargs: self._build_field(value, **kwargs)
+
+        if issubclass(type_, (str, int, bool, float, bytes)):
+            return lambda self, value, **kwargs: value
 
-        if isinstance(value, (str, int, bool, float, bytes)):
-            return value
+        if issubclass(type_, memoryview):
+            return lambda self, value, **kwargs: value.tobytes()
 
-        if isinstance(value, memoryview):
-            return value.tobytes()
+        if issubclass(type_, Decimal):
+            return lambda self, value, **kwargs: float(value)
 
-        if isinstance(value, Decimal):
-            return float(value)
+        if issubclass(type_, datetime):
+            return lambda self, value, **kwargs: self._build_datetime(value, **kwargs)
 
-        if isinstance(value, datetime):
-            return self._build_datetime(value, **kwargs)
+        if issubclass(type_, timedelta):
+            return lambda self, value, **kwargs: self._build_timedelta(value, **kwargs)
 
-        if isinstance(value, timedelta):
-            return self._build_timedelta(value, **kwargs)
+        if issubclass(type_, date):
+            return lambda self, value, **kwargs: self._build_date(value, **kwargs)
 
-        if isinstance(value, date):
-            return self._build_date(value, **kwargs)
+        if issubclass(type_, time):
+            return lambda self, value, **kwargs: self._build_time(value, **kwargs)
 
-        if isinstance(value, time):
-            return self._build_time(value, **kwargs)
+        if issubclass(type_, UUID):
+            return lambda self, value, **kwargs: self._build_uuid(value, **kwargs)
 
-        if isinstance(value, UUID):
-            return self._build_uuid(value, **kwargs)
+        if issubclass(type_, (list, set)):
+            return lambda self, value, **kwargs: [self._build(v, **kwargs) for v in value]
 
-        if isinstance(value, (list, set)):
-            return [self._build(v, **kwargs) for v in value]
+        if issubclass(type_, dict):
+            return lambda self, value, **kwargs: {k: self._build(v, **kwargs) for k, v in value.items()}
 
-        if isinstance(value, dict):
-            return {k: self._build(v, **kwargs) for k, v in value.items()}
+        def _fn(self, value: Any, **kwargs) -> Any:
+            raise MinosMalformedAttributeException(f"Given type is not supported: {type(value)!r} ({value!r})")
 
-        raise MinosMalformedAttributeException(f"Given type is not supported: {type(value)!r} ({value!r})")
+        return _fn
 
     def _build_model(self, model: Model, **kwargs) -> Any:
         raw = {name: self._build_field(field, **kwargs) for name, field in model.fields.items()}
@@ -11,6 +11,9 @@ from asyncio import (
     gather,
     sleep,
 )
+from time import (
+    monotonic,
+)
 from typing import (
     Any,
     AsyncContextManager,
@@ -121,9 +124,23 @@ class Pool(SetupMixin, _PoolBase, Generic[P], ABC):
 
     def __init__(self, *args, already_setup: bool = True, **kwargs):
         super().__init__(*args, already_setup=already_setup, **kwargs)
+        self._wait_time = 0.0
+
+    @property
+    def wait_time(self) -> float:
+        """Get the time spent waiting to acquire an instance, as an exponentially weighted moving average.
+
+        :return: A ``float`` value in seconds.
+        """
+        return self._wait_time
+
+    def _update_wait_time(self, value: float, smoothing: float = 0.1) -> None:
+        self._wait_time += smoothing * (value - self._wait_time)
 
     # noinspection PyUnresolvedReferences
     async def __acquire(self) -> Any:  # pragma: no cover
+        started_at = monotonic()
+
         if self._instances.empty() and not self._semaphore.locked():
             await self._PoolBase__create_new_instance()
 
@@ -141,6 +158,7 @@ class Pool(SetupMixin, _PoolBase, Generic[P], ABC):
                 return await self._PoolBase__acquire()
 
         self._used.add(instance)
+        self._update_wait_time(monotonic() - started_at)
         logger.debug(f"Acquired instance: {instance!r}")
         return instance
 
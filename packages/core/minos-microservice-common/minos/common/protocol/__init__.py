@@ -2,6 +2,7 @@ from .abc import (
     MinosBinaryProtocol,
 )
 from .avro import (
+    AvroSchemaRegistry,
     MinosAvroDatabaseProtocol,
     MinosAvroMessageProtocol,
     MinosAvroProtocol,
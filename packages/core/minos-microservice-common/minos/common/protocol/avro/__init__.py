@@ -7,3 +7,6 @@ from .databases import (
 from .messages import (
     MinosAvroMessageProtocol,
 )
+from .registries import (
+    AvroSchemaRegistry,
+)
@@ -1,12 +1,15 @@
 import io
 from typing import (
     Any,
+    Optional,
     Union,
 )
 
 from fastavro import (
     parse_schema,
     reader,
+    schemaless_reader,
+    schemaless_writer,
     writer,
 )
 
@@ -16,37 +19,94 @@ from ...exceptions import (
 from ..abc import (
     MinosBinaryProtocol,
 )
+from .registries import (
+    AvroSchemaRegistry,
+)
 
 
 class MinosAvroProtocol(MinosBinaryProtocol):
-    """Minos Avro Protocol class."""
+    """Minos Avro Protocol class.
+
+    The data can be encoded as an object container (the default), which embeds the full schema, or following the
+    single-object encoding, which only contains a marker, the schema fingerprint and the schemaless data. The latter is
+    much more compact but the schema must be known by the local registry of the decoding process, otherwise a
+    ``MinosAvroSchemaNotFoundException`` is raised, so that it can be loaded from an ``AvroSchemaStore`` first.
+    """
+
+    SINGLE_OBJECT_MARKER = b"\xc3\x01"
+
+    registry: AvroSchemaRegistry = AvroSchemaRegistry()
 
     @classmethod
-    def encode(cls, value: Any, schema: Any, *args, batch_mode: bool = False, **kwargs) -> bytes:
+    def encode(
+        cls, value: Any, schema: Any, *args, batch_mode: bool = False, single_object: bool = False, **kwargs
+    ) -> bytes:
         """Encoder in avro for database Values
         all the headers are converted in fields with double underscore name
         the body is a set fields coming from the data type.
 
         :param value: The data to be stored.
-        :param schema: The schema relative to the data.
+        :param schema: The schema relative to the data. It can also be a schema previously parsed with
+            ``parse_schema``, which avoids parsing it again.
         :param args: Additional positional arguments.
         :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
             single model.
+        :param single_object: If ``True`` the data is encoded following the single-object encoding, otherwise it is
+            encoded as an object container.
         :param kwargs: Additional named arguments.
         :return: A bytes object.
         """
+        if single_object:
+            return cls._encode_single_object(value, schema, batch_mode)
+
         if not batch_mode:
             value = [value]
 
+        try:
+            raw_schema = cls.parse_schema(schema)
+            return cls._write_data(value, raw_schema)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error encoding data: {exc!r}")
+
+    @classmethod
+    def _encode_single_object(cls, value: Any, schema: Any, batch_mode: bool) -> bytes:
+        if batch_mode:
+            raise MinosProtocolException("The single-object encoding does not support the 'batch_mode' argument.")
+
         if not isinstance(schema, list):
             schema = [schema]
 
         try:
-            raw_schema = cls._parse_schema(schema)
-            return cls._write_data(value, raw_schema)
+            fingerprint = cls.registry.register(schema)
+            parsed_schema = cls.registry.get_parsed_schema(fingerprint)
+            with io.BytesIO() as file:
+                file.write(cls.SINGLE_OBJECT_MARKER)
+                file.write(fingerprint)
+                schemaless_writer(file, parsed_schema, value)
+                return file.getvalue()
         except Exception as exc:
             raise MinosProtocolException(f"Error encoding data: {exc!r}")
 
+    @classmethod
+    def parse_schema(cls, schema: Any) -> dict[str, Any]:
+        """Parse the given schema, so that it can be reused across multiple encode calls.
+
+        :param schema: The schema to be parsed. If it is a list, the first entry is the main one and the rest are the
+            named schemas referenced by it.
+        :return: The parsed schema.
+        """
+        if cls._is_parsed_schema(schema):
+            return schema
+
+        if not isinstance(schema, list):
+            schema = [schema]
+
+        return cls._parse_schema(schema)
+
+    @staticmethod
+    def _is_parsed_schema(schema: Any) -> bool:
+        return isinstance(schema, dict) and "__fastavro_parsed" in schema
+
     @staticmethod
     def _parse_schema(schema: list[dict[str, Any]]) -> dict[str, Any]:
         named_schemas = {}
@@ -73,6 +133,8 @@ class MinosAvroProtocol(MinosBinaryProtocol):
         :param kwargs: Additional named arguments.
         :return: A dictionary or a list of dictionaries.
         """
+        if cls._is_single_object(data):
+            return cls._decode_single_object(data, batch_mode)
 
         try:
             with io.BytesIO(data) as file:
@@ -89,6 +151,19 @@ class MinosAvroProtocol(MinosBinaryProtocol):
 
         return ans
 
+    @classmethod
+    def _decode_single_object(cls, data: bytes, batch_mode: bool) -> Any:
+        if batch_mode:
+            raise MinosProtocolException("The single-object encoding does not support the 'batch_mode' argument.")
+
+        parsed_schema = cls.registry.get_parsed_schema(cls._get_fingerprint(data))
+        try:
+            with io.BytesIO(data) as file:
+                file.seek(len(cls.SINGLE_OBJECT_MARKER) + cls.registry.FINGERPRINT_SIZE)
+                return schemaless_reader(file, parsed_schema)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
+
     # noinspection PyUnusedLocal
     @classmethod
     def decode_schema(cls, data: bytes, *args, **kwargs) -> Union[dict[str, Any], list[dict[str, Any]]]:
@@ -99,6 +174,8 @@ class MinosAvroProtocol(MinosBinaryProtocol):
         :param kwargs: Additional named arguments.
         :return: A tuple or a list of tuples.
         """
+        if cls._is_single_object(data):
+            return cls.registry.get_schema(cls._get_fingerprint(data))
 
         try:
             with io.BytesIO(data) as file:
@@ -109,3 +186,24 @@ class MinosAvroProtocol(MinosBinaryProtocol):
             raise MinosProtocolException(f"Error getting avro schema: {exc}")
 
         return schema
+
+    @classmethod
+    def get_fingerprint(cls, data: bytes) -> Optional[bytes]:
+        """Get the schema fingerprint of the given bytes.
+
+        :param data: A bytes object.
+        :return: The fingerprint if the data follows the single-object encoding or ``None`` otherwise.
+        """
+        if not cls._is_single_object(data):
+            return None
+        return cls._get_fingerprint(data)
+
+    @classmethod
+    def _is_single_object(cls, data: bytes) -> bool:
+        return data.startswith(cls.SINGLE_OBJECT_MARKER)
+
+    @classmethod
+    def _get_fingerprint(cls, data: bytes) -> bytes:
+        start = len(cls.SINGLE_OBJECT_MARKER)
+        end = start + cls.registry.FINGERPRINT_SIZE
+        return data[start:end]
@@ -0,0 +1,165 @@
+from __future__ import (
+    annotations,
+)
+
+import json
+from hashlib import (
+    blake2b,
+)
+from typing import (
+    Any,
+    Union,
+)
+from uuid import (
+    UUID,
+)
+
+from fastavro import (
+    parse_schema,
+)
+
+from ...exceptions import (
+    MinosAvroSchemaNotFoundException,
+)
+
+
+class AvroSchemaRegistry:
+    """Avro Schema Registry class.
+
+    It stores the known schemas indexed by a 64-bit fingerprint, so that the single-object encoding can ship the
+    fingerprint instead of the whole schema. The registry is local to the process, so the schemas must be shared with
+    the decoding processes through an ``AvroSchemaStore``, which publishes the registered schemas and adds the ones
+    that are unknown by the process.
+    """
+
+    FINGERPRINT_SIZE = 8
+
+    def __init__(self):
+        self._parsed_schemas: dict[bytes, dict[str, Any]] = dict()
+        self._schemas: dict[bytes, Union[dict[str, Any], list[Any], str]] = dict()
+        self._registered_schemas: dict[bytes, list[Any]] = dict()
+        self._fingerprints: dict[str, bytes] = dict()
+
+    def __contains__(self, fingerprint: bytes) -> bool:
+        return fingerprint in self._parsed_schemas
+
+    def __len__(self) -> int:
+        return len(self._parsed_schemas)
+
+    def register(self, schema: list[Any]) -> bytes:
+        """Register the given schema.
+
+        :param schema: The schema to be registered, as a list of (possibly named) schemas in which the first one is the
+            main one.
+        :return: The fingerprint of the schema.
+        """
+        schema = self._normalize(schema)
+        key = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+
+        if (fingerprint := self._fingerprints.get(key)) is not None:
+            return fingerprint
+
+        fingerprint = blake2b(key.encode(), digest_size=self.FINGERPRINT_SIZE).digest()
+        self._add(fingerprint, schema, key)
+
+        return fingerprint
+
+    def add(self, fingerprint: bytes, schema: list[Any]) -> None:
+        """Add a schema that has been registered by another process.
+
+        :param fingerprint: The fingerprint of the schema.
+        :param schema: The schema, as it was returned by ``get_registered_schema``.
+        :return: This method does not return anything.
+        """
+        if fingerprint in self._parsed_schemas:
+            return
+
+        self._add(fingerprint, schema, json.dumps(schema, sort_keys=True, separators=(",", ":")))
+
+    def _add(self, fingerprint: bytes, schema: list[Any], key: str) -> None:
+        parsed_schema = self._parse_schema(schema)
+        self._parsed_schemas[fingerprint] = parsed_schema
+        self._schemas[fingerprint] = self._clean(parsed_schema)
+        self._registered_schemas[fingerprint] = schema
+        self._fingerprints[key] = fingerprint
+
+    def get_registered_schema(self, fingerprint: bytes) -> list[Any]:
+        """Get the schema identified by the given fingerprint, as it was registered.
+
+        :param fingerprint: The fingerprint of the schema.
+        :return: A list of (possibly named) schemas in which the first one is the main one.
+        """
+        try:
+            return self._registered_schemas[fingerprint]
+        except KeyError:
+            raise MinosAvroSchemaNotFoundException(fingerprint)
+
+    def get_parsed_schema(self, fingerprint: bytes) -> dict[str, Any]:
+        """Get the parsed schema identified by the given fingerprint.
+
+        :param fingerprint: The fingerprint of the schema.
+        :return: A parsed schema, ready to be used by ``fastavro``.
+        """
+        try:
+            return self._parsed_schemas[fingerprint]
+        except KeyError:
+            raise MinosAvroSchemaNotFoundException(fingerprint)
+
+    def get_schema(self, fingerprint: bytes) -> Union[dict[str, Any], list[Any], str]:
+        """Get the schema identified by the given fingerprint.
+
+        :param fingerprint: The fingerprint of the schema.
+        :return: The schema, with the same structure as the writer schema of an object container.
+        """
+        try:
+            return self._schemas[fingerprint]
+        except KeyError:
+            raise MinosAvroSchemaNotFoundException(fingerprint)
+
+    @classmethod
+    def _normalize(cls, schema: list[Any]) -> list[Any]:
+        # The schema encoder suffixes the namespaces with random identifiers, so they are replaced by sequential ones to
+        # obtain the same fingerprint for equivalent schemas.
+        return cls._normalize_namespaces(schema, dict())
+
+    @classmethod
+    def _normalize_namespaces(cls, schema: Any, namespaces: dict[str, str]) -> Any:
+        if isinstance(schema, list):
+            return [cls._normalize_namespaces(item, namespaces) for item in schema]
+
+        if not isinstance(schema, dict):
+            return schema
+
+        schema = {k: cls._normalize_namespaces(v, namespaces) for k, v in schema.items()}
+        if isinstance(namespace := schema.get("namespace"), str) and "." in namespace:
+            prefix, suffix = namespace.rsplit(".", 1)
+            if cls._is_uuid(suffix):
+                if namespace not in namespaces:
+                    namespaces[namespace] = f"{prefix}.{UUID(int=len(namespaces))!s}"
+                schema["namespace"] = namespaces[namespace]
+        return schema
+
+    @staticmethod
+    def _is_uuid(value: str) -> bool:
+        try:
+            UUID(value)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _parse_schema(schema: list[Any]) -> dict[str, Any]:
+        named_schemas = {}
+        for item in schema[1::-1]:
+            parse_schema(item, named_schemas)
+        return parse_schema(schema[0], named_schemas, expand=True)
+
+    @classmethod
+    def _clean(cls, schema: Any) -> Any:
+        if isinstance(schema, list):
+            return [cls._clean(item) for item in schema]
+
+        if isinstance(schema, dict):
+            return {k: cls._clean(v) for k, v in schema.items() if not k.startswith("__")}
+
+        return schema
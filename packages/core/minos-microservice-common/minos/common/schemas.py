@@ -0,0 +1,99 @@
+from __future__ import (
+    annotations,
+)
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    Any,
+    Optional,
+)
+
+from .exceptions import (
+    MinosAvroSchemaNotFoundException,
+)
+from .injections import (
+    Injectable,
+)
+from .protocol import (
+    AvroSchemaRegistry,
+    MinosAvroProtocol,
+)
+from .setup import (
+    SetupMixin,
+)
+
+
+@Injectable("avro_schema_store")
+class AvroSchemaStore(ABC, SetupMixin):
+    """Avro Schema Store class.
+
+    It shares the schemas of the single-object encoded values between processes, as the ``AvroSchemaRegistry`` is
+    local to each one. The encoding processes publish each schema before sending any value encoded with it, and the
+    decoding processes load the schemas that are not known by their local registry.
+    """
+
+    def __init__(self, *args, registry: Optional[AvroSchemaRegistry] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if registry is None:
+            registry = MinosAvroProtocol.registry
+
+        self.registry = registry
+        self._published: set[bytes] = set()
+
+    async def publish(self, fingerprint: bytes) -> None:
+        """Publish the schema identified by the given fingerprint, so that other processes are able to load it.
+
+        Each schema is only published once per store.
+
+        :param fingerprint: The fingerprint of a schema registered on the local registry.
+        :return: This method does not return anything.
+        """
+        if fingerprint in self._published:
+            return
+
+        schema = self.registry.get_registered_schema(fingerprint)
+        await self._publish(fingerprint, schema)
+
+        self._published.add(fingerprint)
+
+    @abstractmethod
+    async def _publish(self, fingerprint: bytes, schema: list[Any]) -> None:
+        raise NotImplementedError
+
+    async def load(self, fingerprint: bytes) -> None:
+        """Load the schema identified by the given fingerprint into the local registry.
+
+        :param fingerprint: The fingerprint of the schema.
+        :return: This method does not return anything.
+        """
+        if fingerprint in self.registry:
+            return
+
+        schema = await self._load(fingerprint)
+        if schema is None:
+            raise MinosAvroSchemaNotFoundException(fingerprint)
+
+        self.registry.add(fingerprint, schema)
+        self._published.add(fingerprint)
+
+    @abstractmethod
+    async def _load(self, fingerprint: bytes) -> Optional[list[Any]]:
+        raise NotImplementedError
+
+
+class InMemoryAvroSchemaStore(AvroSchemaStore):
+    """In Memory Avro Schema Store class."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._schemas: dict[bytes, list[Any]] = dict()
+
+    async def _publish(self, fingerprint: bytes, schema: list[Any]) -> None:
+        self._schemas[fingerprint] = schema
+
+    async def _load(self, fingerprint: bytes) -> Optional[list[Any]]:
+        return self._schemas.get(fingerprint)
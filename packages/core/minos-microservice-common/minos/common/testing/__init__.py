@@ -1,8 +1,11 @@
 from .database import (
+    MockedAvroSchemaDatabaseOperationFactory,
     MockedDatabaseClient,
     MockedDatabaseOperation,
     MockedLockDatabaseOperationFactory,
     MockedManagementDatabaseOperationFactory,
+    MockedNotificationDatabaseOperation,
+    MockedNotificationDatabaseOperationFactory,
 )
 from .testcases import (
     DatabaseMinosTestCase,
@@ -2,9 +2,12 @@ from .clients import (
     MockedDatabaseClient,
 )
 from .factories import (
+    MockedAvroSchemaDatabaseOperationFactory,
     MockedLockDatabaseOperationFactory,
     MockedManagementDatabaseOperationFactory,
+    MockedNotificationDatabaseOperationFactory,
 )
 from .operations import (
     MockedDatabaseOperation,
+    MockedNotificationDatabaseOperation,
 )
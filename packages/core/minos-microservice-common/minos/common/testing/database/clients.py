@@ -1,25 +1,50 @@
+from __future__ import (
+    annotations,
+)
+
+from asyncio import (
+    Queue,
+)
 from collections.abc import (
     AsyncIterator,
 )
 from typing import (
     Any,
+    ClassVar,
+    Optional,
+)
+from weakref import (
+    WeakSet,
 )
 
 from ...database import (
     DatabaseClient,
+    DatabaseNotification,
 )
 from .operations import (
     MockedDatabaseOperation,
+    MockedNotificationDatabaseOperation,
 )
 
 
 class MockedDatabaseClient(DatabaseClient):
     """For testing purposes"""
 
+    # The listeners are scoped by database, so that the notifications of a test database never reach the clients of
+    # another one, and referenced weakly, so that the clients that are not destroyed are not retained.
+    _listeners: ClassVar[dict[tuple[Optional[str], str], WeakSet[MockedDatabaseClient]]] = dict()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.kwargs = kwargs
         self._response = tuple()
+        self._notifications = Queue()
+
+    async def _destroy(self) -> None:
+        """For testing purposes"""
+        for key in [key for key, listeners in self._listeners.items() if self in listeners]:
+            self._remove_listener(key)
+        await super()._destroy()
 
     async def _reset(self, **kwargs) -> None:
         """For testing purposes"""
@@ -28,6 +53,31 @@ class MockedDatabaseClient(DatabaseClient):
     async def _execute(self, operation: MockedDatabaseOperation) -> None:
         """For testing purposes"""
         self._response = operation.response
+        if isinstance(operation, MockedNotificationDatabaseOperation):
+            self._execute_notification(operation)
+
+    def _execute_notification(self, operation: MockedNotificationDatabaseOperation) -> None:
+        key = (self.kwargs.get("database"), operation.channel)
+        if operation.content == "listen":
+            self._listeners.setdefault(key, WeakSet()).add(self)
+        elif operation.content == "unlisten":
+            self._remove_listener(key)
+        elif operation.content == "notify":
+            notification = DatabaseNotification(operation.channel, operation.payload)
+            for listener in self._listeners.get(key, tuple()):
+                listener._notifications.put_nowait(notification)
+
+    def _remove_listener(self, key: tuple[Optional[str], str]) -> None:
+        listeners = self._listeners.get(key)
+        if listeners is None:
+            return
+        listeners.discard(self)
+        if not len(listeners):
+            del self._listeners[key]
+
+    async def _receive_notification(self) -> DatabaseNotification:
+        """For testing purposes"""
+        return await self._notifications.get()
 
     async def _fetch_all(self, *args, **kwargs) -> AsyncIterator[Any]:
         """For testing purposes"""
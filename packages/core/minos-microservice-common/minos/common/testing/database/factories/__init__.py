@@ -4,3 +4,9 @@ from .locks import (
 from .managements import (
     MockedManagementDatabaseOperationFactory,
 )
+from .notifications import (
+    MockedNotificationDatabaseOperationFactory,
+)
+from .schemas import (
+    MockedAvroSchemaDatabaseOperationFactory,
+)
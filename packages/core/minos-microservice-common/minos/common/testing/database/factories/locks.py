@@ -17,6 +17,10 @@ class MockedLockDatabaseOperationFactory(LockDatabaseOperationFactory):
         """For testing purposes"""
         return MockedDatabaseOperation("acquire")
 
+    def build_try_acquire(self, hashed_key: int) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("try_acquire", [(True,)])
+
     def build_release(self, hashed_key: int) -> DatabaseOperation:
         """For testing purposes"""
         return MockedDatabaseOperation("release")
@@ -0,0 +1,33 @@
+from typing import (
+    Optional,
+)
+
+from ....database import (
+    DatabaseOperation,
+    NotificationDatabaseOperationFactory,
+)
+from ..clients import (
+    MockedDatabaseClient,
+)
+from ..operations import (
+    MockedNotificationDatabaseOperation,
+)
+
+
+class MockedNotificationDatabaseOperationFactory(NotificationDatabaseOperationFactory):
+    """For testing purposes"""
+
+    def build_listen(self, channel: str) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedNotificationDatabaseOperation("listen", channel)
+
+    def build_unlisten(self, channel: str) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedNotificationDatabaseOperation("unlisten", channel)
+
+    def build_notify(self, channel: str, payload: Optional[str] = None) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedNotificationDatabaseOperation("notify", channel, payload)
+
+
+MockedDatabaseClient.set_factory(NotificationDatabaseOperationFactory, MockedNotificationDatabaseOperationFactory)
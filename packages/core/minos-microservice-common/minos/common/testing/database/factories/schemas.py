@@ -0,0 +1,29 @@
+from ....database import (
+    AvroSchemaDatabaseOperationFactory,
+    DatabaseOperation,
+)
+from ..clients import (
+    MockedDatabaseClient,
+)
+from ..operations import (
+    MockedDatabaseOperation,
+)
+
+
+class MockedAvroSchemaDatabaseOperationFactory(AvroSchemaDatabaseOperationFactory):
+    """For testing purposes"""
+
+    def build_create(self) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("create")
+
+    def build_submit(self, fingerprint: bytes, schema: bytes) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("submit")
+
+    def build_query(self, fingerprint: bytes) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("query")
+
+
+MockedDatabaseClient.set_factory(AvroSchemaDatabaseOperationFactory, MockedAvroSchemaDatabaseOperationFactory)
@@ -18,3 +18,12 @@ class MockedDatabaseOperation(DatabaseOperation):
         super().__init__(*args, **kwargs)
         self.content = content
         self.response = tuple(response)
+
+
+class MockedNotificationDatabaseOperation(MockedDatabaseOperation):
+    """For testing purposes"""
+
+    def __init__(self, content: str, channel: str, payload: Optional[str] = None, *args, **kwargs):
+        super().__init__(content, *args, **kwargs)
+        self.channel = channel
+        self.payload = payload
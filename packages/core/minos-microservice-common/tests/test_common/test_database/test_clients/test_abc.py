@@ -19,6 +19,7 @@ from minos.common import (
     DatabaseClient,
     DatabaseClientBuilder,
     DatabaseLock,
+    DatabaseNotification,
     DatabaseOperation,
     DatabaseOperationFactory,
     LockDatabaseOperationFactory,
@@ -43,6 +44,17 @@ class _DatabaseClient(DatabaseClient):
         """For testing purposes."""
 
 
+class _PipelinedDatabaseClient(_DatabaseClient):
+    """For testing purposes."""
+
+    def _can_pipeline(self, operations: tuple[DatabaseOperation, ...]) -> bool:
+        """For testing purposes."""
+        return True
+
+    async def _execute_pipelined(self, operations: tuple[DatabaseOperation, ...], transactional: bool) -> None:
+        """For testing purposes."""
+
+
 class _DatabaseOperation(DatabaseOperation):
     """For testing purposes."""
 
@@ -62,6 +74,10 @@ class _LockDatabaseOperationFactory(LockDatabaseOperationFactory):
         """For testing purposes."""
         return _DatabaseOperation()
 
+    def build_try_acquire(self, hashed_key: int) -> DatabaseOperation:
+        """For testing purposes."""
+        return _DatabaseOperation()
+
     def build_release(self, hashed_key: int) -> DatabaseOperation:
         """For testing purposes."""
         return _DatabaseOperation()
@@ -143,6 +159,66 @@ class TestDatabaseClient(CommonTestCase):
             [call(composed), call(composed.operations[0]), call(composed.operations[1])], mock.call_args_list
         )
 
+    async def test_execute_composed_pipelined(self):
+        client = _PipelinedDatabaseClient()
+        execute_mock = AsyncMock()
+        pipelined_mock = AsyncMock()
+        client._execute = execute_mock
+        client._execute_pipelined = pipelined_mock
+
+        op1, op2, op3 = _DatabaseOperation(), _DatabaseOperation(), _DatabaseOperation()
+        composed = ComposedDatabaseOperation([op1, ComposedDatabaseOperation([op2, op3])], transactional=True)
+        await client.execute(composed)
+
+        self.assertEqual([], execute_mock.call_args_list)
+        self.assertEqual([call((op1, op2, op3), transactional=True)], pipelined_mock.call_args_list)
+
+    async def test_execute_composed_pipelined_empty(self):
+        client = _PipelinedDatabaseClient()
+        pipelined_mock = AsyncMock()
+        client._execute_pipelined = pipelined_mock
+
+        await client.execute(ComposedDatabaseOperation([]))
+
+        self.assertEqual([], pipelined_mock.call_args_list)
+
+    async def test_execute_composed_pipelined_with_lock(self):
+        client = _PipelinedDatabaseClient()
+        pipelined_mock = AsyncMock()
+        client._execute_pipelined = pipelined_mock
+
+        composed = ComposedDatabaseOperation([_DatabaseOperation(lock="foo"), _DatabaseOperation()])
+        with patch.object(DatabaseLock, "acquire") as acquire_mock:
+            await client.execute(composed)
+
+        self.assertEqual(1, acquire_mock.call_count)
+        self.assertEqual("foo", client.lock.key)
+        self.assertEqual(1, pipelined_mock.call_count)
+
+    async def test_execute_composed_not_pipelined(self):
+        client = _PipelinedDatabaseClient()
+        pipelined_mock = AsyncMock()
+        client._execute_pipelined = pipelined_mock
+        execute_mock = AsyncMock(side_effect=client.execute)
+        client.execute = execute_mock
+
+        op1, op2 = _DatabaseOperation(lock="foo"), _DatabaseOperation(lock="bar")
+        composed = ComposedDatabaseOperation([op1, op2])
+        with patch.object(DatabaseLock, "acquire"), patch.object(DatabaseLock, "release"):
+            await client.execute(composed)
+
+        self.assertEqual([], pipelined_mock.call_args_list)
+        self.assertEqual([call(composed), call(op1), call(op2)], execute_mock.call_args_list)
+
+    async def test_execute_composed_not_pipelined_timeout(self):
+        client = _PipelinedDatabaseClient()
+        pipelined_mock = AsyncMock()
+        client._execute_pipelined = pipelined_mock
+
+        await client.execute(ComposedDatabaseOperation([_DatabaseOperation(timeout=1), _DatabaseOperation()]))
+
+        self.assertEqual([], pipelined_mock.call_args_list)
+
     async def test_execute_with_lock(self):
         op1 = _DatabaseOperation(lock="foo")
         with patch.object(DatabaseLock, "acquire") as enter_lock_mock:
@@ -197,6 +273,21 @@ class TestDatabaseClient(CommonTestCase):
 
         self.assertEqual([call()], mock.call_args_list)
 
+    async def test_receive_notification(self):
+        notification = DatabaseNotification("foo", "bar")
+        mock = AsyncMock(return_value=notification)
+        client = _DatabaseClient()
+        client._receive_notification = mock
+
+        self.assertEqual(notification, await client.receive_notification())
+
+        self.assertEqual([call()], mock.call_args_list)
+
+    async def test_receive_notification_raises(self):
+        client = _DatabaseClient()
+        with self.assertRaises(NotImplementedError):
+            await client.receive_notification()
+
     async def test_fetch_one_raises(self):
         mock = MagicMock(return_value=FakeAsyncIterator([]))
         client = _DatabaseClient()
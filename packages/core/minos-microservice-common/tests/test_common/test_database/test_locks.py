@@ -33,6 +33,11 @@ class TestDatabaseLock(unittest.IsolatedAsyncioTestCase):
         lock = DatabaseLock(client, "foo")
         self.assertEqual(hash("foo"), lock.hashed_key)
 
+    async def test_try_acquire(self):
+        client = MockedDatabaseClient()
+        lock = DatabaseLock(client, "foo")
+        self.assertTrue(await lock.try_acquire())
+
 
 if __name__ == "__main__":
     unittest.main()
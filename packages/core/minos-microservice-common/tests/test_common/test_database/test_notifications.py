@@ -0,0 +1,152 @@
+import unittest
+from asyncio import (
+    wait_for,
+)
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    patch,
+)
+
+from minos.common import (
+    DatabaseClientPool,
+    DatabaseNotification,
+    DatabaseNotificationListener,
+    NotificationDatabaseOperationFactory,
+    SetupMixin,
+)
+from minos.common.testing import (
+    DatabaseMinosTestCase,
+    MockedDatabaseClient,
+    MockedNotificationDatabaseOperationFactory,
+)
+from tests.utils import (
+    CommonTestCase,
+)
+
+
+class TestDatabaseNotification(unittest.TestCase):
+    def test_constructor(self):
+        notification = DatabaseNotification("foo", "bar")
+        self.assertEqual("foo", notification.channel)
+        self.assertEqual("bar", notification.payload)
+
+    def test_constructor_without_payload(self):
+        notification = DatabaseNotification("foo")
+        self.assertEqual("foo", notification.channel)
+        self.assertEqual(None, notification.payload)
+
+    def test_eq(self):
+        self.assertEqual(DatabaseNotification("foo", "bar"), DatabaseNotification("foo", "bar"))
+        self.assertNotEqual(DatabaseNotification("foo", "bar"), DatabaseNotification("foo", "baz"))
+        self.assertNotEqual(DatabaseNotification("foo", "bar"), DatabaseNotification("baz", "bar"))
+
+    def test_repr(self):
+        self.assertEqual("DatabaseNotification(channel='foo', payload='bar')", repr(DatabaseNotification("foo", "bar")))
+
+
+class TestDatabaseNotificationListener(CommonTestCase, DatabaseMinosTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = DatabaseClientPool.from_config(self.config)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.pool.setup()
+
+    async def asyncTearDown(self):
+        await self.pool.destroy()
+        await super().asyncTearDown()
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(DatabaseNotificationListener, SetupMixin))
+
+    def test_constructor(self):
+        listener = DatabaseNotificationListener(self.pool, "foo")
+        self.assertEqual(self.pool, listener.database_pool)
+        self.assertEqual("foo", listener.channel)
+        self.assertIsInstance(listener.operation_factory, MockedNotificationDatabaseOperationFactory)
+
+    def test_constructor_raises(self):
+        class _DatabaseClient(MockedDatabaseClient):
+            """For testing purposes."""
+
+            _factories = dict()
+
+        self.pool.client_builder.with_cls(_DatabaseClient)
+        with self.assertRaises(ValueError):
+            DatabaseNotificationListener(self.pool, "foo")
+
+    async def test_receive(self):
+        async with DatabaseNotificationListener(self.pool, "foo") as listener:
+            async with self.pool.acquire() as client:
+                factory = client.get_factory(NotificationDatabaseOperationFactory)
+                await client.execute(factory.build_notify("bar", "one"))
+                await client.execute(factory.build_notify("foo", "two"))
+
+            observed = await wait_for(listener.receive(), 0.5)
+
+        self.assertEqual(DatabaseNotification("foo", "two"), observed)
+
+    async def test_aiter(self):
+        listener = DatabaseNotificationListener(self.pool, "foo")
+        await listener.setup()
+
+        async with self.pool.acquire() as client:
+            factory = client.get_factory(NotificationDatabaseOperationFactory)
+            await client.execute(factory.build_notify("foo", "one"))
+            await client.execute(factory.build_notify("foo", "two"))
+
+        observed = list()
+        async for notification in listener:
+            observed.append(notification)
+            if len(observed) == 2:
+                await listener.destroy()
+
+        self.assertEqual([DatabaseNotification("foo", "one"), DatabaseNotification("foo", "two")], observed)
+
+    async def test_setup_raises_releases_client(self):
+        client = MagicMock(execute=AsyncMock(side_effect=ValueError))
+        acquired = MagicMock()
+        acquired.__aenter__.return_value = client
+
+        listener = DatabaseNotificationListener(self.pool, "foo")
+        with patch.object(self.pool, "acquire", return_value=acquired):
+            with self.assertRaises(ValueError):
+                await listener.setup()
+
+        self.assertEqual(1, acquired.__aexit__.call_count)
+        self.assertFalse(listener.already_setup)
+        self.assertIsNone(listener._client)
+
+    async def test_destroy_unlisten(self):
+        listener = DatabaseNotificationListener(self.pool, "foo")
+        await listener.setup()
+        await listener.destroy()
+
+        async with self.pool.acquire() as client:
+            factory = client.get_factory(NotificationDatabaseOperationFactory)
+            await client.execute(factory.build_notify("foo", "one"))
+
+        # noinspection PyUnresolvedReferences
+        self.assertFalse(any(channel == "foo" for _, channel in MockedDatabaseClient._listeners))
+
+    async def test_notifications_scoped_by_database(self):
+        listener = MockedDatabaseClient(database="one")
+        await listener.setup()
+        other = MockedDatabaseClient(database="two")
+        factory = listener.get_factory(NotificationDatabaseOperationFactory)
+
+        await listener.execute(factory.build_listen("foo"))
+        await other.execute(factory.build_notify("foo", "one"))
+        self.assertTrue(listener._notifications.empty())
+
+        await MockedDatabaseClient(database="one").execute(factory.build_notify("foo", "two"))
+        self.assertEqual(DatabaseNotification("foo", "two"), listener._notifications.get_nowait())
+
+        await listener.destroy()
+        self.assertNotIn(("one", "foo"), MockedDatabaseClient._listeners)
+
+
+if __name__ == "__main__":
+    unittest.main()
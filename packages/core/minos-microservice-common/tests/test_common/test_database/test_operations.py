@@ -37,6 +37,11 @@ class TestComposedDatabaseOperation(unittest.TestCase):
         operations = [_DatabaseOperation(), _DatabaseOperation()]
         composed = ComposedDatabaseOperation(operations)
         self.assertEqual(tuple(operations), composed.operations)
+        self.assertFalse(composed.transactional)
+
+    def test_constructor_transactional(self):
+        composed = ComposedDatabaseOperation([_DatabaseOperation()], transactional=True)
+        self.assertTrue(composed.transactional)
 
 
 class TestDatabaseOperationFactory(unittest.TestCase):
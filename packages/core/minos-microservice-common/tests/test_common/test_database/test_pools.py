@@ -1,5 +1,15 @@
 import unittest
+from asyncio import (
+    CancelledError,
+    TimeoutError,
+    create_task,
+    sleep,
+)
+from contextlib import (
+    AsyncExitStack,
+)
 from unittest.mock import (
+    AsyncMock,
     patch,
 )
 
@@ -96,10 +106,189 @@ class TestDatabaseLockPool(CommonTestCase, DatabaseMinosTestCase):
         await self.pool.destroy()
         await super().asyncTearDown()
 
+    def test_constructor(self):
+        self.assertEqual(2, self.pool.connections)
+        self.assertIsNone(self.pool.acquire_timeout)
+        self.assertEqual(0, self.pool.held)
+        self.assertEqual(0, self.pool.waiting)
+
+    def test_constructor_raises(self):
+        with self.assertRaises(ValueError):
+            DatabaseLockPool.from_config(self.config, connections=0)
+
     async def test_acquire(self):
         async with self.pool.acquire("foo") as lock:
             self.assertIsInstance(lock, DatabaseLock)
             self.assertEqual("foo", lock.key)
+            self.assertEqual(1, self.pool.held)
+
+        self.assertEqual(0, self.pool.held)
+        self.assertEqual(dict(), self.pool._key_locks)
+
+    async def test_acquire_multiplexes_clients(self):
+        keys = [0, 1, 2, 3]
+        async with AsyncExitStack() as stack:
+            locks = [await stack.enter_async_context(self.pool.acquire(key)) for key in keys]
+
+            self.assertEqual(4, self.pool.held)
+
+        self.assertEqual(2, len({id(lock.client) for lock in locks}))
+        self.assertEqual(locks[0].client, locks[2].client)
+        self.assertEqual(locks[1].client, locks[3].client)
+
+    async def test_acquire_same_key_waits(self):
+        async with self.pool.acquire("foo"):
+            task = create_task(self._acquire_and_release("foo"))
+            await sleep(0.01)
+
+            self.assertFalse(task.done())
+            self.assertEqual(1, self.pool.waiting)
+
+        await task
+        self.assertEqual(0, self.pool.waiting)
+        self.assertEqual(0, self.pool.held)
+
+    async def test_acquire_waits(self):
+        with patch.object(DatabaseLock, "try_acquire", return_value=False) as try_acquire_mock:
+            with patch.object(DatabaseLock, "acquire") as acquire_mock:
+                with patch.object(DatabaseLock, "release") as release_mock:
+                    async with self.pool.acquire(0) as lock:
+                        self.assertIsNot(self.pool._clients[0], lock.client)
+                        self.assertEqual(1, self.pool.held)
+
+        self.assertEqual(1, try_acquire_mock.call_count)
+        self.assertEqual(1, acquire_mock.call_count)
+        self.assertEqual(1, release_mock.call_count)
+        self.assertEqual(0, self.pool.held)
+        self.assertEqual(dict(), self.pool._waited_locks)
+        self.assertEqual(0, len(self.pool._used))
+
+    async def test_acquire_cancelled(self):
+        async def _fn():
+            await sleep(10)
+
+        with patch.object(DatabaseLock, "try_acquire", return_value=False):
+            with patch.object(DatabaseLock, "acquire", side_effect=_fn):
+                with patch.object(MockedDatabaseClient, "destroy", AsyncMock()) as destroy_mock:
+                    task = create_task(self._acquire_and_release("foo"))
+                    await sleep(0.01)
+                    task.cancel()
+                    with self.assertRaises(CancelledError):
+                        await task
+
+        self.assertEqual(1, destroy_mock.call_count)
+        self.assertEqual(0, self.pool.held)
+        self.assertEqual(dict(), self.pool._key_locks)
+        self.assertEqual(0, len(self.pool._used))
+
+    async def test_acquire_timeout(self):
+        async def _fn():
+            await sleep(10)
+
+        pool = DatabaseLockPool.from_config(self.config, acquire_timeout=0.01)
+        try:
+            with patch.object(DatabaseLock, "try_acquire", return_value=False):
+                with patch.object(DatabaseLock, "acquire", side_effect=_fn):
+                    with patch.object(MockedDatabaseClient, "destroy", AsyncMock()) as destroy_mock:
+                        with self.assertRaises(TimeoutError):
+                            async with pool.acquire("foo"):
+                                pass
+        finally:
+            await pool.destroy()
+
+        self.assertEqual(1, destroy_mock.call_count)
+        self.assertEqual(0, pool.held)
+        self.assertEqual(dict(), pool._key_locks)
+
+    async def test_acquire_cancelled_after_granted(self):
+        async def _fn():
+            await sleep(0.05)
+            return True
+
+        with patch.object(DatabaseLock, "try_acquire", side_effect=_fn):
+            with patch.object(DatabaseLock, "release") as release_mock:
+                task = create_task(self._acquire_and_release("foo"))
+                await sleep(0.01)
+                task.cancel()
+                with self.assertRaises(CancelledError):
+                    await task
+
+        self.assertEqual(1, release_mock.call_count)
+        self.assertEqual(0, self.pool.held)
+
+    async def test_connection_lost(self):
+        with self.assertRaises(ConnectionException):
+            async with self.pool.acquire(0) as first:
+                with patch.object(MockedDatabaseClient, "is_valid", side_effect=[False, True]):
+                    async with self.pool.acquire(2) as second:
+                        pass
+
+        self.assertIsNot(first.client, second.client)
+        self.assertEqual(second.client, self.pool._clients[0])
+        self.assertEqual(0, self.pool.held)
+        self.assertEqual(set(), self.pool._lost_locks)
+
+    async def test_connection_lost_before_provided(self):
+        with patch.object(MockedDatabaseClient, "is_valid", return_value=False):
+            with patch.object(MockedDatabaseClient, "destroy", AsyncMock()) as destroy_mock:
+                with self.assertRaises(ConnectionException):
+                    await self._acquire_and_release(0)
+
+        self.assertEqual(1, destroy_mock.call_count)
+        self.assertNotIn(0, self.pool._clients)
+        self.assertEqual(0, self.pool.held)
+        self.assertEqual(dict(), self.pool._key_locks)
+        self.assertEqual(set(), self.pool._lost_locks)
+
+    async def test_release_raises_recycles_client(self):
+        with patch.object(DatabaseLock, "release", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                async with self.pool.acquire(0) as lock:
+                    pass
+
+        self.assertNotIn(0, self.pool._clients)
+        self.assertEqual(0, self.pool.held)
+
+        async with self.pool.acquire(0) as other:
+            self.assertIsNot(lock.client, other.client)
+
+    async def test_release_raises_closes_waited_client(self):
+        with patch.object(DatabaseLock, "try_acquire", return_value=False):
+            with patch.object(DatabaseLock, "acquire"):
+                with patch.object(DatabaseLock, "release", side_effect=ValueError):
+                    with patch.object(MockedDatabaseClient, "destroy", AsyncMock()) as destroy_mock:
+                        with self.assertRaises(ValueError):
+                            await self._acquire_and_release(0)
+
+        self.assertEqual(1, destroy_mock.call_count)
+        self.assertIn(0, self.pool._clients)
+        self.assertEqual(0, self.pool.held)
+        self.assertEqual(0, len(self.pool._used))
+
+    async def test_try_acquire_raises_recycles_client(self):
+        with patch.object(DatabaseLock, "try_acquire", side_effect=ValueError):
+            with patch.object(MockedDatabaseClient, "destroy", AsyncMock()) as destroy_mock:
+                with self.assertRaises(ValueError):
+                    await self._acquire_and_release(0)
+
+        self.assertNotIn(0, self.pool._clients)
+        self.assertEqual(1, destroy_mock.call_count)
+        self.assertEqual(0, self.pool.held)
+
+    async def test_destroy(self):
+        async with self.pool.acquire("foo") as lock:
+            pass
+
+        with patch.object(MockedDatabaseClient, "destroy") as mock:
+            await self.pool.destroy()
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(dict(), self.pool._clients)
+        self.assertIsInstance(lock.client, MockedDatabaseClient)
+
+    async def _acquire_and_release(self, key) -> None:
+        async with self.pool.acquire(key):
+            pass
 
 
 if __name__ == "__main__":
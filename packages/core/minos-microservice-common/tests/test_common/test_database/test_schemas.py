@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import (
+    patch,
+)
+
+from minos.common import (
+    AvroSchemaRegistry,
+    AvroSchemaStore,
+    DatabaseAvroSchemaStore,
+    DatabaseMixin,
+    MinosAvroSchemaNotFoundException,
+    MinosJsonBinaryProtocol,
+)
+from minos.common.testing import (
+    DatabaseMinosTestCase,
+    MockedAvroSchemaDatabaseOperationFactory,
+    MockedDatabaseClient,
+)
+from tests.utils import (
+    CommonTestCase,
+    FakeAsyncIterator,
+)
+
+
+class TestDatabaseAvroSchemaStore(CommonTestCase, DatabaseMinosTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = [
+            {"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}
+        ]
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(DatabaseAvroSchemaStore, (AvroSchemaStore, DatabaseMixin)))
+
+    def test_operation_factory(self):
+        store = DatabaseAvroSchemaStore.from_config(self.config)
+        self.assertIsInstance(store.database_operation_factory, MockedAvroSchemaDatabaseOperationFactory)
+
+    async def test_publish(self):
+        registry = AvroSchemaRegistry()
+        fingerprint = registry.register(self.schema)
+
+        async with DatabaseAvroSchemaStore.from_config(self.config, registry=registry) as store:
+            factory = store.database_operation_factory
+            with patch.object(factory, "build_submit", wraps=factory.build_submit) as mock:
+                await store.publish(fingerprint)
+                await store.publish(fingerprint)
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(fingerprint, mock.call_args.args[0])
+        self.assertEqual(
+            registry.get_registered_schema(fingerprint), MinosJsonBinaryProtocol.decode(mock.call_args.args[1])
+        )
+
+    async def test_load(self):
+        fingerprint = AvroSchemaRegistry().register(self.schema)
+        registry = AvroSchemaRegistry()
+
+        encoded = memoryview(MinosJsonBinaryProtocol.encode(self.schema))
+        async with DatabaseAvroSchemaStore.from_config(self.config, registry=registry) as store:
+            with patch.object(MockedDatabaseClient, "fetch_all", return_value=FakeAsyncIterator([(encoded,)])):
+                await store.load(fingerprint)
+
+        self.assertIn(fingerprint, registry)
+
+    async def test_load_unknown_raises(self):
+        async with DatabaseAvroSchemaStore.from_config(self.config, registry=AvroSchemaRegistry()) as store:
+            with patch.object(MockedDatabaseClient, "fetch_all", return_value=FakeAsyncIterator([])):
+                with self.assertRaises(MinosAvroSchemaNotFoundException):
+                    await store.load(bytes(8))
+
+
+if __name__ == "__main__":
+    unittest.main()
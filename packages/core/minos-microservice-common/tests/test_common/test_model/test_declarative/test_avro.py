@@ -280,6 +280,15 @@ class TestModelAvro(unittest.IsolatedAsyncioTestCase):
         recovered = Bar.from_avro_bytes(serialized)
         self.assertEqual(original, recovered)
 
+    def test_from_avro_single_object_bytes(self):
+        original = Bar(first=Foo("one"), second=Foo("two"))
+        serialized = original.avro_single_object_bytes
+        self.assertLess(len(serialized), len(original.avro_bytes))
+        self.assertEqual(serialized, original.avro_single_object_bytes)
+
+        recovered = Bar.from_avro_bytes(serialized)
+        self.assertEqual(original, recovered)
+
     def test_from_avro_bytes_uuid(self):
         original = FooBar(uuid4())
         serialized = original.avro_bytes
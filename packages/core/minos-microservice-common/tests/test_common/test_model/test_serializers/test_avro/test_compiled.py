@@ -0,0 +1,81 @@
+import unittest
+from uuid import (
+    uuid4,
+)
+
+from minos.common import (
+    CompiledAvroSchema,
+    MinosAvroProtocol,
+    ModelType,
+)
+from tests.model_classes import (
+    ShoppingList,
+    User,
+)
+
+
+class TestCompiledAvroSchema(unittest.TestCase):
+    def test_from_type(self):
+        type_ = ModelType.build("tests.model_classes.Foo", {"bar": int})
+        compiled = CompiledAvroSchema.from_type(type_)
+
+        self.assertEqual(type_, compiled.type_)
+        self.assertEqual(1, len(compiled.schema))
+        self.assertEqual("Foo", compiled.schema[0]["name"])
+        self.assertEqual([{"name": "bar", "type": "int"}], compiled.schema[0]["fields"])
+
+    def test_from_type_cached(self):
+        type_ = ModelType.build("tests.model_classes.Foo", {"bar": int})
+
+        self.assertIs(CompiledAvroSchema.from_type(type_), CompiledAvroSchema.from_type(type_))
+
+    def test_from_schema(self):
+        schema = {
+            "type": "record",
+            "name": "Foo",
+            "namespace": "tests.model_classes.hello",
+            "fields": [{"type": "int", "name": "bar"}],
+        }
+        compiled = CompiledAvroSchema.from_schema(schema)
+
+        self.assertEqual(schema, compiled.schema)
+        self.assertEqual(ModelType.build("tests.model_classes.Foo", {"bar": int}), compiled.type_)
+
+    def test_from_schema_cached(self):
+        schema = {"type": "record", "name": "tests.model_classes.Foo", "fields": [{"type": "int", "name": "bar"}]}
+
+        self.assertIs(CompiledAvroSchema.from_schema(schema), CompiledAvroSchema.from_schema(schema))
+
+    def test_parsed_schema(self):
+        compiled = CompiledAvroSchema.from_type(ModelType.build("tests.model_classes.Foo", {"bar": int}))
+
+        self.assertIs(compiled.parsed_schema, compiled.parsed_schema)
+        self.assertIs(compiled.parsed_schema, MinosAvroProtocol.parse_schema(compiled.parsed_schema))
+
+    def test_encode_decode(self):
+        model = ShoppingList(User(1234), cost="1.234")
+        compiled = CompiledAvroSchema.from_type(model.model_type)
+
+        encoded = compiled.encode(model.avro_data)
+        self.assertEqual(model.avro_data, MinosAvroProtocol.decode(encoded))
+
+        self.assertEqual(model, compiled.decode(MinosAvroProtocol.decode(encoded)))
+
+    def test_encode_single_object(self):
+        model = User(1234)
+        compiled = CompiledAvroSchema.from_type(model.model_type)
+
+        encoded = compiled.encode(model.avro_data, single_object=True)
+        self.assertTrue(encoded.startswith(MinosAvroProtocol.SINGLE_OBJECT_MARKER))
+        self.assertEqual(model.avro_data, MinosAvroProtocol.decode(encoded))
+
+    def test_encode_union(self):
+        compiled = CompiledAvroSchema.from_type(ModelType.build("tests.model_classes.Foo", {"bar": str}))
+        compiled = CompiledAvroSchema([["string", compiled.schema[0]]])
+
+        value = str(uuid4())
+        self.assertEqual(value, MinosAvroProtocol.decode(compiled.encode(value)))
+
+
+if __name__ == "__main__":
+    unittest.main()
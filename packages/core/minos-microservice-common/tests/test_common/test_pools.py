@@ -9,6 +9,7 @@ from typing import (
     Any,
 )
 from unittest.mock import (
+    AsyncMock,
     MagicMock,
     patch,
 )
@@ -85,6 +86,17 @@ class TestPool(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(1, pool.create_instance_call_count)
         self.assertLess(0, pool.destroy_instance_call_count)
 
+    async def test_wait_time(self):
+        async def _fn(p):
+            async with p.acquire():
+                await sleep(0.1)
+
+        async with _Pool(maxsize=1) as pool:
+            pool._create_instance = AsyncMock(side_effect=object)
+            self.assertEqual(0.0, pool.wait_time)
+            await gather(_fn(pool), _fn(pool))
+            self.assertLess(0.0, pool.wait_time)
+
     async def test_close(self):
         async def _fn1(p):
             async with p.acquire():
@@ -102,8 +114,8 @@ class TestPool(unittest.IsolatedAsyncioTestCase):
 
 
 class _Pool(Pool):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.create_instance_call_count = 0
         self.destroy_instance_call_count = 0
 
@@ -1,7 +1,11 @@
 import unittest
+from uuid import (
+    uuid4,
+)
 
 from minos.common import (
     MinosAvroProtocol,
+    MinosAvroSchemaNotFoundException,
     MinosProtocolException,
 )
 
@@ -123,6 +127,81 @@ class TestMinosAvroProtocol(unittest.TestCase):
         with self.assertRaises(MinosProtocolException):
             MinosAvroProtocol.decode(serialized)
 
+    def test_parsed_schema(self):
+        schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": "double", "name": "foo"}],
+        }
+        parsed = MinosAvroProtocol.parse_schema(schema)
+        self.assertIs(parsed, MinosAvroProtocol.parse_schema(parsed))
+
+        data = {"foo": 3.14159265359}
+        serialized = MinosAvroProtocol.encode(data, parsed)
+        self.assertEqual(data, MinosAvroProtocol.decode(serialized))
+
+    def test_single_object(self):
+        schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": "double", "name": "foo"}],
+        }
+        data = {"foo": 3.14159265359}
+        serialized = MinosAvroProtocol.encode(data, schema, single_object=True)
+
+        self.assertTrue(serialized.startswith(MinosAvroProtocol.SINGLE_OBJECT_MARKER))
+        self.assertLess(len(serialized), len(MinosAvroProtocol.encode(data, schema)))
+
+        self.assertEqual(data, MinosAvroProtocol.decode(serialized))
+        self.assertEqual(
+            {
+                "type": "record",
+                "name": "tests.model_classes.ShoppingList",
+                "fields": [{"type": "double", "name": "foo"}],
+            },
+            MinosAvroProtocol.decode_schema(serialized),
+        )
+
+    def test_get_fingerprint(self):
+        schema = {"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}
+
+        serialized = MinosAvroProtocol.encode({"bar": 1}, schema, single_object=True)
+        self.assertEqual(serialized[2:10], MinosAvroProtocol.get_fingerprint(serialized))
+
+        self.assertIsNone(MinosAvroProtocol.get_fingerprint(MinosAvroProtocol.encode({"bar": 1}, schema)))
+
+    def test_single_object_same_fingerprint(self):
+        def _build_schema(suffix: str):
+            return {
+                "type": "record",
+                "name": "Foo",
+                "namespace": f"tests.{suffix}",
+                "fields": [{"type": "int", "name": "bar"}],
+            }
+
+        one = MinosAvroProtocol.encode({"bar": 1}, _build_schema(str(uuid4())), single_object=True)
+        two = MinosAvroProtocol.encode({"bar": 1}, _build_schema(str(uuid4())), single_object=True)
+
+        self.assertEqual(one, two)
+
+    def test_single_object_batch_mode_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.encode(["one", 1], [["string", "int"]], batch_mode=True, single_object=True)
+
+        serialized = MinosAvroProtocol.encode("one", [["string", "int"]], single_object=True)
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode(serialized, batch_mode=True)
+
+    def test_single_object_unknown_fingerprint_raises(self):
+        serialized = MinosAvroProtocol.SINGLE_OBJECT_MARKER + bytes(8) + b"foo"
+
+        with self.assertRaises(MinosAvroSchemaNotFoundException) as context:
+            MinosAvroProtocol.decode(serialized)
+        self.assertEqual(bytes(8), context.exception.fingerprint)
+
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_schema(serialized)
+
 
 if __name__ == "__main__":
     unittest.main()
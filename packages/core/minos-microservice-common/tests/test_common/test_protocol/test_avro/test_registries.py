@@ -0,0 +1,115 @@
+import unittest
+from uuid import (
+    uuid4,
+)
+
+from minos.common import (
+    AvroSchemaRegistry,
+    MinosProtocolException,
+)
+
+
+class TestAvroSchemaRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = AvroSchemaRegistry()
+
+    def test_register(self):
+        schema = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}]
+
+        fingerprint = self.registry.register(schema)
+
+        self.assertIsInstance(fingerprint, bytes)
+        self.assertEqual(AvroSchemaRegistry.FINGERPRINT_SIZE, len(fingerprint))
+        self.assertIn(fingerprint, self.registry)
+        self.assertEqual(1, len(self.registry))
+
+    def test_register_same(self):
+        schema = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}]
+
+        self.assertEqual(self.registry.register(schema), self.registry.register(schema))
+        self.assertEqual(1, len(self.registry))
+
+    def test_register_different(self):
+        one = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}]
+        two = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "long", "name": "bar"}]}]
+
+        self.assertNotEqual(self.registry.register(one), self.registry.register(two))
+        self.assertEqual(2, len(self.registry))
+
+    def test_register_logical_type(self):
+        one = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "string", "name": "bar"}]}]
+        two = [
+            {
+                "type": "record",
+                "name": "Foo",
+                "namespace": "tests",
+                "fields": [{"type": {"type": "string", "logicalType": "uuid"}, "name": "bar"}],
+            }
+        ]
+
+        self.assertNotEqual(self.registry.register(one), self.registry.register(two))
+
+    def test_register_random_namespaces(self):
+        def _build_schema():
+            return [
+                {
+                    "type": "record",
+                    "name": "Foo",
+                    "namespace": f"tests.{uuid4()!s}",
+                    "fields": [
+                        {
+                            "type": {
+                                "type": "record",
+                                "name": "Foo",
+                                "namespace": f"tests.{uuid4()!s}",
+                                "fields": [{"type": "int", "name": "bar"}],
+                            },
+                            "name": "bar",
+                        }
+                    ],
+                }
+            ]
+
+        self.assertEqual(self.registry.register(_build_schema()), self.registry.register(_build_schema()))
+        self.assertEqual(1, len(self.registry))
+
+    def test_get_schema(self):
+        schema = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}]
+        fingerprint = self.registry.register(schema)
+
+        expected = {"type": "record", "name": "tests.Foo", "fields": [{"type": "int", "name": "bar"}]}
+        self.assertEqual(expected, self.registry.get_schema(fingerprint))
+
+    def test_get_parsed_schema(self):
+        schema = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}]
+        fingerprint = self.registry.register(schema)
+
+        observed = self.registry.get_parsed_schema(fingerprint)
+        self.assertEqual("tests.Foo", observed["name"])
+
+    def test_get_registered_schema(self):
+        schema = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}]
+        fingerprint = self.registry.register(schema)
+
+        self.assertEqual(schema, self.registry.get_registered_schema(fingerprint))
+
+    def test_add(self):
+        schema = [{"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}]
+        fingerprint = AvroSchemaRegistry().register(schema)
+
+        self.registry.add(fingerprint, schema)
+
+        self.assertIn(fingerprint, self.registry)
+        self.assertEqual(fingerprint, self.registry.register(schema))
+        self.assertEqual(1, len(self.registry))
+
+    def test_get_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            self.registry.get_schema(bytes(8))
+
+        with self.assertRaises(MinosProtocolException):
+            self.registry.get_parsed_schema(bytes(8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from minos.common import (
+    AvroSchemaRegistry,
+    AvroSchemaStore,
+    InMemoryAvroSchemaStore,
+    MinosAvroProtocol,
+    MinosAvroSchemaNotFoundException,
+    SetupMixin,
+)
+
+
+class TestInMemoryAvroSchemaStore(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = [
+            {"type": "record", "name": "Foo", "namespace": "tests", "fields": [{"type": "int", "name": "bar"}]}
+        ]
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(InMemoryAvroSchemaStore, (AvroSchemaStore, SetupMixin)))
+
+    def test_constructor(self):
+        self.assertEqual(MinosAvroProtocol.registry, InMemoryAvroSchemaStore().registry)
+
+    async def test_publish_load(self):
+        source = AvroSchemaRegistry()
+        target = AvroSchemaRegistry()
+        fingerprint = source.register(self.schema)
+
+        store = InMemoryAvroSchemaStore(registry=source)
+        await store.publish(fingerprint)
+
+        # noinspection PyUnresolvedReferences
+        store.registry = target
+        await store.load(fingerprint)
+
+        self.assertIn(fingerprint, target)
+        self.assertEqual(source.get_schema(fingerprint), target.get_schema(fingerprint))
+
+    async def test_publish_once(self):
+        registry = AvroSchemaRegistry()
+        fingerprint = registry.register(self.schema)
+
+        store = InMemoryAvroSchemaStore(registry=registry)
+        await store.publish(fingerprint)
+        store._schemas.clear()
+        await store.publish(fingerprint)
+
+        self.assertEqual(dict(), store._schemas)
+
+    async def test_publish_unknown_raises(self):
+        store = InMemoryAvroSchemaStore(registry=AvroSchemaRegistry())
+        with self.assertRaises(MinosAvroSchemaNotFoundException):
+            await store.publish(bytes(8))
+
+    async def test_load_unknown_raises(self):
+        store = InMemoryAvroSchemaStore(registry=AvroSchemaRegistry())
+        with self.assertRaises(MinosAvroSchemaNotFoundException) as context:
+            await store.load(bytes(8))
+        self.assertEqual(bytes(8), context.exception.fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
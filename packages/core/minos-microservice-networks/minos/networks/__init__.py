@@ -7,10 +7,13 @@ __version__ = "0.7.0"
 from .brokers import (
     REQUEST_HEADERS_CONTEXT_VAR,
     REQUEST_REPLY_TOPIC_CONTEXT_VAR,
+    BatchedBrokerPublisher,
     BrokerClient,
     BrokerClientPool,
     BrokerDispatcher,
+    BrokerDispatcherBatch,
     BrokerHandler,
+    BrokerHandlerConcurrencyLimiter,
     BrokerHandlerService,
     BrokerMessage,
     BrokerMessageV1,
@@ -24,6 +27,8 @@ from .brokers import (
     BrokerPublisherQueueDatabaseOperationFactory,
     BrokerQueue,
     BrokerQueueDatabaseOperationFactory,
+    BrokerReplyChannel,
+    BrokerReplyMultiplexer,
     BrokerRequest,
     BrokerResponse,
     BrokerResponseException,
@@ -51,6 +56,7 @@ from .brokers import (
     InMemoryBrokerSubscriberDuplicateValidator,
     InMemoryBrokerSubscriberQueue,
     InMemoryBrokerSubscriberQueueBuilder,
+    MultiplexedBrokerClientPool,
     QueuedBrokerPublisher,
     QueuedBrokerSubscriber,
     QueuedBrokerSubscriberBuilder,
@@ -86,6 +92,7 @@ from .discovery import (
 )
 from .exceptions import (
     MinosActionNotFoundException,
+    MinosBrokerPublishException,
     MinosDiscoveryConnectorException,
     MinosHandlerException,
     MinosHandlerNotFoundEnoughEntriesException,
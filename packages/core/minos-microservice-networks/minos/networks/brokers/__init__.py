@@ -10,12 +10,14 @@ from .collections import (
 )
 from .dispatchers import (
     BrokerDispatcher,
+    BrokerDispatcherBatch,
     BrokerRequest,
     BrokerResponse,
     BrokerResponseException,
 )
 from .handlers import (
     BrokerHandler,
+    BrokerHandlerConcurrencyLimiter,
     BrokerHandlerService,
     BrokerPort,
 )
@@ -28,10 +30,16 @@ from .messages import (
     BrokerMessageV1Status,
     BrokerMessageV1Strategy,
 )
+from .multiplexers import (
+    BrokerReplyChannel,
+    BrokerReplyMultiplexer,
+)
 from .pools import (
     BrokerClientPool,
+    MultiplexedBrokerClientPool,
 )
 from .publishers import (
+    BatchedBrokerPublisher,
     BrokerPublisher,
     BrokerPublisherBuilder,
     BrokerPublisherQueue,
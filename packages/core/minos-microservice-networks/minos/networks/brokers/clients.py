@@ -44,12 +44,22 @@ logger = logging.getLogger(__name__)
 class BrokerClient(SetupMixin):
     """Broker Client class."""
 
-    def __init__(self, topic: str, publisher: BrokerPublisher, subscriber: BrokerSubscriber, **kwargs):
+    def __init__(
+        self,
+        topic: str,
+        publisher: BrokerPublisher,
+        subscriber: BrokerSubscriber,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
+        if headers is None:
+            headers = dict()
 
         self.topic = topic
         self.publisher = publisher
         self.subscriber = subscriber
+        self.headers = headers
 
     @classmethod
     def _from_config(cls, config: Config, **kwargs) -> BrokerClient:
@@ -126,6 +136,7 @@ class BrokerClient(SetupMixin):
         :return: This method does not return anything.
         """
         message.set_reply_topic(self.topic)
+        message.headers.update(self.headers)
         await self.publisher.send(message)
 
     async def receive(self, *args, **kwargs) -> BrokerMessage:
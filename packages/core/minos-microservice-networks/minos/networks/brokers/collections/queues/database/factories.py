@@ -23,6 +23,13 @@ class BrokerQueueDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``SQL`` instance.
         """
 
+    @abstractmethod
+    def build_notification_channel(self) -> str:
+        """Get the name of the channel used to notify that new entries have been submitted.
+
+        :return: A ``str`` value.
+        """
+
     @abstractmethod
     def build_mark_processed(self, id_: int) -> DatabaseOperation:
         """Build the "update not processed" query.
@@ -30,6 +37,14 @@ class BrokerQueueDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``SQL`` instance.
         """
 
+    @abstractmethod
+    def build_mark_processed_many(self, ids: Iterable[int]) -> DatabaseOperation:
+        """Build the "update not processed" query for multiple entries at once.
+
+        :param ids: The identifiers of the entries to be updated.
+        :return: A ``SQL`` instance.
+        """
+
     @abstractmethod
     def build_delete(self, id_: int) -> DatabaseOperation:
         """Build the "delete processed" query.
@@ -37,6 +52,14 @@ class BrokerQueueDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         :return: A ``SQL`` instance.
         """
 
+    @abstractmethod
+    def build_delete_many(self, ids: Iterable[int]) -> DatabaseOperation:
+        """Build the "delete processed" query for multiple entries at once.
+
+        :param ids: The identifiers of the entries to be deleted.
+        :return: A ``SQL`` instance.
+        """
+
     @abstractmethod
     def build_mark_processing(self, ids: Iterable[int]) -> DatabaseOperation:
         """
@@ -52,9 +75,12 @@ class BrokerQueueDatabaseOperationFactory(DatabaseOperationFactory, ABC):
         """
 
     @abstractmethod
-    def build_submit(self, topic: str, data: bytes) -> DatabaseOperation:
+    def build_submit(self, topic: str, data: bytes, priority: int = 0) -> DatabaseOperation:
         """Build the "insert" query.
 
+        :param topic: The topic of the entry.
+        :param data: The serialized message.
+        :param priority: The priority of the entry. Lower values are dequeued first.
         :return: A ``SQL`` instance.
         """
 
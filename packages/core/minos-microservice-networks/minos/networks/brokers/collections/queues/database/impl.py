@@ -10,6 +10,7 @@ from asyncio import (
     QueueEmpty,
     TimeoutError,
     create_task,
+    sleep,
     wait_for,
 )
 from contextlib import (
@@ -23,15 +24,15 @@ from typing import (
     TypeVar,
 )
 
-from cached_property import (
-    cached_property,
-)
-
 from minos.common import (
     Builder,
+    ComposedDatabaseOperation,
     Config,
     DatabaseClient,
     DatabaseMixin,
+    DatabaseNotification,
+    DatabaseNotificationListener,
+    NotificationDatabaseOperationFactory,
 )
 
 from ....messages import (
@@ -58,13 +59,17 @@ class DatabaseBrokerQueue(
 ):
     """Database Broker Queue class."""
 
-    _queue: PriorityQueue[_Entry]
+    _queue: PriorityQueue[tuple[int, int, bytes]]
+
+    _LISTEN_RETRY_DELAY: float = 1.0
 
     def __init__(
         self,
         *args,
         retry: Optional[int] = None,
         records: Optional[int] = None,
+        ack_records: Optional[int] = None,
+        ack_max_wait: Optional[float] = None,
         database_key: Optional[tuple[str]] = None,
         **kwargs,
     ):
@@ -76,14 +81,34 @@ class DatabaseBrokerQueue(
             retry = 2
         if records is None:
             records = 1000
+        if ack_records is None:
+            ack_records = 1
+        if ack_max_wait is None:
+            ack_max_wait = 1.0
 
         self._retry = retry
         self._records = records
+        self._ack_records = ack_records
+        self._ack_max_wait = ack_max_wait
 
         self._queue = PriorityQueue(maxsize=records)
 
         self._run_task = None
         self._enqueued_event = Event()
+        self._exhausted = True
+
+        try:
+            notification_operation_factory = self.database_client_cls.get_factory(NotificationDatabaseOperationFactory)
+        except ValueError:
+            notification_operation_factory = None
+
+        self._notification_operation_factory = notification_operation_factory
+        self._listener = None
+        self._listen_task = None
+
+        self._processed_ids = list()
+        self._not_processed_ids = list()
+        self._ack_task = None
 
     @property
     def retry(self) -> int:
@@ -101,6 +126,22 @@ class DatabaseBrokerQueue(
         """
         return self._records
 
+    @property
+    def ack_records(self) -> int:
+        """Get the number of acknowledgements that are accumulated before being flushed to the database.
+
+        :return: A ``int`` value.
+        """
+        return self._ack_records
+
+    @property
+    def ack_max_wait(self) -> float:
+        """Get the maximum number of seconds that an acknowledgement can be waiting before being flushed.
+
+        :return: A ``float`` value.
+        """
+        return self._ack_max_wait
+
     @classmethod
     def _from_config(cls, config: Config, **kwargs) -> DatabaseBrokerQueue:
         broker_interface = config.get_interface_by_name("broker")
@@ -112,17 +153,88 @@ class DatabaseBrokerQueue(
     async def _setup(self) -> None:
         await super()._setup()
         await self._create_table()
+        await self._start_listen()
         await self._start_run()
 
     async def _destroy(self) -> None:
         await self._stop_run()
+        await self._stop_listen()
         await self._flush_queue()
+        await self._stop_ack()
+        await self._flush_ack()
         await super()._destroy()
 
     async def _create_table(self) -> None:
         operation = self.database_operation_factory.build_create()
         await self.execute_on_database(operation)
 
+    async def _start_listen(self) -> None:
+        if self._notification_operation_factory is None or self._listen_task is not None:
+            return
+
+        self._listener = self._build_listener()
+        await self._listener.setup()
+        self._listen_task = create_task(self._listen())
+
+    def _build_listener(self) -> DatabaseNotificationListener:
+        return DatabaseNotificationListener(
+            self.database_pool,
+            self.database_operation_factory.build_notification_channel(),
+            operation_factory=self._notification_operation_factory,
+        )
+
+    async def _stop_listen(self) -> None:
+        if self._listen_task is not None:
+            task = self._listen_task
+            self._listen_task = None
+
+            task.cancel()
+            with suppress(TimeoutError, CancelledError):
+                await wait_for(task, 0.5)
+
+        if self._listener is not None:
+            listener = self._listener
+            self._listener = None
+            await listener.destroy()
+
+    async def _listen(self) -> NoReturn:
+        while True:
+            try:
+                async for notification in self._listener:
+                    if self._is_relevant_notification(notification):
+                        self._enqueued_event.set()
+                return
+            except Exception as exc:
+                logger.warning(f"The notification listener failed: {exc!r}. Restarting it...")
+
+            # The notifications sent in the meantime are lost, so the entries are looked up again.
+            self._enqueued_event.set()
+            await self._restart_listener()
+
+    async def _restart_listener(self) -> None:
+        # noinspection PyBroadException
+        with suppress(Exception):
+            await self._listener.destroy()
+
+        while True:
+            await sleep(self._LISTEN_RETRY_DELAY)
+            listener = self._build_listener()
+            try:
+                await listener.setup()
+            except Exception as exc:
+                logger.warning(f"The notification listener could not be restarted: {exc!r}. Retrying...")
+                # noinspection PyBroadException
+                with suppress(Exception):
+                    await listener.destroy()
+                continue
+
+            self._listener = listener
+            return
+
+    # noinspection PyUnusedLocal
+    def _is_relevant_notification(self, notification: DatabaseNotification) -> bool:
+        return True
+
     async def _start_run(self) -> None:
         if self._run_task is None:
             self._run_task = create_task(self._run())
@@ -139,15 +251,19 @@ class DatabaseBrokerQueue(
     async def _flush_queue(self):
         while True:
             try:
-                entry = self._queue.get_nowait()
+                _, id_, _ = self._queue.get_nowait()
             except QueueEmpty:
                 break
-            operation = self.database_operation_factory.build_mark_processed(entry.id_)
-            await self.execute_on_database(operation)
+            self._not_processed_ids.append(id_)
             self._queue.task_done()
 
     async def _enqueue(self, message: BrokerMessage) -> None:
-        operation = self.database_operation_factory.build_submit(message.topic, message.avro_bytes)
+        operation = self.database_operation_factory.build_submit(message.topic, message.avro_bytes, message.priority)
+        if self._notification_operation_factory is not None:
+            notify_operation = self._notification_operation_factory.build_notify(
+                self.database_operation_factory.build_notification_channel(), message.topic
+            )
+            operation = ComposedDatabaseOperation([operation, notify_operation])
         await self.execute_on_database(operation)
         await self._notify_enqueued(message)
 
@@ -157,31 +273,88 @@ class DatabaseBrokerQueue(
 
     async def _dequeue(self) -> BrokerMessage:
         while True:
-            entry = await self._queue.get()
+            _, id_, data = await self._queue.get()
             try:
                 # noinspection PyBroadException
                 try:
-                    message = entry.data
+                    message = BrokerMessage.from_avro_bytes(data)
                 except Exception as exc:
-                    logger.warning(
-                        f"There was a problem while trying to deserialize the entry with {entry.id_!r} id: {exc}"
-                    )
-                    operation = self.database_operation_factory.build_mark_processed(entry.id_)
-                    await self.execute_on_database(operation)
+                    logger.warning(f"There was a problem while trying to deserialize the entry with {id_!r} id: {exc}")
+                    await self._ack(id_, processed=False)
                     continue
 
-                operation = self.database_operation_factory.build_delete(entry.id_)
-                await self.execute_on_database(operation)
+                await self._ack(id_)
                 return message
             finally:
                 self._queue.task_done()
 
+    async def _ack(self, id_: int, processed: bool = True) -> None:
+        if processed:
+            self._processed_ids.append(id_)
+        else:
+            self._not_processed_ids.append(id_)
+
+        if len(self._processed_ids) + len(self._not_processed_ids) >= self._ack_records:
+            await self._stop_ack()
+            await self._try_flush_ack()
+        elif self._ack_task is None:
+            self._ack_task = create_task(self._wait_and_flush_ack())
+
+    async def _wait_and_flush_ack(self) -> None:
+        await sleep(self._ack_max_wait)
+        self._ack_task = None
+        await self._try_flush_ack()
+
+    async def _stop_ack(self) -> None:
+        if self._ack_task is not None:
+            task = self._ack_task
+            self._ack_task = None
+
+            task.cancel()
+            with suppress(CancelledError):
+                await task
+
+    async def _try_flush_ack(self) -> None:
+        # noinspection PyBroadException
+        try:
+            await self._flush_ack()
+        except Exception as exc:
+            logger.warning(f"There was a problem while trying to flush the acknowledgements: {exc!r}")
+            if self._ack_task is None:
+                self._ack_task = create_task(self._wait_and_flush_ack())
+
+    async def _flush_ack(self) -> None:
+        processed_ids, self._processed_ids = self._processed_ids, list()
+        not_processed_ids, self._not_processed_ids = self._not_processed_ids, list()
+
+        if not len(processed_ids) and not len(not_processed_ids):
+            return
+
+        try:
+            operations = list()
+            if len(processed_ids):
+                operations.append(self.database_operation_factory.build_delete_many(processed_ids))
+            if len(not_processed_ids):
+                operations.append(self.database_operation_factory.build_mark_processed_many(not_processed_ids))
+
+            async with self.database_pool.acquire() as client:
+                for operation in operations:
+                    await client.execute(operation)
+        except BaseException:
+            # The identifiers are kept, so that they are flushed again later instead of being lost.
+            self._processed_ids = processed_ids + self._processed_ids
+            self._not_processed_ids = not_processed_ids + self._not_processed_ids
+            raise
+
     async def _run(self, max_wait: Optional[float] = 60.0) -> NoReturn:
         while self._run_task is not None:
             await self._wait_for_entries(max_wait)
             await self._dequeue_batch()
 
     async def _wait_for_entries(self, max_wait: Optional[float]) -> None:
+        if not self._exhausted:
+            return
+
         while True:
             if await self._get_count():
                 return
@@ -203,18 +376,17 @@ class DatabaseBrokerQueue(
     async def _dequeue_batch(self) -> None:
         async with self.database_pool.acquire() as client:
             rows = await self._dequeue_rows(client)
+            self._exhausted = len(rows) < self._records
 
             if not len(rows):
                 return
 
-            entries = [_Entry(*row) for row in rows]
-
-            ids = tuple(entry.id_ for entry in entries)
+            ids = tuple(id_ for id_, _, _ in rows)
             operation = self.database_operation_factory.build_mark_processing(ids)
             await client.execute(operation)
 
-        for entry in entries:
-            await self._queue.put(entry)
+        for id_, priority, data in rows:
+            await self._queue.put((priority, id_, data))
 
     async def _dequeue_rows(self, client: DatabaseClient) -> list[Any]:
         operation = self.database_operation_factory.build_query(self._retry, self._records)
@@ -222,27 +394,6 @@ class DatabaseBrokerQueue(
         return [row async for row in client.fetch_all()]
 
 
-class _Entry:
-    def __init__(self, id_: int, data_bytes: bytes):
-        self.id_ = id_
-        self.data_bytes = data_bytes
-
-    @cached_property
-    def data(self) -> BrokerMessage:
-        """Get the data.
-
-        :return: A ``Model`` inherited instance.
-        """
-        return BrokerMessage.from_avro_bytes(self.data_bytes)
-
-    def __lt__(self, other: Any) -> bool:
-        # noinspection PyBroadException
-        try:
-            return isinstance(other, type(self)) and self.data < other.data
-        except Exception:
-            return False
-
-
 class DatabaseBrokerQueueBuilder(Builder):
     """Database Broker Queue Builder class."""
 
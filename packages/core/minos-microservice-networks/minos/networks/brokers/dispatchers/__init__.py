@@ -1,3 +1,6 @@
+from .batches import (
+    BrokerDispatcherBatch,
+)
 from .impl import (
     BrokerDispatcher,
 )
@@ -0,0 +1,114 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from asyncio import (
+    CancelledError,
+    Future,
+    Lock,
+    Task,
+    create_task,
+    get_running_loop,
+    sleep,
+)
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from contextlib import (
+    suppress,
+)
+from typing import (
+    Optional,
+)
+
+from ..messages import (
+    BrokerMessage,
+    BrokerMessageV1Payload,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BrokerDispatcherBatch:
+    """Broker Dispatcher Batch class.
+
+    It accumulates the submitted messages until there are ``batch_size`` of them or ``max_wait`` seconds have passed
+    since the first one was submitted, then dispatches all of them at once with the given function. Each submission
+    waits until its batch has been dispatched and returns its own payload. The batches are dispatched one at a time and
+    in submission order, accumulating the messages submitted in the meantime.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[list[BrokerMessage]], Awaitable[list[BrokerMessageV1Payload]]],
+        batch_size: int,
+        max_wait: float,
+    ):
+        self.fn = fn
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+
+        self._entries: list[tuple[BrokerMessage, Future]] = list()
+        self._timer: Optional[Task] = None
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def submit(self, message: BrokerMessage) -> BrokerMessageV1Payload:
+        """Submit a message to the batch.
+
+        :param message: The message to be dispatched.
+        :return: The payload obtained after dispatching the message.
+        """
+        future = get_running_loop().create_future()
+        self._entries.append((message, future))
+
+        if len(self._entries) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = create_task(self._flush_later())
+
+        return await future
+
+    async def flush(self) -> None:
+        """Dispatch the accumulated messages.
+
+        :return: This method does not return anything.
+        """
+        async with self._lock:
+            await self._stop_timer()
+
+            size = self.batch_size
+            entries, self._entries = self._entries[:size], self._entries[size:]
+            if len(self._entries) and self._timer is None:
+                self._timer = create_task(self._flush_later())
+
+            if not len(entries):
+                return
+
+            logger.debug(f"Dispatching a batch of {len(entries)} messages...")
+
+            try:
+                payloads = await self.fn([message for message, _ in entries])
+            except Exception as exc:
+                for _, future in entries:
+                    future.set_exception(exc)
+                return
+
+            for (_, future), payload in zip(entries, payloads):
+                future.set_result(payload)
+
+    async def _flush_later(self) -> None:
+        await sleep(self.max_wait)
+        self._timer = None
+        await self.flush()
+
+    async def _stop_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            with suppress(CancelledError):
+                await self._timer
+            self._timer = None
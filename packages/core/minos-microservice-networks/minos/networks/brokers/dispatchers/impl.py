@@ -4,9 +4,13 @@ from __future__ import (
 
 import logging
 import traceback
+from asyncio import (
+    gather,
+)
 from collections.abc import (
     Awaitable,
     Callable,
+    Hashable,
 )
 from functools import (
     wraps,
@@ -15,6 +19,7 @@ from inspect import (
     isawaitable,
 )
 from typing import (
+    Any,
     Optional,
     Union,
 )
@@ -27,6 +32,8 @@ from minos.common import (
 )
 
 from ...decorators import (
+    BrokerEnrouteDecorator,
+    EnrouteCollector,
     EnrouteFactory,
 )
 from ...exceptions import (
@@ -48,6 +55,9 @@ from ..messages import (
 from ..publishers import (
     BrokerPublisher,
 )
+from .batches import (
+    BrokerDispatcherBatch,
+)
 from .requests import (
     BrokerRequest,
     BrokerResponse,
@@ -57,20 +67,78 @@ logger = logging.getLogger(__name__)
 
 
 class BrokerDispatcher(SetupMixin):
-    """Broker Dispatcher class."""
+    """Broker Dispatcher class.
 
-    def __init__(self, actions: dict[str, Optional[Callable]], publisher: BrokerPublisher, **kwargs):
+    The messages of the topics that have batch options, given as ``(batch_size, max_wait)`` pairs, are accumulated and
+    dispatched in batches, so that their actions are called with a list of requests.
+    """
+
+    def __init__(
+        self,
+        actions: dict[str, Optional[Callable]],
+        publisher: BrokerPublisher,
+        keys: Optional[dict[str, Callable]] = None,
+        batch_options: Optional[dict[str, tuple[int, float]]] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
+        if keys is None:
+            keys = dict()
+        if batch_options is None:
+            batch_options = dict()
+
         self._actions = actions
         self._publisher = publisher
+        self._keys = keys
+        self._batch_options = batch_options
+        self._batches: dict[str, BrokerDispatcherBatch] = dict()
 
     @classmethod
     def _from_config(cls, config: Config, **kwargs) -> BrokerDispatcher:
+        kwargs["keys"] = cls._get_keys(config, **kwargs)
+        kwargs["batch_options"] = cls._get_batch_options(config, **kwargs)
         kwargs["actions"] = cls._get_actions(config, **kwargs)
         kwargs["publisher"] = cls._get_publisher(**kwargs)
         # noinspection PyProtectedMember
         return cls(**kwargs)
 
+    @classmethod
+    def _get_keys(
+        cls, config: Config, handlers: dict[str, Optional[Callable]] = None, keys: dict[str, Callable] = None, **kwargs
+    ) -> dict[str, Callable[[BrokerRequest], Union[Optional[Hashable], Awaitable[Optional[Hashable]]]]]:
+        if keys is None:
+            keys = dict()
+            if handlers is None:
+                for decorator in cls._get_decorators(config):
+                    if decorator.key is not None:
+                        keys[decorator.topic] = decorator.key
+        return keys
+
+    @classmethod
+    def _get_batch_options(
+        cls,
+        config: Config,
+        handlers: dict[str, Optional[Callable]] = None,
+        batch_options: dict[str, tuple[int, float]] = None,
+        **kwargs,
+    ) -> dict[str, tuple[int, float]]:
+        if batch_options is None:
+            batch_options = dict()
+            if handlers is None:
+                for decorator in cls._get_decorators(config):
+                    if decorator.batch_size is not None:
+                        batch_options[decorator.topic] = (decorator.batch_size, decorator.max_wait)
+        return batch_options
+
+    @staticmethod
+    def _get_decorators(config: Config) -> list[BrokerEnrouteDecorator]:
+        decorators = list()
+        for service in config.get_services():
+            collector = EnrouteCollector(service, config=config)
+            for values in collector.get_broker_command_query_event().values():
+                decorators.extend(values)
+        return decorators
+
     @staticmethod
     def _get_actions(
         config: Config, handlers: dict[str, Optional[Callable]] = None, **kwargs
@@ -95,6 +163,10 @@ class BrokerDispatcher(SetupMixin):
             raise NotProvidedException(f"A {BrokerPublisher!r} object must be provided.")
         return publisher
 
+    async def _destroy(self) -> None:
+        await gather(*(batch.flush() for batch in self._batches.values()))
+        await super()._destroy()
+
     @property
     def publisher(self) -> BrokerPublisher:
         """Get the publisher instance.
@@ -103,6 +175,37 @@ class BrokerDispatcher(SetupMixin):
         """
         return self._publisher
 
+    @property
+    def keys(self) -> dict[str, Callable]:
+        """Keys getter.
+
+        :return: A dictionary in which the keys are topics and the values are the key functions.
+        """
+        return self._keys
+
+    async def get_key(self, message: BrokerMessage) -> Optional[Hashable]:
+        """Get the ordering key of the given message, using the key function of its topic.
+
+        :param message: The message to be inspected.
+        :return: A hashable value or ``None`` if the topic does not have any key function.
+        """
+        fn = self._keys.get(message.topic)
+        if fn is None:
+            return None
+
+        key = fn(BrokerRequest(message))
+        if isawaitable(key):
+            key = await key
+        return key
+
+    @property
+    def batch_options(self) -> dict[str, tuple[int, float]]:
+        """Batch options getter.
+
+        :return: A dictionary in which the keys are topics and the values are ``(batch_size, max_wait)`` pairs.
+        """
+        return self._batch_options
+
     @property
     def actions(self) -> dict[str, Optional[Callable]]:
         """Actions getter.
@@ -118,9 +221,12 @@ class BrokerDispatcher(SetupMixin):
         :return: This method does not return anything.
         """
         action = self.get_action(message.topic)
-        fn = self.get_callback(action)
 
-        payload = await fn(message)
+        if message.topic in self._batch_options:
+            payload = await self._get_batch(message.topic, action).submit(message)
+        else:
+            fn = self.get_callback(action)
+            payload = await fn(message)
 
         if message.should_reply:
             reply = BrokerMessageV1(topic=message.reply_topic, payload=payload, identifier=message.identifier)
@@ -169,6 +275,64 @@ class BrokerDispatcher(SetupMixin):
 
         return _wrapper
 
+    def _get_batch(self, topic: str, action: Callable) -> BrokerDispatcherBatch:
+        if topic not in self._batches:
+            batch_size, max_wait = self._batch_options[topic]
+            self._batches[topic] = BrokerDispatcherBatch(self.get_batch_callback(action), batch_size, max_wait)
+        return self._batches[topic]
+
+    @staticmethod
+    def get_batch_callback(
+        fn: Callable[[list[BrokerRequest]], Union[Optional[Any], Awaitable[Optional[Any]]]]
+    ) -> Callable[[list[BrokerMessage]], Awaitable[list[BrokerMessageV1Payload]]]:
+        """Get the batch handler function to be used by the Broker Handler.
+
+        The given function is called with a list of requests and can return a list containing one response for each
+        request, a single response for all of them, or ``None``. As the requests may come from different users, the
+        user and headers context variables are not set.
+
+        :param fn: The action function.
+        :return: A wrapper function around the given one that is compatible with the Broker Handler API.
+        """
+
+        @wraps(fn)
+        async def _wrapper(raws: list[BrokerMessage]) -> list[BrokerMessageV1Payload]:
+            logger.info(f"Dispatching a batch of {len(raws)} messages...")
+
+            requests = [BrokerRequest(raw) for raw in raws]
+
+            try:
+                response = fn(requests)
+                if isawaitable(response):
+                    response = await response
+
+                if isinstance(response, (list, tuple)) and len(response) == len(requests):
+                    responses = response
+                else:
+                    responses = [response] * len(requests)
+
+                results = list()
+                for response in responses:
+                    if isinstance(response, Response):
+                        results.append((await response.content(), response.status))
+                    else:
+                        results.append((None, BrokerMessageV1Status.SUCCESS))
+            except ResponseException as exc:
+                tb = traceback.format_exc()
+                logger.error(f"Raised an application exception:\n {tb}")
+                results = [(repr(exc), exc.status)] * len(requests)
+            except Exception as exc:
+                tb = traceback.format_exc()
+                logger.exception(f"Raised a system exception:\n {tb}")
+                results = [(repr(exc), BrokerMessageV1Status.SYSTEM_ERROR)] * len(requests)
+
+            return [
+                BrokerMessageV1Payload(content=content, status=status, headers=request.headers)
+                for (content, status), request in zip(results, requests)
+            ]
+
+        return _wrapper
+
     def get_action(self, topic: str) -> Callable[[Request], Union[Optional[Response], Awaitable[Optional[Response]]]]:
         """Get the handling function to be called.
 
@@ -1,6 +1,9 @@
 from .impl import (
     BrokerHandler,
 )
+from .limiters import (
+    BrokerHandlerConcurrencyLimiter,
+)
 from .ports import (
     BrokerHandlerService,
     BrokerPort,
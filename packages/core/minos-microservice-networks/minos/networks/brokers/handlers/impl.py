@@ -5,57 +5,164 @@ from __future__ import (
 import logging
 from asyncio import (
     Queue,
+    Semaphore,
+    Task,
     create_task,
     gather,
 )
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
 from collections.abc import (
+    Hashable,
     Iterable,
 )
+from functools import (
+    partial,
+)
+from itertools import (
+    count,
+)
+from time import (
+    monotonic,
+)
 from typing import (
+    Any,
+    Final,
     NoReturn,
     Optional,
+    Union,
+)
+from uuid import (
+    UUID,
 )
 
 from minos.common import (
     Config,
     Inject,
+    MinosConfigException,
     NotProvidedException,
+    PoolFactory,
     SetupMixin,
 )
 
 from ..dispatchers import (
     BrokerDispatcher,
 )
+from ..messages import (
+    BrokerMessage,
+)
 from ..subscribers import (
     BrokerSubscriber,
     BrokerSubscriberBuilder,
 )
+from .limiters import (
+    BrokerHandlerConcurrencyLimiter,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class BrokerHandler(SetupMixin):
-    """Broker Handler class."""
+    """Broker Handler class.
+
+    If ``ordered`` is set, each consumer reads from its own lane and the messages are sharded onto the lanes by a key,
+    so that the ones with the same key are dispatched strictly in order while the ones with different keys are
+    dispatched concurrently. The key is obtained from the key function of the topic's enroute decorator if it is set,
+    from the ``"partition_key"`` header, or from the ``uuid`` attribute of the content otherwise.
+
+    If a ``limiter`` is given, the number of messages dispatched at the same time is adapted by it. In that case, if the
+    dispatching is not ordered, ``max_limit`` consumers are created instead of ``concurrency``. When the handler is
+    built from config, the limiter is built from the ``handler.limiter`` entry of the broker's ``common`` section
+    (either ``true`` or a mapping with its arguments), watching the wait time of the default database pool unless
+    other ``pools`` are given.
+
+    The messages of the topics dispatched in batches do not hold a consumer until their batch is dispatched, so that the
+    batches are not limited by the number of consumers. Instead, they are acknowledged once their batch has been
+    dispatched, and up to twice the largest batch size of them are pending at the same time, so that a batch can be
+    collected while the previous one is being dispatched. In the ordered case, a consumer waits for its pending batched
+    messages before dispatching a message that is not batched.
+
+    The messages whose dispatching fails are negatively acknowledged so that they are delivered again, up to
+    ``max_attempts`` times. After that, they are negatively acknowledged without requeueing, so that a poison message
+    is discarded (or dead-lettered, if the broker is configured to do so) instead of blocking its queue or partition.
+    """
+
+    KEY_HEADER: Final[str] = "partition_key"
+    _MAX_TRACKED_ATTEMPTS: Final[int] = 1024
 
     def __init__(
-        self, dispatcher: BrokerDispatcher, subscriber: BrokerSubscriber, concurrency: int = 5, *args, **kwargs
+        self,
+        dispatcher: BrokerDispatcher,
+        subscriber: BrokerSubscriber,
+        concurrency: int = 5,
+        ordered: bool = False,
+        limiter: Optional[BrokerHandlerConcurrencyLimiter] = None,
+        max_attempts: int = 3,
+        *args,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
 
         self._dispatcher = dispatcher
         self._subscriber = subscriber
 
-        self._queue = Queue(maxsize=1)
+        if limiter is not None and not ordered:
+            concurrency = limiter.max_limit
+
+        if ordered:
+            queues = [Queue(maxsize=1) for _ in range(concurrency)]
+        else:
+            queues = [Queue(maxsize=1)]
+
+        self._queues = queues
+        self._counter = count()
         self._consumers = list()
         self._concurrency = concurrency
+        self._ordered = ordered
+        self._limiter = limiter
+        self._max_attempts = max_attempts
+        self._attempts: OrderedDict[UUID, int] = OrderedDict()
+
+        batch_sizes = [batch_size for batch_size, _ in dispatcher.batch_options.values()]
+        self._batch_slots = Semaphore(2 * max(batch_sizes)) if len(batch_sizes) else None
+        self._batched: defaultdict[Queue, set[Task]] = defaultdict(set)
 
     @classmethod
     def _from_config(cls, config: Config, **kwargs) -> BrokerHandler:
         dispatcher = cls._get_dispatcher(config, **kwargs)
         subscriber = cls._get_subscriber(config, topics=set(dispatcher.actions.keys()), **kwargs)
+        kwargs["limiter"] = cls._get_limiter(config, **kwargs)
 
         return cls(dispatcher, subscriber, **kwargs)
 
+    @staticmethod
+    @Inject()
+    def _get_limiter(
+        config: Config,
+        limiter: Optional[BrokerHandlerConcurrencyLimiter] = None,
+        pool_factory: Optional[PoolFactory] = None,
+        **kwargs,
+    ) -> Optional[BrokerHandlerConcurrencyLimiter]:
+        if limiter is not None:
+            return limiter
+
+        try:
+            handler_config = config.get_interface_by_name("broker").get("common", dict()).get("handler", dict())
+        except MinosConfigException:
+            handler_config = dict()
+
+        limiter_config: Union[bool, dict[str, Any], None] = handler_config.get("limiter")
+        if not limiter_config:
+            return None
+
+        limiter_kwargs = dict() if limiter_config is True else dict(limiter_config)
+        if "pools" not in limiter_kwargs and pool_factory is not None:
+            limiter_kwargs["pools"] = [pool_factory.get_pool("database")]
+
+        return BrokerHandlerConcurrencyLimiter(**limiter_kwargs)
+
     @staticmethod
     @Inject()
     def _get_dispatcher(
@@ -98,6 +205,14 @@ class BrokerHandler(SetupMixin):
 
         return subscriber
 
+    @property
+    def limiter(self) -> Optional[BrokerHandlerConcurrencyLimiter]:
+        """Get the concurrency limiter.
+
+        :return: A ``BrokerHandlerConcurrencyLimiter`` instance or ``None``.
+        """
+        return self._limiter
+
     async def _setup(self) -> None:
         await super()._setup()
         await self._dispatcher.setup()
@@ -120,29 +235,108 @@ class BrokerHandler(SetupMixin):
         :return: This method does not return anything.
         """
         async for message in self._subscriber:
-            await self._queue.put(message)
+            queue = await self._get_queue(message)
+            await queue.put(message)
+
+    async def _get_queue(self, message: BrokerMessage) -> Queue:
+        if len(self._queues) == 1:
+            return self._queues[0]
+
+        key = await self._get_key(message)
+        if key is None:
+            index = next(self._counter)
+        else:
+            index = hash(key)
+
+        return self._queues[index % len(self._queues)]
+
+    async def _get_key(self, message: BrokerMessage) -> Optional[Hashable]:
+        key = await self._dispatcher.get_key(message)
+
+        if key is None:
+            key = message.headers.get(self.KEY_HEADER)
+
+        if key is None:
+            content = message.content
+            if isinstance(content, dict):
+                key = content.get("uuid")
+            else:
+                key = getattr(content, "uuid", None)
+
+        return key
 
     async def _create_consumers(self):
         while len(self._consumers) < self._concurrency:
-            self._consumers.append(create_task(self._consume()))
+            queue = self._queues[len(self._consumers) % len(self._queues)]
+            self._consumers.append(create_task(self._consume(queue)))
 
     async def _destroy_consumers(self):
-        await self._queue.join()
+        await gather(*(queue.join() for queue in self._queues))
+        await gather(*(task for tasks in self._batched.values() for task in tasks), return_exceptions=True)
         for consumer in self._consumers:
             consumer.cancel()
         await gather(*self._consumers, return_exceptions=True)
         self._consumers = list()
 
-    async def _consume(self) -> None:
+    async def _consume(self, queue: Queue) -> None:
         while True:
-            await self._consume_one()
+            await self._consume_one(queue)
 
-    async def _consume_one(self) -> None:
-        message = await self._queue.get()
+    async def _consume_one(self, queue: Queue) -> None:
+        message = await queue.get()
         try:
-            try:
-                await self._dispatcher.dispatch(message)
-            except Exception as exc:
-                logger.warning(f"An exception was raised: {exc!r}")
+            if message.topic in self._dispatcher.batch_options:
+                await self._submit_batched(queue, message)
+                return
+
+            if self._ordered:
+                await self._wait_batched(queue)
+
+            if self._limiter is None:
+                await self._dispatch_one(message)
+            else:
+                await self._limiter.acquire()
+                started_at = monotonic()
+                try:
+                    await self._dispatch_one(message)
+                finally:
+                    await self._limiter.release(monotonic() - started_at)
         finally:
-            self._queue.task_done()
+            queue.task_done()
+
+    async def _submit_batched(self, queue: Queue, message: BrokerMessage) -> None:
+        await self._batch_slots.acquire()
+        task = create_task(self._dispatch_one(message))
+        self._batched[queue].add(task)
+        task.add_done_callback(partial(self._release_batched, queue))
+
+    def _release_batched(self, queue: Queue, task: Task) -> None:
+        self._batched[queue].discard(task)
+        self._batch_slots.release()
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.warning(f"An exception was raised while acknowledging a batched message: {exc!r}")
+
+    async def _wait_batched(self, queue: Queue) -> None:
+        if len(tasks := self._batched[queue]):
+            await gather(*tasks, return_exceptions=True)
+
+    async def _dispatch_one(self, message: BrokerMessage) -> None:
+        try:
+            await self._dispatcher.dispatch(message)
+        except Exception as exc:
+            logger.warning(f"An exception was raised: {exc!r}")
+            await self._subscriber.nack(message, requeue=self._register_failure(message))
+        else:
+            self._attempts.pop(message.identifier, None)
+            await self._subscriber.ack(message)
+
+    def _register_failure(self, message: BrokerMessage) -> bool:
+        attempts = self._attempts.pop(message.identifier, 0) + 1
+        if attempts >= self._max_attempts:
+            logger.warning(f"Discarding {message!r} after {attempts} failed attempts...")
+            return False
+
+        self._attempts[message.identifier] = attempts
+        while len(self._attempts) > self._MAX_TRACKED_ATTEMPTS:
+            self._attempts.popitem(last=False)
+        return True
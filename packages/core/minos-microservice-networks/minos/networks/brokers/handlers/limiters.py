@@ -0,0 +1,134 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from asyncio import (
+    Condition,
+)
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    Optional,
+)
+
+from minos.common import (
+    Pool,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BrokerHandlerConcurrencyLimiter:
+    """Broker Handler Concurrency Limiter class.
+
+    It limits the number of messages that are dispatched at the same time, adapting the limit between ``min_limit`` and
+    ``max_limit`` with an Additive-Increase/Multiplicative-Decrease (AIMD) policy. While the dispatching latency and the
+    wait time of the given pools stay under their targets and there are messages waiting for a slot, the limit grows
+    by one every ``limit`` dispatches. When any of the targets is exceeded, the limit is multiplied by
+    ``backoff_ratio``, at most once every ``limit`` dispatches.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        initial_limit: Optional[int] = None,
+        latency_target: float = 1.0,
+        pool_wait_target: float = 0.1,
+        backoff_ratio: float = 0.5,
+        pools: Iterable[Pool] = tuple(),
+    ):
+        if not 0 < min_limit <= max_limit:
+            raise ValueError(f"The limits must satisfy 0 < min_limit <= max_limit. Obtained: {min_limit}, {max_limit}")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(f"The backoff_ratio must be between 0 and 1. Obtained: {backoff_ratio}")
+
+        if initial_limit is None:
+            initial_limit = min_limit
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.pool_wait_target = pool_wait_target
+        self.backoff_ratio = backoff_ratio
+        self.pools = tuple(pools)
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._active = 0
+        self._waiting = 0
+        self._since_backoff = 0
+        self._condition = Condition()
+
+    @property
+    def limit(self) -> int:
+        """Get the current limit.
+
+        :return: An ``int`` value.
+        """
+        return int(self._limit)
+
+    @property
+    def active(self) -> int:
+        """Get the number of messages that are being dispatched.
+
+        :return: An ``int`` value.
+        """
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Get the number of messages that are waiting for a slot.
+
+        :return: An ``int`` value.
+        """
+        return self._waiting
+
+    @property
+    def pool_wait_time(self) -> float:
+        """Get the highest wait time among the given pools.
+
+        :return: A ``float`` value in seconds.
+        """
+        return max((pool.wait_time for pool in self.pools), default=0.0)
+
+    async def acquire(self) -> None:
+        """Wait until there is a slot available to dispatch a message.
+
+        :return: This method does not return anything.
+        """
+        async with self._condition:
+            self._waiting += 1
+            try:
+                await self._condition.wait_for(lambda: self._active < self.limit)
+            finally:
+                self._waiting -= 1
+            self._active += 1
+
+    async def release(self, latency: float) -> None:
+        """Release a slot, updating the limit with the observed latency.
+
+        :param latency: The time spent dispatching the message, in seconds.
+        :return: This method does not return anything.
+        """
+        async with self._condition:
+            self._active -= 1
+            self._update(latency)
+            self._condition.notify_all()
+
+    def _update(self, latency: float) -> None:
+        self._since_backoff += 1
+
+        if latency > self.latency_target or self.pool_wait_time > self.pool_wait_target:
+            if self._since_backoff >= self.limit:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                self._since_backoff = 0
+                logger.debug(f"Decreased the concurrency limit to {self.limit}.")
+            return
+
+        if self._waiting > 0 and self._limit < self.max_limit:
+            previous = self.limit
+            self._limit = min(self.max_limit, self._limit + 1 / self.limit)
+            if previous != self.limit:
+                logger.debug(f"Increased the concurrency limit to {self.limit}.")
@@ -108,6 +108,14 @@ class BrokerMessage(ABC, Model):
         :return: A ``dict`` instance with ``str`` keys and ``str`` values.
         """
 
+    @property
+    @abstractmethod
+    def priority(self) -> int:
+        """Get the priority of the message. Lower values are processed first.
+
+        :return: An ``int`` value.
+        """
+
     # noinspection PyMethodParameters
     @classmethod
     def encode_schema(cls, encoder: SchemaEncoder, target: ModelType, **kwargs) -> Any:
@@ -131,6 +131,20 @@ class BrokerMessageV1(BrokerMessage, DeclarativeModel):
         """
         return self.payload.headers
 
+    @property
+    def priority(self) -> int:
+        """Get the priority of the message, which is read from the ``"priority"`` header. Lower values are processed
+        first. Invalid values fall back to the default priority.
+
+        :return: An ``int`` value.
+        """
+        value = self.headers.get("priority", 0)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            logger.warning(f"The given priority value is invalid: {value!r}")
+            return 0
+
     @property
     def data(self) -> Any:
         """Get the payload content.
@@ -0,0 +1,162 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from asyncio import (
+    CancelledError,
+    Queue,
+    Task,
+    create_task,
+)
+from contextlib import (
+    suppress,
+)
+from typing import (
+    Final,
+    Optional,
+)
+from uuid import (
+    uuid4,
+)
+
+from minos.common import (
+    Config,
+    SetupMixin,
+)
+
+from .clients import (
+    BrokerClient,
+)
+from .messages import (
+    BrokerMessage,
+)
+from .subscribers import (
+    BrokerSubscriber,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BrokerReplyMultiplexer(SetupMixin):
+    """Broker Reply Multiplexer class.
+
+    It shares a single reply topic, and so a single subscriber, between many request-reply channels. Each channel is
+    identified by a header that is set on the requests and propagated back on the replies, so a dispatcher task can
+    route each reply to the channel that is waiting for it.
+    """
+
+    CHANNEL_HEADER: Final[str] = "reply_channel"
+
+    def __init__(self, topic: str, subscriber: BrokerSubscriber, **kwargs):
+        super().__init__(**kwargs)
+
+        self.topic = topic
+        self.subscriber = subscriber
+
+        self._channels: dict[str, BrokerReplyChannel] = dict()
+        self._task: Optional[Task] = None
+
+    @classmethod
+    def _from_config(cls, config: Config, **kwargs) -> BrokerReplyMultiplexer:
+        if "topic" not in kwargs:
+            kwargs["topic"] = str(uuid4()).replace("-", "")
+
+        subscriber = BrokerClient._get_subscriber(config, **kwargs)
+
+        return cls(kwargs["topic"], subscriber)
+
+    async def _setup(self) -> None:
+        await super()._setup()
+        await self.subscriber.setup()
+        self._task = create_task(self._run())
+
+    async def _destroy(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(CancelledError):
+                await self._task
+            self._task = None
+
+        await self.subscriber.destroy()
+        await super()._destroy()
+
+    @property
+    def channels(self) -> dict[str, BrokerReplyChannel]:
+        """Get the open channels.
+
+        :return: A dictionary in which the keys are the channel identifiers and the values are the channels.
+        """
+        return self._channels
+
+    def open_channel(self) -> BrokerReplyChannel:
+        """Open a new channel.
+
+        :return: A ``BrokerReplyChannel`` instance.
+        """
+        channel = BrokerReplyChannel(self, str(uuid4()))
+        self._channels[channel.identifier] = channel
+        return channel
+
+    def close_channel(self, channel: BrokerReplyChannel) -> None:
+        """Close the given channel, so that its replies are discarded from now on.
+
+        :param channel: The channel to be closed.
+        :return: This method does not return anything.
+        """
+        self._channels.pop(channel.identifier, None)
+
+    async def _run(self) -> None:
+        async for message in self.subscriber:
+            self.dispatch(message)
+
+    def dispatch(self, message: BrokerMessage) -> None:
+        """Route the given reply to its channel.
+
+        :param message: The reply to be routed.
+        :return: This method does not return anything.
+        """
+        channel = self._channels.get(message.headers.get(self.CHANNEL_HEADER))
+        if channel is None:
+            logger.warning(f"Discarding {message!r} as it does not belong to any open channel...")
+            return
+
+        channel.add_message(message)
+
+
+class BrokerReplyChannel(BrokerSubscriber):
+    """Broker Reply Channel class.
+
+    It is a lightweight subscriber that receives the replies routed to it by a ``BrokerReplyMultiplexer``, so it does
+    not need any setup.
+    """
+
+    def __init__(self, multiplexer: BrokerReplyMultiplexer, identifier: str, already_setup: bool = True, **kwargs):
+        super().__init__([multiplexer.topic], already_setup=already_setup, **kwargs)
+        self.identifier = identifier
+
+        self._multiplexer = multiplexer
+        self._queue: Queue[BrokerMessage] = Queue()
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Get the headers to be set on the requests, so that their replies are routed to this channel.
+
+        :return: A dictionary with ``str`` keys and values.
+        """
+        return {self._multiplexer.CHANNEL_HEADER: self.identifier}
+
+    def add_message(self, message: BrokerMessage) -> None:
+        """Add a reply to the channel.
+
+        :param message: The reply to be added.
+        :return: This method does not return anything.
+        """
+        self._queue.put_nowait(message)
+
+    async def _receive(self) -> BrokerMessage:
+        return await self._queue.get()
+
+    async def _destroy(self) -> None:
+        self._multiplexer.close_channel(self)
+        await super()._destroy()
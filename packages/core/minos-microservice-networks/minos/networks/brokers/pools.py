@@ -3,6 +3,10 @@ from __future__ import (
 )
 
 import logging
+from asyncio import (
+    Lock,
+    Semaphore,
+)
 from contextvars import (
     Token,
 )
@@ -21,8 +25,13 @@ from .clients import (
     BrokerClient,
 )
 from .messages import (
+    REQUEST_HEADERS_CONTEXT_VAR,
     REQUEST_REPLY_TOPIC_CONTEXT_VAR,
 )
+from .multiplexers import (
+    BrokerReplyChannel,
+    BrokerReplyMultiplexer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,3 +78,88 @@ class _ReplyTopicContextManager:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         REQUEST_REPLY_TOPIC_CONTEXT_VAR.reset(self._token)
         await self.wrapper.__aexit__(exc_type, exc_val, exc_tb)
+
+
+class MultiplexedBrokerClientPool(BrokerClientPool):
+    """Multiplexed Broker Client Pool class.
+
+    Instead of keeping a few clients with their own reply subscribers, each acquisition opens a lightweight channel over
+    a single ``BrokerReplyMultiplexer``, so the reply subscriber is only started once per pool. The ``maxsize`` argument
+    limits the number of concurrently open channels, so the acquisitions wait when the limit is reached.
+    """
+
+    def __init__(self, instance_kwargs: dict[str, Any], maxsize: int = 1000, *args, **kwargs):
+        super().__init__(instance_kwargs, maxsize, *args, **kwargs)
+        self._channels_semaphore = Semaphore(maxsize)
+        self._multiplexer: Optional[BrokerReplyMultiplexer] = None
+        self._multiplexer_lock = Lock()
+
+    async def _destroy(self) -> None:
+        await super()._destroy()
+        if self._multiplexer is not None:
+            await self._multiplexer.destroy()
+            self._multiplexer = None
+
+    async def get_multiplexer(self) -> BrokerReplyMultiplexer:
+        """Get the multiplexer, building it if it is not available yet.
+
+        :return: A ``BrokerReplyMultiplexer`` instance.
+        """
+        async with self._multiplexer_lock:
+            if self._multiplexer is None:
+                multiplexer = BrokerReplyMultiplexer.from_config(**self._instance_kwargs)
+                await multiplexer.setup()
+                self._multiplexer = multiplexer
+        return self._multiplexer
+
+    def acquire(self, *args, **kwargs) -> AsyncContextManager:
+        """Acquire a new instance wrapped on an asynchronous context manager.
+
+        :return: An asynchronous context manager.
+        """
+        return _ReplyChannelContextManager(self)
+
+    async def _acquire_channel(self) -> BrokerClient:
+        await self._channels_semaphore.acquire()
+        try:
+            multiplexer = await self.get_multiplexer()
+            channel = multiplexer.open_channel()
+        except BaseException:
+            self._channels_semaphore.release()
+            raise
+
+        publisher = BrokerClient._get_publisher(**self._instance_kwargs)
+        return BrokerClient(multiplexer.topic, publisher, channel, headers=channel.headers)
+
+    async def _release_channel(self, broker: BrokerClient) -> None:
+        try:
+            await broker.subscriber.destroy()
+        finally:
+            self._channels_semaphore.release()
+
+
+class _ReplyChannelContextManager:
+    _broker: Optional[BrokerClient]
+    _reply_topic_token: Optional[Token]
+    _headers_token: Optional[Token]
+
+    def __init__(self, pool: MultiplexedBrokerClientPool):
+        self.pool = pool
+        self._broker = None
+        self._reply_topic_token = None
+        self._headers_token = None
+
+    async def __aenter__(self) -> BrokerClient:
+        self._broker = await self.pool._acquire_channel()
+
+        channel: BrokerReplyChannel = self._broker.subscriber
+        headers = (REQUEST_HEADERS_CONTEXT_VAR.get() or dict()) | channel.headers
+
+        self._reply_topic_token = REQUEST_REPLY_TOPIC_CONTEXT_VAR.set(self._broker.topic)
+        self._headers_token = REQUEST_HEADERS_CONTEXT_VAR.set(headers)
+        return self._broker
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        REQUEST_HEADERS_CONTEXT_VAR.reset(self._headers_token)
+        REQUEST_REPLY_TOPIC_CONTEXT_VAR.reset(self._reply_topic_token)
+        await self.pool._release_channel(self._broker)
@@ -2,6 +2,9 @@ from .abc import (
     BrokerPublisher,
     BrokerPublisherBuilder,
 )
+from .batched import (
+    BatchedBrokerPublisher,
+)
 from .memory import (
     InMemoryBrokerPublisher,
 )
@@ -17,10 +17,13 @@ from typing import (
 )
 
 from minos.common import (
+    AvroSchemaStore,
     BuildableMixin,
     Builder,
     Config,
+    Inject,
     Injectable,
+    MinosAvroProtocol,
     MinosConfigException,
 )
 
@@ -39,7 +42,17 @@ logger = logging.getLogger(__name__)
 
 @Injectable("broker_publisher")
 class BrokerPublisher(ABC, BuildableMixin):
-    """Broker Publisher class."""
+    """Broker Publisher class.
+
+    If an ``AvroSchemaStore`` is provided, the messages are encoded following the compact single-object encoding and
+    their schemas are published to the store, so that the subscribers are able to decode them. Otherwise, the messages
+    are encoded as object containers, which embed the whole schema.
+    """
+
+    @Inject()
+    def __init__(self, *args, avro_schema_store: Optional[AvroSchemaStore] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.avro_schema_store = avro_schema_store
 
     async def send(self, message: BrokerMessage) -> None:
         """Send a message.
@@ -54,6 +67,14 @@ class BrokerPublisher(ABC, BuildableMixin):
     async def _send(self, message: BrokerMessage) -> None:
         raise NotImplementedError
 
+    async def _encode(self, message: BrokerMessage) -> bytes:
+        if self.avro_schema_store is None:
+            return message.avro_bytes
+
+        data = message.avro_single_object_bytes
+        await self.avro_schema_store.publish(MinosAvroProtocol.get_fingerprint(data))
+        return data
+
 
 BrokerPublisherCls = TypeVar("BrokerPublisherCls", bound=BrokerPublisher)
 
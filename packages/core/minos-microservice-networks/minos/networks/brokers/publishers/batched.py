@@ -0,0 +1,141 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from asyncio import (
+    CancelledError,
+    Future,
+    create_task,
+    ensure_future,
+    gather,
+    sleep,
+)
+from collections.abc import (
+    Awaitable,
+)
+from contextlib import (
+    suppress,
+)
+from typing import (
+    Any,
+    Optional,
+)
+
+from ...exceptions import (
+    MinosBrokerPublishException,
+)
+from ..messages import (
+    BrokerMessage,
+)
+from .abc import (
+    BrokerPublisher,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedBrokerPublisher(BrokerPublisher, ABC):
+    """Batched Broker Publisher class.
+
+    The broker acknowledgements of up to ``max_pending`` messages are awaited at once, so that the broker is able to
+    handle them in batches instead of one by one. The pending messages are also awaited once ``pending_max_wait``
+    seconds have elapsed since the first of them was sent, so that they are not kept waiting for the next ones.
+
+    As the acknowledgements are awaited later, the failures are raised as a ``MinosBrokerPublishException`` that
+    contains the messages that caused them, instead of being attributed to the message that triggered the flush.
+    """
+
+    def __init__(self, *args, max_pending: Optional[int] = None, pending_max_wait: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if max_pending is None:
+            max_pending = 1
+        if pending_max_wait is None:
+            pending_max_wait = 0.1
+
+        self._max_pending = max_pending
+        self._pending_max_wait = pending_max_wait
+
+        self._pending: list[tuple[BrokerMessage, Future]] = list()
+        self._failures: list[tuple[BrokerMessage, Exception]] = list()
+        self._flush_task = None
+
+    @property
+    def max_pending(self) -> int:
+        """Get the number of messages whose acknowledgements can be pending at once.
+
+        :return: An ``int`` value.
+        """
+        return self._max_pending
+
+    @property
+    def pending_max_wait(self) -> float:
+        """Get the maximum number of seconds that an acknowledgement can be pending before being awaited.
+
+        :return: A ``float`` value.
+        """
+        return self._pending_max_wait
+
+    async def _destroy(self) -> None:
+        await self._stop_flush()
+        await self.flush()
+        await super()._destroy()
+
+    async def _send(self, message: BrokerMessage) -> None:
+        acknowledgement = await self._publish(message)
+        self._pending.append((message, ensure_future(acknowledgement)))
+
+        if len(self._pending) >= self._max_pending:
+            await self._stop_flush()
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = create_task(self._wait_and_flush())
+
+    @abstractmethod
+    async def _publish(self, message: BrokerMessage) -> Awaitable[Any]:
+        """Publish a message without waiting for its acknowledgement.
+
+        :param message: The message to be published.
+        :return: An awaitable that completes once the broker has acknowledged the message.
+        """
+        raise NotImplementedError
+
+    async def flush(self) -> None:
+        """Wait until the pending messages are acknowledged by the broker.
+
+        :return: This method does not return anything.
+        """
+        pending, self._pending = self._pending, list()
+        failures, self._failures = self._failures, list()
+
+        results = await gather(*(future for _, future in pending), return_exceptions=True)
+        for (message, _), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                failures.append((message, result))
+
+        if len(failures):
+            raise MinosBrokerPublishException(failures)
+
+    async def _wait_and_flush(self) -> None:
+        await sleep(self._pending_max_wait)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except MinosBrokerPublishException as exc:
+            # There is not any caller to raise to, so the failures are kept to be raised by the next flush.
+            logger.warning(f"There was a problem while trying to flush the pending messages: {exc!r}")
+            self._failures.extend(exc.failures)
+
+    async def _stop_flush(self) -> None:
+        if self._flush_task is not None:
+            task = self._flush_task
+            self._flush_task = None
+
+            task.cancel()
+            with suppress(CancelledError):
+                await task
@@ -21,10 +21,13 @@ from typing import (
 )
 
 from minos.common import (
+    AvroSchemaStore,
     BuildableMixin,
     Builder,
     Config,
+    Inject,
     Injectable,
+    MinosAvroSchemaNotFoundException,
     MinosConfigException,
 )
 
@@ -48,11 +51,17 @@ logger = logging.getLogger(__name__)
 
 
 class BrokerSubscriber(ABC, BuildableMixin):
-    """Broker Subscriber class."""
+    """Broker Subscriber class.
 
-    def __init__(self, topics: Iterable[str], **kwargs):
+    The messages encoded following the single-object encoding can only be decoded if their schema is known, so it is
+    loaded from the ``AvroSchemaStore`` if it is provided.
+    """
+
+    @Inject()
+    def __init__(self, topics: Iterable[str], avro_schema_store: Optional[AvroSchemaStore] = None, **kwargs):
         super().__init__(**kwargs)
         self._topics = set(topics)
+        self.avro_schema_store = avro_schema_store
 
     @property
     def topics(self) -> set[str]:
@@ -83,6 +92,41 @@ class BrokerSubscriber(ABC, BuildableMixin):
     async def _receive(self) -> BrokerMessage:
         raise NotImplementedError
 
+    async def _decode(self, data: bytes) -> BrokerMessage:
+        try:
+            return BrokerMessage.from_avro_bytes(data)
+        except MinosAvroSchemaNotFoundException as exc:
+            if self.avro_schema_store is None:
+                raise exc
+            await self.avro_schema_store.load(exc.fingerprint)
+
+        return BrokerMessage.from_avro_bytes(data)
+
+    async def ack(self, message: BrokerMessage) -> None:
+        """Acknowledge that the given message has been processed.
+
+        :param message: The message to be acknowledged.
+        :return: This method does not return anything.
+        """
+        logger.debug(f"Acknowledging {message!r} message...")
+        await self._ack(message)
+
+    async def _ack(self, message: BrokerMessage) -> None:
+        return
+
+    async def nack(self, message: BrokerMessage, requeue: bool = True) -> None:
+        """Notify that the given message could not be processed.
+
+        :param message: The message to be negatively acknowledged.
+        :param requeue: If ``True`` the message is delivered again, otherwise it is discarded.
+        :return: This method does not return anything.
+        """
+        logger.debug(f"Negatively acknowledging {message!r} message...")
+        await self._nack(message, requeue)
+
+    async def _nack(self, message: BrokerMessage, requeue: bool) -> None:
+        return
+
 
 BrokerSubscriberCls = TypeVar("BrokerSubscriberCls", bound=BrokerSubscriber)
 
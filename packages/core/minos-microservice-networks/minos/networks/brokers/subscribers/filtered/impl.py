@@ -12,8 +12,6 @@ from .validators import (
     BrokerSubscriberValidator,
 )
 
-_sentinel = object()
-
 
 class FilteredBrokerSubscriber(BrokerSubscriber):
     """Filtered Broker Subscriber class."""
@@ -37,10 +35,17 @@ class FilteredBrokerSubscriber(BrokerSubscriber):
         await super()._destroy()
 
     async def _receive(self) -> BrokerMessage:
-        message = _sentinel
-        while message is _sentinel or not (await self.validator.is_valid(message)):
+        message = await self.impl.receive()
+        while not (await self.validator.is_valid(message)):
+            await self.impl.ack(message)
             message = await self.impl.receive()
         return message
 
+    async def _ack(self, message: BrokerMessage) -> None:
+        await self.impl.ack(message)
+
+    async def _nack(self, message: BrokerMessage, requeue: bool) -> None:
+        await self.impl.nack(message, requeue)
+
 
 FilteredBrokerSubscriber.set_builder(Builder)
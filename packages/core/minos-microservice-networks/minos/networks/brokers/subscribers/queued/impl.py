@@ -81,6 +81,7 @@ class QueuedBrokerSubscriber(BrokerSubscriber):
     async def _run(self) -> NoReturn:
         async for message in self.impl:
             await self.queue.enqueue(message)
+            await self.impl.ack(message)
 
     def _receive(self) -> Awaitable[BrokerMessage]:
         return self.queue.dequeue()
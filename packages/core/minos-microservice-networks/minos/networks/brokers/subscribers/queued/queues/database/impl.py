@@ -9,6 +9,7 @@ from typing import (
 
 from minos.common import (
     DatabaseClient,
+    DatabaseNotification,
 )
 
 from .....collections import (
@@ -31,6 +32,9 @@ class DatabaseBrokerSubscriberQueue(
 ):
     """Database Broker Subscriber Queue class."""
 
+    def _is_relevant_notification(self, notification: DatabaseNotification) -> bool:
+        return notification.payload in self.topics
+
     async def _get_count(self) -> int:
         # noinspection PyTypeChecker
         operation = self.database_operation_factory.build_count(self._retry, self.topics)
@@ -1,11 +1,21 @@
 from abc import (
     ABC,
 )
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Hashable,
+)
 from typing import (
     Final,
     Iterable,
+    Optional,
+    Union,
 )
 
+from ...requests import (
+    Request,
+)
 from .abc import (
     EnrouteDecorator,
 )
@@ -15,11 +25,28 @@ from .kinds import (
 
 
 class BrokerEnrouteDecorator(EnrouteDecorator, ABC):
-    """Broker Enroute class"""
+    """Broker Enroute class
+
+    If ``batch_size`` is set, the decorated handler is called with a list of up to ``batch_size`` requests, waiting at
+    most ``max_wait`` seconds to fill it, instead of being called once per request.
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        key: Optional[Callable[[Request], Union[Optional[Hashable], Awaitable[Optional[Hashable]]]]] = None,
+        batch_size: Optional[int] = None,
+        max_wait: float = 1.0,
+        **kwargs,
+    ):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"The batch_size must be a positive number. Obtained: {batch_size!r}")
 
-    def __init__(self, topic: str, **kwargs):
         super().__init__(**kwargs)
         self.topic = topic
+        self.key = key
+        self.batch_size = batch_size
+        self.max_wait = max_wait
 
     def __iter__(self) -> Iterable:
         yield from (self.topic,)
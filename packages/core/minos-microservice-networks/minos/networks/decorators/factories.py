@@ -158,20 +158,32 @@ class EnrouteFactory:
 
         for name, decorators in mapping.items():
             for decorator in decorators:
-                ans[decorator].add(self._build_one_method(class_, name, decorator.pre_fn_name, decorator.post_fn_name))
-
-    def _build_one_method(self, class_: type, name: str, pref_fn_name: str, post_fn_name: str, **kwargs) -> Handler:
+                batched = getattr(decorator, "batch_size", None) is not None
+                ans[decorator].add(
+                    self._build_one_method(class_, name, decorator.pre_fn_name, decorator.post_fn_name, batched)
+                )
+
+    def _build_one_method(
+        self, class_: type, name: str, pref_fn_name: str, post_fn_name: str, batched: bool = False, **kwargs
+    ) -> Handler:
         instance = class_(**kwargs)
         fn = getattr(instance, name)
         pre_fn = getattr(instance, pref_fn_name, None)
         post_fn = getattr(instance, post_fn_name, None)
 
+        async def _pre(request: Request) -> Request:
+            request = pre_fn(request)
+            if isawaitable(request):
+                request = await request
+            return request
+
         @wraps(fn)
-        async def _wrapper(request: Request) -> Optional[Response]:
+        async def _wrapper(request: Union[Request, list[Request]]) -> Optional[Response]:
             if pre_fn is not None:
-                request = pre_fn(request)
-                if isawaitable(request):
-                    request = await request
+                if batched:
+                    request = [await _pre(one) for one in request]
+                else:
+                    request = await _pre(request)
 
             response = fn(request)
             if isawaitable(response):
@@ -1,7 +1,20 @@
+from __future__ import (
+    annotations,
+)
+
+from typing import (
+    TYPE_CHECKING,
+)
+
 from minos.common import (
     MinosException,
 )
 
+if TYPE_CHECKING:
+    from .brokers import (
+        BrokerMessage,
+    )
+
 
 class MinosNetworkException(MinosException):
     """Base network exception."""
@@ -15,6 +28,23 @@ class MinosInvalidDiscoveryClient(MinosNetworkException):
     """Exception raised when the configured Discovery Client does not implement de DiscoveryClient interface"""
 
 
+class MinosBrokerPublishException(MinosNetworkException):
+    """Exception to be raised when some messages could not be published."""
+
+    def __init__(self, failures: list[tuple[BrokerMessage, Exception]]):
+        self.failures = failures
+        detail = ", ".join(f"{message.identifier!s}: {exc!r}" for message, exc in failures)
+        super().__init__(f"{len(failures)} messages could not be published ({detail}).")
+
+    @property
+    def messages(self) -> list[BrokerMessage]:
+        """Get the messages that could not be published.
+
+        :return: A list of ``BrokerMessage`` instances.
+        """
+        return [message for message, _ in self.failures]
+
+
 class MinosHandlerException(MinosNetworkException):
     """Base handler exception."""
 
@@ -21,14 +21,26 @@ class MockedBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFact
         """For testing purposes"""
         return MockedDatabaseOperation("create_queue_table")
 
+    def build_notification_channel(self) -> str:
+        """For testing purposes"""
+        return "queue"
+
     def build_mark_processed(self, id_: int) -> DatabaseOperation:
         """For testing purposes"""
         return MockedDatabaseOperation("update_not_processed")
 
+    def build_mark_processed_many(self, ids: Iterable[int]) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("update_not_processed_many")
+
     def build_delete(self, id_: int) -> DatabaseOperation:
         """For testing purposes"""
         return MockedDatabaseOperation("delete_processed")
 
+    def build_delete_many(self, ids: Iterable[int]) -> DatabaseOperation:
+        """For testing purposes"""
+        return MockedDatabaseOperation("delete_processed_many")
+
     def build_mark_processing(self, ids: Iterable[int]) -> DatabaseOperation:
         """For testing purposes"""
         return MockedDatabaseOperation("mark_processing")
@@ -37,7 +49,7 @@ class MockedBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFact
         """For testing purposes"""
         return MockedDatabaseOperation("count_not_processed")
 
-    def build_submit(self, topic: str, data: bytes) -> DatabaseOperation:
+    def build_submit(self, topic: str, data: bytes, priority: int = 0) -> DatabaseOperation:
         """For testing purposes"""
         return MockedDatabaseOperation("insert")
 
@@ -5,6 +5,10 @@ from minos.networks import (
 )
 
 
+def _ticket_key(request: Request) -> str:
+    return request.headers.get("ticket")
+
+
 class QueryService:
     @enroute.rest.query(path="/ticket", method="POST", foo="bar")
     def add_ticket(self, request: Request) -> Response:
@@ -14,6 +18,6 @@ class QueryService:
     def ticket_added(self, request: Request):
         return "query_service_ticket_added"
 
-    @enroute.broker.event("TicketDeleted")
+    @enroute.broker.event("TicketDeleted", key=_ticket_key, batch_size=10, max_wait=0.5)
     def ticket_deleted(self, request: Request):
         return "ticket_deleted"
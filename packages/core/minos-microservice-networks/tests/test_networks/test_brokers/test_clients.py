@@ -78,6 +78,16 @@ class TestBrokerClient(NetworksTestCase, DatabaseMinosTestCase):
         )
         self.assertEqual([call(expected)], mock.call_args_list)
 
+    async def test_send_with_headers(self):
+        mock = AsyncMock()
+        self.publisher.send = mock
+        broker = BrokerClient(self.topic, self.publisher, self.broker.subscriber, headers={"foo": "bar"})
+
+        message = BrokerMessageV1("AddFoo", BrokerMessageV1Payload(56))
+        await broker.send(message)
+
+        self.assertEqual({"foo": "bar"}, mock.call_args.args[0].headers)
+
     async def test_receive(self):
         expected = FakeModel("test1")
         # noinspection PyUnresolvedReferences
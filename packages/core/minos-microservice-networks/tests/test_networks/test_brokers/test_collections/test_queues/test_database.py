@@ -1,6 +1,7 @@
 import unittest
 from asyncio import (
     sleep,
+    wait_for,
 )
 from itertools import (
     chain,
@@ -8,17 +9,25 @@ from itertools import (
 )
 from unittest.mock import (
     AsyncMock,
+    MagicMock,
+    call,
     patch,
 )
 
 from minos.common import (
+    ConnectionException,
     DatabaseMixin,
+    DatabaseNotification,
+    DatabaseNotificationListener,
+    NotificationDatabaseOperationFactory,
 )
 from minos.common.testing import (
     DatabaseMinosTestCase,
     MockedDatabaseClient,
+    MockedDatabaseOperation,
 )
 from minos.networks import (
+    BrokerMessage,
     BrokerMessageV1,
     BrokerMessageV1Payload,
     BrokerQueue,
@@ -47,6 +56,13 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
         self.assertEqual(self.operation_factory, queue.database_operation_factory)
         self.assertEqual(2, queue.retry)
         self.assertEqual(1000, queue.records)
+        self.assertEqual(1, queue.ack_records)
+        self.assertEqual(1.0, queue.ack_max_wait)
+
+    def test_constructor_ack(self):
+        queue = DatabaseBrokerQueue(operation_factory=self.operation_factory, ack_records=100, ack_max_wait=0.5)
+        self.assertEqual(100, queue.ack_records)
+        self.assertEqual(0.5, queue.ack_max_wait)
 
     async def test_operation_factory(self):
         queue = DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory)
@@ -60,7 +76,7 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
             MockedDatabaseClient,
             "fetch_all",
             side_effect=chain(
-                [FakeAsyncIterator([(0,)]), FakeAsyncIterator([(1, message.avro_bytes)])],
+                [FakeAsyncIterator([(0,)]), FakeAsyncIterator([(1, 0, message.avro_bytes)])],
                 cycle([FakeAsyncIterator([(0,)])]),
             ),
         ):
@@ -85,7 +101,7 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
             side_effect=chain(
                 [
                     FakeAsyncIterator([(2,)]),
-                    FakeAsyncIterator([(1, messages[0].avro_bytes), (2, messages[1].avro_bytes)]),
+                    FakeAsyncIterator([(1, 0, messages[0].avro_bytes), (2, 0, messages[1].avro_bytes)]),
                 ],
                 cycle([FakeAsyncIterator([(0,)])]),
             ),
@@ -108,7 +124,9 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
         with patch.object(
             MockedDatabaseClient,
             "fetch_all",
-            return_value=FakeAsyncIterator([[1, messages[0].avro_bytes], [2, bytes()], [3, messages[1].avro_bytes]]),
+            return_value=FakeAsyncIterator(
+                [[1, 0, messages[0].avro_bytes], [2, 0, bytes()], [3, 0, messages[1].avro_bytes]]
+            ),
         ):
             async with DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory) as queue:
                 queue._get_count = AsyncMock(side_effect=[3, 0])
@@ -132,8 +150,8 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
                     FakeAsyncIterator([(0,)]),
                     FakeAsyncIterator(
                         [
-                            (1, messages[0].avro_bytes),
-                            (2, messages[1].avro_bytes),
+                            (1, 0, messages[0].avro_bytes),
+                            (2, 0, messages[1].avro_bytes),
                         ]
                     ),
                 ],
@@ -150,10 +168,10 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
 
     async def test_dequeue_ordered(self):
         unsorted = [
-            BrokerMessageV1("foo", BrokerMessageV1Payload(4)),
-            BrokerMessageV1("foo", BrokerMessageV1Payload(2)),
-            BrokerMessageV1("foo", BrokerMessageV1Payload(3)),
-            BrokerMessageV1("foo", BrokerMessageV1Payload(1)),
+            BrokerMessageV1("foo", BrokerMessageV1Payload(4, headers={"priority": "4"})),
+            BrokerMessageV1("foo", BrokerMessageV1Payload(2, headers={"priority": "2"})),
+            BrokerMessageV1("foo", BrokerMessageV1Payload(3, headers={"priority": "2"})),
+            BrokerMessageV1("foo", BrokerMessageV1Payload(1, headers={"priority": "1"})),
         ]
 
         with patch.object(
@@ -164,10 +182,10 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
                     FakeAsyncIterator([(2,)]),
                     FakeAsyncIterator(
                         [
-                            (1, unsorted[0].avro_bytes),
-                            (2, unsorted[1].avro_bytes),
-                            (3, unsorted[2].avro_bytes),
-                            (4, unsorted[3].avro_bytes),
+                            (1, 4, unsorted[0].avro_bytes),
+                            (2, 2, unsorted[1].avro_bytes),
+                            (3, 2, unsorted[2].avro_bytes),
+                            (4, 1, unsorted[3].avro_bytes),
                         ]
                     ),
                 ],
@@ -183,6 +201,279 @@ class TestDatabaseBrokerQueue(NetworksTestCase, DatabaseMinosTestCase):
 
         self.assertEqual(expected, observed)
 
+    async def test_dequeue_deserializes_once(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+
+        with patch.object(
+            MockedDatabaseClient,
+            "fetch_all",
+            return_value=FakeAsyncIterator([[1, 0, messages[0].avro_bytes], [2, 0, messages[1].avro_bytes]]),
+        ):
+            async with DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory) as queue:
+                queue._get_count = AsyncMock(side_effect=[2, 0])
+
+                with patch.object(BrokerMessage, "from_avro_bytes", side_effect=messages) as mock:
+                    observed = [await queue.dequeue(), await queue.dequeue()]
+
+        self.assertEqual(messages, observed)
+        self.assertEqual(2, mock.call_count)
+
+    async def test_enqueue_with_priority(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar", headers={"priority": "3"}))
+
+        async with DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory) as queue:
+            with patch.object(
+                self.operation_factory, "build_submit", return_value=MockedDatabaseOperation("insert")
+            ) as mock:
+                await queue.enqueue(message)
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual("foo", mock.call_args.args[0])
+        self.assertEqual(message, BrokerMessage.from_avro_bytes(mock.call_args.args[1]))
+        self.assertEqual(3, mock.call_args.args[2])
+
+    async def test_dequeue_ack_batched_by_records(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+
+        with patch.object(
+            MockedDatabaseClient,
+            "fetch_all",
+            return_value=FakeAsyncIterator([[1, 0, messages[0].avro_bytes], [2, 0, messages[1].avro_bytes]]),
+        ):
+            async with DatabaseBrokerQueue.from_config(
+                self.config, operation_factory=self.operation_factory, ack_records=2, ack_max_wait=60
+            ) as queue:
+                queue._get_count = AsyncMock(side_effect=[2, 0])
+
+                with patch.object(
+                    self.operation_factory,
+                    "build_delete_many",
+                    return_value=MockedDatabaseOperation("delete_processed_many"),
+                ) as mock:
+                    await queue.dequeue()
+                    self.assertEqual([], mock.call_args_list)
+
+                    await queue.dequeue()
+                    self.assertEqual([call([1, 2])], mock.call_args_list)
+
+    async def test_dequeue_ack_batched_by_time(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        with patch.object(
+            MockedDatabaseClient,
+            "fetch_all",
+            return_value=FakeAsyncIterator([[1, 0, message.avro_bytes]]),
+        ):
+            async with DatabaseBrokerQueue.from_config(
+                self.config, operation_factory=self.operation_factory, ack_records=100, ack_max_wait=0.1
+            ) as queue:
+                queue._get_count = AsyncMock(side_effect=[1, 0])
+
+                with patch.object(
+                    self.operation_factory,
+                    "build_delete_many",
+                    return_value=MockedDatabaseOperation("delete_processed_many"),
+                ) as mock:
+                    await queue.dequeue()
+                    self.assertEqual([], mock.call_args_list)
+
+                    await sleep(0.2)
+                    self.assertEqual([call([1])], mock.call_args_list)
+
+    async def test_dequeue_ack_not_processed(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        with patch.object(
+            MockedDatabaseClient,
+            "fetch_all",
+            return_value=FakeAsyncIterator([[1, 0, bytes()], [2, 0, message.avro_bytes]]),
+        ):
+            async with DatabaseBrokerQueue.from_config(
+                self.config, operation_factory=self.operation_factory, ack_records=2
+            ) as queue:
+                queue._get_count = AsyncMock(side_effect=[2, 0])
+
+                with patch.object(
+                    self.operation_factory,
+                    "build_mark_processed_many",
+                    return_value=MockedDatabaseOperation("update_not_processed_many"),
+                ) as mark_mock, patch.object(
+                    self.operation_factory,
+                    "build_delete_many",
+                    return_value=MockedDatabaseOperation("delete_processed_many"),
+                ) as delete_mock:
+                    self.assertEqual(message, await queue.dequeue())
+
+                    self.assertEqual([call([1])], mark_mock.call_args_list)
+                    self.assertEqual([call([2])], delete_mock.call_args_list)
+
+    async def test_dequeue_ack_retried(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        with patch.object(
+            MockedDatabaseClient,
+            "fetch_all",
+            return_value=FakeAsyncIterator([[1, 0, message.avro_bytes]]),
+        ):
+            async with DatabaseBrokerQueue.from_config(
+                self.config, operation_factory=self.operation_factory, ack_records=1, ack_max_wait=0.1
+            ) as queue:
+                queue._get_count = AsyncMock(side_effect=[1, 0])
+
+                with patch.object(
+                    self.operation_factory,
+                    "build_delete_many",
+                    side_effect=[ValueError(), MockedDatabaseOperation("delete_processed_many")],
+                ) as mock:
+                    self.assertEqual(message, await queue.dequeue())
+                    self.assertEqual([1], queue._processed_ids)
+
+                    await sleep(0.2)
+                    self.assertEqual([call([1]), call([1])], mock.call_args_list)
+                    self.assertEqual([], queue._processed_ids)
+
+    async def test_destroy_flushes_ack(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        with patch.object(
+            MockedDatabaseClient,
+            "fetch_all",
+            return_value=FakeAsyncIterator([[1, 0, message.avro_bytes]]),
+        ):
+            queue = DatabaseBrokerQueue.from_config(
+                self.config, operation_factory=self.operation_factory, ack_records=100, ack_max_wait=60
+            )
+            await queue.setup()
+            queue._get_count = AsyncMock(side_effect=[1, 0])
+
+            with patch.object(
+                self.operation_factory,
+                "build_delete_many",
+                return_value=MockedDatabaseOperation("delete_processed_many"),
+            ) as mock:
+                await queue.dequeue()
+                self.assertEqual([], mock.call_args_list)
+
+                await queue.destroy()
+                self.assertEqual([call([1])], mock.call_args_list)
+
+    async def test_enqueue_notifies(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        async with DatabaseNotificationListener(self.pool_factory.get_pool("database"), "queue") as listener:
+            async with DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory) as queue:
+                await queue.enqueue(message)
+
+            observed = await wait_for(listener.receive(), 0.5)
+
+        self.assertEqual(DatabaseNotification("queue", "foo"), observed)
+
+    async def test_dequeue_with_notification(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        with patch.object(DatabaseBrokerQueue, "_get_count", return_value=0), patch.object(
+            MockedDatabaseClient, "fetch_all", return_value=FakeAsyncIterator([(1, 0, message.avro_bytes)])
+        ):
+            async with DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory) as queue:
+                await sleep(0.1)  # To give time to the queue to start waiting.
+
+                # Simulates an enqueue performed by another process.
+                async with self.pool_factory.get_pool("database").acquire() as client:
+                    factory = client.get_factory(NotificationDatabaseOperationFactory)
+                    await client.execute(factory.build_notify("queue", "foo"))
+
+                observed = await wait_for(queue.dequeue(), 0.5)
+
+        self.assertEqual(message, observed)
+
+    async def test_listen_restarts_listener(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        with patch.object(DatabaseBrokerQueue, "_get_count", return_value=0), patch.object(
+            DatabaseBrokerQueue, "_LISTEN_RETRY_DELAY", 0.01
+        ), patch.object(
+            MockedDatabaseClient, "fetch_all", return_value=FakeAsyncIterator([(1, 0, message.avro_bytes)])
+        ):
+            async with DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory) as queue:
+                listener = queue._listener
+                listener.receive = AsyncMock(side_effect=ConnectionException(""))
+                await sleep(0.1)
+
+                self.assertIsNot(listener, queue._listener)
+                self.assertTrue(listener.already_destroyed)
+                self.assertFalse(queue._listen_task.done())
+
+                async with self.pool_factory.get_pool("database").acquire() as client:
+                    factory = client.get_factory(NotificationDatabaseOperationFactory)
+                    await client.execute(factory.build_notify("queue", "foo"))
+
+                observed = await wait_for(queue.dequeue(), 0.5)
+
+        self.assertEqual(message, observed)
+
+    async def test_restart_listener_destroys_failed_listener(self):
+        failed = MagicMock(setup=AsyncMock(side_effect=ConnectionException("")), destroy=AsyncMock())
+        restarted = MagicMock(setup=AsyncMock(), destroy=AsyncMock())
+
+        queue = DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory)
+        queue._listener = MagicMock(destroy=AsyncMock())
+
+        with patch.object(DatabaseBrokerQueue, "_LISTEN_RETRY_DELAY", 0), patch.object(
+            queue, "_build_listener", side_effect=[failed, restarted]
+        ):
+            await queue._restart_listener()
+
+        self.assertEqual(1, failed.destroy.call_count)
+        self.assertEqual(0, restarted.destroy.call_count)
+        self.assertEqual(restarted, queue._listener)
+
+    async def test_dequeue_without_notifications(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        with patch.object(MockedDatabaseClient, "get_factory", side_effect=ValueError):
+            queue = DatabaseBrokerQueue.from_config(self.config, operation_factory=self.operation_factory)
+
+        with patch.object(
+            MockedDatabaseClient, "fetch_all", return_value=FakeAsyncIterator([(1, 0, message.avro_bytes)])
+        ):
+            async with queue:
+                queue._get_count = AsyncMock(side_effect=[1, 0])
+                observed = await wait_for(queue.dequeue(), 0.5)
+
+        self.assertIsNone(queue._listener)
+        self.assertEqual(message, observed)
+
+    async def test_dequeue_skips_count_while_not_exhausted(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+
+        with patch.object(
+            MockedDatabaseClient,
+            "fetch_all",
+            side_effect=[
+                FakeAsyncIterator([(1, 0, messages[0].avro_bytes)]),
+                FakeAsyncIterator([(2, 0, messages[1].avro_bytes)]),
+                FakeAsyncIterator([]),
+            ],
+        ):
+            async with DatabaseBrokerQueue.from_config(
+                self.config, operation_factory=self.operation_factory, records=1
+            ) as queue:
+                queue._get_count = AsyncMock(side_effect=[1, 0])
+                observed = [await queue.dequeue(), await queue.dequeue()]
+                await sleep(0.1)
+
+        self.assertEqual(messages, observed)
+        self.assertEqual(2, queue._get_count.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from asyncio import (
+    create_task,
+    gather,
+    sleep,
+)
+from unittest.mock import (
+    AsyncMock,
+    call,
+)
+
+from minos.networks import (
+    BrokerDispatcherBatch,
+    BrokerMessageV1,
+    BrokerMessageV1Payload,
+)
+
+
+class TestBrokerDispatcherBatch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(3)]
+        self.fn = AsyncMock(side_effect=lambda messages: [message.content for message in messages])
+
+    def test_constructor(self):
+        batch = BrokerDispatcherBatch(self.fn, 10, 0.5)
+
+        self.assertEqual(self.fn, batch.fn)
+        self.assertEqual(10, batch.batch_size)
+        self.assertEqual(0.5, batch.max_wait)
+        self.assertEqual(0, len(batch))
+
+    async def test_submit_batch_size(self):
+        batch = BrokerDispatcherBatch(self.fn, 3, 10)
+
+        observed = await gather(*(batch.submit(message) for message in self.messages))
+
+        self.assertEqual([0, 1, 2], observed)
+        self.assertEqual([call(self.messages)], self.fn.call_args_list)
+        self.assertEqual(0, len(batch))
+
+    async def test_submit_max_wait(self):
+        batch = BrokerDispatcherBatch(self.fn, 10, 0.1)
+
+        observed = await gather(*(batch.submit(message) for message in self.messages[:2]))
+
+        self.assertEqual([0, 1], observed)
+        self.assertEqual([call(self.messages[:2])], self.fn.call_args_list)
+
+    async def test_submit_raises(self):
+        self.fn.side_effect = ValueError
+        batch = BrokerDispatcherBatch(self.fn, 2, 10)
+
+        observed = await gather(*(batch.submit(message) for message in self.messages[:2]), return_exceptions=True)
+
+        self.assertEqual(2, len(observed))
+        self.assertTrue(all(isinstance(exc, ValueError) for exc in observed))
+
+    async def test_flush(self):
+        batch = BrokerDispatcherBatch(self.fn, 10, 10)
+
+        task = create_task(batch.submit(self.messages[0]))
+        await sleep(0.01)
+        self.assertEqual(1, len(batch))
+
+        await batch.flush()
+
+        self.assertEqual(0, await task)
+        self.assertEqual(0, len(batch))
+
+    async def test_flush_sequential(self):
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(5)]
+        observed = list()
+
+        async def _fn(messages_):
+            observed.append([message.content for message in messages_])
+            await sleep(0.05)
+            return [message.content for message in messages_]
+
+        batch = BrokerDispatcherBatch(_fn, 2, 0.01)
+
+        self.assertEqual([0, 1, 2, 3, 4], await gather(*(batch.submit(message) for message in messages)))
+        self.assertEqual([[0, 1], [2, 3], [4]], observed)
+
+    async def test_flush_empty(self):
+        batch = BrokerDispatcherBatch(self.fn, 10, 10)
+
+        await batch.flush()
+
+        self.assertEqual(0, self.fn.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
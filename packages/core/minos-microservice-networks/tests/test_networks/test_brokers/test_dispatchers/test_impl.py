@@ -1,4 +1,9 @@
 import unittest
+from asyncio import (
+    create_task,
+    gather,
+    sleep,
+)
 from unittest.mock import (
     AsyncMock,
     MagicMock,
@@ -95,6 +100,32 @@ class TestBrokerDispatcher(NetworksTestCase, DatabaseMinosTestCase):
         )
 
         self.assertEqual(self.publisher, self.dispatcher.publisher)
+        self.assertEqual({"TicketDeleted"}, set(self.dispatcher.keys.keys()))
+        self.assertEqual({"TicketDeleted": (10, 0.5)}, self.dispatcher.batch_options)
+
+    def test_from_config_with_handlers(self):
+        dispatcher = BrokerDispatcher.from_config(self.config, publisher=self.publisher, handlers={"foo": _Cls._fn})
+
+        self.assertEqual({"foo"}, set(dispatcher.actions.keys()))
+        self.assertEqual(dict(), dispatcher.keys)
+        self.assertEqual(dict(), dispatcher.batch_options)
+
+    async def test_get_key(self):
+        message = BrokerMessageV1("TicketDeleted", BrokerMessageV1Payload(headers={"ticket": "foo"}))
+
+        self.assertEqual("foo", await self.dispatcher.get_key(message))
+
+    async def test_get_key_awaitable(self):
+        async def _fn(request: Request) -> str:
+            return await request.content()
+
+        dispatcher = BrokerDispatcher(dict(), self.publisher, keys={"foo": _fn})
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        self.assertEqual("bar", await dispatcher.get_key(message))
+
+    async def test_get_key_without_fn(self):
+        self.assertEqual(None, await self.dispatcher.get_key(self.message))
 
     def test_from_config_raises(self):
         with self.assertRaises(NotProvidedException):
@@ -224,6 +255,100 @@ class TestBrokerDispatcher(NetworksTestCase, DatabaseMinosTestCase):
         self.assertEqual(1, callback_mock.call_count)
         self.assertEqual(call(BrokerRequest(message)), callback_mock.call_args)
 
+    async def test_get_batch_callback(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload(i, headers={"foo": str(i)}), reply_topic="bar")
+            for i in range(3)
+        ]
+
+        async def _fn(requests: list[Request]) -> list[Response]:
+            return [BrokerResponse(await request.content() * 10) for request in requests]
+
+        fn = self.dispatcher.get_batch_callback(_fn)
+
+        expected = [BrokerMessageV1Payload(i * 10, {"foo": str(i)}, BrokerMessageV1Status.SUCCESS) for i in range(3)]
+        self.assertEqual(expected, await fn(messages))
+
+    async def test_get_batch_callback_single_response(self):
+        async def _fn(requests: list[Request]) -> Response:
+            return BrokerResponse(len(requests))
+
+        fn = self.dispatcher.get_batch_callback(_fn)
+
+        expected = [BrokerMessageV1Payload(2, self.headers, BrokerMessageV1Status.SUCCESS)] * 2
+        self.assertEqual(expected, await fn([self.message, self.message]))
+
+    async def test_get_batch_callback_none(self):
+        async def _fn(requests: list[Request]) -> None:
+            for request in requests:
+                await request.content()
+
+        fn = self.dispatcher.get_batch_callback(_fn)
+
+        # noinspection PyArgumentEqualDefault
+        expected = [BrokerMessageV1Payload(None, self.headers, BrokerMessageV1Status.SUCCESS)] * 2
+        self.assertEqual(expected, await fn([self.message, self.message]))
+
+    async def test_get_batch_callback_raises_response(self):
+        fn = self.dispatcher.get_batch_callback(_Cls._fn_raises_response)
+
+        expected = [
+            BrokerMessageV1Payload(repr(BrokerResponseException("foo")), self.headers, BrokerMessageV1Status.ERROR)
+        ] * 2
+        self.assertEqual(expected, await fn([self.message, self.message]))
+
+    async def test_get_batch_callback_raises_exception(self):
+        fn = self.dispatcher.get_batch_callback(_Cls._fn_raises_exception)
+
+        expected = [BrokerMessageV1Payload(repr(ValueError()), self.headers, BrokerMessageV1Status.SYSTEM_ERROR)] * 2
+        self.assertEqual(expected, await fn([self.message, self.message]))
+
+    async def test_dispatch_batch(self):
+        callback_mock = AsyncMock(side_effect=lambda requests: [Response(len(requests))] * len(requests))
+        dispatcher = BrokerDispatcher({"foo": callback_mock}, self.publisher, batch_options={"foo": (2, 10)})
+
+        send_mock = AsyncMock()
+        self.publisher.send = send_mock
+
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i), reply_topic="bar") for i in range(2)]
+        await gather(*(dispatcher.dispatch(message) for message in messages))
+
+        self.assertEqual(1, callback_mock.call_count)
+        self.assertEqual([BrokerRequest(message) for message in messages], callback_mock.call_args.args[0])
+
+        expected = [
+            call(
+                BrokerMessageV1(
+                    "bar",
+                    BrokerMessageV1Payload(2, status=BrokerMessageV1Status.SUCCESS, headers=message.headers),
+                    identifier=message.identifier,
+                )
+            )
+            for message in messages
+        ]
+        self.assertCountEqual(expected, send_mock.call_args_list)
+
+    async def test_dispatch_batch_max_wait(self):
+        callback_mock = AsyncMock()
+        dispatcher = BrokerDispatcher({"foo": callback_mock}, self.publisher, batch_options={"foo": (10, 0.1)})
+
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        await dispatcher.dispatch(message)
+
+        self.assertEqual([call([BrokerRequest(message)])], callback_mock.call_args_list)
+
+    async def test_destroy_flushes_batches(self):
+        callback_mock = AsyncMock()
+        dispatcher = BrokerDispatcher({"foo": callback_mock}, self.publisher, batch_options={"foo": (10, 10)})
+
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        async with dispatcher:
+            task = create_task(dispatcher.dispatch(message))
+            await sleep(0.01)
+
+        await task
+        self.assertEqual([call([BrokerRequest(message)])], callback_mock.call_args_list)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,17 +1,29 @@
 import unittest
+from asyncio import (
+    sleep,
+)
+from time import (
+    monotonic,
+)
 from unittest.mock import (
     AsyncMock,
+    MagicMock,
     call,
+    patch,
 )
 
 from minos.common import (
+    Config,
     NotProvidedException,
 )
 from minos.networks import (
+    BrokerDispatcher,
     BrokerHandler,
+    BrokerHandlerConcurrencyLimiter,
     BrokerMessageV1,
     BrokerMessageV1Payload,
     InMemoryBrokerPublisher,
+    InMemoryBrokerSubscriber,
     InMemoryBrokerSubscriberBuilder,
 )
 from tests.utils import (
@@ -35,6 +47,49 @@ class TestBrokerHandler(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(NotProvidedException):
             BrokerHandler.from_config(CONFIG_FILE_PATH, publisher=self.publisher)
 
+    def test_from_config_without_limiter(self):
+        handler = BrokerHandler.from_config(
+            CONFIG_FILE_PATH, publisher=self.publisher, subscriber_builder=self.subscriber_builder
+        )
+        self.assertIsNone(handler.limiter)
+
+    def test_from_config_limiter(self):
+        config = Config(CONFIG_FILE_PATH)
+        broker_config = config.get_interface_by_name("broker")
+        broker_config["common"] |= {
+            "handler": {"limiter": {"min_limit": 2, "max_limit": 10, "latency_target": 0.5, "pool_wait_target": 0.2}}
+        }
+        pool = MagicMock(wait_time=0.0)
+        pool_factory = MagicMock(get_pool=MagicMock(return_value=pool))
+
+        with patch.object(Config, "get_interface_by_name", return_value=broker_config):
+            handler = BrokerHandler.from_config(
+                config, publisher=self.publisher, subscriber_builder=self.subscriber_builder, pool_factory=pool_factory
+            )
+
+        limiter = handler.limiter
+        self.assertIsInstance(limiter, BrokerHandlerConcurrencyLimiter)
+        self.assertEqual(2, limiter.min_limit)
+        self.assertEqual(10, limiter.max_limit)
+        self.assertEqual(0.5, limiter.latency_target)
+        self.assertEqual(0.2, limiter.pool_wait_target)
+        self.assertEqual((pool,), limiter.pools)
+        self.assertEqual([call("database")], pool_factory.get_pool.call_args_list)
+        self.assertEqual(10, handler._concurrency)
+
+    def test_from_config_limiter_enabled(self):
+        config = Config(CONFIG_FILE_PATH)
+        broker_config = config.get_interface_by_name("broker")
+        broker_config["common"] |= {"handler": {"limiter": True}}
+
+        with patch.object(Config, "get_interface_by_name", return_value=broker_config):
+            handler = BrokerHandler.from_config(
+                config, publisher=self.publisher, subscriber_builder=self.subscriber_builder
+            )
+
+        self.assertIsInstance(handler.limiter, BrokerHandlerConcurrencyLimiter)
+        self.assertEqual(tuple(), handler.limiter.pools)
+
     async def test_run(self):
         dispatch_mock = AsyncMock(side_effect=[None, ValueError])
 
@@ -47,6 +102,151 @@ class TestBrokerHandler(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual([call(self.messages[0]), call(self.messages[1])], dispatch_mock.call_args_list)
 
+    async def test_run_ack_nack(self):
+        dispatch_mock = AsyncMock(side_effect=[None, ValueError])
+        ack_mock = AsyncMock()
+        nack_mock = AsyncMock()
+
+        async with BrokerHandler.from_config(
+            CONFIG_FILE_PATH, publisher=self.publisher, subscriber_builder=self.subscriber_builder, concurrency=1
+        ) as handler:
+            handler._subscriber.receive = AsyncMock(side_effect=self.messages)
+            handler._subscriber.ack = ack_mock
+            handler._subscriber.nack = nack_mock
+            handler._dispatcher.dispatch = dispatch_mock
+            await handler.run()
+
+        self.assertEqual([call(self.messages[0])], ack_mock.call_args_list)
+        self.assertEqual([call(self.messages[1], requeue=True)], nack_mock.call_args_list)
+
+    async def test_run_nack_max_attempts(self):
+        message = self.messages[0]
+        nack_mock = AsyncMock()
+
+        async with BrokerHandler.from_config(
+            CONFIG_FILE_PATH,
+            publisher=self.publisher,
+            subscriber_builder=self.subscriber_builder,
+            concurrency=1,
+            max_attempts=2,
+        ) as handler:
+            handler._subscriber.receive = AsyncMock(side_effect=[message, message, message])
+            handler._subscriber.nack = nack_mock
+            handler._dispatcher.dispatch = AsyncMock(side_effect=ValueError)
+            await handler.run()
+
+        self.assertEqual(
+            [call(message, requeue=True), call(message, requeue=False), call(message, requeue=True)],
+            nack_mock.call_args_list,
+        )
+
+    async def test_run_ordered(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload({"uuid": "one", "value": i % 4}))
+            if i % 2
+            else BrokerMessageV1("foo", BrokerMessageV1Payload(i, headers={"partition_key": "two"}))
+            for i in range(8)
+        ]
+        observed = {"one": list(), "two": list()}
+
+        async def _fn(message):
+            # The latest messages are faster, so they would be dispatched first if they were not ordered.
+            await sleep(0.01 * (len(messages) - messages.index(message)))
+            key = message.headers.get("partition_key", "one")
+            observed[key].append(message)
+
+        async with BrokerHandler.from_config(
+            CONFIG_FILE_PATH,
+            publisher=self.publisher,
+            subscriber_builder=self.subscriber_builder,
+            concurrency=4,
+            ordered=True,
+        ) as handler:
+            handler._subscriber.receive = AsyncMock(side_effect=messages)
+            handler._dispatcher.dispatch = AsyncMock(side_effect=_fn)
+            await handler.run()
+
+        self.assertEqual(messages[1::2], observed["one"])
+        self.assertEqual(messages[::2], observed["two"])
+
+    async def test_run_with_limiter(self):
+        limiter = BrokerHandlerConcurrencyLimiter(max_limit=3)
+        acquire_mock = AsyncMock(side_effect=limiter.acquire)
+        release_mock = AsyncMock(side_effect=limiter.release)
+        limiter.acquire = acquire_mock
+        limiter.release = release_mock
+
+        async with BrokerHandler.from_config(
+            CONFIG_FILE_PATH, publisher=self.publisher, subscriber_builder=self.subscriber_builder, limiter=limiter
+        ) as handler:
+            self.assertEqual(limiter, handler.limiter)
+            self.assertEqual(3, len(handler._consumers))
+
+            handler._subscriber.receive = AsyncMock(side_effect=self.messages)
+            handler._dispatcher.dispatch = AsyncMock(side_effect=[None, ValueError])
+            await handler.run()
+
+        self.assertEqual(2, acquire_mock.call_count)
+        self.assertEqual(2, release_mock.call_count)
+        self.assertEqual(0, limiter.active)
+
+    async def test_run_batched(self):
+        messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(50)]
+        callback_mock = AsyncMock(return_value=None)
+        ack_mock = AsyncMock()
+
+        dispatcher = BrokerDispatcher({"foo": callback_mock}, self.publisher, batch_options={"foo": (100, 0.2)})
+        subscriber = InMemoryBrokerSubscriber(["foo"])
+        async with BrokerHandler(dispatcher, subscriber, concurrency=5) as handler:
+            handler._subscriber.receive = AsyncMock(side_effect=messages)
+            handler._subscriber.ack = ack_mock
+
+            started_at = monotonic()
+            await handler.run()
+            await handler._destroy_consumers()
+            elapsed = monotonic() - started_at
+
+        self.assertEqual(1, callback_mock.call_count)
+        self.assertEqual(list(range(50)), [request.raw.content for request in callback_mock.call_args.args[0]])
+        self.assertEqual([call(message) for message in messages], ack_mock.call_args_list)
+        self.assertLess(elapsed, 1.0)
+
+    async def test_run_batched_ordered(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload(0, headers={"partition_key": "one"})),
+            BrokerMessageV1("bar", BrokerMessageV1Payload(1, headers={"partition_key": "one"})),
+            BrokerMessageV1("foo", BrokerMessageV1Payload(2, headers={"partition_key": "one"})),
+        ]
+        observed = list()
+
+        async def _batch_fn(requests):
+            observed.extend(request.raw.content for request in requests)
+
+        async def _fn(request):
+            observed.append(request.raw.content)
+
+        dispatcher = BrokerDispatcher({"foo": _batch_fn, "bar": _fn}, self.publisher, batch_options={"foo": (10, 0.1)})
+        subscriber = InMemoryBrokerSubscriber(["foo", "bar"])
+        async with BrokerHandler(dispatcher, subscriber, concurrency=2, ordered=True) as handler:
+            handler._subscriber.receive = AsyncMock(side_effect=messages)
+            await handler.run()
+
+        self.assertEqual([0, 1, 2], observed)
+
+    async def test_get_key(self):
+        handler = BrokerHandler.from_config(
+            CONFIG_FILE_PATH, publisher=self.publisher, subscriber_builder=self.subscriber_builder, ordered=True
+        )
+        handler._dispatcher.get_key = AsyncMock(side_effect=["foo", None, None, None])
+
+        self.assertEqual("foo", await handler._get_key(self.messages[0]))
+        self.assertEqual(
+            "bar",
+            await handler._get_key(BrokerMessageV1("foo", BrokerMessageV1Payload(headers={"partition_key": "bar"}))),
+        )
+        self.assertEqual("bar", await handler._get_key(BrokerMessageV1("foo", BrokerMessageV1Payload({"uuid": "bar"}))))
+        self.assertEqual(None, await handler._get_key(self.messages[0]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+from asyncio import (
+    create_task,
+    sleep,
+)
+from unittest.mock import (
+    MagicMock,
+)
+
+from minos.networks import (
+    BrokerHandlerConcurrencyLimiter,
+)
+
+
+class TestBrokerHandlerConcurrencyLimiter(unittest.IsolatedAsyncioTestCase):
+    def test_constructor(self):
+        limiter = BrokerHandlerConcurrencyLimiter()
+
+        self.assertEqual(1, limiter.min_limit)
+        self.assertEqual(50, limiter.max_limit)
+        self.assertEqual(1, limiter.limit)
+        self.assertEqual(0, limiter.active)
+        self.assertEqual(0, limiter.waiting)
+        self.assertEqual(0.0, limiter.pool_wait_time)
+
+    def test_constructor_initial_limit(self):
+        self.assertEqual(5, BrokerHandlerConcurrencyLimiter(initial_limit=5).limit)
+        self.assertEqual(10, BrokerHandlerConcurrencyLimiter(max_limit=10, initial_limit=20).limit)
+
+    def test_constructor_raises(self):
+        with self.assertRaises(ValueError):
+            BrokerHandlerConcurrencyLimiter(min_limit=0)
+        with self.assertRaises(ValueError):
+            BrokerHandlerConcurrencyLimiter(min_limit=5, max_limit=4)
+        with self.assertRaises(ValueError):
+            BrokerHandlerConcurrencyLimiter(backoff_ratio=1)
+
+    def test_pool_wait_time(self):
+        pools = [MagicMock(wait_time=0.2), MagicMock(wait_time=0.5)]
+        limiter = BrokerHandlerConcurrencyLimiter(pools=pools)
+
+        self.assertEqual(0.5, limiter.pool_wait_time)
+
+    async def test_acquire_release(self):
+        limiter = BrokerHandlerConcurrencyLimiter(max_limit=2)
+
+        await limiter.acquire()
+        self.assertEqual(1, limiter.active)
+
+        task = create_task(limiter.acquire())
+        await sleep(0.01)
+        self.assertFalse(task.done())
+        self.assertEqual(1, limiter.waiting)
+
+        await limiter.release(0.1)
+        await task
+
+        self.assertEqual(1, limiter.active)
+        self.assertEqual(0, limiter.waiting)
+
+    async def test_increase(self):
+        limiter = BrokerHandlerConcurrencyLimiter(max_limit=3)
+
+        limiter._waiting = 1
+        for _ in range(3):
+            await limiter.acquire()
+            await limiter.release(0.1)
+
+        self.assertEqual(3, limiter.limit)
+
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(0.1)
+
+        self.assertEqual(3, limiter.limit)
+
+    async def test_increase_without_waiting(self):
+        limiter = BrokerHandlerConcurrencyLimiter(max_limit=3)
+
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(0.1)
+
+        self.assertEqual(1, limiter.limit)
+
+    async def test_decrease_latency(self):
+        limiter = BrokerHandlerConcurrencyLimiter(initial_limit=8, latency_target=1.0)
+
+        await limiter.acquire()
+        await limiter.release(2.0)
+        self.assertEqual(8, limiter.limit)
+
+        for _ in range(7):
+            await limiter.acquire()
+            await limiter.release(2.0)
+        self.assertEqual(4, limiter.limit)
+
+        for _ in range(4):
+            await limiter.acquire()
+            await limiter.release(2.0)
+        self.assertEqual(2, limiter.limit)
+
+    async def test_decrease_pool_wait_time(self):
+        limiter = BrokerHandlerConcurrencyLimiter(
+            initial_limit=2, pool_wait_target=0.1, pools=[MagicMock(wait_time=0.2)]
+        )
+
+        for _ in range(2):
+            await limiter.acquire()
+            await limiter.release(0.1)
+
+        self.assertEqual(1, limiter.limit)
+
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(0.1)
+
+        self.assertEqual(1, limiter.limit)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,6 +26,7 @@ class TestBrokerMessage(unittest.TestCase):
             "headers",
             "status",
             "ok",
+            "priority",
         }
         self.assertTrue(expected.issubset(BrokerMessage.__abstractmethods__))
 
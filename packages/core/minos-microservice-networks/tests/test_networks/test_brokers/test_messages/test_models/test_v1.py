@@ -88,6 +88,19 @@ class TestBrokerMessageV1(unittest.TestCase):
         message = BrokerMessageV1(self.topic, self.payload)
         self.assertEqual(self.payload.headers, message.headers)
 
+    def test_priority(self):
+        message = BrokerMessageV1(self.topic, BrokerMessageV1Payload(headers={"priority": "3"}))
+        self.assertEqual(3, message.priority)
+
+    def test_priority_default(self):
+        message = BrokerMessageV1(self.topic, self.payload)
+        self.assertEqual(0, message.priority)
+
+    def test_priority_invalid(self):
+        message = BrokerMessageV1(self.topic, BrokerMessageV1Payload(headers={"priority": "high"}))
+        with self.assertLogs("minos.networks.brokers.messages.models.v1", level="WARNING"):
+            self.assertEqual(0, message.priority)
+
     def test_content(self):
         message = BrokerMessageV1(self.topic, self.payload)
         self.assertEqual(self.payload.content, message.content)
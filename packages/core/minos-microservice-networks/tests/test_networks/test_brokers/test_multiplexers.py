@@ -0,0 +1,89 @@
+import unittest
+from asyncio import (
+    sleep,
+)
+
+from minos.common import (
+    SetupMixin,
+)
+from minos.common.testing import (
+    DatabaseMinosTestCase,
+)
+from minos.networks import (
+    BrokerMessageV1,
+    BrokerMessageV1Payload,
+    BrokerReplyChannel,
+    BrokerReplyMultiplexer,
+    BrokerSubscriber,
+    InMemoryBrokerSubscriberBuilder,
+)
+from tests.utils import (
+    NetworksTestCase,
+)
+
+
+class TestBrokerReplyMultiplexer(NetworksTestCase, DatabaseMinosTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.subscriber_builder = InMemoryBrokerSubscriberBuilder()
+        self.multiplexer = BrokerReplyMultiplexer.from_config(
+            self.config, topic="fooReply", subscriber_builder=self.subscriber_builder
+        )
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.multiplexer.setup()
+
+    async def asyncTearDown(self):
+        await self.multiplexer.destroy()
+        await super().asyncTearDown()
+
+    def test_base_classes(self):
+        self.assertIsInstance(self.multiplexer, SetupMixin)
+
+    def test_from_config(self):
+        self.assertEqual("fooReply", self.multiplexer.topic)
+        self.assertIsInstance(self.multiplexer.subscriber, BrokerSubscriber)
+        self.assertEqual({"fooReply"}, self.multiplexer.subscriber.topics)
+
+    def test_from_config_random_topic(self):
+        multiplexer = BrokerReplyMultiplexer.from_config(self.config, subscriber_builder=self.subscriber_builder)
+        self.assertIsInstance(multiplexer.topic, str)
+        self.assertNotEqual(self.multiplexer.topic, multiplexer.topic)
+
+    async def test_open_close_channel(self):
+        channel = self.multiplexer.open_channel()
+        self.assertIsInstance(channel, BrokerReplyChannel)
+        self.assertEqual({"fooReply"}, channel.topics)
+        self.assertEqual({BrokerReplyMultiplexer.CHANNEL_HEADER: channel.identifier}, channel.headers)
+        self.assertEqual({channel.identifier: channel}, self.multiplexer.channels)
+
+        await channel.destroy()
+        self.assertEqual(dict(), self.multiplexer.channels)
+
+    async def test_dispatch(self):
+        one, two = self.multiplexer.open_channel(), self.multiplexer.open_channel()
+
+        first = BrokerMessageV1("fooReply", BrokerMessageV1Payload("one", headers=one.headers))
+        second = BrokerMessageV1("fooReply", BrokerMessageV1Payload("two", headers=two.headers))
+        self.multiplexer.subscriber.add_message(second)
+        self.multiplexer.subscriber.add_message(first)
+
+        self.assertEqual(first, await one.receive())
+        self.assertEqual(second, await two.receive())
+
+    async def test_dispatch_unknown_channel(self):
+        channel = self.multiplexer.open_channel()
+
+        with self.assertLogs("minos.networks.brokers.multiplexers", level="WARNING"):
+            self.multiplexer.dispatch(BrokerMessageV1("fooReply", BrokerMessageV1Payload("unknown")))
+            self.multiplexer.dispatch(
+                BrokerMessageV1("fooReply", BrokerMessageV1Payload("unknown", headers={"reply_channel": "foo"}))
+            )
+
+        await sleep(0)
+        self.assertTrue(channel._queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,16 @@ from minos.common.testing import (
     DatabaseMinosTestCase,
 )
 from minos.networks import (
+    REQUEST_HEADERS_CONTEXT_VAR,
     REQUEST_REPLY_TOPIC_CONTEXT_VAR,
     BrokerClient,
     BrokerClientPool,
+    BrokerMessageV1,
+    BrokerMessageV1Payload,
+    BrokerReplyChannel,
     InMemoryBrokerPublisher,
     InMemoryBrokerSubscriberBuilder,
+    MultiplexedBrokerClientPool,
 )
 from tests.utils import (
     NetworksTestCase,
@@ -54,5 +59,69 @@ class TestBrokerClientPool(NetworksTestCase, DatabaseMinosTestCase):
         self.assertEqual(None, REQUEST_REPLY_TOPIC_CONTEXT_VAR.get())
 
 
+class TestMultiplexedBrokerClientPool(NetworksTestCase, DatabaseMinosTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.publisher = InMemoryBrokerPublisher.from_config(self.config)
+        self.subscriber_builder = InMemoryBrokerSubscriberBuilder()
+        self.pool = MultiplexedBrokerClientPool.from_config(
+            self.config, publisher=self.publisher, subscriber_builder=self.subscriber_builder
+        )
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.publisher.setup()
+        await self.pool.setup()
+
+    async def asyncTearDown(self):
+        await self.pool.destroy()
+        await self.publisher.destroy()
+        await super().asyncTearDown()
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(MultiplexedBrokerClientPool, BrokerClientPool))
+
+    async def test_acquire(self):
+        async with self.pool.acquire() as broker:
+            self.assertIsInstance(broker, BrokerClient)
+            self.assertIsInstance(broker.subscriber, BrokerReplyChannel)
+            self.assertEqual(broker.subscriber.headers, broker.headers)
+
+    async def test_acquire_share_multiplexer(self):
+        async with self.pool.acquire() as one:
+            async with self.pool.acquire() as two:
+                self.assertEqual(one.topic, two.topic)
+                self.assertNotEqual(one.subscriber.identifier, two.subscriber.identifier)
+
+        multiplexer = await self.pool.get_multiplexer()
+        self.assertEqual(dict(), multiplexer.channels)
+
+    async def test_acquire_context_vars(self):
+        self.assertEqual(None, REQUEST_REPLY_TOPIC_CONTEXT_VAR.get())
+        self.assertEqual(None, REQUEST_HEADERS_CONTEXT_VAR.get())
+
+        async with self.pool.acquire() as broker:
+            self.assertEqual(broker.topic, REQUEST_REPLY_TOPIC_CONTEXT_VAR.get())
+            self.assertEqual(broker.headers, REQUEST_HEADERS_CONTEXT_VAR.get())
+
+        self.assertEqual(None, REQUEST_REPLY_TOPIC_CONTEXT_VAR.get())
+        self.assertEqual(None, REQUEST_HEADERS_CONTEXT_VAR.get())
+
+    async def test_send_receive(self):
+        async with self.pool.acquire() as broker:
+            message = BrokerMessageV1("AddFoo", BrokerMessageV1Payload(56))
+            await broker.send(message)
+
+            multiplexer = await self.pool.get_multiplexer()
+            reply = BrokerMessageV1(
+                message.reply_topic,
+                BrokerMessageV1Payload("bar", headers=message.headers),
+                identifier=message.identifier,
+            )
+            multiplexer.subscriber.add_message(reply)
+
+            self.assertEqual(reply, await broker.receive())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,8 @@ from unittest.mock import (
 from minos.common import (
     Builder,
     Config,
+    InMemoryAvroSchemaStore,
+    MinosAvroProtocol,
     MinosConfigException,
     SetupMixin,
 )
@@ -52,6 +54,29 @@ class TestBrokerPublisher(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual([call(message)], mock.call_args_list)
 
+    async def test_encode(self):
+        publisher = _BrokerPublisher()
+        self.assertIsNone(publisher.avro_schema_store)
+
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        observed = await publisher._encode(message)
+
+        self.assertIsNone(MinosAvroProtocol.get_fingerprint(observed))
+        self.assertEqual(message, BrokerMessage.from_avro_bytes(observed))
+
+    async def test_encode_with_store(self):
+        store = InMemoryAvroSchemaStore()
+        publisher = _BrokerPublisher(avro_schema_store=store)
+        self.assertEqual(store, publisher.avro_schema_store)
+
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        observed = await publisher._encode(message)
+
+        fingerprint = MinosAvroProtocol.get_fingerprint(observed)
+        self.assertIsNotNone(fingerprint)
+        self.assertIsNotNone(await store._load(fingerprint))
+        self.assertEqual(message, BrokerMessage.from_avro_bytes(observed))
+
 
 class TestBrokerPublisherBuilder(unittest.TestCase):
     def test_constructor(self):
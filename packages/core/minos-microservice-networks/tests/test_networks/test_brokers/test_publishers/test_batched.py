@@ -0,0 +1,135 @@
+import unittest
+from abc import (
+    ABC,
+)
+from asyncio import (
+    Future,
+    sleep,
+)
+from typing import (
+    Optional,
+)
+from uuid import (
+    UUID,
+)
+
+from minos.networks import (
+    BatchedBrokerPublisher,
+    BrokerMessage,
+    BrokerMessageV1,
+    BrokerMessageV1Payload,
+    BrokerPublisher,
+    MinosBrokerPublishException,
+)
+
+
+class _BatchedBrokerPublisher(BatchedBrokerPublisher):
+    """For testing purposes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.published = list()
+        self.exceptions: dict[UUID, Exception] = dict()
+
+    async def _publish(self, message: BrokerMessage) -> Future:
+        """For testing purposes."""
+        self.published.append(message)
+
+        future = Future()
+        exc: Optional[Exception] = self.exceptions.get(message.identifier)
+        if exc is None:
+            future.set_result(None)
+        else:
+            future.set_exception(exc)
+        return future
+
+
+class TestBatchedBrokerPublisher(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(3)]
+
+    def test_abstract(self):
+        self.assertTrue(issubclass(BatchedBrokerPublisher, (ABC, BrokerPublisher)))
+        # noinspection PyUnresolvedReferences
+        self.assertEqual({"_publish"}, BatchedBrokerPublisher.__abstractmethods__)
+
+    def test_constructor(self):
+        publisher = _BatchedBrokerPublisher()
+        self.assertEqual(1, publisher.max_pending)
+        self.assertEqual(0.1, publisher.pending_max_wait)
+
+    def test_constructor_extended(self):
+        publisher = _BatchedBrokerPublisher(max_pending=10, pending_max_wait=0.5)
+        self.assertEqual(10, publisher.max_pending)
+        self.assertEqual(0.5, publisher.pending_max_wait)
+
+    async def test_send_max_pending(self):
+        publisher = _BatchedBrokerPublisher(max_pending=2, pending_max_wait=60)
+
+        await publisher.send(self.messages[0])
+        self.assertEqual(1, len(publisher._pending))
+        self.assertIsNotNone(publisher._flush_task)
+
+        await publisher.send(self.messages[1])
+        self.assertEqual(0, len(publisher._pending))
+        self.assertIsNone(publisher._flush_task)
+
+        self.assertEqual(self.messages[:2], publisher.published)
+
+    async def test_send_max_wait(self):
+        publisher = _BatchedBrokerPublisher(max_pending=10, pending_max_wait=0.01)
+
+        await publisher.send(self.messages[0])
+        await publisher.send(self.messages[1])
+        self.assertEqual(2, len(publisher._pending))
+
+        await sleep(0.05)
+
+        self.assertEqual(0, len(publisher._pending))
+        self.assertIsNone(publisher._flush_task)
+
+    async def test_flush_raises_failed_messages(self):
+        exc = ValueError()
+        publisher = _BatchedBrokerPublisher(max_pending=3, pending_max_wait=60)
+        publisher.exceptions[self.messages[1].identifier] = exc
+
+        await publisher.send(self.messages[0])
+        await publisher.send(self.messages[1])
+        with self.assertRaises(MinosBrokerPublishException) as context:
+            await publisher.send(self.messages[2])
+
+        self.assertEqual([(self.messages[1], exc)], context.exception.failures)
+        self.assertEqual([self.messages[1]], context.exception.messages)
+        self.assertEqual(0, len(publisher._pending))
+
+        await publisher.flush()
+
+    async def test_send_max_wait_keeps_failures(self):
+        exc = ValueError()
+        publisher = _BatchedBrokerPublisher(max_pending=10, pending_max_wait=0.01)
+        publisher.exceptions[self.messages[0].identifier] = exc
+
+        await publisher.send(self.messages[0])
+        await sleep(0.05)
+        self.assertEqual(0, len(publisher._pending))
+
+        await publisher.send(self.messages[1])
+        with self.assertRaises(MinosBrokerPublishException) as context:
+            await publisher.flush()
+
+        self.assertEqual([(self.messages[0], exc)], context.exception.failures)
+
+    async def test_destroy_flushes(self):
+        publisher = _BatchedBrokerPublisher(max_pending=10, pending_max_wait=60)
+        await publisher.setup()
+        await publisher.send(self.messages[0])
+        self.assertEqual(1, len(publisher._pending))
+
+        await publisher.destroy()
+
+        self.assertEqual(0, len(publisher._pending))
+        self.assertIsNone(publisher._flush_task)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,11 +5,17 @@ from abc import (
 from unittest.mock import (
     AsyncMock,
     MagicMock,
+    call,
+    patch,
 )
 
 from minos.common import (
+    AvroSchemaRegistry,
     Builder,
     Config,
+    InMemoryAvroSchemaStore,
+    MinosAvroProtocol,
+    MinosAvroSchemaNotFoundException,
     MinosConfigException,
     SetupMixin,
 )
@@ -59,6 +65,49 @@ class TestBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(message, observed)
         self.assertEqual(1, mock.call_count)
 
+    async def test_decode(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        subscriber = _BrokerSubscriber(list())
+        self.assertIsNone(subscriber.avro_schema_store)
+
+        observed = await subscriber._decode(message.avro_bytes)
+        self.assertEqual(message, observed)
+
+    async def test_decode_single_object_with_store(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        data = message.avro_single_object_bytes
+        fingerprint = MinosAvroProtocol.get_fingerprint(data)
+
+        publishing_store = InMemoryAvroSchemaStore()
+        await publishing_store.publish(fingerprint)
+
+        with patch.object(MinosAvroProtocol, "registry", AvroSchemaRegistry()):
+            store = InMemoryAvroSchemaStore()
+            store._schemas = publishing_store._schemas
+            subscriber = _BrokerSubscriber(list(), avro_schema_store=store)
+
+            observed = await subscriber._decode(data)
+
+        self.assertEqual(message, observed)
+
+    async def test_decode_single_object_without_store_raises(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        data = message.avro_single_object_bytes
+
+        with patch.object(MinosAvroProtocol, "registry", AvroSchemaRegistry()):
+            subscriber = _BrokerSubscriber(list())
+            with self.assertRaises(MinosAvroSchemaNotFoundException):
+                await subscriber._decode(data)
+
+    async def test_decode_single_object_with_store_unknown_raises(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        data = message.avro_single_object_bytes
+
+        with patch.object(MinosAvroProtocol, "registry", AvroSchemaRegistry()):
+            subscriber = _BrokerSubscriber(list(), avro_schema_store=InMemoryAvroSchemaStore())
+            with self.assertRaises(MinosAvroSchemaNotFoundException):
+                await subscriber._decode(data)
+
     async def test_aiter(self):
         expected = [
             BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
@@ -77,6 +126,27 @@ class TestBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(expected, observed)
 
+    async def test_ack(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        mock = AsyncMock()
+        subscriber = _BrokerSubscriber(list())
+        subscriber._ack = mock
+
+        await subscriber.ack(message)
+        self.assertEqual([call(message)], mock.call_args_list)
+
+    async def test_nack(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        mock = AsyncMock()
+        subscriber = _BrokerSubscriber(list())
+        subscriber._nack = mock
+
+        await subscriber.nack(message)
+        await subscriber.nack(message, requeue=False)
+        self.assertEqual([call(message, True), call(message, False)], mock.call_args_list)
+
 
 class TestBrokerSubscriberBuilder(unittest.TestCase):
     def test_constructor(self):
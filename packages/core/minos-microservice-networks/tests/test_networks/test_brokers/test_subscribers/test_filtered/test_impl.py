@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import (
     AsyncMock,
+    call,
 )
 
 from minos.networks import (
@@ -69,6 +70,41 @@ class TestFilteredBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(one, await subscriber.receive())
             self.assertEqual(two, await subscriber.receive())
 
+    async def test_receive_ack_invalid(self):
+        one = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        two = BrokerMessageV1("bar", BrokerMessageV1Payload("foo"))
+
+        self.impl.add_message(one)
+        self.impl.add_message(one)
+        self.impl.add_message(two)
+
+        ack_mock = AsyncMock()
+        self.impl.ack = ack_mock
+
+        async with FilteredBrokerSubscriber(self.impl, self.validator) as subscriber:
+            await subscriber.receive()
+            self.assertEqual(0, ack_mock.call_count)
+            await subscriber.receive()
+            self.assertEqual([call(one)], ack_mock.call_args_list)
+
+    async def test_ack(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        mock = AsyncMock()
+        self.impl.ack = mock
+
+        await FilteredBrokerSubscriber(self.impl, self.validator).ack(message)
+        self.assertEqual([call(message)], mock.call_args_list)
+
+    async def test_nack(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        mock = AsyncMock()
+        self.impl.nack = mock
+
+        await FilteredBrokerSubscriber(self.impl, self.validator).nack(message, requeue=False)
+        self.assertEqual([call(message, False)], mock.call_args_list)
+
 
 if __name__ == "__main__":
     unittest.main()
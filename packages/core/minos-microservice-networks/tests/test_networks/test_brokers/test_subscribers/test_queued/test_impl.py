@@ -97,10 +97,14 @@ class TestQueuedBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
         enqueue_mock = AsyncMock()
         self.queue.enqueue = enqueue_mock
 
+        ack_mock = AsyncMock()
+        self.impl.ack = ack_mock
+
         async with QueuedBrokerSubscriber(self.impl, self.queue):
             await sleep(0.5)  # To give time to consume the message
 
         self.assertEqual([call(self.messages[0]), call(self.messages[1])], enqueue_mock.call_args_list)
+        self.assertEqual([call(self.messages[0]), call(self.messages[1])], ack_mock.call_args_list)
 
 
 class TestQueuedBrokerSubscriberBuilder(unittest.TestCase):
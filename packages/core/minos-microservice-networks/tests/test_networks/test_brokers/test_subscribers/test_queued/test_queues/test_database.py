@@ -10,6 +10,9 @@ from unittest.mock import (
     patch,
 )
 
+from minos.common import (
+    DatabaseNotification,
+)
 from minos.common.testing import (
     DatabaseMinosTestCase,
     MockedDatabaseClient,
@@ -40,6 +43,12 @@ class TestDatabaseBrokerSubscriberQueue(NetworksTestCase, DatabaseMinosTestCase)
 
         self.assertIsInstance(queue.database_operation_factory, MockedBrokerSubscriberQueueDatabaseOperationFactory)
 
+    def test_is_relevant_notification(self):
+        queue = DatabaseBrokerSubscriberQueue.from_config(self.config, topics={"foo", "bar"})
+
+        self.assertTrue(queue._is_relevant_notification(DatabaseNotification("broker_subscriber_queue", "foo")))
+        self.assertFalse(queue._is_relevant_notification(DatabaseNotification("broker_subscriber_queue", "baz")))
+
     async def test_enqueue(self):
         message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
 
@@ -47,7 +56,7 @@ class TestDatabaseBrokerSubscriberQueue(NetworksTestCase, DatabaseMinosTestCase)
             MockedDatabaseClient,
             "fetch_all",
             side_effect=chain(
-                [FakeAsyncIterator([(0,)]), FakeAsyncIterator([(1, message.avro_bytes)])],
+                [FakeAsyncIterator([(0,)]), FakeAsyncIterator([(1, 0, message.avro_bytes)])],
                 cycle([FakeAsyncIterator([(0,)])]),
             ),
         ):
@@ -70,7 +79,7 @@ class TestDatabaseBrokerSubscriberQueue(NetworksTestCase, DatabaseMinosTestCase)
                         [2],
                     ]
                 ),
-                FakeAsyncIterator([[1, messages[0].avro_bytes], [2, bytes()], [3, messages[1].avro_bytes]]),
+                FakeAsyncIterator([[1, 0, messages[0].avro_bytes], [2, 0, bytes()], [3, 0, messages[1].avro_bytes]]),
                 FakeAsyncIterator([(0,)]),
             ],
         ):
@@ -90,7 +99,7 @@ class TestDatabaseBrokerSubscriberQueue(NetworksTestCase, DatabaseMinosTestCase)
             "fetch_all",
             side_effect=[
                 FakeAsyncIterator([(0,)]),
-                FakeAsyncIterator([(1, messages[0].avro_bytes), (3, messages[1].avro_bytes)]),
+                FakeAsyncIterator([(1, 0, messages[0].avro_bytes), (3, 0, messages[1].avro_bytes)]),
                 FakeAsyncIterator([(0,)]),
             ],
         ):
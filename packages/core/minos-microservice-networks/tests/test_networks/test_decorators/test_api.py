@@ -51,6 +51,25 @@ class TestEnroute(unittest.IsolatedAsyncioTestCase):
     def test_broker_event_decorators(self):
         decorator = enroute.broker.event("CreateTicket")
         self.assertEqual(BrokerEventEnrouteDecorator("CreateTicket"), decorator)
+        self.assertEqual(None, decorator.key)
+
+    def test_broker_event_decorators_key(self):
+        def _fn(request):
+            return request
+
+        decorator = enroute.broker.event("CreateTicket", key=_fn)
+        self.assertEqual(BrokerEventEnrouteDecorator("CreateTicket"), decorator)
+        self.assertEqual(_fn, decorator.key)
+
+    def test_broker_event_decorators_batch(self):
+        decorator = enroute.broker.event("CreateTicket", batch_size=10, max_wait=0.5)
+        self.assertEqual(BrokerEventEnrouteDecorator("CreateTicket"), decorator)
+        self.assertEqual(10, decorator.batch_size)
+        self.assertEqual(0.5, decorator.max_wait)
+
+    def test_broker_event_decorators_batch_raises(self):
+        with self.assertRaises(ValueError):
+            enroute.broker.event("CreateTicket", batch_size=0)
 
     def test_periodic_command_decorators(self):
         decorator = enroute.periodic.event("0 */2 * * *")
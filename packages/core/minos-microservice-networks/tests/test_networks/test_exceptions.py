@@ -4,6 +4,9 @@ from minos.common import (
     MinosException,
 )
 from minos.networks import (
+    BrokerMessageV1,
+    BrokerMessageV1Payload,
+    MinosBrokerPublishException,
     MinosNetworkException,
 )
 
@@ -12,6 +15,17 @@ class TestExceptions(unittest.TestCase):
     def test_type(self):
         self.assertTrue(issubclass(MinosNetworkException, MinosException))
 
+    def test_broker_publish(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        exc = ValueError("baz")
+
+        observed = MinosBrokerPublishException([(message, exc)])
+
+        self.assertIsInstance(observed, MinosNetworkException)
+        self.assertEqual([(message, exc)], observed.failures)
+        self.assertEqual([message], observed.messages)
+        self.assertIn(str(message.identifier), str(observed))
+
 
 if __name__ == "__main__":
     unittest.main()
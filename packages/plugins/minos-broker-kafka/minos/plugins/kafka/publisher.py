@@ -4,6 +4,7 @@ from __future__ import (
 
 import logging
 from asyncio import (
+    Future,
     TimeoutError,
     wait_for,
 )
@@ -14,6 +15,8 @@ from functools import (
     partial,
 )
 from typing import (
+    Any,
+    Final,
     Optional,
 )
 
@@ -21,9 +24,12 @@ from aiokafka import (
     AIOKafkaProducer,
 )
 
+from minos.common import (
+    Config,
+)
 from minos.networks import (
+    BatchedBrokerPublisher,
     BrokerMessage,
-    BrokerPublisher,
     BrokerPublisherBuilder,
 )
 
@@ -35,10 +41,29 @@ from .common import (
 logger = logging.getLogger(__name__)
 
 
-class KafkaBrokerPublisher(BrokerPublisher, KafkaCircuitBreakerMixin):
-    """Kafka Broker Publisher class."""
+class KafkaBrokerPublisher(BatchedBrokerPublisher, KafkaCircuitBreakerMixin):
+    """Kafka Broker Publisher class.
+
+    The messages are sent with a partition key, so that the ones related with the same entity are stored on the same
+    partition and then consumed in order. The key is obtained from the ``"partition_key"`` header if it is set, or from
+    the ``uuid`` attribute of the content otherwise.
+
+    The delivery of up to ``max_pending`` messages can be awaited at once (see ``BatchedBrokerPublisher``), so that the
+    producer is able to group them into batches (according to the ``linger_ms`` and ``max_batch_size`` values) instead
+    of waiting for the broker acknowledgement of each message before sending the next one.
+    """
 
-    def __init__(self, *args, host: Optional[str] = None, port: Optional[int] = None, **kwargs):
+    PARTITION_KEY_HEADER: Final[str] = "partition_key"
+
+    def __init__(
+        self,
+        *args,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        linger_ms: int = 0,
+        max_batch_size: int = 16384,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
         if host is None:
@@ -50,6 +75,9 @@ class KafkaBrokerPublisher(BrokerPublisher, KafkaCircuitBreakerMixin):
         self._host = host
         self._port = port
 
+        self._linger_ms = linger_ms
+        self._max_batch_size = max_batch_size
+
         self._client = None
 
     @property
@@ -73,8 +101,10 @@ class KafkaBrokerPublisher(BrokerPublisher, KafkaCircuitBreakerMixin):
         await self._start_client()
 
     async def _destroy(self) -> None:
-        await self._stop_client()
-        await super()._destroy()
+        try:
+            await super()._destroy()
+        finally:
+            await self._stop_client()
 
     async def _start_client(self) -> None:
         # noinspection PyBroadException
@@ -88,9 +118,29 @@ class KafkaBrokerPublisher(BrokerPublisher, KafkaCircuitBreakerMixin):
         with suppress(TimeoutError):
             await wait_for(self._client.stop(), 0.5)
 
-    async def _send(self, message: BrokerMessage) -> None:
-        fn = partial(self.client.send_and_wait, message.topic, message.avro_bytes)
-        await self.with_circuit_breaker(fn)
+    async def _publish(self, message: BrokerMessage) -> Future:
+        data = await self._encode(message)
+        fn = partial(self.client.send, message.topic, data, key=self._build_key(message))
+        return await self.with_circuit_breaker(fn)
+
+    def _build_key(self, message: BrokerMessage) -> Optional[bytes]:
+        key = message.headers.get(self.PARTITION_KEY_HEADER)
+
+        if key is None:
+            key = self._get_content_uuid(message)
+
+        if key is None:
+            return None
+
+        return str(key).encode()
+
+    @staticmethod
+    def _get_content_uuid(message: BrokerMessage) -> Optional[Any]:
+        content = message.content
+        if isinstance(content, dict):
+            return content.get("uuid")
+
+        return getattr(content, "uuid", None)
 
     @property
     def client(self) -> AIOKafkaProducer:
@@ -103,7 +153,11 @@ class KafkaBrokerPublisher(BrokerPublisher, KafkaCircuitBreakerMixin):
         return self._client
 
     def _build_client(self) -> AIOKafkaProducer:
-        return AIOKafkaProducer(bootstrap_servers=self._bootstrap_servers)
+        return AIOKafkaProducer(
+            bootstrap_servers=self._bootstrap_servers,
+            linger_ms=self._linger_ms,
+            max_batch_size=self._max_batch_size,
+        )
 
     @property
     def _bootstrap_servers(self):
@@ -113,5 +167,19 @@ class KafkaBrokerPublisher(BrokerPublisher, KafkaCircuitBreakerMixin):
 class KafkaBrokerPublisherBuilder(BrokerPublisherBuilder[KafkaBrokerPublisher], KafkaBrokerBuilderMixin):
     """Kafka Broker Publisher Builder class."""
 
+    def with_config(self, config: Config):
+        """Set config.
+
+        :param config: The config to be set.
+        :return: This method return the builder instance.
+        """
+        common_config = config.get_interface_by_name("broker").get("common", dict())
+
+        for key in ("linger_ms", "max_batch_size", "max_pending", "pending_max_wait"):
+            if common_config.get(key) is not None:
+                self.kwargs[key] = common_config[key]
+
+        return super().with_config(config)
+
 
 KafkaBrokerPublisher.set_builder(KafkaBrokerPublisherBuilder)
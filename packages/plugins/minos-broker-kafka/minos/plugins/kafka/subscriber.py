@@ -7,6 +7,9 @@ from asyncio import (
     TimeoutError,
     wait_for,
 )
+from collections import (
+    deque,
+)
 from collections.abc import (
     Iterable,
 )
@@ -23,6 +26,7 @@ from typing import (
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerStoppedError,
+    TopicPartition,
 )
 from cached_property import (
     cached_property,
@@ -34,9 +38,14 @@ from kafka.admin import (
     NewTopic,
 )
 from kafka.errors import (
+    CommitFailedError,
+    IllegalStateError,
     TopicAlreadyExistsError,
 )
 
+from minos.common import (
+    Config,
+)
 from minos.networks import (
     BrokerMessage,
     BrokerSubscriber,
@@ -52,7 +61,17 @@ logger = logging.getLogger(__name__)
 
 
 class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
-    """Kafka Broker Subscriber class."""
+    """Kafka Broker Subscriber class.
+
+    The topics are created with ``num_partitions`` partitions, so that many consumers of the same group can share the
+    load, while the messages with the same partition key are still consumed in order.
+
+    If ``max_records`` is set, the records are fetched in batches of up to that size and the offsets are not committed
+    automatically. Instead, each partition is committed up to the last record whose message, and all the previous
+    ones, have been acknowledged through ``ack``, so that the not yet processed messages are delivered again after a
+    restart or a rebalance. The records that cannot be decoded are skipped, and the pending records of a partition that
+    is no longer assigned are discarded, as they will be delivered to its new consumer.
+    """
 
     def __init__(
         self,
@@ -61,6 +80,10 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
         port: Optional[int] = None,
         group_id: Optional[str] = None,
         remove_topics_on_destroy: bool = False,
+        num_partitions: int = 1,
+        replication_factor: int = 1,
+        max_records: Optional[int] = None,
+        fetch_timeout_ms: int = 500,
         **kwargs,
     ):
         super().__init__(topics, **kwargs)
@@ -76,6 +99,16 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
 
         self._remove_topics_on_destroy = remove_topics_on_destroy
 
+        self._num_partitions = num_partitions
+        self._replication_factor = replication_factor
+
+        self._max_records = max_records
+        self._fetch_timeout_ms = fetch_timeout_ms
+
+        self._buffer: deque[BrokerMessage] = deque()
+        self._deliveries: dict[tuple[TopicPartition, int], BrokerMessage] = dict()
+        self._offsets: dict[TopicPartition, dict[int, bool]] = dict()
+
     @property
     def host(self) -> str:
         """The host of kafka.
@@ -108,12 +141,39 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
         """
         return self._remove_topics_on_destroy
 
+    @property
+    def num_partitions(self) -> int:
+        """The number of partitions of the created topics.
+
+        :return: An ``int`` value.
+        """
+        return self._num_partitions
+
+    @property
+    def replication_factor(self) -> int:
+        """The replication factor of the created topics.
+
+        :return: An ``int`` value.
+        """
+        return self._replication_factor
+
+    @property
+    def max_records(self) -> Optional[int]:
+        """The maximum number of records to be fetched at once.
+
+        :return: An ``int`` value or ``None`` if the records are fetched one by one.
+        """
+        return self._max_records
+
     async def _setup(self) -> None:
         await super()._setup()
         await self._create_topics()
         await self._start_client()
 
     async def _destroy(self) -> None:
+        self._buffer.clear()
+        self._deliveries.clear()
+        self._offsets.clear()
         await self._stop_client()
         await self._delete_topics()
         await self._stop_admin_client()
@@ -139,7 +199,9 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
 
         new_topics = list()
         for topic in self.topics:
-            new_topics.append(NewTopic(name=topic, num_partitions=1, replication_factor=1))
+            new_topics.append(
+                NewTopic(name=topic, num_partitions=self.num_partitions, replication_factor=self.replication_factor)
+            )
 
         def _fn() -> None:
             with suppress(TopicAlreadyExistsError):
@@ -164,15 +226,125 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
         return KafkaAdminClient(bootstrap_servers=f"{self.host}:{self.port}")
 
     async def _receive(self) -> BrokerMessage:
+        if self._max_records is not None:
+            return await self._receive_from_batch()
+
         try:
             record = await self.client.getone()
         except ConsumerStoppedError:
             raise StopAsyncIteration
 
         bytes_ = record.value
-        message = BrokerMessage.from_avro_bytes(bytes_)
+        message = await self._decode(bytes_)
         return message
 
+    async def _receive_from_batch(self) -> BrokerMessage:
+        while not len(self._buffer):
+            await self._fetch_batch()
+        return self._buffer.popleft()
+
+    async def _fetch_batch(self) -> None:
+        try:
+            batches = await self.client.getmany(timeout_ms=self._fetch_timeout_ms, max_records=self._max_records)
+        except ConsumerStoppedError:
+            raise StopAsyncIteration
+
+        for partition, records in batches.items():
+            offsets = self._offsets.setdefault(partition, dict())
+            discarded = list()
+            for record in records:
+                offsets[record.offset] = False
+                try:
+                    message = await self._decode(record.value)
+                except Exception as exc:
+                    logger.warning(f"Discarding the undecodable record at {record.offset!r} of {partition!r}: {exc!r}")
+                    discarded.append(record.offset)
+                    continue
+                # The delivery is carried by the message, as the identifiers are not unique across redeliveries.
+                message._kafka_delivery = (partition, record.offset)
+                self._deliveries[message._kafka_delivery] = message
+                self._buffer.append(message)
+
+            for offset in discarded:
+                await self._mark_as_processed(partition, offset)
+
+    async def _ack(self, message: BrokerMessage) -> None:
+        delivery = self._pop_delivery(message)
+        if delivery is None:
+            return
+
+        await self._mark_as_processed(*delivery)
+
+    async def _nack(self, message: BrokerMessage, requeue: bool) -> None:
+        delivery = self._pop_delivery(message)
+        if delivery is None:
+            return
+
+        if not requeue:
+            await self._mark_as_processed(*delivery)
+            return
+
+        # Kafka is not able to deliver a single record again, so the whole partition is rewound to the failed one.
+        partition, offset = delivery
+        self._discard_from(partition, offset)
+        try:
+            self.client.seek(partition, offset)
+        except IllegalStateError:
+            self._revoke(partition)
+
+    def _pop_delivery(self, message: BrokerMessage) -> Optional[tuple[TopicPartition, int]]:
+        delivery = getattr(message, "_kafka_delivery", None)
+        if delivery is None or self._deliveries.get(delivery) is not message:
+            return None
+
+        del self._deliveries[delivery]
+        return delivery
+
+    async def _mark_as_processed(self, partition: TopicPartition, offset: int) -> None:
+        offsets = self._offsets.get(partition)
+        if offsets is None or offset not in offsets:
+            return
+        offsets[offset] = True
+
+        committable = None
+        for offset, processed in tuple(offsets.items()):
+            if not processed:
+                break
+            del offsets[offset]
+            committable = offset + 1
+
+        if committable is None:
+            return
+
+        try:
+            await self.client.commit({partition: committable})
+        except CommitFailedError as exc:
+            logger.warning(f"The {partition!r} offsets could not be committed: {exc!r}")
+        except IllegalStateError:
+            self._revoke(partition)
+
+    def _revoke(self, partition: TopicPartition) -> None:
+        # The partition has been assigned to another consumer, which will deliver again its not committed records.
+        logger.warning(f"The {partition!r} partition is no longer assigned. Discarding its pending records...")
+        self._discard_from(partition, 0)
+        self._offsets.pop(partition, None)
+
+    def _discard_from(self, partition: TopicPartition, offset: int) -> None:
+        discarded = {
+            (partition_, offset_)
+            for partition_, offset_ in self._deliveries
+            if partition_ == partition and offset_ >= offset
+        }
+        for delivery in discarded:
+            del self._deliveries[delivery]
+
+        self._buffer = deque(message for message in self._buffer if message._kafka_delivery not in discarded)
+
+        offsets = self._offsets.get(partition, dict())
+        for offset_ in tuple(offsets):
+            if offset_ >= offset:
+                del offsets[offset_]
+
     @cached_property
     def client(self) -> AIOKafkaConsumer:
         """Get the kafka consumer client.
@@ -184,11 +356,26 @@ class KafkaBrokerSubscriber(BrokerSubscriber, KafkaCircuitBreakerMixin):
             bootstrap_servers=f"{self.host}:{self.port}",
             group_id=self.group_id,
             auto_offset_reset="earliest",
+            enable_auto_commit=self._max_records is None,
         )
 
 
 class KafkaBrokerSubscriberBuilder(BrokerSubscriberBuilder[KafkaBrokerSubscriber], KafkaBrokerBuilderMixin):
     """Kafka Broker Subscriber Builder class."""
 
+    def with_config(self, config: Config):
+        """Set config.
+
+        :param config: The config to be set.
+        :return: This method return the builder instance.
+        """
+        common_config = config.get_interface_by_name("broker").get("common", dict())
+
+        for key in ("num_partitions", "replication_factor", "max_records", "fetch_timeout_ms"):
+            if common_config.get(key) is not None:
+                self.kwargs[key] = common_config[key]
+
+        return super().with_config(config)
+
 
 KafkaBrokerSubscriber.set_builder(KafkaBrokerSubscriberBuilder)
@@ -1,6 +1,13 @@
 import unittest
+from asyncio import (
+    Future,
+)
 from unittest.mock import (
     AsyncMock,
+    patch,
+)
+from uuid import (
+    uuid4,
 )
 
 from aiokafka import (
@@ -52,6 +59,15 @@ class TestKafkaBrokerPublisher(unittest.IsolatedAsyncioTestCase):
 
         self.assertIsInstance(publisher.client, AIOKafkaProducer)
 
+    async def test_client_batching(self):
+        publisher = KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH, linger_ms=5, max_batch_size=1024)
+
+        with patch("minos.plugins.kafka.publisher.AIOKafkaProducer") as mock:
+            publisher._build_client()
+
+        self.assertEqual(5, mock.call_args.kwargs["linger_ms"])
+        self.assertEqual(1024, mock.call_args.kwargs["max_batch_size"])
+
     async def test_start_without_connection(self):
         publisher = KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH, circuit_breaker_time=0.1)
         stop_mock = AsyncMock(side_effect=publisher.client.stop)
@@ -72,16 +88,83 @@ class TestKafkaBrokerPublisher(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(1, stop_mock.call_count)
 
     async def test_send(self):
-        send_mock = AsyncMock()
+        send_mock = AsyncMock(side_effect=self._build_future)
         message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
 
         async with KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH) as publisher:
-            publisher.client.send_and_wait = send_mock
+            publisher.client.send = send_mock
             await publisher.send(message)
 
         self.assertEqual(1, send_mock.call_count)
         self.assertEqual("foo", send_mock.call_args.args[0])
         self.assertEqual(message, BrokerMessage.from_avro_bytes(send_mock.call_args.args[1]))
+        self.assertEqual(None, send_mock.call_args.kwargs["key"])
+
+    async def test_send_with_content_key(self):
+        send_mock = AsyncMock(side_effect=self._build_future)
+        uuid = uuid4()
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload({"uuid": uuid}))
+
+        async with KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH) as publisher:
+            publisher.client.send = send_mock
+            await publisher.send(message)
+
+        self.assertEqual(str(uuid).encode(), send_mock.call_args.kwargs["key"])
+
+    async def test_send_with_header_key(self):
+        send_mock = AsyncMock(side_effect=self._build_future)
+        message = BrokerMessageV1(
+            "foo", BrokerMessageV1Payload({"uuid": uuid4()}, headers={KafkaBrokerPublisher.PARTITION_KEY_HEADER: "bar"})
+        )
+
+        async with KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH) as publisher:
+            publisher.client.send = send_mock
+            await publisher.send(message)
+
+        self.assertEqual(b"bar", send_mock.call_args.kwargs["key"])
+
+    async def test_send_max_pending(self):
+        futures = list()
+
+        async def _fn(*args, **kwargs):
+            future = Future()
+            futures.append(future)
+            return future
+
+        send_mock = AsyncMock(side_effect=_fn)
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        async with KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH, max_pending=3) as publisher:
+            publisher.client.send = send_mock
+
+            await publisher.send(message)
+            await publisher.send(message)
+            self.assertEqual(2, len(publisher._pending))
+
+            for future in futures:
+                future.set_result(None)
+
+            futures.clear()
+            await publisher.send(message)
+            futures[0].set_result(None)
+            self.assertEqual(0, len(publisher._pending))
+
+            await publisher.send(message)
+            self.assertEqual(1, len(publisher._pending))
+            futures[1].set_result(None)
+
+        self.assertEqual(0, len(publisher._pending))
+        self.assertEqual(4, send_mock.call_count)
+
+    async def test_flush(self):
+        future = Future()
+        future.set_result(None)
+        publisher = KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH)
+        publisher._pending.append((BrokerMessageV1("foo", BrokerMessageV1Payload("bar")), future))
+
+        await publisher.flush()
+
+        self.assertEqual(0, len(publisher._pending))
 
     async def test_send_without_connection(self):
         async def _fn(*args, **kwargs):
@@ -96,13 +179,19 @@ class TestKafkaBrokerPublisher(unittest.IsolatedAsyncioTestCase):
         async with KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH, circuit_breaker_time=0.1) as publisher:
             stop_mock = AsyncMock(side_effect=publisher.client.stop)
             publisher.client.stop = stop_mock
-            publisher.client.send_and_wait = mock
+            publisher.client.send = mock
 
             with self.assertRaises(ValueError):
                 await publisher.send(message)
 
             self.assertEqual(0, stop_mock.call_count)
 
+    @staticmethod
+    async def _build_future(*args, **kwargs) -> Future:
+        future = Future()
+        future.set_result(None)
+        return future
+
     async def test_setup_destroy(self):
         publisher = KafkaBrokerPublisher.from_config(CONFIG_FILE_PATH)
         start_mock = AsyncMock()
@@ -136,6 +225,23 @@ class TestKafkaBrokerPublisherBuilder(unittest.TestCase):
         }
         self.assertEqual(expected, builder.kwargs)
 
+    def test_with_config_batching(self):
+        broker_config = self.config.get_interface_by_name("broker")
+        broker_config["common"] |= {
+            "linger_ms": 5,
+            "max_batch_size": 1024,
+            "max_pending": 10,
+            "pending_max_wait": 0.5,
+        }
+
+        with patch.object(Config, "get_interface_by_name", return_value=broker_config):
+            builder = KafkaBrokerPublisherBuilder().with_config(self.config)
+
+        self.assertEqual(5, builder.kwargs["linger_ms"])
+        self.assertEqual(1024, builder.kwargs["max_batch_size"])
+        self.assertEqual(10, builder.kwargs["max_pending"])
+        self.assertEqual(0.5, builder.kwargs["pending_max_wait"])
+
     def test_build(self):
         common_config = self.config.get_interface_by_name("broker")["common"]
         builder = KafkaBrokerPublisherBuilder().with_config(self.config)
@@ -5,16 +5,20 @@ from collections import (
 from unittest.mock import (
     AsyncMock,
     MagicMock,
+    call,
+    patch,
 )
 
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerStoppedError,
+    TopicPartition,
 )
 from kafka import (
     KafkaAdminClient,
 )
 from kafka.errors import (
+    IllegalStateError,
     KafkaConnectionError,
 )
 
@@ -35,6 +39,7 @@ from tests.utils import (
 )
 
 _ConsumerMessage = namedtuple("_ConsumerMessage", ["value"])
+_ConsumerRecord = namedtuple("_ConsumerRecord", ["value", "offset"])
 
 
 class TestKafkaBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
@@ -47,6 +52,26 @@ class TestKafkaBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
         self.assertEqual("localhost", subscriber.host)
         self.assertEqual(9092, subscriber.port)
         self.assertEqual(None, subscriber.group_id)
+        self.assertEqual(1, subscriber.num_partitions)
+        self.assertEqual(1, subscriber.replication_factor)
+
+    def test_constructor_partitions(self):
+        subscriber = KafkaBrokerSubscriber(["foo", "bar"], num_partitions=6, replication_factor=3)
+        self.assertEqual(6, subscriber.num_partitions)
+        self.assertEqual(3, subscriber.replication_factor)
+
+    async def test_create_topics_partitions(self):
+        subscriber = KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo"}, num_partitions=6)
+
+        admin_client_mock = MagicMock()
+        with patch.object(KafkaBrokerSubscriber, "admin_client", admin_client_mock):
+            await subscriber._create_topics()
+
+        self.assertEqual(1, admin_client_mock.create_topics.call_count)
+        (new_topic,) = admin_client_mock.create_topics.call_args.args[0]
+        self.assertEqual("foo", new_topic.name)
+        self.assertEqual(6, new_topic.num_partitions)
+        self.assertEqual(1, new_topic.replication_factor)
 
     async def test_from_config(self):
         config = Config(CONFIG_FILE_PATH)
@@ -209,6 +234,130 @@ class TestKafkaBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
             with self.assertRaises(StopAsyncIteration):
                 await subscriber.receive()
 
+    async def test_client_auto_commit(self):
+        subscriber = KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo"})
+        self.assertEqual(None, subscriber.max_records)
+        self.assertTrue(subscriber.client._enable_auto_commit)
+
+        subscriber = KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo"}, max_records=10)
+        self.assertEqual(10, subscriber.max_records)
+        self.assertFalse(subscriber.client._enable_auto_commit)
+
+
+class TestKafkaBrokerSubscriberBatch(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.partition = TopicPartition("foo", 0)
+        self.messages = [BrokerMessageV1("foo", BrokerMessageV1Payload(i)) for i in range(3)]
+
+        self.subscriber = KafkaBrokerSubscriber.from_config(CONFIG_FILE_PATH, topics={"foo"}, max_records=10)
+        self.getmany_mock = AsyncMock(
+            side_effect=[
+                dict(),
+                {self.partition: [_ConsumerRecord(m.avro_bytes, 10 + i) for i, m in enumerate(self.messages)]},
+            ]
+        )
+        self.commit_mock = AsyncMock()
+        self.seek_mock = MagicMock()
+        self.subscriber.client.getmany = self.getmany_mock
+        self.subscriber.client.commit = self.commit_mock
+        self.subscriber.client.seek = self.seek_mock
+
+    async def test_receive(self):
+        observed = [await self.subscriber.receive() for _ in self.messages]
+
+        self.assertEqual(self.messages, observed)
+        self.assertEqual([call(timeout_ms=500, max_records=10)] * 2, self.getmany_mock.call_args_list)
+
+    async def test_receive_stopped(self):
+        self.subscriber.client.getmany = AsyncMock(side_effect=ConsumerStoppedError)
+
+        with self.assertRaises(StopAsyncIteration):
+            await self.subscriber.receive()
+
+    async def test_ack(self):
+        one, two, three = [await self.subscriber.receive() for _ in self.messages]
+
+        await self.subscriber.ack(two)
+        self.assertEqual(0, self.commit_mock.call_count)
+
+        await self.subscriber.ack(one)
+        self.assertEqual([call({self.partition: 12})], self.commit_mock.call_args_list)
+
+        self.commit_mock.reset_mock()
+        await self.subscriber.ack(three)
+        self.assertEqual([call({self.partition: 13})], self.commit_mock.call_args_list)
+
+    async def test_ack_duplicated_identifier(self):
+        message = self.messages[0]
+        records = [_ConsumerRecord(message.avro_bytes, 10 + i) for i in range(2)]
+        self.subscriber.client.getmany = AsyncMock(return_value={self.partition: records})
+
+        one = await self.subscriber.receive()
+        two = await self.subscriber.receive()
+        self.assertEqual(one.identifier, two.identifier)
+
+        await self.subscriber.ack(two)
+        self.assertEqual(0, self.commit_mock.call_count)
+
+        await self.subscriber.ack(one)
+        self.assertEqual([call({self.partition: 12})], self.commit_mock.call_args_list)
+        self.assertEqual(dict(), self.subscriber._deliveries)
+
+    async def test_nack(self):
+        one = await self.subscriber.receive()
+        two = await self.subscriber.receive()
+
+        await self.subscriber.nack(two)
+        self.assertEqual([call(self.partition, 11)], self.seek_mock.call_args_list)
+        self.assertEqual(0, len(self.subscriber._buffer))
+
+        await self.subscriber.ack(one)
+        self.assertEqual([call({self.partition: 11})], self.commit_mock.call_args_list)
+
+    async def test_nack_without_requeue(self):
+        one = await self.subscriber.receive()
+
+        await self.subscriber.nack(one, requeue=False)
+
+        self.assertEqual(0, self.seek_mock.call_count)
+        self.assertEqual([call({self.partition: 11})], self.commit_mock.call_args_list)
+
+    async def test_receive_skips_undecodable(self):
+        records = [_ConsumerRecord(m.avro_bytes, 10 + i) for i, m in enumerate(self.messages)]
+        records[1] = _ConsumerRecord(b"invalid", 11)
+        self.subscriber.client.getmany = AsyncMock(return_value={self.partition: records})
+
+        one = await self.subscriber.receive()
+        three = await self.subscriber.receive()
+        self.assertEqual([self.messages[0], self.messages[2]], [one, three])
+
+        await self.subscriber.ack(one)
+        self.assertEqual([call({self.partition: 12})], self.commit_mock.call_args_list)
+
+        self.commit_mock.reset_mock()
+        await self.subscriber.ack(three)
+        self.assertEqual([call({self.partition: 13})], self.commit_mock.call_args_list)
+
+    async def test_nack_revoked(self):
+        self.seek_mock.side_effect = IllegalStateError()
+        one = await self.subscriber.receive()
+
+        await self.subscriber.nack(one)
+
+        self.assertEqual(0, len(self.subscriber._buffer))
+        self.assertEqual(dict(), self.subscriber._deliveries)
+        self.assertNotIn(self.partition, self.subscriber._offsets)
+
+    async def test_ack_revoked(self):
+        self.commit_mock.side_effect = IllegalStateError()
+        one = await self.subscriber.receive()
+
+        await self.subscriber.ack(one)
+
+        self.assertEqual(0, len(self.subscriber._buffer))
+        self.assertEqual(dict(), self.subscriber._deliveries)
+        self.assertNotIn(self.partition, self.subscriber._offsets)
+
 
 class TestKafkaBrokerSubscriberBuilder(unittest.TestCase):
     def setUp(self) -> None:
@@ -225,6 +374,26 @@ class TestKafkaBrokerSubscriberBuilder(unittest.TestCase):
         }
         self.assertEqual(expected, builder.kwargs)
 
+    def test_with_config_partitions(self):
+        broker_config = self.config.get_interface_by_name("broker")
+        broker_config["common"] |= {"num_partitions": 6, "replication_factor": 3}
+
+        with patch.object(Config, "get_interface_by_name", return_value=broker_config):
+            builder = KafkaBrokerSubscriberBuilder().with_config(self.config)
+
+        self.assertEqual(6, builder.kwargs["num_partitions"])
+        self.assertEqual(3, builder.kwargs["replication_factor"])
+
+    def test_with_config_batch(self):
+        broker_config = self.config.get_interface_by_name("broker")
+        broker_config["common"] |= {"max_records": 100, "fetch_timeout_ms": 50}
+
+        with patch.object(Config, "get_interface_by_name", return_value=broker_config):
+            builder = KafkaBrokerSubscriberBuilder().with_config(self.config)
+
+        self.assertEqual(100, builder.kwargs["max_records"])
+        self.assertEqual(50, builder.kwargs["fetch_timeout_ms"])
+
     def test_build(self):
         common_config = self.config.get_interface_by_name("broker")["common"]
         builder = KafkaBrokerSubscriberBuilder().with_config(self.config).with_topics({"one", "two"})
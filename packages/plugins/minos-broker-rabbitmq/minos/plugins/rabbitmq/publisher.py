@@ -3,6 +3,9 @@ from __future__ import (
 )
 
 import logging
+from collections.abc import (
+    Awaitable,
+)
 from typing import (
     Optional,
 )
@@ -12,9 +15,12 @@ from aio_pika import (
     connect,
 )
 
+from minos.common import (
+    Config,
+)
 from minos.networks import (
+    BatchedBrokerPublisher,
     BrokerMessage,
-    BrokerPublisher,
     BrokerPublisherBuilder,
 )
 
@@ -25,8 +31,13 @@ from .common import (
 logger = logging.getLogger(__name__)
 
 
-class RabbitMQBrokerPublisher(BrokerPublisher):
-    """RabbitMQ Broker Publisher class."""
+class RabbitMQBrokerPublisher(BatchedBrokerPublisher):
+    """RabbitMQ Broker Publisher class.
+
+    The messages are published on a channel with publisher confirms, waiting for the confirmations of up to
+    ``max_pending`` messages at once (see ``BatchedBrokerPublisher``), so that the broker is able to confirm them in
+    batches instead of one by one.
+    """
 
     def __init__(
         self,
@@ -59,19 +70,36 @@ class RabbitMQBrokerPublisher(BrokerPublisher):
     async def _setup(self) -> None:
         await super()._setup()
         self.connection = await connect(f"amqp://{self.user}:{self.password}@{self.host}:{self.port}/")
-        self.channel = await self.connection.channel()
+        self.channel = await self.connection.channel(publisher_confirms=True)
 
     async def _destroy(self) -> None:
-        await self.channel.close()
-        await self.connection.close()
-        await super()._destroy()
+        try:
+            await super()._destroy()
+        finally:
+            await self.channel.close()
+            await self.connection.close()
 
-    async def _send(self, message: BrokerMessage) -> None:
-        await self.channel.default_exchange.publish(Message(message.avro_bytes), routing_key=message.topic)
+    async def _publish(self, message: BrokerMessage) -> Awaitable[None]:
+        data = await self._encode(message)
+        return self.channel.default_exchange.publish(Message(data), routing_key=message.topic)
 
 
 class RabbitMQBrokerPublisherBuilder(BrokerPublisherBuilder[RabbitMQBrokerPublisher], RabbitMQBrokerBuilderMixin):
     """RabbitMQ Broker Publisher Builder class."""
 
+    def with_config(self, config: Config):
+        """Set config.
+
+        :param config: The config to be set.
+        :return: This method return the builder instance.
+        """
+        common_config = config.get_interface_by_name("broker").get("common", dict())
+
+        for key in ("max_pending", "pending_max_wait"):
+            if common_config.get(key) is not None:
+                self.kwargs[key] = common_config[key]
+
+        return super().with_config(config)
+
 
 RabbitMQBrokerPublisher.set_builder(RabbitMQBrokerPublisherBuilder)
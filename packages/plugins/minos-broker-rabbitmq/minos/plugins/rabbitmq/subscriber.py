@@ -23,9 +23,16 @@ from typing import (
 )
 
 from aio_pika import (
+    IncomingMessage,
     connect,
 )
+from aio_pika.exceptions import (
+    ChannelInvalidStateError,
+)
 
+from minos.common import (
+    Config,
+)
 from minos.networks import (
     BrokerMessage,
     BrokerSubscriber,
@@ -40,7 +47,13 @@ logger = logging.getLogger(__name__)
 
 
 class RabbitMQBrokerSubscriber(BrokerSubscriber):
-    """RabbitMQ Broker Subscriber class."""
+    """RabbitMQ Broker Subscriber class.
+
+    Each topic is consumed with a ``prefetch_count`` limit, so that the broker does not deliver more unacknowledged
+    messages than the ones that fit on the internal buffer. The deliveries are acknowledged through ``ack`` once the
+    received messages have been processed, or returned to the queue through ``nack`` otherwise, so that the pending
+    ones are delivered again if the subscriber stops before processing them.
+    """
 
     def __init__(
         self,
@@ -49,6 +62,7 @@ class RabbitMQBrokerSubscriber(BrokerSubscriber):
         port: Optional[int] = None,
         user: str = None,
         password: str = None,
+        prefetch_count: int = 10,
         **kwargs,
     ):
         super().__init__(topics, **kwargs)
@@ -67,10 +81,13 @@ class RabbitMQBrokerSubscriber(BrokerSubscriber):
         self.user = user
         self.password = password
 
+        self.prefetch_count = prefetch_count
+
         self.connection = None
 
         self._run_task = None
-        self._queue: Queue[bytes] = Queue(maxsize=1)
+        self._queue: Queue[IncomingMessage] = Queue(maxsize=prefetch_count)
+        self._deliveries: dict[tuple[str, int], IncomingMessage] = dict()
 
     async def _setup(self) -> None:
         await super()._setup()
@@ -79,6 +96,7 @@ class RabbitMQBrokerSubscriber(BrokerSubscriber):
 
     async def _destroy(self) -> None:
         await self._stop_task()
+        self._deliveries.clear()
         await self.connection.close()
         await super()._destroy()
 
@@ -99,24 +117,70 @@ class RabbitMQBrokerSubscriber(BrokerSubscriber):
     async def _run_one(self, topic: str) -> None:
         channel = await self.connection.channel()
         try:
+            await channel.set_qos(prefetch_count=self.prefetch_count)
             queue = await channel.declare_queue(topic)
-            iterator = queue.iterator()
+            iterator = queue.iterator(no_ack=False)
             try:
                 async for message in iterator:
-                    await self._queue.put(message.body)
+                    await self._queue.put(message)
             finally:
                 await iterator.close()
         finally:
             await channel.close()
 
     async def _receive(self) -> BrokerMessage:
-        bytes_ = await self._queue.get()
-        message = BrokerMessage.from_avro_bytes(bytes_)
-        return message
+        while True:
+            delivery = await self._queue.get()
+            try:
+                message = await self._decode(delivery.body)
+            except Exception as exc:
+                # An undecodable message would never be acknowledged, holding one of the prefetched slots forever.
+                logger.warning(f"Rejecting an undecodable message: {exc!r}")
+                with suppress(ChannelInvalidStateError):
+                    await delivery.reject(requeue=False)
+                continue
+
+            # The delivery tags are only unique per channel, and there is one channel per topic.
+            message._rabbitmq_delivery = (delivery.routing_key, delivery.delivery_tag)
+            self._deliveries[message._rabbitmq_delivery] = delivery
+            return message
+
+    def _pop_delivery(self, message: BrokerMessage) -> Optional[IncomingMessage]:
+        return self._deliveries.pop(getattr(message, "_rabbitmq_delivery", None), None)
+
+    async def _ack(self, message: BrokerMessage) -> None:
+        delivery = self._pop_delivery(message)
+        if delivery is None:
+            return
+
+        # If the channel has been closed, the broker will deliver the message again.
+        with suppress(ChannelInvalidStateError):
+            await delivery.ack()
+
+    async def _nack(self, message: BrokerMessage, requeue: bool) -> None:
+        delivery = self._pop_delivery(message)
+        if delivery is None:
+            return
+
+        with suppress(ChannelInvalidStateError):
+            await delivery.nack(requeue=requeue)
 
 
 class RabbitMQBrokerSubscriberBuilder(BrokerSubscriberBuilder[RabbitMQBrokerSubscriber], RabbitMQBrokerBuilderMixin):
     """RabbitMQ Broker Subscriber Builder class."""
 
+    def with_config(self, config: Config):
+        """Set config.
+
+        :param config: The config to be set.
+        :return: This method return the builder instance.
+        """
+        common_config = config.get_interface_by_name("broker").get("common", dict())
+
+        if common_config.get("prefetch_count") is not None:
+            self.kwargs["prefetch_count"] = common_config["prefetch_count"]
+
+        return super().with_config(config)
+
 
 RabbitMQBrokerSubscriber.set_builder(RabbitMQBrokerSubscriberBuilder)
@@ -1,5 +1,7 @@
 import unittest
 from unittest.mock import (
+    AsyncMock,
+    MagicMock,
     patch,
 )
 
@@ -13,6 +15,7 @@ from minos.networks import (
 )
 from minos.plugins.rabbitmq import (
     RabbitMQBrokerPublisher,
+    RabbitMQBrokerPublisherBuilder,
 )
 from tests.utils import (
     CONFIG_FILE_PATH,
@@ -29,6 +32,7 @@ class TestRabbitMQBrokerPublisher(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(5672, publisher.port)
         self.assertEqual("guest", publisher.user)
         self.assertEqual("guest", publisher.password)
+        self.assertEqual(1, publisher.max_pending)
 
     def test_from_config(self):
         config = Config(CONFIG_FILE_PATH)
@@ -49,6 +53,38 @@ class TestRabbitMQBrokerPublisher(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(3, mock.call_count)
 
+    async def test_send_max_pending(self):
+        publisher = RabbitMQBrokerPublisher(max_pending=2)
+        publish_mock = AsyncMock()
+        publisher.channel = MagicMock(default_exchange=MagicMock(publish=publish_mock))
+
+        await publisher.send(BrokerMessageV1("foo1", BrokerMessageV1Payload("bar")))
+        self.assertEqual(1, len(publisher._pending))
+
+        await publisher.send(BrokerMessageV1("foo2", BrokerMessageV1Payload("bar")))
+        self.assertEqual(0, len(publisher._pending))
+
+        await publisher.send(BrokerMessageV1("foo3", BrokerMessageV1Payload("bar")))
+        await publisher.flush()
+        self.assertEqual(0, len(publisher._pending))
+
+        self.assertEqual(["foo1", "foo2", "foo3"], [c.kwargs["routing_key"] for c in publish_mock.call_args_list])
+
+
+class TestRabbitMQBrokerPublisherBuilder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = Config(CONFIG_FILE_PATH)
+
+    def test_with_config_max_pending(self):
+        broker_config = self.config.get_interface_by_name("broker")
+        broker_config["common"] |= {"max_pending": 50, "pending_max_wait": 0.5}
+
+        with patch.object(Config, "get_interface_by_name", return_value=broker_config):
+            builder = RabbitMQBrokerPublisherBuilder().with_config(self.config)
+
+        self.assertEqual(50, builder.kwargs["max_pending"])
+        self.assertEqual(0.5, builder.kwargs["pending_max_wait"])
+
 
 if __name__ == "__main__":
     unittest.main()
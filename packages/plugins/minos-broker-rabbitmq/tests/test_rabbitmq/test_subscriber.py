@@ -3,6 +3,9 @@ from collections import (
     namedtuple,
 )
 from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    call,
     patch,
 )
 
@@ -11,6 +14,8 @@ from minos.common import (
     ModelType,
 )
 from minos.networks import (
+    BrokerMessageV1,
+    BrokerMessageV1Payload,
     BrokerSubscriber,
 )
 from minos.plugins.rabbitmq import (
@@ -37,6 +42,8 @@ class TestRabbitMQBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(5672, subscriber.port)
         self.assertEqual("guest", subscriber.user)
         self.assertEqual("guest", subscriber.password)
+        self.assertEqual(10, subscriber.prefetch_count)
+        self.assertEqual(10, subscriber._queue.maxsize)
 
     async def test_from_config(self):
         config = Config(CONFIG_FILE_PATH)
@@ -55,6 +62,68 @@ class TestRabbitMQBrokerSubscriber(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(_Foo("foobar"), observed)
 
+    async def test_ack(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        delivery = MagicMock(body=message.avro_bytes, ack=AsyncMock(), nack=AsyncMock())
+
+        subscriber = RabbitMQBrokerSubscriber({"foo"})
+        subscriber._queue.put_nowait(delivery)
+
+        observed = await subscriber.receive()
+        await subscriber.ack(observed)
+        await subscriber.ack(observed)
+
+        self.assertEqual([call()], delivery.ack.call_args_list)
+        self.assertEqual(0, delivery.nack.call_count)
+
+    async def test_ack_duplicated_identifier(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        deliveries = [
+            MagicMock(body=message.avro_bytes, routing_key="foo", delivery_tag=tag, ack=AsyncMock()) for tag in (1, 2)
+        ]
+
+        subscriber = RabbitMQBrokerSubscriber({"foo"})
+        for delivery in deliveries:
+            subscriber._queue.put_nowait(delivery)
+
+        one = await subscriber.receive()
+        two = await subscriber.receive()
+        self.assertEqual(one.identifier, two.identifier)
+
+        await subscriber.ack(two)
+        await subscriber.ack(one)
+
+        self.assertEqual([call()], deliveries[0].ack.call_args_list)
+        self.assertEqual([call()], deliveries[1].ack.call_args_list)
+        self.assertEqual(dict(), subscriber._deliveries)
+
+    async def test_receive_rejects_undecodable(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        invalid = MagicMock(body=b"invalid", reject=AsyncMock())
+        delivery = MagicMock(body=message.avro_bytes)
+
+        subscriber = RabbitMQBrokerSubscriber({"foo"})
+        subscriber._queue.put_nowait(invalid)
+        subscriber._queue.put_nowait(delivery)
+
+        observed = await subscriber.receive()
+
+        self.assertEqual(message, observed)
+        self.assertEqual([call(requeue=False)], invalid.reject.call_args_list)
+
+    async def test_nack(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+        delivery = MagicMock(body=message.avro_bytes, ack=AsyncMock(), nack=AsyncMock())
+
+        subscriber = RabbitMQBrokerSubscriber({"foo"})
+        subscriber._queue.put_nowait(delivery)
+
+        observed = await subscriber.receive()
+        await subscriber.nack(observed)
+
+        self.assertEqual(0, delivery.ack.call_count)
+        self.assertEqual([call(requeue=True)], delivery.nack.call_args_list)
+
 
 class TestRabbitMQBrokerSubscriberBuilder(unittest.TestCase):
     def setUp(self) -> None:
@@ -72,6 +141,15 @@ class TestRabbitMQBrokerSubscriberBuilder(unittest.TestCase):
         }
         self.assertEqual(expected, builder.kwargs)
 
+    def test_with_config_prefetch_count(self):
+        broker_config = self.config.get_interface_by_name("broker")
+        broker_config["common"] |= {"prefetch_count": 50}
+
+        with patch.object(Config, "get_interface_by_name", return_value=broker_config):
+            builder = RabbitMQBrokerSubscriberBuilder().with_config(self.config)
+
+        self.assertEqual(50, builder.kwargs["prefetch_count"])
+
     def test_build(self):
         common_config = self.config.get_interface_by_name("broker")["common"]
         builder = RabbitMQBrokerSubscriberBuilder().with_config(self.config).with_topics({"one", "two"})
@@ -8,6 +8,7 @@ from .clients import (
     AiopgDatabaseClient,
 )
 from .factories import (
+    AiopgAvroSchemaDatabaseOperationFactory,
     AiopgBrokerPublisherQueueDatabaseOperationFactory,
     AiopgBrokerQueueDatabaseOperationFactory,
     AiopgBrokerSubscriberDuplicateValidatorDatabaseOperationFactory,
@@ -15,6 +16,7 @@ from .factories import (
     AiopgEventDatabaseOperationFactory,
     AiopgLockDatabaseOperationFactory,
     AiopgManagementDatabaseOperationFactory,
+    AiopgNotificationDatabaseOperationFactory,
     AiopgSnapshotDatabaseOperationFactory,
     AiopgSnapshotQueryDatabaseOperationBuilder,
     AiopgTransactionDatabaseOperationFactory,
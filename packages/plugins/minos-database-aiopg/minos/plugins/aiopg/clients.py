@@ -15,6 +15,7 @@ from functools import (
 )
 from typing import (
     Optional,
+    Union,
 )
 
 import aiopg
@@ -27,11 +28,16 @@ from psycopg2 import (
     OperationalError,
     ProgrammingError,
 )
+from psycopg2.sql import (
+    Composable,
+)
 
 from minos.common import (
     CircuitBreakerMixin,
     ConnectionException,
     DatabaseClient,
+    DatabaseNotification,
+    DatabaseOperation,
     IntegrityException,
     ProgrammingException,
 )
@@ -176,7 +182,28 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
         fn = partial(self._execute_cursor, operation=operation.query, parameters=operation.parameters)
         await self.with_circuit_breaker(fn)
 
-    async def _execute_cursor(self, operation: str, parameters: dict):
+    def _can_pipeline(self, operations: tuple[DatabaseOperation, ...]) -> bool:
+        return all(isinstance(operation, AiopgDatabaseOperation) for operation in operations)
+
+    async def _execute_pipelined(self, operations: tuple[AiopgDatabaseOperation, ...], transactional: bool) -> None:
+        fn = partial(self._execute_pipelined_cursor, operations=operations, transactional=transactional)
+        await self.with_circuit_breaker(fn)
+
+    async def _execute_pipelined_cursor(self, operations: tuple[AiopgDatabaseOperation, ...], transactional: bool):
+        if not await self.is_connected():
+            await self.recreate()
+
+        # The statements are sent within a single query, so postgres runs all of them within an implicit transaction,
+        # unless it is explicitly committed between them.
+        cursor = await self._connection.cursor(timeout=self._cursor_timeout)
+        statements = [cursor.mogrify(operation.query, operation.parameters) for operation in operations]
+        cursor.close()
+
+        # The parameters are already bound, so the query must not be interpolated again.
+        separator = b";\n" if transactional else b";\nCOMMIT;\n"
+        await self._execute_cursor(operation=separator.join(statements), parameters=None)
+
+    async def _execute_cursor(self, operation: Union[str, bytes, Composable], parameters: Optional[dict]):
         if not await self.is_connected():
             await self.recreate()
 
@@ -188,6 +215,13 @@ class AiopgDatabaseClient(DatabaseClient, CircuitBreakerMixin):
         except IntegrityError as exc:
             raise IntegrityException(f"The requested operation raised a integrity error: {exc!r}")
 
+    async def _receive_notification(self) -> DatabaseNotification:
+        if not await self.is_connected():
+            raise ConnectionException("There is not any open connection to receive notifications.")
+
+        notify = await self._connection.notifies.get()
+        return DatabaseNotification(notify.channel, notify.payload)
+
     async def _destroy_cursor(self, **kwargs):
         if self._cursor is not None:
             if not self._cursor.closed:
@@ -5,8 +5,10 @@ from .aggregate import (
     AiopgTransactionDatabaseOperationFactory,
 )
 from .common import (
+    AiopgAvroSchemaDatabaseOperationFactory,
     AiopgLockDatabaseOperationFactory,
     AiopgManagementDatabaseOperationFactory,
+    AiopgNotificationDatabaseOperationFactory,
 )
 from .networks import (
     AiopgBrokerPublisherQueueDatabaseOperationFactory,
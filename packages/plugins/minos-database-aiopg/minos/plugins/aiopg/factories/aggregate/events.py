@@ -164,12 +164,103 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
 
         return AiopgDatabaseOperation(query, parameters, lock)
 
-    def _build_submit_from(self, transaction_uuids: Iterable[UUID]) -> tuple[Composable, dict[str, Any]]:
+    def build_submit_many(
+        self, transaction_uuids: Iterable[UUID], entries: Iterable[dict[str, Any]]
+    ) -> DatabaseOperation:
+        """Build the database operation to submit multiple rows into the event table at once.
+
+        The versions are computed as in ``build_submit``, but incrementing them for each entry of the same identifier.
+
+        :param transaction_uuids: The sequence of nested transaction in on top of the current events' transaction.
+        :param entries: The entries to be submitted, as mappings containing the ``build_submit`` arguments. All of them
+            must belong to the same transaction.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        columns = {
+            "uuid": "UUID",
+            "action": "ACTION_TYPE",
+            "name": "TEXT",
+            "version": "INT",
+            "data": "BYTEA",
+            "created_at": "TIMESTAMPTZ",
+            "transaction_uuid": "UUID",
+        }
+
+        values = list()
+        parameters = dict()
+        for index, entry in enumerate(entries, start=1):
+            placeholders = [
+                SQL("{}::{}").format(Placeholder(f"entry_{index}_{column}"), SQL(type_))
+                for column, type_ in columns.items()
+            ]
+            values.append(SQL("({})").format(SQL(", ").join([Literal(index), *placeholders])))
+            parameters |= {f"entry_{index}_{column}": entry[column] for column in columns}
+
+        query = SQL(
+            """
+            WITH input (ordinality, uuid, action, name, version, data, created_at, transaction_uuid) AS (
+                VALUES {values}
+            ),
+            previous AS (
+                SELECT DISTINCT ON (t1.uuid) t1.uuid, t1.version
+                FROM ( {from_parts} ) AS t1
+                ORDER BY t1.uuid, t1.transaction_index DESC
+            ),
+            prepared AS (
+                SELECT
+                    input.ordinality,
+                    input.action,
+                    (CASE input.uuid WHEN uuid_nil() THEN uuid_generate_v4() ELSE input.uuid END) AS uuid,
+                    input.name,
+                    COALESCE(
+                        input.version,
+                        COALESCE(previous.version, 0) + ROW_NUMBER() OVER (
+                            PARTITION BY
+                                input.uuid,
+                                input.version IS NULL,
+                                (CASE input.uuid WHEN uuid_nil() THEN input.ordinality END)
+                            ORDER BY input.ordinality
+                        )
+                    ) AS version,
+                    input.data,
+                    COALESCE(input.created_at, NOW()) AS created_at,
+                    input.transaction_uuid
+                FROM input LEFT JOIN previous ON input.uuid = previous.uuid
+            ),
+            inserted AS (
+                INSERT INTO {table_name} (action, uuid, name, version, data, created_at, transaction_uuid)
+                SELECT action, uuid, name, version, data, created_at, transaction_uuid
+                FROM prepared
+                ORDER BY ordinality
+                RETURNING id, uuid, version, created_at
+            )
+            SELECT id, uuid, version, created_at
+            FROM inserted
+            ORDER BY id;
+            """
+        )
+
+        from_sql, from_parameters = self._build_submit_from(
+            transaction_uuids, SQL("uuid IN (SELECT input.uuid FROM input)")
+        )
+
+        query = query.format(
+            values=SQL(", ").join(values),
+            from_parts=from_sql,
+            table_name=Identifier(self.build_table_name()),
+        )
+        parameters = from_parameters | parameters
+
+        return AiopgDatabaseOperation(query, parameters)
+
+    def _build_submit_from(
+        self, transaction_uuids: Iterable[UUID], condition: Composable = SQL("uuid = %(uuid)s")
+    ) -> tuple[Composable, dict[str, Any]]:
         select_transaction = SQL(
             """
             SELECT {index} AS transaction_index, uuid, MAX(version) AS version
             FROM {table_name}
-            WHERE uuid = %(uuid)s AND transaction_uuid = {transaction_uuid}
+            WHERE {condition} AND transaction_uuid = {transaction_uuid}
             GROUP BY uuid
             """
         )
@@ -182,6 +273,7 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
             from_query_parts.append(
                 select_transaction.format(
                     index=Literal(index),
+                    condition=condition,
                     transaction_uuid=Placeholder(name),
                     table_name=Identifier(self.build_table_name()),
                 ),
@@ -194,6 +286,7 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
     def build_query(
         self,
         uuid: Optional[UUID] = None,
+        uuid_in: Optional[Iterable[UUID, ...]] = None,
         name: Optional[str] = None,
         version: Optional[int] = None,
         version_lt: Optional[int] = None,
@@ -213,6 +306,7 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
         """Build the database operation to select rows.
 
         :param uuid: The identifier must be equal to the given value.
+        :param uuid_in: The identifier must be equal to one of the given values.
         :param name: The classname must be equal to the given value.
         :param version: The version must be equal to the given value.
         :param version_lt: The version must be lower than the given value.
@@ -230,6 +324,8 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
 
         :return: A ``DatabaseOperation`` instance.
         """
+        if uuid_in is not None:
+            uuid_in = tuple(uuid_in)
         if transaction_uuid_in is not None:
             transaction_uuid_in = tuple(transaction_uuid_in)
 
@@ -242,6 +338,8 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
 
         if uuid is not None:
             conditions.append("uuid = %(uuid)s")
+        if uuid_in is not None:
+            conditions.append("uuid IN %(uuid_in)s")
         if name is not None:
             conditions.append("name = %(name)s")
         if version is not None:
@@ -278,6 +376,7 @@ class AiopgEventDatabaseOperationFactory(EventDatabaseOperationFactory):
             f"{_select_all} WHERE {' AND '.join(conditions)} ORDER BY id;",
             {
                 "uuid": uuid,
+                "uuid_in": uuid_in,
                 "name": name,
                 "version": version,
                 "version_lt": version_lt,
@@ -4,6 +4,9 @@ from collections.abc import (
 from datetime import (
     datetime,
 )
+from hashlib import (
+    sha256,
+)
 from typing import (
     Any,
     Optional,
@@ -12,8 +15,15 @@ from uuid import (
     UUID,
 )
 
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+    Literal,
+)
+
 from minos.aggregate import (
     SnapshotDatabaseOperationFactory,
+    SnapshotIndex,
 )
 from minos.aggregate.queries import (
     _Condition,
@@ -53,6 +63,13 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
         """
         return "snapshot_aux_offset"
 
+    def build_schema_table_name(self) -> str:
+        """Get the schema table name.
+
+        :return: A ``str`` value.
+        """
+        return "snapshot_aux_schema"
+
     def build_create(self) -> DatabaseOperation:
         """Build the database operation to create the snapshot table.
 
@@ -80,6 +97,20 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
                     """,
                     lock=self.build_table_name(),
                 ),
+                AiopgDatabaseOperation(
+                    f"""
+                    ALTER TABLE {self.build_table_name()}
+                    ADD COLUMN IF NOT EXISTS schema_hash BYTEA;
+                    """,
+                    lock=self.build_table_name(),
+                ),
+                AiopgDatabaseOperation(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS {self.build_table_name()}_name_transaction_uuid_idx
+                    ON {self.build_table_name()} (name, transaction_uuid);
+                    """,
+                    lock=self.build_table_name(),
+                ),
                 AiopgDatabaseOperation(
                     f"""
                     CREATE TABLE IF NOT EXISTS {self.build_offset_table_name()} (
@@ -90,9 +121,45 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
                     """,
                     lock=self.build_offset_table_name(),
                 ),
+                AiopgDatabaseOperation(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {self.build_schema_table_name()} (
+                        hash BYTEA PRIMARY KEY,
+                        schema BYTEA NOT NULL
+                    );
+                    """,
+                    lock=self.build_schema_table_name(),
+                ),
             ]
         )
 
+    def build_create_indexes(self, name: str, indexes: Iterable[SnapshotIndex]) -> DatabaseOperation:
+        """Build the database operation to create the secondary indexes of a ``RootEntity``.
+
+        Each index is a partial expression index over the rows of the given ``RootEntity``, built with the same
+        expression used by the queries to access the field, so that the filters and orderings on it can use the index.
+
+        :param name: Class name of the ``RootEntity``.
+        :param indexes: The indexes to be created.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        operations = list()
+        for index in indexes:
+            if index.field in AiopgSnapshotQueryDatabaseOperationBuilder._FIXED_FIELDS_MAPPER:
+                continue
+
+            digest = sha256(f"{name}:{index.field}".encode()).hexdigest()[:16]
+            query = SQL("CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ((data#>{field})) WHERE name = {name}")
+            query = query.format(
+                index_name=Identifier(f"{self.build_table_name()}_{digest}_idx"),
+                table_name=Identifier(self.build_table_name()),
+                field=Literal("{{{}}}".format(index.field.replace(".", ","))),
+                name=Literal(name),
+            )
+            operations.append(AiopgDatabaseOperation(query, lock=self.build_table_name()))
+
+        return ComposedDatabaseOperation(operations)
+
     def build_delete(self, transaction_uuids: Iterable[UUID]) -> DatabaseOperation:
         """Build the database operation to delete rows by transaction identifiers.
 
@@ -117,6 +184,7 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
         created_at: datetime,
         updated_at: datetime,
         transaction_uuid: UUID,
+        schema_hash: Optional[bytes] = None,
     ) -> DatabaseOperation:
         """Build the insert database operation.
 
@@ -128,13 +196,14 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
         :param created_at: The creation datetime.
         :param updated_at: The last update datetime.
         :param transaction_uuid: The transaction identifier.
+        :param schema_hash: The content hash of the schema, stored with ``build_submit_schemas``.
         :return: A ``DatabaseOperation`` instance.
         """
 
         return AiopgDatabaseOperation(
             f"""
             INSERT INTO {self.build_table_name()} (
-                uuid, name, version, schema, data, created_at, updated_at, transaction_uuid
+                uuid, name, version, schema, data, created_at, updated_at, transaction_uuid, schema_hash
             )
             VALUES (
                 %(uuid)s,
@@ -144,11 +213,17 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
                 %(data)s,
                 %(created_at)s,
                 %(updated_at)s,
-                %(transaction_uuid)s
+                %(transaction_uuid)s,
+                %(schema_hash)s
             )
             ON CONFLICT (uuid, transaction_uuid)
             DO
-               UPDATE SET version = %(version)s, schema = %(schema)s, data = %(data)s, updated_at = %(updated_at)s
+               UPDATE SET
+                    version = %(version)s,
+                    schema = %(schema)s,
+                    data = %(data)s,
+                    updated_at = %(updated_at)s,
+                    schema_hash = %(schema_hash)s
             RETURNING created_at, updated_at;
             """.strip(),
             {
@@ -160,9 +235,96 @@ class AiopgSnapshotDatabaseOperationFactory(SnapshotDatabaseOperationFactory):
                 "created_at": created_at,
                 "updated_at": updated_at,
                 "transaction_uuid": transaction_uuid,
+                "schema_hash": schema_hash,
             },
         )
 
+    def build_submit_many(self, entries: Iterable[dict[str, Any]]) -> DatabaseOperation:
+        """Build the database operation to insert multiple rows at once.
+
+        :param entries: The entries to be inserted, as mappings containing the ``build_submit`` arguments.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        entries = list(entries)
+        if not len(entries):
+            return ComposedDatabaseOperation([])
+
+        columns = (
+            "uuid",
+            "name",
+            "version",
+            "schema",
+            "data",
+            "created_at",
+            "updated_at",
+            "transaction_uuid",
+            "schema_hash",
+        )
+
+        values = list()
+        parameters = dict()
+        for i, entry in enumerate(entries):
+            values.append(f"({', '.join(f'%({column}_{i})s' for column in columns)})")
+            parameters |= {f"{column}_{i}": entry.get(column) for column in columns}
+
+        return AiopgDatabaseOperation(
+            f"""
+            INSERT INTO {self.build_table_name()} (
+                {", ".join(columns)}
+            )
+            VALUES {", ".join(values)}
+            ON CONFLICT (uuid, transaction_uuid)
+            DO
+               UPDATE SET
+                    version = EXCLUDED.version,
+                    schema = EXCLUDED.schema,
+                    data = EXCLUDED.data,
+                    updated_at = EXCLUDED.updated_at,
+                    schema_hash = EXCLUDED.schema_hash;
+            """.strip(),
+            parameters,
+        )
+
+    def build_submit_schemas(self, schemas: dict[bytes, bytes]) -> DatabaseOperation:
+        """Build the database operation to store schemas, ignoring the already stored ones.
+
+        :param schemas: A mapping from content hashes to encoded schemas.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        schemas = list(schemas.items())
+        if not len(schemas):
+            return ComposedDatabaseOperation([])
+
+        values = list()
+        parameters = dict()
+        for i, (schema_hash, schema) in enumerate(schemas):
+            values.append(f"(%(hash_{i})s, %(schema_{i})s)")
+            parameters |= {f"hash_{i}": schema_hash, f"schema_{i}": schema}
+
+        return AiopgDatabaseOperation(
+            f"""
+            INSERT INTO {self.build_schema_table_name()} (hash, schema)
+            VALUES {", ".join(values)}
+            ON CONFLICT (hash) DO NOTHING;
+            """.strip(),
+            parameters,
+        )
+
+    def build_query_schemas(self, schema_hashes: Iterable[bytes]) -> DatabaseOperation:
+        """Build the database operation to get schemas by content hash.
+
+        :param schema_hashes: The content hashes of the schemas.
+        :return: A ``DatabaseOperation`` instance that returns ``(hash, schema)`` rows.
+        """
+        return AiopgDatabaseOperation(
+            f"""
+            SELECT hash, schema
+            FROM {self.build_schema_table_name()}
+            WHERE hash IN %(hashes)s;
+            """,
+            {"hashes": tuple(schema_hashes)},
+        )
+
     def build_query(
         self,
         name: str,
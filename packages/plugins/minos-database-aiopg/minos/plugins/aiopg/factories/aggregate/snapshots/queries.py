@@ -57,6 +57,12 @@ class AiopgSnapshotQueryDatabaseOperationBuilder:
     """Aiopg Snapshot Query Database Operation Builder class.
 
     This class build postgres-compatible database queries over fields based on a condition, ordering, etc.
+
+    If the query is performed over a single transaction, the condition is applied directly to the snapshot rows, so
+    that it can be resolved with the table indexes. Otherwise, it is applied after resolving the latest version of each
+    instance across the given transactions.
+
+    The ties of the ordering are broken by the ``uuid`` field, so that the results are sorted deterministically.
     """
 
     def __init__(
@@ -103,7 +109,10 @@ class AiopgSnapshotQueryDatabaseOperationBuilder:
     def _build(self) -> Composable:
         self._parameters["name"] = self.name
 
-        query = SQL(" WHERE ").join([self._build_select_from(), self._build_condition(self.condition)])
+        if len(self.transaction_uuids) == 1:
+            query = SQL(" AND ").join([self._build_select_from_transaction(), self._build_condition(self.condition)])
+        else:
+            query = SQL(" WHERE ").join([self._build_select_from(), self._build_condition(self.condition)])
 
         if self.exclude_deleted:
             query = SQL(" AND ").join([query, self._EXCLUDE_DELETED_CONDITION])
@@ -116,6 +125,14 @@ class AiopgSnapshotQueryDatabaseOperationBuilder:
 
         return query
 
+    def _build_select_from_transaction(self) -> Composable:
+        name = "transaction_uuid_1"
+        self._parameters[name] = self.transaction_uuids[0]
+
+        return self._SELECT_TRANSACTION_ENTRIES_QUERY.format(
+            transaction_uuid=Placeholder(name), table_name=Identifier(self.table_name)
+        )
+
     def _build_select_from(self) -> Composable:
         from_query_parts = list()
         for index, transaction_uuid in enumerate(self.transaction_uuids, start=1):
@@ -215,6 +232,11 @@ class AiopgSnapshotQueryDatabaseOperationBuilder:
             field = Literal("{{{}}}".format(field.replace(".", ",")))
             order_by = SQL("ORDER BY data#>{field} {direction}").format(field=field, direction=direction)
 
+        if ordering.by != "uuid":
+            order_by = SQL("{order_by}, {uuid} {direction}").format(
+                order_by=order_by, uuid=Identifier("uuid"), direction=direction
+            )
+
         return order_by
 
     @staticmethod
@@ -263,7 +285,8 @@ class AiopgSnapshotQueryDatabaseOperationBuilder:
         "   t2.data, "
         "   t2.created_at, "
         "   t2.updated_at, "
-        "   t2.transaction_uuid "
+        "   t2.transaction_uuid, "
+        "   t2.schema_hash "
         "FROM ("
         "   SELECT DISTINCT ON (uuid) t1.* "
         "   FROM ( {from_parts} ) AS t1 "
@@ -271,6 +294,12 @@ class AiopgSnapshotQueryDatabaseOperationBuilder:
         ") AS t2"
     )
 
+    _SELECT_TRANSACTION_ENTRIES_QUERY = SQL(
+        "SELECT uuid, name, version, schema, data, created_at, updated_at, transaction_uuid, schema_hash "
+        "FROM {table_name} "
+        "WHERE name = %(name)s AND transaction_uuid = {transaction_uuid}"
+    )
+
     _SELECT_TRANSACTION_CHUNK = SQL(
         "SELECT {index} AS transaction_index, * "
         "FROM {table_name} "
@@ -248,5 +248,30 @@ class AiopgTransactionDatabaseOperationFactory(TransactionDatabaseOperationFacto
             },
         )
 
+    def build_query_ancestry(self, uuid: UUID) -> DatabaseOperation:
+        """Build the database operation to select the ancestry of a transaction in a single query.
+
+        :param uuid: The identifier of the transaction.
+        :return: A ``DatabaseOperation`` instance that returns ``(uuid, destination_uuid)`` rows, from the outer
+            transaction to the given one.
+        """
+        return AiopgDatabaseOperation(
+            f"""
+            WITH RECURSIVE ancestry (uuid, destination_uuid, depth) AS (
+                SELECT uuid, destination_uuid, 0
+                FROM {self.build_table_name()}
+                WHERE uuid = %(uuid)s
+                UNION ALL
+                SELECT t.uuid, t.destination_uuid, a.depth + 1
+                FROM {self.build_table_name()} AS t
+                    INNER JOIN ancestry AS a ON t.uuid = a.destination_uuid
+            )
+            SELECT uuid, destination_uuid
+            FROM ancestry
+            ORDER BY depth DESC;
+            """,
+            {"uuid": uuid},
+        )
+
 
 AiopgDatabaseClient.set_factory(TransactionDatabaseOperationFactory, AiopgTransactionDatabaseOperationFactory)
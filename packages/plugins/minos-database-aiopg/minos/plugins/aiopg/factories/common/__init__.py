@@ -4,3 +4,9 @@ from .locks import (
 from .managemens import (
     AiopgManagementDatabaseOperationFactory,
 )
+from .notifications import (
+    AiopgNotificationDatabaseOperationFactory,
+)
+from .schemas import (
+    AiopgAvroSchemaDatabaseOperationFactory,
+)
@@ -22,6 +22,14 @@ class AiopgLockDatabaseOperationFactory(LockDatabaseOperationFactory):
         """
         return AiopgDatabaseOperation("select pg_advisory_lock(%(hashed_key)s)", {"hashed_key": hashed_key})
 
+    def build_try_acquire(self, hashed_key: int) -> DatabaseOperation:
+        """Build the database operation to acquire the lock without waiting.
+
+        :param hashed_key: The hashed key that identifies the lock.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AiopgDatabaseOperation("select pg_try_advisory_lock(%(hashed_key)s)", {"hashed_key": hashed_key})
+
     def build_release(self, hashed_key: int) -> DatabaseOperation:
         """Build the database operation to release the lock.
 
@@ -0,0 +1,55 @@
+from typing import (
+    Optional,
+)
+
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+)
+
+from minos.common import (
+    DatabaseOperation,
+    NotificationDatabaseOperationFactory,
+)
+
+from ...clients import (
+    AiopgDatabaseClient,
+)
+from ...operations import (
+    AiopgDatabaseOperation,
+)
+
+
+# noinspection SqlNoDataSourceInspection
+class AiopgNotificationDatabaseOperationFactory(NotificationDatabaseOperationFactory):
+    """Aiopg Notification Database Operation Factory class."""
+
+    def build_listen(self, channel: str) -> DatabaseOperation:
+        """Build the database operation to start listening a channel.
+
+        :param channel: The name of the channel.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AiopgDatabaseOperation(SQL("LISTEN {channel}").format(channel=Identifier(channel)))
+
+    def build_unlisten(self, channel: str) -> DatabaseOperation:
+        """Build the database operation to stop listening a channel.
+
+        :param channel: The name of the channel.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AiopgDatabaseOperation(SQL("UNLISTEN {channel}").format(channel=Identifier(channel)))
+
+    def build_notify(self, channel: str, payload: Optional[str] = None) -> DatabaseOperation:
+        """Build the database operation to send a notification to a channel.
+
+        :param channel: The name of the channel.
+        :param payload: The payload of the notification.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AiopgDatabaseOperation(
+            SQL("SELECT pg_notify(%(channel)s, %(payload)s)"), {"channel": channel, "payload": payload}
+        )
+
+
+AiopgDatabaseClient.set_factory(NotificationDatabaseOperationFactory, AiopgNotificationDatabaseOperationFactory)
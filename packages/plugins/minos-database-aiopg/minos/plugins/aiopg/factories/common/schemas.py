@@ -0,0 +1,74 @@
+from psycopg2.sql import (
+    SQL,
+)
+
+from minos.common import (
+    AvroSchemaDatabaseOperationFactory,
+    DatabaseOperation,
+)
+
+from ...clients import (
+    AiopgDatabaseClient,
+)
+from ...operations import (
+    AiopgDatabaseOperation,
+)
+
+
+# noinspection SqlNoDataSourceInspection,SqlResolve
+class AiopgAvroSchemaDatabaseOperationFactory(AvroSchemaDatabaseOperationFactory):
+    """Aiopg Avro Schema Database Operation Factory class."""
+
+    @staticmethod
+    def build_table_name() -> str:
+        """Get the table name.
+
+        :return: A ``str`` value.
+        """
+        return "avro_schema"
+
+    def build_create(self) -> DatabaseOperation:
+        """Build the database operation to create the schema table.
+
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AiopgDatabaseOperation(
+            SQL(
+                f"CREATE TABLE IF NOT EXISTS {self.build_table_name()} ("
+                "   fingerprint BYTEA PRIMARY KEY, "
+                "   schema BYTEA NOT NULL, "
+                "   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()"
+                ")"
+            ),
+            lock=self.build_table_name(),
+        )
+
+    def build_submit(self, fingerprint: bytes, schema: bytes) -> DatabaseOperation:
+        """Build the database operation to store a schema, doing nothing if it is already stored.
+
+        :param fingerprint: The fingerprint of the schema.
+        :param schema: The encoded schema.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AiopgDatabaseOperation(
+            SQL(
+                f"INSERT INTO {self.build_table_name()} (fingerprint, schema) "
+                "VALUES (%(fingerprint)s, %(schema)s) "
+                "ON CONFLICT (fingerprint) DO NOTHING"
+            ),
+            {"fingerprint": fingerprint, "schema": schema},
+        )
+
+    def build_query(self, fingerprint: bytes) -> DatabaseOperation:
+        """Build the database operation to get the encoded schema identified by a fingerprint.
+
+        :param fingerprint: The fingerprint of the schema.
+        :return: A ``DatabaseOperation`` instance.
+        """
+        return AiopgDatabaseOperation(
+            SQL(f"SELECT schema FROM {self.build_table_name()} WHERE fingerprint = %(fingerprint)s"),
+            {"fingerprint": fingerprint},
+        )
+
+
+AiopgDatabaseClient.set_factory(AvroSchemaDatabaseOperationFactory, AiopgAvroSchemaDatabaseOperationFactory)
@@ -11,6 +11,7 @@ from psycopg2.sql import (
 )
 
 from minos.common import (
+    ComposedDatabaseOperation,
     DatabaseOperation,
 )
 from minos.networks import (
@@ -34,23 +35,42 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
         """
         raise NotImplementedError
 
+    def build_notification_channel(self) -> str:
+        """Get the name of the channel used to notify that new entries have been submitted.
+
+        :return: A ``str`` value.
+        """
+        return self.build_table_name()
+
     def build_create(self) -> DatabaseOperation:
         """Build the "create table" query.
 
         :return: A ``SQL`` instance.
         """
-        return AiopgDatabaseOperation(
-            SQL(
-                f"CREATE TABLE IF NOT EXISTS {self.build_table_name()} ("
-                "id BIGSERIAL NOT NULL PRIMARY KEY, "
-                "topic VARCHAR(255) NOT NULL, "
-                "data BYTEA NOT NULL, "
-                "retry INTEGER NOT NULL DEFAULT 0, "
-                "processing BOOL NOT NULL DEFAULT FALSE, "
-                "created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), "
-                "updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW())"
-            ),
-            lock=self.build_table_name(),
+        return ComposedDatabaseOperation(
+            [
+                AiopgDatabaseOperation(
+                    SQL(
+                        f"CREATE TABLE IF NOT EXISTS {self.build_table_name()} ("
+                        "id BIGSERIAL NOT NULL PRIMARY KEY, "
+                        "topic VARCHAR(255) NOT NULL, "
+                        "data BYTEA NOT NULL, "
+                        "priority INTEGER NOT NULL DEFAULT 0, "
+                        "retry INTEGER NOT NULL DEFAULT 0, "
+                        "processing BOOL NOT NULL DEFAULT FALSE, "
+                        "created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), "
+                        "updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW())"
+                    ),
+                    lock=self.build_table_name(),
+                ),
+                AiopgDatabaseOperation(
+                    SQL(
+                        f"ALTER TABLE {self.build_table_name()} "
+                        "ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 0"
+                    ),
+                    lock=self.build_table_name(),
+                ),
+            ]
         )
 
     def build_mark_processed(self, id_: int) -> DatabaseOperation:
@@ -66,6 +86,20 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
             {"id": id_},
         )
 
+    def build_mark_processed_many(self, ids: Iterable[int]) -> DatabaseOperation:
+        """Build the "update not processed" query for multiple entries at once.
+
+        :param ids: The identifiers of the entries to be updated.
+        :return: A ``SQL`` instance.
+        """
+        return AiopgDatabaseOperation(
+            SQL(
+                f"UPDATE {self.build_table_name()} "
+                "SET processing = FALSE, retry = retry + 1, updated_at = NOW() WHERE id = ANY(%(ids)s)"
+            ),
+            {"ids": list(ids)},
+        )
+
     def build_delete(self, id_: int) -> DatabaseOperation:
         """Build the "delete processed" query.
 
@@ -76,6 +110,17 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
             {"id": id_},
         )
 
+    def build_delete_many(self, ids: Iterable[int]) -> DatabaseOperation:
+        """Build the "delete processed" query for multiple entries at once.
+
+        :param ids: The identifiers of the entries to be deleted.
+        :return: A ``SQL`` instance.
+        """
+        return AiopgDatabaseOperation(
+            SQL(f"DELETE FROM {self.build_table_name()} WHERE id = ANY(%(ids)s)"),
+            {"ids": list(ids)},
+        )
+
     def build_mark_processing(self, ids: Iterable[int]) -> DatabaseOperation:
         """
 
@@ -99,14 +144,21 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
             {"retry": retry},
         )
 
-    def build_submit(self, topic: str, data: bytes) -> DatabaseOperation:
+    def build_submit(self, topic: str, data: bytes, priority: int = 0) -> DatabaseOperation:
         """Build the "insert" query.
 
+        :param topic: The topic of the entry.
+        :param data: The serialized message.
+        :param priority: The priority of the entry. Lower values are dequeued first.
         :return: A ``SQL`` instance.
         """
         return AiopgDatabaseOperation(
-            SQL(f"INSERT INTO {self.build_table_name()} (topic, data) VALUES (%(topic)s, %(data)s) RETURNING id"),
-            {"topic": topic, "data": data},
+            SQL(
+                f"INSERT INTO {self.build_table_name()} (topic, data, priority) "
+                "VALUES (%(topic)s, %(data)s, %(priority)s) "
+                "RETURNING id"
+            ),
+            {"topic": topic, "data": data, "priority": priority},
         )
 
     def build_query(self, retry: int, records: int, *args, **kwargs) -> DatabaseOperation:
@@ -116,7 +168,7 @@ class AiopgBrokerQueueDatabaseOperationFactory(BrokerQueueDatabaseOperationFacto
         """
         return AiopgDatabaseOperation(
             SQL(
-                "SELECT id, data "
+                "SELECT id, priority, data "
                 f"FROM {self.build_table_name()} "
                 "WHERE NOT processing AND retry < %(retry)s "
                 "ORDER BY created_at "
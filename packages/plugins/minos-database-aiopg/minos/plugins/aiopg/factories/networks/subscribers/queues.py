@@ -59,7 +59,7 @@ class AiopgBrokerSubscriberQueueDatabaseOperationFactory(
         """
         return AiopgDatabaseOperation(
             SQL(
-                "SELECT id, data "
+                "SELECT id, priority, data "
                 f"FROM {self.build_table_name()} "
                 "WHERE NOT processing AND retry < %(retry)s AND topic IN %(topics)s "
                 "ORDER BY created_at "
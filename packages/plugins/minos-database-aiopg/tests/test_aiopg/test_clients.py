@@ -1,4 +1,7 @@
 import unittest
+from asyncio import (
+    wait_for,
+)
 from unittest.mock import (
     PropertyMock,
     call,
@@ -17,7 +20,9 @@ from psycopg2 import (
 )
 
 from minos.common import (
+    ComposedDatabaseOperation,
     ConnectionException,
+    DatabaseNotification,
     DatabaseOperation,
     IntegrityException,
     ProgrammingException,
@@ -25,6 +30,7 @@ from minos.common import (
 from minos.plugins.aiopg import (
     AiopgDatabaseClient,
     AiopgDatabaseOperation,
+    AiopgNotificationDatabaseOperationFactory,
 )
 from tests.utils import (
     AiopgTestCase,
@@ -132,6 +138,37 @@ class TestAiopgDatabaseClient(AiopgTestCase):
             execute_mock.call_args_list,
         )
 
+    async def test_execute_composed(self):
+        composed = ComposedDatabaseOperation(
+            [
+                AiopgDatabaseOperation("SELECT %(foo)s", {"foo": 1}),
+                AiopgDatabaseOperation("SELECT %(foo)s", {"foo": "bar"}),
+            ]
+        )
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            with patch.object(Cursor, "execute") as execute_mock:
+                await client.execute(composed)
+        self.assertEqual(
+            [call(operation=b"SELECT 1;\nCOMMIT;\nSELECT 'bar'", parameters=None)],
+            execute_mock.call_args_list,
+        )
+
+    async def test_execute_composed_transactional(self):
+        composed = ComposedDatabaseOperation(
+            [AiopgDatabaseOperation("SELECT 1"), AiopgDatabaseOperation("SELECT 2")], transactional=True
+        )
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            with patch.object(Cursor, "execute") as execute_mock:
+                await client.execute(composed)
+        self.assertEqual([call(operation=b"SELECT 1;\nSELECT 2", parameters=None)], execute_mock.call_args_list)
+
+    async def test_execute_composed_fetch(self):
+        composed = ComposedDatabaseOperation([AiopgDatabaseOperation("SELECT 1"), AiopgDatabaseOperation("SELECT 2")])
+        async with AiopgDatabaseClient.from_config(self.config) as client:
+            await client.execute(composed)
+            observed = await client.fetch_one()
+        self.assertEqual((2,), observed)
+
     async def test_execute_disconnected(self):
         async with AiopgDatabaseClient.from_config(self.config) as client:
             await client.close()
@@ -201,6 +238,23 @@ class TestAiopgDatabaseClient(AiopgTestCase):
         for obs in observed:
             self.assertIsInstance(obs, tuple)
 
+    async def test_receive_notification(self):
+        factory = AiopgNotificationDatabaseOperationFactory()
+        async with AiopgDatabaseClient.from_config(self.config) as listener:
+            await listener.execute(factory.build_listen("foo"))
+
+            async with AiopgDatabaseClient.from_config(self.config) as client:
+                await client.execute(factory.build_notify("foo", "bar"))
+
+            observed = await wait_for(listener.receive_notification(), 1)
+
+        self.assertEqual(DatabaseNotification("foo", "bar"), observed)
+
+    async def test_receive_notification_raises_disconnected(self):
+        client = AiopgDatabaseClient.from_config(self.config)
+        with self.assertRaises(ConnectionException):
+            await client.receive_notification()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -48,9 +48,30 @@ class TestAiopgEventDatabaseOperationFactory(unittest.TestCase):
         )
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_submit_many(self):
+        transaction_uuid = uuid4()
+        entries = [
+            {
+                "uuid": uuid4(),
+                "action": Action.CREATE,
+                "name": "Foo",
+                "version": None,
+                "data": bytes(),
+                "created_at": current_datetime(),
+                "transaction_uuid": transaction_uuid,
+            }
+            for _ in range(3)
+        ]
+        transaction_uuids = [uuid4(), transaction_uuid]
+        operation = self.factory.build_submit_many(transaction_uuids=transaction_uuids, entries=entries)
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual(entries[2]["uuid"], operation.parameters["entry_3_uuid"])
+        self.assertEqual(transaction_uuids[0], operation.parameters["transaction_uuid_1"])
+
     def test_build_query(self):
         operation = self.factory.build_query(
             uuid=uuid4(),
+            uuid_in=[uuid4(), uuid4()],
             name="Foo",
             version=423453,
             version_lt=234,
@@ -7,6 +7,7 @@ from minos.aggregate import (
     Condition,
     Ordering,
     SnapshotDatabaseOperationFactory,
+    SnapshotIndex,
 )
 from minos.common import (
     ComposedDatabaseOperation,
@@ -34,10 +35,25 @@ class TestAiopgSnapshotDatabaseOperationFactory(unittest.TestCase):
     def test_build_create(self):
         operation = self.factory.build_create()
         self.assertIsInstance(operation, ComposedDatabaseOperation)
-        self.assertEqual(3, len(operation.operations))
+        self.assertEqual(6, len(operation.operations))
         for sub in operation.operations:
             self.assertIsInstance(sub, AiopgDatabaseOperation)
 
+    def test_build_create_indexes(self):
+        operation = self.factory.build_create_indexes(
+            "path.to.Car", [SnapshotIndex("color"), SnapshotIndex("owner.name"), SnapshotIndex("version")]
+        )
+        self.assertIsInstance(operation, ComposedDatabaseOperation)
+        self.assertEqual(2, len(operation.operations))
+        for sub in operation.operations:
+            self.assertIsInstance(sub, AiopgDatabaseOperation)
+            self.assertEqual("snapshot", sub.lock)
+
+    def test_build_create_indexes_empty(self):
+        operation = self.factory.build_create_indexes("path.to.Car", [])
+        self.assertIsInstance(operation, ComposedDatabaseOperation)
+        self.assertEqual(0, len(operation.operations))
+
     def test_build_build_delete(self):
         operation = self.factory.build_delete({uuid4(), uuid4()})
         self.assertIsInstance(operation, AiopgDatabaseOperation)
@@ -55,6 +71,47 @@ class TestAiopgSnapshotDatabaseOperationFactory(unittest.TestCase):
         )
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_submit_many(self):
+        entries = [
+            {
+                "uuid": uuid4(),
+                "name": "Foo",
+                "version": version,
+                "schema": bytes(),
+                "data": {"foo": "bar"},
+                "created_at": current_datetime(),
+                "updated_at": current_datetime(),
+                "transaction_uuid": uuid4(),
+            }
+            for version in range(3)
+        ]
+        operation = self.factory.build_submit_many(entries)
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual(3 * 9, len(operation.parameters))
+        self.assertIsNone(operation.parameters["schema_hash_0"])
+
+    def test_build_submit_many_empty(self):
+        operation = self.factory.build_submit_many([])
+        self.assertIsInstance(operation, ComposedDatabaseOperation)
+        self.assertEqual(0, len(operation.operations))
+
+    def test_build_submit_schemas(self):
+        operation = self.factory.build_submit_schemas({b"foo": b"bar", b"one": b"two"})
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual(
+            {"hash_0": b"foo", "schema_0": b"bar", "hash_1": b"one", "schema_1": b"two"}, operation.parameters
+        )
+
+    def test_build_submit_schemas_empty(self):
+        operation = self.factory.build_submit_schemas(dict())
+        self.assertIsInstance(operation, ComposedDatabaseOperation)
+        self.assertEqual(0, len(operation.operations))
+
+    def test_build_query_schemas(self):
+        operation = self.factory.build_query_schemas([b"foo", b"bar"])
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"hashes": (b"foo", b"bar")}, operation.parameters)
+
     def test_build_query(self):
         operation = self.factory.build_query(
             name="Foo",
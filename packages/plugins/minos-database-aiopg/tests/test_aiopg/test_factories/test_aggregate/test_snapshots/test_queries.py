@@ -42,10 +42,8 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
             "name": self.classname,
             "transaction_uuid_1": NULL_UUID,
         }
-        self.base_select = AiopgSnapshotQueryDatabaseOperationBuilder._SELECT_ENTRIES_QUERY.format(
-            from_parts=AiopgSnapshotQueryDatabaseOperationBuilder._SELECT_TRANSACTION_CHUNK.format(
-                index=Literal(1), transaction_uuid=Placeholder("transaction_uuid_1"), table_name=Identifier("snapshot")
-            )
+        self.base_select = AiopgSnapshotQueryDatabaseOperationBuilder._SELECT_TRANSACTION_ENTRIES_QUERY.format(
+            transaction_uuid=Placeholder("transaction_uuid_1"), table_name=Identifier("snapshot")
         )
 
     def test_constructor(self):
@@ -124,7 +122,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         condition = Condition.TRUE
         observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("TRUE")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("TRUE")])
         expected_parameters = self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -133,7 +131,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
     async def test_build_false(self):
         condition = Condition.FALSE
         observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("FALSE")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("FALSE")])
         expected_parameters = self.base_parameters
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
         self.assertEqual(self._flatten_parameters(expected_parameters), self._flatten_parameters(observed[1]))
@@ -144,7 +142,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL('("uuid" = %(hello)s)')])
+        expected_query = SQL(" AND ").join([self.base_select, SQL('("uuid" = %(hello)s)')])
         expected_parameters = {"hello": str(uuid)} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -155,7 +153,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL('("version" = %(hello)s)')])
+        expected_query = SQL(" AND ").join([self.base_select, SQL('("version" = %(hello)s)')])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -166,7 +164,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL('("created_at" = %(hello)s)')])
+        expected_query = SQL(" AND ").join([self.base_select, SQL('("created_at" = %(hello)s)')])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -177,7 +175,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL('("updated_at" = %(hello)s)')])
+        expected_query = SQL(" AND ").join([self.base_select, SQL('("updated_at" = %(hello)s)')])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -188,7 +186,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL('("uuid"::text LIKE %(hello)s)')])
+        expected_query = SQL(" AND ").join([self.base_select, SQL('("uuid"::text LIKE %(hello)s)')])
         expected_parameters = {"hello": "a%"} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -199,7 +197,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(data#>'{age}' < %(hello)s::jsonb)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(data#>'{age}' < %(hello)s::jsonb)")])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -210,7 +208,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(data#>'{age}' <= %(hello)s::jsonb)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(data#>'{age}' <= %(hello)s::jsonb)")])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -221,7 +219,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(data#>'{age}' > %(hello)s::jsonb)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(data#>'{age}' > %(hello)s::jsonb)")])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -232,7 +230,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(data#>'{age}' >= %(hello)s::jsonb)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(data#>'{age}' >= %(hello)s::jsonb)")])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -243,7 +241,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(data#>'{age}' = %(hello)s::jsonb)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(data#>'{age}' = %(hello)s::jsonb)")])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -254,7 +252,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(data#>'{age}' <> %(hello)s::jsonb)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(data#>'{age}' <> %(hello)s::jsonb)")])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -265,7 +263,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(data#>'{age}' IN %(hello)s::jsonb)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(data#>'{age}' IN %(hello)s::jsonb)")])
         expected_parameters = {"hello": (1, 2, 3)} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -276,7 +274,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("FALSE")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("FALSE")])
         expected_parameters = self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -287,7 +285,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(data#>>'{name}' LIKE %(hello)s)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(data#>>'{name}' LIKE %(hello)s)")])
         expected_parameters = {"hello": "a%"} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -298,7 +296,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         with patch.object(AiopgSnapshotQueryDatabaseOperationBuilder, "generate_random_str", side_effect=["hello"]):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("(NOT (data#>'{age}' < %(hello)s::jsonb))")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("(NOT (data#>'{age}' < %(hello)s::jsonb))")])
         expected_parameters = {"hello": 1} | self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -339,7 +337,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
             self.classname, Condition.TRUE, exclude_deleted=True
         ).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("TRUE AND (data IS NOT NULL)")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("TRUE AND (data IS NOT NULL)")])
         expected_parameters = self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -349,7 +347,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         ordering = Ordering.ASC("created_at")
         observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, ordering).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL('TRUE ORDER BY "created_at" ASC')])
+        expected_query = SQL(" AND ").join([self.base_select, SQL('TRUE ORDER BY "created_at" ASC, "uuid" ASC')])
 
         expected_parameters = self.base_parameters
 
@@ -360,7 +358,17 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         ordering = Ordering.DESC("created_at")
         observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, ordering).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL('TRUE ORDER BY "created_at" DESC')])
+        expected_query = SQL(" AND ").join([self.base_select, SQL('TRUE ORDER BY "created_at" DESC, "uuid" DESC')])
+        expected_parameters = self.base_parameters
+
+        self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
+        self.assertEqual(self._flatten_parameters(expected_parameters), self._flatten_parameters(observed[1]))
+
+    async def test_build_uuid_ordering(self):
+        ordering = Ordering.DESC("uuid")
+        observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, ordering).build()
+
+        expected_query = SQL(" AND ").join([self.base_select, SQL('TRUE ORDER BY "uuid" DESC')])
         expected_parameters = self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -370,7 +378,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         ordering = Ordering.ASC("name")
         observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, ordering).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("TRUE ORDER BY data#>'{name}' ASC")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("TRUE ORDER BY data#>'{name}' ASC, \"uuid\" ASC")])
         expected_parameters = self.base_parameters
 
         self.assertEqual(await self._flatten_query(expected_query), await self._flatten_query(observed[0]))
@@ -380,7 +388,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         ordering = Ordering.DESC("name")
         observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, ordering).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("TRUE ORDER BY data#>'{name}' DESC")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("TRUE ORDER BY data#>'{name}' DESC, \"uuid\" DESC")])
 
         expected_parameters = self.base_parameters
 
@@ -390,7 +398,7 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
     async def test_build_limit(self):
         observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, Condition.TRUE, limit=10).build()
 
-        expected_query = SQL(" WHERE ").join([self.base_select, SQL("TRUE LIMIT 10")])
+        expected_query = SQL(" AND ").join([self.base_select, SQL("TRUE LIMIT 10")])
 
         expected_parameters = self.base_parameters
 
@@ -410,13 +418,13 @@ class TestAiopgSnapshotQueryDatabaseOperationBuilder(AiopgTestCase):
         ):
             observed = AiopgSnapshotQueryDatabaseOperationBuilder(self.classname, condition, ordering, limit).build()
 
-        expected_query = SQL(" WHERE ").join(
+        expected_query = SQL(" AND ").join(
             [
                 self.base_select,
                 SQL(
                     "((data#>'{inventory,amount}' = %(one)s::jsonb) AND ((data#>'{title}' = %(two)s::jsonb) OR "
                     '("version" > %(three)s))) '
-                    'ORDER BY "updated_at" DESC '
+                    'ORDER BY "updated_at" DESC, "uuid" DESC '
                     "LIMIT 100"
                 ),
             ]
@@ -64,6 +64,12 @@ class TestAiopgTransactionDatabaseOperationFactory(unittest.TestCase):
         )
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_query_ancestry(self):
+        uuid = uuid4()
+        operation = self.factory.build_query_ancestry(uuid)
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"uuid": uuid}, operation.parameters)
+
 
 if __name__ == "__main__":
     unittest.main()
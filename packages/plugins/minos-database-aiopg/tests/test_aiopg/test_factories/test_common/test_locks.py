@@ -20,6 +20,10 @@ class TestAiopgLockDatabaseOperationFactory(unittest.TestCase):
         operation = self.factory.build_acquire(56)
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_try_acquire(self):
+        operation = self.factory.build_try_acquire(56)
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+
     def test_build_release(self):
         operation = self.factory.build_release(56)
         self.assertIsInstance(operation, AiopgDatabaseOperation)
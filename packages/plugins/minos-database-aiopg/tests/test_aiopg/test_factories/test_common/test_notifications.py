@@ -0,0 +1,34 @@
+import unittest
+
+from minos.common import (
+    NotificationDatabaseOperationFactory,
+)
+from minos.plugins.aiopg import (
+    AiopgDatabaseOperation,
+    AiopgNotificationDatabaseOperationFactory,
+)
+
+
+class TestAiopgNotificationDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AiopgNotificationDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(AiopgNotificationDatabaseOperationFactory, NotificationDatabaseOperationFactory))
+
+    def test_build_listen(self):
+        operation = self.factory.build_listen("foo")
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+
+    def test_build_unlisten(self):
+        operation = self.factory.build_unlisten("foo")
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+
+    def test_build_notify(self):
+        operation = self.factory.build_notify("foo", "bar")
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"channel": "foo", "payload": "bar"}, operation.parameters)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from minos.common import (
+    AvroSchemaDatabaseOperationFactory,
+)
+from minos.plugins.aiopg import (
+    AiopgAvroSchemaDatabaseOperationFactory,
+    AiopgDatabaseOperation,
+)
+
+
+class TestAiopgAvroSchemaDatabaseOperationFactory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.factory = AiopgAvroSchemaDatabaseOperationFactory()
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(AiopgAvroSchemaDatabaseOperationFactory, AvroSchemaDatabaseOperationFactory))
+
+    def test_build_table_name(self):
+        self.assertEqual("avro_schema", self.factory.build_table_name())
+
+    def test_build_create(self):
+        operation = self.factory.build_create()
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+
+    def test_build_submit(self):
+        operation = self.factory.build_submit(bytes(8), b"[]")
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"fingerprint": bytes(8), "schema": b"[]"}, operation.parameters)
+
+    def test_build_query(self):
+        operation = self.factory.build_query(bytes(8))
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"fingerprint": bytes(8)}, operation.parameters)
+
+
+if __name__ == "__main__":
+    unittest.main()
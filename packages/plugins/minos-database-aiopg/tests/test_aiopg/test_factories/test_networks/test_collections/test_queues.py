@@ -1,5 +1,8 @@
 import unittest
 
+from minos.common import (
+    ComposedDatabaseOperation,
+)
 from minos.networks import (
     BrokerQueueDatabaseOperationFactory,
 )
@@ -27,18 +30,34 @@ class TestAiopgBrokerQueueDatabaseOperationFactory(unittest.TestCase):
     def test_build_table_name(self):
         self.assertEqual("foo", self.factory.build_table_name())
 
+    def test_build_notification_channel(self):
+        self.assertEqual("foo", self.factory.build_notification_channel())
+
     def test_build_create(self):
         operation = self.factory.build_create()
-        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertIsInstance(operation, ComposedDatabaseOperation)
+        self.assertEqual(2, len(operation.operations))
+        for sub in operation.operations:
+            self.assertIsInstance(sub, AiopgDatabaseOperation)
 
     def test_build_mark_processed(self):
         operation = self.factory.build_mark_processed(id_=56)
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_mark_processed_many(self):
+        operation = self.factory.build_mark_processed_many(ids=[56, 78])
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"ids": [56, 78]}, operation.parameters)
+
     def test_build_delete(self):
         operation = self.factory.build_delete(id_=56)
         self.assertIsInstance(operation, AiopgDatabaseOperation)
 
+    def test_build_delete_many(self):
+        operation = self.factory.build_delete_many(ids=[56, 78])
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"ids": [56, 78]}, operation.parameters)
+
     def test_build_mark_processing(self):
         operation = self.factory.build_mark_processing(ids={56, 78})
         self.assertIsInstance(operation, AiopgDatabaseOperation)
@@ -50,6 +69,12 @@ class TestAiopgBrokerQueueDatabaseOperationFactory(unittest.TestCase):
     def test_build_submit(self):
         operation = self.factory.build_submit(topic="foo", data=bytes())
         self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"topic": "foo", "data": bytes(), "priority": 0}, operation.parameters)
+
+    def test_build_submit_with_priority(self):
+        operation = self.factory.build_submit(topic="foo", data=bytes(), priority=3)
+        self.assertIsInstance(operation, AiopgDatabaseOperation)
+        self.assertEqual({"topic": "foo", "data": bytes(), "priority": 3}, operation.parameters)
 
     def test_build_query(self):
         operation = self.factory.build_query(retry=3, records=1000)